@@ -1,4 +1,4 @@
-__version__ = '1.0.97'
+__version__ = '1.0.98'
 
 
 from .core import *
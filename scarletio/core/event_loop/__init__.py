@@ -1,6 +1,7 @@
 from .cycler import *
 from .event_loop import *
 from .event_loop_functionality_helpers import *
+from .event_loop_instrumentation import *
 from .event_thread_suspender import *
 from .event_thread_type import *
 from .executor import *
@@ -13,6 +14,7 @@ __all__ = (
     *cycler.__all__,
     *event_loop.__all__,
     *event_loop_functionality_helpers.__all__,
+    *event_loop_instrumentation.__all__,
     *event_thread_suspender.__all__,
     *event_thread_type.__all__,
     *executor.__all__,
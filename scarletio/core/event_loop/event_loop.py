@@ -3,6 +3,7 @@ __all__ = ('EventThread', )
 import errno, os, subprocess, sys
 from collections import deque
 from functools import partial as partial_func
+from sys import getrefcount as get_reference_count
 from heapq import heappop, heappush
 from itertools import chain
 from selectors import DefaultSelector, EVENT_READ, EVENT_WRITE
@@ -16,6 +17,7 @@ from socket import (
 )
 from stat import S_ISSOCK
 from threading import Thread, current_thread
+from time import perf_counter
 
 from ...utils import IS_UNIX, Reference, WeakSet, copy_docs, export, include, is_coroutine
 
@@ -33,10 +35,11 @@ from .event_loop_functionality_helpers import (
     EventThreadRunDescriptor, _create_connection_shared_precheck, _create_unix_connection_shared_precheck,
     _is_stream_socket, _iter_futures_of, _set_reuse_port, _ssl_deprecation_precheck
 )
+from .event_loop_instrumentation import EventLoopInstrumentation
 from .event_thread_suspender import ThreadSuspenderContext
 from .event_thread_type import EventThreadType
 from .executor import Executor
-from .handles import Handle, TimerHandle, TimerWeakHandle
+from .handles import FutureCallbacksHandle, Handle, TimerHandle, TimerWeakHandle
 from .server import Server
 
 
@@ -73,6 +76,12 @@ class EventThread(Executor, Thread, metaclass = EventThreadType):
         The asynchronous generators bound to the event loop.
     _async_generators_shutdown_called : `bool`
         Whether the event loop's asynchronous generators where shut down.
+    _handle_pool : `None | list` of ``Handle``
+        Recycled handles to reuse. `None` if handle pooling is disabled.
+    _handle_pool_size : `int`
+        The maximal amount of handles to keep in the pool.
+    _instrumentation : `None | EventLoopInstrumentation`
+        Collects the event loop's metrics. `None` if instrumentation is disabled.
     _self_write_socket : `Socket`
         Socket, which can be used to wake up the thread by writing into it.
     _ready : `deque` of ``Handle``
@@ -103,9 +112,9 @@ class EventThread(Executor, Thread, metaclass = EventThreadType):
     time_resolution = LOOP_TIME_RESOLUTION
     
     __slots__ = (
-        '__dict__', '__weakref__', '_async_generators', '_async_generators_shutdown_called', '_self_write_socket',
-        '_ready', '_scheduled', '_self_read_socket', 'context', 'current_task', 'running', 'selector', 'should_run',
-        'started',
+        '__dict__', '__weakref__', '_async_generators', '_async_generators_shutdown_called', '_handle_pool',
+        '_handle_pool_size', '_instrumentation', '_self_write_socket', '_ready', '_scheduled', '_self_read_socket',
+        'context', 'current_task', 'running', 'selector', 'should_run', 'started',
     )
     
     def __init__(self):
@@ -129,6 +138,11 @@ class EventThread(Executor, Thread, metaclass = EventThreadType):
         self._async_generators = WeakSet()
         self._async_generators_shutdown_called = False
         
+        self._handle_pool = None
+        self._handle_pool_size = 0
+        
+        self._instrumentation = None
+        
         self._self_read_socket = None
         self._self_write_socket = None
     
@@ -169,6 +183,103 @@ class EventThread(Executor, Thread, metaclass = EventThreadType):
         return is_stopped
     
     
+    def enable_handle_pool(self, size = 1024):
+        """
+        Enables recycling the handles used by ``.call_soon`` and by the future callbacks, saving their allocation.
+        
+        A handle is only recycled after it ran (or was cancelled) if nothing else references it, so handles kept by the
+        user are never reused. The pool is picked up from the event loop's next iteration.
+        
+        Parameters
+        ----------
+        size : `int` = `1024`, Optional
+            The maximal amount of handles to keep in the pool.
+        
+        Raises
+        ------
+        TypeError
+            - If `size` is not `int`.
+        ValueError
+            - If `size` is `0` or less.
+        """
+        if not isinstance(size, int):
+            raise TypeError(
+                f'`size` can be `int`, got {type(size).__name__}; {size!r}.'
+            )
+        
+        if size <= 0:
+            raise ValueError(
+                f'`size` cannot be `0` or less, got {size!r}.'
+            )
+        
+        handle_pool = self._handle_pool
+        if handle_pool is None:
+            self._handle_pool = []
+        else:
+            del handle_pool[size:]
+        
+        self._handle_pool_size = size
+    
+    
+    def disable_handle_pool(self):
+        """
+        Disables recycling handles and releases the pooled ones.
+        """
+        self._handle_pool = None
+        self._handle_pool_size = 0
+    
+    
+    def enable_instrumentation(self, slow_handle_threshold = 0.1, file = None):
+        """
+        Enables collecting the event loop's metrics: the time spent waiting on the selector, the ready and scheduled
+        queue lengths and the time spent running each handle. The handles running longer than the given threshold are
+        reported with their representation and with the stack of the task they stepped.
+        
+        If already enabled, replaces the instrumentation, resetting its counters.
+        
+        Parameters
+        ----------
+        slow_handle_threshold : `float` = `0.1`, Optional
+            Handles running at least this much seconds are reported.
+        
+        file : `None`, `I/O stream` = `None`, Optional
+            The file to write the slow handle reports to. Defaults to `sys.stderr`.
+        
+        Returns
+        -------
+        instrumentation : ``EventLoopInstrumentation``
+        
+        Raises
+        ------
+        TypeError
+            - If `slow_handle_threshold` is not `float`.
+        ValueError
+            - If `slow_handle_threshold` is negative.
+        """
+        instrumentation = EventLoopInstrumentation(slow_handle_threshold, file)
+        self._instrumentation = instrumentation
+        return instrumentation
+    
+    
+    def disable_instrumentation(self):
+        """
+        Disables collecting the event loop's metrics.
+        """
+        self._instrumentation = None
+    
+    
+    def get_instrumentation(self):
+        """
+        Returns the event loop's instrumentation.
+        
+        Returns
+        -------
+        instrumentation : ``None | EventLoopInstrumentation``
+            Returns `None` if instrumentation is disabled.
+        """
+        return self._instrumentation
+    
+    
     def _maybe_start(self):
         """
         Starts the event loop's thread if not yet started.
@@ -377,7 +488,15 @@ class EventThread(Executor, Thread, metaclass = EventThreadType):
             if not self._maybe_start():
                 return None
         
-        handle = Handle(callback, args)
+        handle_pool = self._handle_pool
+        if handle_pool:
+            handle = handle_pool.pop()
+            handle.func = callback
+            handle.args = args
+            handle.cancelled = False
+        else:
+            handle = Handle(callback, args)
+        
         self._ready.append(handle)
         return handle
     
@@ -478,6 +597,8 @@ class EventThread(Executor, Thread, metaclass = EventThreadType):
         Notes
         -----
         If the event loop is not running, clears the callback instead of scheduling them.
+        
+        The callbacks are called in reversed order. If the future has more callbacks, they are all called by 1 handle.
         """
         callbacks = future._callbacks
         if not self.running:
@@ -485,9 +606,24 @@ class EventThread(Executor, Thread, metaclass = EventThreadType):
                 callbacks.clear()
                 return
         
-        while callbacks:
-            handle = Handle(callbacks.pop(), (future,))
-            self._ready.append(handle)
+        callback_count = len(callbacks)
+        if callback_count == 0:
+            return
+        
+        if callback_count == 1:
+            handle_pool = self._handle_pool
+            if handle_pool:
+                handle = handle_pool.pop()
+                handle.func = callbacks.pop()
+                handle.args = (future,)
+                handle.cancelled = False
+            else:
+                handle = Handle(callbacks.pop(), (future,))
+        else:
+            handle = FutureCallbacksHandle(callbacks[::-1], future)
+            callbacks.clear()
+        
+        self._ready.append(handle)
     
     
     def create_future(self):
@@ -502,7 +638,7 @@ class EventThread(Executor, Thread, metaclass = EventThreadType):
         return Future(self)
     
     
-    def create_task(self, coroutine):
+    def create_task(self, coroutine, *, context = ..., eager = False):
         """
         Creates a task wrapping the given coroutine.
         
@@ -511,12 +647,20 @@ class EventThread(Executor, Thread, metaclass = EventThreadType):
         coroutine : `CoroutineType`, `GeneratorType`
             The coroutine, to wrap.
         
+        context : `None | Context`, Optional (Keyword only)
+            The context in what the coroutine is stepped. Defaults to a copy of the current context.
+            Pass it as `None` to run the task without entering a context.
+        
+        eager : `bool` = `False`, Optional (Keyword only)
+            Whether the first step of the coroutine should run instantly if called from the event loop's thread.
+            Saves a loop iteration for coroutines which finish without suspending, like cache hits.
+        
         Returns
         -------
         task : ``Task``
             The created task instance.
         """
-        return Task(self, coroutine)
+        return Task(self, coroutine, context = context, eager = eager)
     
     
     def create_task_thread_safe(self, coroutine):
@@ -679,7 +823,13 @@ class EventThread(Executor, Thread, metaclass = EventThreadType):
                 else:
                     timeout = None
                 
-                event_list = self.selector.select(timeout)
+                instrumentation = self._instrumentation
+                if instrumentation is None:
+                    event_list = self.selector.select(timeout)
+                else:
+                    select_start = perf_counter()
+                    event_list = self.selector.select(timeout)
+                    instrumentation._add_select(perf_counter() - select_start)
                 
                 if event_list:
                     for key, mask in event_list:
@@ -704,10 +854,47 @@ class EventThread(Executor, Thread, metaclass = EventThreadType):
                 event_list = None
                 
                 # process callbacks
-                while ready:
-                    handle = ready.popleft()
-                    if not handle.cancelled:
-                        handle._run()
+                handle_pool = self._handle_pool
+                if (instrumentation is None) and (handle_pool is None):
+                    while ready:
+                        handle = ready.popleft()
+                        if not handle.cancelled:
+                            handle._run()
+                
+                elif (instrumentation is not None):
+                    instrumentation._add_iteration(len(ready), len(scheduled))
+                    handle_pool_size = self._handle_pool_size
+                    while ready:
+                        handle = ready.popleft()
+                        if not handle.cancelled:
+                            instrumentation._run_handle(self, handle)
+                        
+                        if (
+                            (handle_pool is not None) and
+                            (type(handle) is Handle) and
+                            (get_reference_count(handle) == 2) and
+                            (len(handle_pool) < handle_pool_size)
+                        ):
+                            handle.func = None
+                            handle.args = None
+                            handle_pool.append(handle)
+                
+                else:
+                    handle_pool_size = self._handle_pool_size
+                    while ready:
+                        handle = ready.popleft()
+                        if not handle.cancelled:
+                            handle._run()
+                        
+                        # Only recycle plain handles, which are not referenced anywhere else (local + parameter).
+                        if (
+                            (type(handle) is Handle) and
+                            (get_reference_count(handle) == 2) and
+                            (len(handle_pool) < handle_pool_size)
+                        ):
+                            handle.func = None
+                            handle.args = None
+                            handle_pool.append(handle)
                 
                 handle = None # remove from locals or the gc derps out.
     
@@ -816,7 +1003,8 @@ class EventThread(Executor, Thread, metaclass = EventThreadType):
             future_checks_pending.add(task)
         
         for handle in chain(self._ready, self._scheduled):
-            future_checks_pending.update(_iter_futures_of(handle.func))
+            for func in handle.iter_functions():
+                future_checks_pending.update(_iter_futures_of(func))
             
             for parameter in handle.iter_positional_parameters():
                 future_checks_pending.update(_iter_futures_of(parameter))
@@ -0,0 +1,389 @@
+__all__ = ('EventLoopInstrumentation',)
+
+import sys
+from time import perf_counter
+
+from ...utils import HIGHLIGHT_TOKEN_TYPES, alchemy_incendiary, get_highlight_streamer, include, render_frames_into
+from ...utils.trace.frame_proxy import FrameProxyFrame, FrameProxyVirtual
+
+from ..traps import Task
+
+from .handles import FutureCallbacksHandle
+
+
+get_default_trace_writer_highlighter = include('get_default_trace_writer_highlighter')
+
+
+class EventLoopInstrumentation:
+    """
+    Collects timing and queue depth metrics of an ``EventThread``. Enabled by ``EventThread.enable_instrumentation``.
+    
+    The counters are cumulative since the instrumentation was created or last ``.reset``.
+    
+    Attributes
+    ----------
+    file : `None | I/O stream`
+        The file to write the slow handle reports to. Defaults to `sys.stderr`.
+    
+    handle_count : `int`
+        How much handles ran.
+    
+    handle_duration : `float`
+        The total time spent running handles.
+    
+    handle_duration_max : `float`
+        The longest time a single handle ran.
+    
+    iteration_count : `int`
+        How much iterations the event loop did.
+    
+    ready_length_max : `int`
+        The most handles ready to run at the start of an iteration's callback processing.
+    
+    ready_length_total : `int`
+        The sum of the ready handles at the start of each iteration's callback processing.
+    
+    scheduled_length_max : `int`
+        The most timer handles scheduled at the start of an iteration's callback processing.
+    
+    select_duration : `float`
+        The total time spent waiting on the selector.
+    
+    select_duration_max : `float`
+        The longest time spent waiting on the selector in a single iteration.
+    
+    slow_handle_count : `int`
+        How much handles ran longer than `slow_handle_threshold`.
+    
+    slow_handle_threshold : `float`
+        Handles running at least this much seconds are reported.
+    """
+    __slots__ = (
+        'file', 'handle_count', 'handle_duration', 'handle_duration_max', 'iteration_count', 'ready_length_max',
+        'ready_length_total', 'scheduled_length_max', 'select_duration', 'select_duration_max', 'slow_handle_count',
+        'slow_handle_threshold'
+    )
+    
+    def __new__(cls, slow_handle_threshold = 0.1, file = None):
+        """
+        Creates a new event loop instrumentation.
+        
+        Parameters
+        ----------
+        slow_handle_threshold : `float` = `0.1`, Optional
+            Handles running at least this much seconds are reported.
+        
+        file : `None`, `I/O stream` = `None`, Optional
+            The file to write the slow handle reports to. Defaults to `sys.stderr`.
+        
+        Raises
+        ------
+        TypeError
+            - If `slow_handle_threshold` is not `float`.
+        ValueError
+            - If `slow_handle_threshold` is negative.
+        """
+        if not isinstance(slow_handle_threshold, (int, float)):
+            raise TypeError(
+                f'`slow_handle_threshold` can be `float`, got '
+                f'{type(slow_handle_threshold).__name__}; {slow_handle_threshold!r}.'
+            )
+        
+        if slow_handle_threshold < 0:
+            raise ValueError(
+                f'`slow_handle_threshold` cannot be negative, got {slow_handle_threshold!r}.'
+            )
+        
+        self = object.__new__(cls)
+        self.file = file
+        self.slow_handle_threshold = float(slow_handle_threshold)
+        self.reset()
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the event loop instrumentation's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' iterations = ')
+        repr_parts.append(repr(self.iteration_count))
+        
+        repr_parts.append(', handles = ')
+        repr_parts.append(repr(self.handle_count))
+        
+        slow_handle_count = self.slow_handle_count
+        if slow_handle_count:
+            repr_parts.append(', slow handles = ')
+            repr_parts.append(repr(slow_handle_count))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def reset(self):
+        """
+        Resets the counters of the instrumentation.
+        """
+        self.handle_count = 0
+        self.handle_duration = 0.0
+        self.handle_duration_max = 0.0
+        self.iteration_count = 0
+        self.ready_length_max = 0
+        self.ready_length_total = 0
+        self.scheduled_length_max = 0
+        self.select_duration = 0.0
+        self.select_duration_max = 0.0
+        self.slow_handle_count = 0
+    
+    
+    def get_statistics(self):
+        """
+        Returns the counters of the instrumentation.
+        
+        Returns
+        -------
+        statistics : `dict<str, int | float>`
+        """
+        iteration_count = self.iteration_count
+        handle_count = self.handle_count
+        
+        return {
+            'handle_count': handle_count,
+            'handle_duration': self.handle_duration,
+            'handle_duration_average': (self.handle_duration / handle_count if handle_count else 0.0),
+            'handle_duration_max': self.handle_duration_max,
+            'iteration_count': iteration_count,
+            'ready_length_average': (self.ready_length_total / iteration_count if iteration_count else 0.0),
+            'ready_length_max': self.ready_length_max,
+            'scheduled_length_max': self.scheduled_length_max,
+            'select_duration': self.select_duration,
+            'select_duration_max': self.select_duration_max,
+            'slow_handle_count': self.slow_handle_count,
+        }
+    
+    
+    def _add_select(self, duration):
+        """
+        Records the time spent waiting on the selector.
+        
+        Parameters
+        ----------
+        duration : `float`
+            The waited time.
+        """
+        self.select_duration += duration
+        if duration > self.select_duration_max:
+            self.select_duration_max = duration
+    
+    
+    def _add_iteration(self, ready_length, scheduled_length):
+        """
+        Records an iteration of the event loop.
+        
+        Parameters
+        ----------
+        ready_length : `int`
+            The amount of handles ready to run.
+        
+        scheduled_length : `int`
+            The amount of scheduled timer handles.
+        """
+        self.iteration_count += 1
+        self.ready_length_total += ready_length
+        if ready_length > self.ready_length_max:
+            self.ready_length_max = ready_length
+        
+        if scheduled_length > self.scheduled_length_max:
+            self.scheduled_length_max = scheduled_length
+    
+    
+    def _run_handle(self, loop, handle):
+        """
+        Runs the given handle and records it. The callbacks of future callbacks handles are measured one by one, so
+        the slow one can be reported.
+        
+        Parameters
+        ----------
+        loop : ``EventThread``
+            The event loop, which runs the handle.
+        
+        handle : ``Handle``
+            The handle to run.
+        """
+        if type(handle) is FutureCallbacksHandle:
+            start = perf_counter()
+            callback, callback_duration = handle._run_measured()
+            duration = perf_counter() - start
+        
+        else:
+            callback = None
+            callback_duration = 0.0
+            start = perf_counter()
+            handle._run()
+            duration = perf_counter() - start
+        
+        self._add_handle(loop, handle, duration, callback, callback_duration)
+    
+    
+    def _add_handle(self, loop, handle, duration, callback = None, callback_duration = 0.0):
+        """
+        Records a handle ran by the event loop. If it ran for too long, reports it.
+        
+        Parameters
+        ----------
+        loop : ``EventThread``
+            The event loop, which ran the handle.
+        
+        handle : ``Handle``
+            The handle, which ran.
+        
+        duration : `float`
+            The time the handle ran for.
+        
+        callback : `None | callable` = `None`, Optional
+            The slowest callback of a future callbacks handle.
+        
+        callback_duration : `float` = `0.0`, Optional
+            The time the slowest callback ran for.
+        """
+        self.handle_count += 1
+        self.handle_duration += duration
+        if duration > self.handle_duration_max:
+            self.handle_duration_max = duration
+        
+        if duration >= self.slow_handle_threshold:
+            self.slow_handle_count += 1
+            self._report_slow_handle(loop, handle, duration, callback, callback_duration)
+    
+    
+    def _report_slow_handle(self, loop, handle, duration, callback = None, callback_duration = 0.0):
+        """
+        Writes the given slow handle's representation, its slowest callback if it called more and if it stepped a
+        task, the task's stack.
+        
+        The stack is captured after the step returned, so it shows where the task is suspended at next, not the code
+        which was blocking. If the task finished with the step, there is no stack to show.
+        
+        The representations and the frames are captured immediately, since the handle might be reused and the task
+        continues running. The rendering is done in an executor, since it includes blocking file reads.
+        
+        Parameters
+        ----------
+        loop : ``EventThread``
+            The event loop, which ran the handle.
+        
+        handle : ``Handle``
+            The slow handle.
+        
+        duration : `float`
+            The time the handle ran for.
+        
+        callback : `None | callable` = `None`, Optional
+            The slowest callback of a future callbacks handle.
+        
+        callback_duration : `float` = `0.0`, Optional
+            The time the slowest callback ran for.
+        
+        Returns
+        -------
+        future : ``Future``
+            Returns a future, what can be awaited to wait for the report to be written.
+        """
+        representation = repr(handle)
+        
+        if callback is None:
+            callback_representation = None
+            function = getattr(handle, 'func', None)
+        else:
+            callback_representation = repr(callback)
+            function = callback
+        
+        task = getattr(function, '__self__', None)
+        if isinstance(task, Task):
+            frames = [FrameProxyVirtual(FrameProxyFrame(frame)) for frame in task.get_stack() if (frame is not None)]
+        else:
+            frames = None
+        
+        future = loop.run_in_executor(
+            alchemy_incendiary(
+                _write_slow_handle_report,
+                (representation, duration, callback_representation, callback_duration, frames, self.file),
+            )
+        )
+        future.silence()
+        return future
+
+
+def _write_slow_handle_report(representation, duration, callback_representation, callback_duration, frames, file):
+    """
+    Writes a slow handle report.
+    
+    This function calls blocking operations and should not run inside of an event loop.
+    
+    Parameters
+    ----------
+    representation : `str`
+        The slow handle's representation.
+    
+    duration : `float`
+        The time the handle ran for.
+    
+    callback_representation : `None | str`
+        The representation of the slowest callback of a future callbacks handle.
+    
+    callback_duration : `float`
+        The time the slowest callback ran for.
+    
+    frames : `None | list<FrameProxyBase>`
+        The stack of the task stepped by the handle, captured after the step.
+    
+    file : `None`, `I/O stream`
+        The file to write the report to. Defaults to `sys.stderr`.
+    """
+    if file is None:
+        highlighter = get_default_trace_writer_highlighter()
+    else:
+        highlighter = None
+    
+    highlight_streamer = get_highlight_streamer(highlighter)
+    extend = []
+    
+    lines = [f'Slow handle blocked the event loop for {duration:.3f} seconds: {representation}']
+    
+    if (callback_representation is not None):
+        lines.append(f'Slowest callback ran for {callback_duration:.3f} seconds: {callback_representation}')
+    
+    if (frames is not None):
+        if frames:
+            lines.append(
+                'Stack of the stepped task after the step; it shows where the task is suspended at, not the code '
+                'which was blocking:'
+            )
+        else:
+            lines.append('The stepped task finished, it has no stack to show.')
+    
+    for line in lines:
+        extend.extend(highlight_streamer.asend((
+            HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TRACE_TITLE,
+            line,
+        )))
+        extend.extend(highlight_streamer.asend((
+            HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_LINE_BREAK,
+            '\n',
+        )))
+    
+    extend.extend(highlight_streamer.asend(None))
+    
+    if frames:
+        render_frames_into(frames, extend, highlighter = highlighter)
+    
+    if file is None:
+        # ignore exception cases
+        file = sys.stderr
+        
+        # On shutdown `sys.stderr` can be set to `None`
+        if (file is None):
+            return
+    
+    file.write(''.join(extend))
+    file.flush()
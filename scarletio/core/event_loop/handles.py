@@ -1,11 +1,14 @@
-__all__ = ('Handle', 'TimerHandle', 'TimerWeakHandle',)
+__all__ = ('FutureCallbacksHandle', 'Handle', 'TimerHandle', 'TimerWeakHandle',)
 
+from time import perf_counter
 from types import MethodType
 
-from ...utils import WeakCallable, WeakReferer, ignore_frame, include, weak_method
+from ...utils import WeakCallable, WeakReferer, copy_docs, ignore_frame, include, weak_method
 
 
 ignore_frame(__spec__.origin, '_run', 'self.func(*self.args)', )
+ignore_frame(__spec__.origin, '_run', 'callback(future)', )
+ignore_frame(__spec__.origin, '_run_measured', 'callback(future)', )
 
 
 write_exception_async = include('write_exception_async')
@@ -160,6 +163,21 @@ class Handle:
             self = None  # Needed to break cycles when an exception occurs.
     
     
+    def iter_functions(self):
+        """
+        Iterates over the functions called by the handle.
+        
+        This method is an iterable generator.
+        
+        Yields
+        ------
+        func : `callable`
+        """
+        func = self.func
+        if (func is not None):
+            yield func
+    
+    
     def iter_positional_parameters(self):
         """
         Iterates over the handle's positional parameters.
@@ -175,6 +193,188 @@ class Handle:
             yield from args
 
 
+class FutureCallbacksHandle(Handle):
+    """
+    Handle calling all the done callbacks of a future. Created by ``EventThread._schedule_callbacks`` when a future
+    has more callbacks, so they do not need a handle each.
+    
+    Attributes
+    ----------
+    func : `None`
+        Unused, the called functions are stored in ``.callbacks``.
+    args : `None | tuple<Future>`
+        Parameters to call the callbacks with.
+    callbacks : `None | list<callable>`
+        The callbacks to call in order.
+    cancelled : `bool`
+        Whether the handle is cancelled.
+    """
+    __slots__ = ('callbacks',)
+    
+    def __init__(self, callbacks, future):
+        """
+        Creates a new ``FutureCallbacksHandle`` with the given parameters.
+        
+        Parameters
+        ----------
+        callbacks : `list<callable>`
+            The callbacks to call in order.
+        future : ``Future``
+            The future to call the callbacks with.
+        """
+        self.func = None
+        self.args = (future,)
+        self.callbacks = callbacks
+        self.cancelled = False
+    
+    
+    @copy_docs(Handle._create_repr)
+    def _create_repr(self, expect, expected_value):
+        repr_parts = [
+            '<',
+            type(self).__name__,
+        ]
+        
+        if self.cancelled:
+            repr_parts.append(' cancelled')
+        
+        else:
+            repr_parts.append(' callbacks = [')
+            
+            callbacks = self.callbacks
+            limit = len(callbacks)
+            if limit:
+                index = 0
+                while True:
+                    callback = callbacks[index]
+                    if expect and (callback is expected_value):
+                        callback_repr = '...'
+                    else:
+                        callback_repr = repr(callback)
+                    
+                    repr_parts.append(callback_repr)
+                    
+                    index += 1
+                    if index == limit:
+                        break
+                    
+                    repr_parts.append(', ')
+                    continue
+            
+            repr_parts.append('], future = ')
+            
+            future = self.args[0]
+            if expect and (future is expected_value):
+                future_repr = '...'
+            else:
+                future_repr = repr(future)
+            
+            repr_parts.append(future_repr)
+        
+        repr_parts.append('>')
+        
+        return ''.join(repr_parts)
+    
+    
+    @copy_docs(Handle.cancel)
+    def cancel(self):
+        if not self.cancelled:
+            self.cancelled = True
+            self.args = None
+            self.callbacks = None
+    
+    
+    def _run(self):
+        """
+        Calls the callbacks with the future. If exception occurs meanwhile, renders it and continues with the next
+        callback.
+        
+        Notes
+        -----
+        This method should be called only inside of an ``EventThread``.
+        """
+        future = self.args[0]
+        try:
+            for callback in self.callbacks:
+                try:
+                    callback(future)
+                except BaseException as err:
+                    write_exception_async(
+                        err,
+                        [
+                            'Exception occurred at ',
+                            type(self).__name__,
+                            '._run\nAt running ',
+                            repr(callback),
+                            '\n',
+                        ]
+                    )
+        
+        finally:
+            # Needed to break cycles when an exception occurs.
+            self = None
+            future = None
+            callback = None
+    
+    
+    def _run_measured(self):
+        """
+        Calls the callbacks with the future like ``._run``, meanwhile measuring how long each of them runs.
+        
+        Returns
+        -------
+        slowest_callback : `None | callable`
+            The callback, which ran the longest.
+        
+        slowest_duration : `float`
+            The time the slowest callback ran for.
+        
+        Notes
+        -----
+        This method should be called only inside of an ``EventThread``.
+        """
+        slowest_callback = None
+        slowest_duration = 0.0
+        
+        future = self.args[0]
+        try:
+            for callback in self.callbacks:
+                start = perf_counter()
+                try:
+                    callback(future)
+                except BaseException as err:
+                    write_exception_async(
+                        err,
+                        [
+                            'Exception occurred at ',
+                            type(self).__name__,
+                            '._run_measured\nAt running ',
+                            repr(callback),
+                            '\n',
+                        ]
+                    )
+                
+                duration = perf_counter() - start
+                if duration >= slowest_duration:
+                    slowest_callback = callback
+                    slowest_duration = duration
+        
+        finally:
+            # Needed to break cycles when an exception occurs.
+            self = None
+            future = None
+            callback = None
+        
+        return slowest_callback, slowest_duration
+    
+    
+    @copy_docs(Handle.iter_functions)
+    def iter_functions(self):
+        callbacks = self.callbacks
+        if (callbacks is not None):
+            yield from callbacks
+
+
 class TimerHandle(Handle):
     """
     Object returned by a callback registration method:
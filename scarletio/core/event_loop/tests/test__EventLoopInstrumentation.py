@@ -0,0 +1,249 @@
+from io import StringIO
+from time import sleep as blocking_sleep
+
+import vampytest
+
+from ...top_level import get_event_loop
+from ...traps import Future, Task, skip_poll_cycle, skip_ready_cycle, sleep
+
+from ..event_loop_instrumentation import EventLoopInstrumentation
+from ..handles import FutureCallbacksHandle, Handle
+
+
+def _assert_fields_set(instrumentation):
+    """
+    Asserts whether every fields are set of the given event loop instrumentation.
+    
+    Parameters
+    ----------
+    instrumentation : ``EventLoopInstrumentation``
+        The instrumentation to check.
+    """
+    vampytest.assert_instance(instrumentation, EventLoopInstrumentation)
+    vampytest.assert_instance(instrumentation.handle_count, int)
+    vampytest.assert_instance(instrumentation.handle_duration, float)
+    vampytest.assert_instance(instrumentation.handle_duration_max, float)
+    vampytest.assert_instance(instrumentation.iteration_count, int)
+    vampytest.assert_instance(instrumentation.ready_length_max, int)
+    vampytest.assert_instance(instrumentation.ready_length_total, int)
+    vampytest.assert_instance(instrumentation.scheduled_length_max, int)
+    vampytest.assert_instance(instrumentation.select_duration, float)
+    vampytest.assert_instance(instrumentation.select_duration_max, float)
+    vampytest.assert_instance(instrumentation.slow_handle_count, int)
+    vampytest.assert_instance(instrumentation.slow_handle_threshold, float)
+
+
+def test__EventLoopInstrumentation__new():
+    """
+    Tests whether ``EventLoopInstrumentation.__new__`` works as intended.
+    """
+    file = StringIO()
+    instrumentation = EventLoopInstrumentation(1, file)
+    _assert_fields_set(instrumentation)
+    
+    vampytest.assert_is(instrumentation.file, file)
+    vampytest.assert_eq(instrumentation.slow_handle_threshold, 1.0)
+    vampytest.assert_eq(instrumentation.iteration_count, 0)
+
+
+def _iter_options__new__type_error():
+    yield 'a'
+    yield None
+
+
+def _iter_options__new__value_error():
+    yield -1
+    yield -0.5
+
+
+@vampytest._(vampytest.call_from(_iter_options__new__type_error()).raising(TypeError))
+@vampytest._(vampytest.call_from(_iter_options__new__value_error()).raising(ValueError))
+def test__EventLoopInstrumentation__new__error(slow_handle_threshold):
+    """
+    Tests whether ``EventLoopInstrumentation.__new__`` raises the correct errors.
+    
+    Parameters
+    ----------
+    slow_handle_threshold : `object`
+        Threshold to create the instrumentation with.
+    
+    Raises
+    ------
+    TypeError
+    ValueError
+    """
+    EventLoopInstrumentation(slow_handle_threshold)
+
+
+def test__EventLoopInstrumentation__repr():
+    """
+    Tests whether ``EventLoopInstrumentation.__repr__`` works as intended.
+    """
+    instrumentation = EventLoopInstrumentation()
+    
+    output = repr(instrumentation)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(instrumentation).__name__, output)
+
+
+def test__EventLoopInstrumentation__counters():
+    """
+    Tests whether ``EventLoopInstrumentation`` counts as intended and whether ``.get_statistics`` and ``.reset`` work.
+    """
+    instrumentation = EventLoopInstrumentation(10.0)
+    
+    instrumentation._add_select(0.5)
+    instrumentation._add_select(0.25)
+    instrumentation._add_iteration(4, 2)
+    instrumentation._add_iteration(2, 3)
+    instrumentation._add_handle(None, Handle(print, ()), 0.5)
+    instrumentation._add_handle(None, Handle(print, ()), 1.5)
+    
+    vampytest.assert_eq(
+        instrumentation.get_statistics(),
+        {
+            'handle_count': 2,
+            'handle_duration': 2.0,
+            'handle_duration_average': 1.0,
+            'handle_duration_max': 1.5,
+            'iteration_count': 2,
+            'ready_length_average': 3.0,
+            'ready_length_max': 4,
+            'scheduled_length_max': 3,
+            'select_duration': 0.75,
+            'select_duration_max': 0.5,
+            'slow_handle_count': 0,
+        },
+    )
+    
+    instrumentation.reset()
+    _assert_fields_set(instrumentation)
+    vampytest.assert_eq(instrumentation.handle_count, 0)
+    vampytest.assert_eq(instrumentation.iteration_count, 0)
+    vampytest.assert_eq(instrumentation.get_statistics()['ready_length_average'], 0.0)
+
+
+async def test__EventLoopInstrumentation__report_slow_handle():
+    """
+    Tests whether ``EventLoopInstrumentation._report_slow_handle`` writes the handle and the task's stack.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    file = StringIO()
+    instrumentation = EventLoopInstrumentation(0.0, file)
+    
+    async def slow_coroutine():
+        await skip_ready_cycle()
+    
+    task = Task(loop, slow_coroutine())
+    await skip_ready_cycle()
+    
+    try:
+        await instrumentation._report_slow_handle(loop, Handle(task._step, ()), 0.25)
+    finally:
+        await task
+    
+    output = file.getvalue()
+    vampytest.assert_in('0.250', output)
+    vampytest.assert_in('_step', output)
+    vampytest.assert_in('slow_coroutine', output)
+    vampytest.assert_in('not the code which was blocking', output)
+
+
+async def test__EventLoopInstrumentation__report_slow_handle__task_finished():
+    """
+    Tests whether ``EventLoopInstrumentation._report_slow_handle`` writes that the stepped task finished.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    file = StringIO()
+    instrumentation = EventLoopInstrumentation(0.0, file)
+    
+    async def slow_coroutine():
+        pass
+    
+    task = Task(loop, slow_coroutine())
+    await task
+    
+    await instrumentation._report_slow_handle(loop, Handle(task._step, ()), 0.25)
+    
+    output = file.getvalue()
+    vampytest.assert_in('finished', output)
+
+
+async def test__EventLoopInstrumentation__run_handle__future_callbacks():
+    """
+    Tests whether ``EventLoopInstrumentation._run_handle`` reports the slowest callback of a future callbacks handle.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    file = StringIO()
+    instrumentation = EventLoopInstrumentation(0.01, file)
+    
+    def fast_callback(future):
+        pass
+    
+    def slow_callback(future):
+        blocking_sleep(0.02)
+    
+    future = Future(loop)
+    future.set_result(None)
+    
+    instrumentation._run_handle(loop, FutureCallbacksHandle([fast_callback, slow_callback, fast_callback], future))
+    vampytest.assert_eq(instrumentation.handle_count, 1)
+    vampytest.assert_eq(instrumentation.slow_handle_count, 1)
+    vampytest.assert_true(instrumentation.handle_duration_max >= 0.02)
+    
+    # The report is written in an executor.
+    for _ in range(100):
+        if file.getvalue():
+            break
+        
+        await sleep(0.01, loop)
+    
+    output = file.getvalue()
+    vampytest.assert_in('Slowest callback', output)
+    vampytest.assert_in(slow_callback.__qualname__, output)
+
+
+async def test__EventThread__instrumentation():
+    """
+    Tests whether ``EventThread.enable_instrumentation`` collects metrics and reports the slow handles.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    file = StringIO()
+    
+    try:
+        instrumentation = loop.enable_instrumentation(0.01, file)
+        vampytest.assert_is(loop.get_instrumentation(), instrumentation)
+        
+        # The instrumentation is picked up by the next loop iteration.
+        await skip_poll_cycle(loop)
+        
+        loop.call_soon(blocking_sleep, 0.02)
+        await skip_poll_cycle(loop)
+        
+        vampytest.assert_true(instrumentation.iteration_count)
+        vampytest.assert_true(instrumentation.handle_count)
+        vampytest.assert_true(instrumentation.ready_length_max)
+        vampytest.assert_eq(instrumentation.slow_handle_count, 1)
+        vampytest.assert_true(instrumentation.handle_duration_max >= 0.02)
+    
+    finally:
+        loop.disable_instrumentation()
+    
+    vampytest.assert_is(loop.get_instrumentation(), None)
+    
+    # The report is written in an executor.
+    for _ in range(100):
+        if file.getvalue():
+            break
+        
+        await sleep(0.01, loop)
+    
+    vampytest.assert_in('sleep', file.getvalue())
@@ -0,0 +1,155 @@
+import vampytest
+
+from ...top_level import get_event_loop
+from ...traps import Future, skip_poll_cycle, skip_ready_cycle
+
+from ..handles import Handle
+
+
+async def test__EventThread__enable_handle_pool():
+    """
+    Tests whether ``EventThread.enable_handle_pool`` and ``.disable_handle_pool`` work as intended.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    
+    try:
+        loop.enable_handle_pool(16)
+        vampytest.assert_eq(loop._handle_pool, [])
+        vampytest.assert_eq(loop._handle_pool_size, 16)
+    finally:
+        loop.disable_handle_pool()
+    
+    vampytest.assert_is(loop._handle_pool, None)
+    vampytest.assert_eq(loop._handle_pool_size, 0)
+
+
+def _iter_options__enable_handle_pool__type_error():
+    yield 'a'
+    yield 1.0
+
+
+def _iter_options__enable_handle_pool__value_error():
+    yield 0
+    yield -1
+
+
+@vampytest._(vampytest.call_from(_iter_options__enable_handle_pool__type_error()).raising(TypeError))
+@vampytest._(vampytest.call_from(_iter_options__enable_handle_pool__value_error()).raising(ValueError))
+async def test__EventThread__enable_handle_pool__error(size):
+    """
+    Tests whether ``EventThread.enable_handle_pool`` raises the correct errors.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    size : `object`
+        Pool size to enable the pool with.
+    
+    Raises
+    ------
+    TypeError
+    ValueError
+    """
+    loop = get_event_loop()
+    
+    try:
+        loop.enable_handle_pool(size)
+    finally:
+        loop.disable_handle_pool()
+
+
+async def test__EventThread__handle_pool__recycle():
+    """
+    Tests whether the handles not referenced elsewhere are recycled.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    called = []
+    
+    try:
+        loop.enable_handle_pool(16)
+        # The pool is picked up by the next loop iteration.
+        await skip_poll_cycle(loop)
+        
+        for index in range(4):
+            loop.call_soon(called.append, index)
+        
+        await skip_ready_cycle()
+        
+        vampytest.assert_eq(called, [0, 1, 2, 3])
+        
+        handle_pool = loop._handle_pool
+        vampytest.assert_true(handle_pool)
+        for handle in handle_pool:
+            vampytest.assert_is(type(handle), Handle)
+            vampytest.assert_is(handle.func, None)
+            vampytest.assert_is(handle.args, None)
+    
+    finally:
+        loop.disable_handle_pool()
+
+
+async def test__EventThread__handle_pool__reuse():
+    """
+    Tests whether the pooled handles are reused.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    called = []
+    
+    try:
+        loop.enable_handle_pool(16)
+        
+        pooled_handle = Handle(None, None)
+        pooled_handle.cancelled = True
+        loop._handle_pool.append(pooled_handle)
+        
+        handle = loop.call_soon(called.append, 1)
+        vampytest.assert_is(handle, pooled_handle)
+        vampytest.assert_false(handle.cancelled)
+        vampytest.assert_eq(handle.args, (1,))
+        
+        pooled_handle = Handle(None, None)
+        loop._handle_pool.append(pooled_handle)
+        
+        future = Future(loop)
+        future.add_done_callback(called.append)
+        future.set_result(None)
+        vampytest.assert_is(pooled_handle.args[0], future)
+        
+        await skip_ready_cycle()
+        vampytest.assert_eq(called, [1, future])
+    
+    finally:
+        loop.disable_handle_pool()
+
+
+async def test__EventThread__handle_pool__referenced():
+    """
+    Tests whether the handles referenced by the user are not recycled.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    called = []
+    
+    try:
+        loop.enable_handle_pool(16)
+        # The pool is picked up by the next loop iteration.
+        await skip_poll_cycle(loop)
+        
+        handle = loop.call_soon(called.append, 1)
+        await skip_ready_cycle()
+        
+        vampytest.assert_instance(handle, Handle)
+        vampytest.assert_eq(called, [1])
+        vampytest.assert_not_in(handle, loop._handle_pool)
+        vampytest.assert_eq(handle.args, (1,))
+    
+    finally:
+        loop.disable_handle_pool()
@@ -0,0 +1,174 @@
+from time import sleep as blocking_sleep
+
+import vampytest
+
+from ...top_level import get_event_loop
+from ...traps import Future, skip_ready_cycle
+
+from ..handles import FutureCallbacksHandle, Handle
+
+
+def _assert_fields_set(handle):
+    """
+    Asserts whether every fields are set of the given handle.
+    
+    Parameters
+    ----------
+    handle : ``FutureCallbacksHandle``
+        The handle to check.
+    """
+    vampytest.assert_instance(handle, FutureCallbacksHandle)
+    vampytest.assert_instance(handle, Handle)
+    vampytest.assert_instance(handle.args, tuple, nullable = True)
+    vampytest.assert_instance(handle.callbacks, list, nullable = True)
+    vampytest.assert_instance(handle.cancelled, bool)
+
+
+async def test__FutureCallbacksHandle__new():
+    """
+    Tests whether ``FutureCallbacksHandle.__init__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    future = Future(get_event_loop())
+    callbacks = [lambda future: None, lambda future: None]
+    
+    handle = FutureCallbacksHandle(callbacks, future)
+    _assert_fields_set(handle)
+    
+    vampytest.assert_is(handle.callbacks, callbacks)
+    vampytest.assert_eq(handle.args, (future,))
+    vampytest.assert_false(handle.cancelled)
+
+
+async def test__FutureCallbacksHandle__repr():
+    """
+    Tests whether ``FutureCallbacksHandle.__repr__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    future = Future(get_event_loop())
+    handle = FutureCallbacksHandle([lambda future: None, lambda future: None], future)
+    
+    output = repr(handle)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(handle).__name__, output)
+    
+    handle.cancel()
+    output = repr(handle)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in('cancelled', output)
+
+
+async def test__FutureCallbacksHandle__cancel():
+    """
+    Tests whether ``FutureCallbacksHandle.cancel`` works as intended.
+    
+    This function is a coroutine.
+    """
+    future = Future(get_event_loop())
+    handle = FutureCallbacksHandle([lambda future: None], future)
+    
+    handle.cancel()
+    _assert_fields_set(handle)
+    
+    vampytest.assert_true(handle.cancelled)
+    vampytest.assert_is(handle.callbacks, None)
+    vampytest.assert_eq([*handle.iter_functions()], [])
+
+
+async def test__FutureCallbacksHandle__run():
+    """
+    Tests whether ``FutureCallbacksHandle._run`` works as intended.
+    
+    This function is a coroutine.
+    """
+    future = Future(get_event_loop())
+    called = []
+    
+    def callback_0(future):
+        called.append((0, future))
+    
+    def callback_1(future):
+        called.append((1, future))
+    
+    handle = FutureCallbacksHandle([callback_0, callback_1], future)
+    vampytest.assert_eq([*handle.iter_functions()], [callback_0, callback_1])
+    
+    handle._run()
+    vampytest.assert_eq(called, [(0, future), (1, future)])
+
+
+async def test__FutureCallbacksHandle__run_measured():
+    """
+    Tests whether ``FutureCallbacksHandle._run_measured`` works as intended.
+    
+    This function is a coroutine.
+    """
+    future = Future(get_event_loop())
+    called = []
+    
+    def callback_0(future):
+        called.append((0, future))
+    
+    def callback_1(future):
+        blocking_sleep(0.01)
+        called.append((1, future))
+    
+    def callback_2(future):
+        called.append((2, future))
+    
+    handle = FutureCallbacksHandle([callback_0, callback_1, callback_2], future)
+    
+    output = handle._run_measured()
+    vampytest.assert_eq(called, [(0, future), (1, future), (2, future)])
+    
+    vampytest.assert_instance(output, tuple)
+    vampytest.assert_eq(len(output), 2)
+    slowest_callback, slowest_duration = output
+    vampytest.assert_is(slowest_callback, callback_1)
+    vampytest.assert_instance(slowest_duration, float)
+    vampytest.assert_true(slowest_duration >= 0.01)
+
+
+async def test__EventThread__schedule_callbacks():
+    """
+    Tests whether ``EventThread._schedule_callbacks`` works as intended.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    called = []
+    
+    def callback_0(future):
+        called.append(0)
+    
+    def callback_1(future):
+        called.append(1)
+    
+    def callback_2(future):
+        called.append(2)
+    
+    future = Future(loop)
+    future.add_done_callback(callback_0)
+    future.add_done_callback(callback_1)
+    future.add_done_callback(callback_2)
+    
+    ready_count = len(loop._ready)
+    future.set_result(None)
+    
+    vampytest.assert_eq(len(loop._ready), ready_count + 1)
+    vampytest.assert_instance(loop._ready[-1], FutureCallbacksHandle)
+    vampytest.assert_eq(future._callbacks, [])
+    
+    await skip_ready_cycle()
+    vampytest.assert_eq(called, [2, 1, 0])
+    
+    future = Future(loop)
+    future.add_done_callback(callback_0)
+    future.set_result(None)
+    
+    vampytest.assert_is(type(loop._ready[-1]), Handle)
+    
+    await skip_ready_cycle()
+    vampytest.assert_eq(called, [2, 1, 0, 0])
@@ -1,6 +1,7 @@
 __all__ = ('PayloadStream', )
 
 from collections import deque as Deque
+from io import BytesIO
 
 from ...utils import RichAttributeErrorBaseType, include
 
@@ -21,6 +22,8 @@ STREAM_FLAG_WAIT_ANY = STREAM_FLAG_WAIT_WHOLE | STREAM_FLAG_WAIT_CHUNK
 STREAM_FLAG_DONE_RAISE_ANY = STREAM_FLAG_DONE_EXCEPTION | STREAM_FLAG_DONE_CANCELLED | STREAM_FLAG_DONE_ABORTED
 STREAM_FLAG_DONE_ANY = STREAM_FLAG_DONE_SUCCESS | STREAM_FLAG_DONE_RAISE_ANY
 
+PREALLOCATION_SIZE_MIN = 1 << 16
+
     
 def _get_payload_stream_flags_name(flags):
     """
@@ -88,6 +91,13 @@ class PayloadStream(RichAttributeErrorBaseType):
     
     Attributes
     ----------
+    _buffer : `None | BytesIO`
+        Preallocated buffer the received chunks are written into when the whole payload is awaited and its size is
+        known.
+    
+    _buffer_position : `int`
+        The amount of bytes written into ``._buffer``.
+    
     _chunks : `Deque<bytes | memoryview>`
         Cached chunks.
     
@@ -100,13 +110,19 @@ class PayloadStream(RichAttributeErrorBaseType):
     _exception : `None | BaseException`
         Payload reader exception.
     
+    _expected_size : `int`
+        The expected size of the payload. Set as `0` if unknown.
+    
     _protocol : ``ReadProtocolBase``
         The parent protocol.
     
     _waiter : `None | Future`
         Payload waiter used when waiting for a new chunk or for all chunks respectively.
     """
-    __slots__ = ('_chunks', '_done_callbacks', '_exception', '_flags', '_protocol', '_waiter')
+    __slots__ = (
+        '_buffer', '_buffer_position', '_chunks', '_done_callbacks', '_exception', '_expected_size', '_flags',
+        '_protocol', '_waiter'
+    )
     
     def __new__(cls, protocol):
         """
@@ -118,9 +134,12 @@ class PayloadStream(RichAttributeErrorBaseType):
             The parent protocol.
         """
         self = object.__new__(cls)
+        self._buffer = None
+        self._buffer_position = 0
         self._chunks = Deque()
         self._done_callbacks = None
         self._exception = None
+        self._expected_size = 0
         self._flags = 0
         self._protocol = protocol
         self._waiter = None
@@ -149,7 +168,7 @@ class PayloadStream(RichAttributeErrorBaseType):
         -------
         size : `int`
         """
-        size = 0
+        size = self._buffer_position
         for chunk in self._chunks:
             size += len(chunk)
         
@@ -170,6 +189,41 @@ class PayloadStream(RichAttributeErrorBaseType):
         return self.get_total_size()
     
     
+    def set_expected_size(self, size):
+        """
+        Sets the expected size of the payload.
+        
+        If the whole payload is awaited and it is big enough, a buffer with the given size is preallocated and the
+        received chunks are written directly into it, instead of joining them at the end.
+        
+        Parameters
+        ----------
+        size : `int`
+            The expected size of the payload.
+        """
+        self._expected_size = size
+    
+    
+    def _allocate_buffer(self):
+        """
+        Allocates a buffer for the expected size of the payload and moves the already received chunks into it.
+        
+        A `BytesIO` created from a `bytes` it solely owns writes into it in place and hands it over as `bytes` without
+        copying, so the payload is held only once.
+        """
+        buffer = BytesIO(bytes(self._expected_size))
+        position = 0
+        
+        chunks = self._chunks
+        while chunks:
+            chunk = chunks.popleft()
+            buffer.write(chunk)
+            position += len(chunk)
+        
+        self._buffer = buffer
+        self._buffer_position = position
+    
+    
     def set_done_success(self):
         """
         Sets the payload stream to be done with success.
@@ -214,6 +268,8 @@ class PayloadStream(RichAttributeErrorBaseType):
             waiter.set_exception_if_pending(_create_payload_stream_done_exception(flags))
         
         self._chunks.clear()
+        self._buffer = None
+        self._buffer_position = 0
         self._run_done_callbacks()
         return True
     
@@ -244,6 +300,8 @@ class PayloadStream(RichAttributeErrorBaseType):
         
         self._exception = exception
         self._chunks.clear()
+        self._buffer = None
+        self._buffer_position = 0
         self._run_done_callbacks()
         return True
     
@@ -272,6 +330,12 @@ class PayloadStream(RichAttributeErrorBaseType):
                 if waiter.set_result_if_pending(chunk):
                     return True
         
+        buffer = self._buffer
+        if (buffer is not None):
+            buffer.write(chunk)
+            self._buffer_position += len(chunk)
+            return True
+        
         self._chunks.append(chunk)
         return True
     
@@ -436,6 +500,9 @@ class PayloadStream(RichAttributeErrorBaseType):
         self._check_raise_flags()
         
         if not self._flags & STREAM_FLAG_DONE_SUCCESS:
+            if (self._buffer is None) and (self._expected_size >= PREALLOCATION_SIZE_MIN):
+                self._allocate_buffer()
+            
             waiter = self._waiter
             if (waiter is None):
                 self._protocol._resume_reading()
@@ -448,6 +515,15 @@ class PayloadStream(RichAttributeErrorBaseType):
                 self._abort()
                 raise
         
+        buffer = self._buffer
+        if (buffer is not None):
+            self._buffer = None
+            buffer.truncate(self._buffer_position)
+            self._buffer_position = 0
+            data = buffer.getvalue()
+            buffer.close()
+            return data
+        
         chunks = self._chunks
         data = b''.join(chunks)
         chunks.clear()
@@ -5,7 +5,7 @@ from functools import partial as partial_func
 
 from ...utils import copy_docs, to_coroutine
 
-from ..traps import Future, Task, skip_ready_cycle
+from ..traps import Future, Task, is_within_deadline, skip_ready_cycle
 
 from .abstract import AbstractProtocolBase
 from .payload_stream import PayloadStream
@@ -912,6 +912,8 @@ class ReadProtocolBase(AbstractProtocolBase):
         EofError
             Connection lost before `n` bytes were received.
         """
+        payload_stream.set_expected_size(n)
+        
         try:
             async for chunk in self._read_exactly_by_chunk(n):
                 payload_stream.add_received_chunk(chunk)
@@ -1211,8 +1213,11 @@ class ReadWriteProtocolBase(ReadProtocolBase):
     
     _drain_waiter : ``None | Future``
         A future, what is used to block the writing task, till it's writen data is drained.
+    
+    _writing_paused : `bool`
+        Whether the protocol's respective transport asked it to pause writing. Defaults to `False`.
     """
-    __slots__ = ('_drain_waiter', )
+    __slots__ = ('_drain_waiter', '_writing_paused')
     
     def __new__(cls, loop):
         """
@@ -1226,18 +1231,19 @@ class ReadWriteProtocolBase(ReadProtocolBase):
         self = ReadProtocolBase.__new__(cls, loop)
         
         self._drain_waiter = None
+        self._writing_paused = False
         
         return self
     
     
     @copy_docs(AbstractProtocolBase.pause_writing)
     def pause_writing(self):
-        self._paused = True
+        self._writing_paused = True
     
     
     @copy_docs(AbstractProtocolBase.resume_writing)
     def resume_writing(self):
-        self._paused = False
+        self._writing_paused = False
         
         drain_waiter = self._drain_waiter
         if drain_waiter is None:
@@ -1253,7 +1259,7 @@ class ReadWriteProtocolBase(ReadProtocolBase):
         
         This method is a coroutine.
         """
-        if not self._paused:
+        if not self._writing_paused:
             return
         
         drain_waiter = Future(self._loop)
@@ -1269,7 +1275,7 @@ class ReadWriteProtocolBase(ReadProtocolBase):
             self.set_exception(exception)
         
         # wake up the writer if currently paused.
-        if not self._paused:
+        if not self._writing_paused:
             return
         
         drain_waiter = self._drain_waiter
@@ -1453,7 +1459,8 @@ class DatagramAddressedReadProtocol(AbstractProtocolBase):
         
         if (timeout is not None):
             waiter = Task(self._loop, self.wait_for_receive(address))
-            waiter.apply_timeout(timeout)
+            if is_within_deadline(timeout):
+                waiter.apply_timeout(timeout)
             
             try:
                 result = await waiter
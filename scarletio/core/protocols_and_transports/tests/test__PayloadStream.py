@@ -1,4 +1,6 @@
 from collections import deque as Deque
+from io import BytesIO
+from tracemalloc import get_traced_memory, start as start_tracing_memory, stop as stop_tracing_memory
 
 import vampytest
 
@@ -8,8 +10,8 @@ from ...top_level import get_event_loop
 from ...traps import Future, Task, skip_ready_cycle
 
 from ..payload_stream import (
-    PayloadStream, STREAM_FLAG_DONE_ABORTED, STREAM_FLAG_DONE_CANCELLED, STREAM_FLAG_DONE_EXCEPTION,
-    STREAM_FLAG_DONE_SUCCESS, STREAM_FLAG_WAIT_CHUNK, STREAM_FLAG_WAIT_WHOLE,
+    PREALLOCATION_SIZE_MIN, PayloadStream, STREAM_FLAG_DONE_ABORTED, STREAM_FLAG_DONE_CANCELLED,
+    STREAM_FLAG_DONE_EXCEPTION, STREAM_FLAG_DONE_SUCCESS, STREAM_FLAG_WAIT_CHUNK, STREAM_FLAG_WAIT_WHOLE
 )
 from ..protocol import ReadProtocolBase
 
@@ -35,10 +37,13 @@ def _assert_fields_set(payload_stream):
         The payload stream to check.
     """
     vampytest.assert_instance(payload_stream, PayloadStream)
+    vampytest.assert_instance(payload_stream._buffer, BytesIO, nullable = True)
+    vampytest.assert_instance(payload_stream._buffer_position, int)
     vampytest.assert_instance(payload_stream._chunks, Deque)
     vampytest.assert_instance(payload_stream._done_callbacks, list, nullable = True)
     vampytest.assert_instance(payload_stream._flags, int)
     vampytest.assert_instance(payload_stream._exception, BaseException, nullable = True)
+    vampytest.assert_instance(payload_stream._expected_size, int)
     vampytest.assert_instance(payload_stream._protocol, ReadProtocolBase)
     vampytest.assert_instance(payload_stream._waiter, Future, nullable = True)
 
@@ -652,6 +657,148 @@ async def test__PayloadStream__await():
     vampytest.assert_eq([*payload_stream._chunks], [])
 
 
+async def test__PayloadStream__await__preallocated():
+    """
+    Tests whether ``PayloadStream.__await__`` works as intended.
+    
+    This function is a coroutine.
+    
+    Case: expected size is set and is big enough to preallocate.
+    """
+    loop = get_event_loop()
+    protocol = TestProtocol(loop)
+    chunk_0 = b'a' * (PREALLOCATION_SIZE_MIN >> 1)
+    chunk_1 = b'b' * (PREALLOCATION_SIZE_MIN >> 2)
+    chunk_2 = b'c' * (PREALLOCATION_SIZE_MIN >> 2)
+    
+    payload_stream = PayloadStream(protocol)
+    payload_stream.set_expected_size(PREALLOCATION_SIZE_MIN)
+    
+    payload_stream.add_received_chunk(chunk_0)
+    task = Task(loop, payload_stream.__await__())
+    
+    await skip_ready_cycle()
+    vampytest.assert_false(task.is_done())
+    vampytest.assert_is_not(payload_stream._buffer, None)
+    vampytest.assert_eq([*payload_stream._chunks], [])
+    
+    payload_stream.add_received_chunk(chunk_1)
+    payload_stream.add_received_chunk(chunk_2)
+    vampytest.assert_eq([*payload_stream._chunks], [])
+    vampytest.assert_eq(payload_stream.get_total_size(), PREALLOCATION_SIZE_MIN)
+    
+    payload_stream.set_done_success()
+    
+    await skip_ready_cycle()
+    vampytest.assert_true(task.is_done())
+    
+    result = task.get_result()
+    vampytest.assert_instance(result, bytes)
+    vampytest.assert_eq(result, chunk_0 + chunk_1 + chunk_2)
+    vampytest.assert_is(payload_stream._buffer, None)
+
+
+async def test__PayloadStream__await__preallocated_less():
+    """
+    Tests whether ``PayloadStream.__await__`` works as intended.
+    
+    This function is a coroutine.
+    
+    Case: expected size is set, but less data is received.
+    """
+    loop = get_event_loop()
+    protocol = TestProtocol(loop)
+    chunk_0 = b'a' * (PREALLOCATION_SIZE_MIN >> 1)
+    
+    payload_stream = PayloadStream(protocol)
+    payload_stream.set_expected_size(PREALLOCATION_SIZE_MIN)
+    
+    task = Task(loop, payload_stream.__await__())
+    
+    await skip_ready_cycle()
+    payload_stream.add_received_chunk(chunk_0)
+    payload_stream.set_done_success()
+    
+    await skip_ready_cycle()
+    vampytest.assert_true(task.is_done())
+    
+    result = task.get_result()
+    vampytest.assert_instance(result, bytes)
+    vampytest.assert_eq(result, chunk_0)
+
+
+async def test__PayloadStream__await__preallocated_memory():
+    """
+    Tests whether ``PayloadStream.__await__`` works as intended.
+    
+    Case: the preallocated payload is not held twice.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    protocol = TestProtocol(loop)
+    chunk_size = PREALLOCATION_SIZE_MIN
+    chunk_count = 64
+    chunk = memoryview(b'a' * chunk_size)
+    expected_size = chunk_size * chunk_count
+    
+    payload_stream = PayloadStream(protocol)
+    payload_stream.set_expected_size(expected_size)
+    task = Task(loop, payload_stream.__await__())
+    await skip_ready_cycle()
+    
+    start_tracing_memory()
+    try:
+        for _ in range(chunk_count):
+            payload_stream.add_received_chunk(chunk)
+        
+        payload_stream.set_done_success()
+        await skip_ready_cycle()
+        result = task.get_result()
+        
+        current, peak = get_traced_memory()
+    finally:
+        stop_tracing_memory()
+    
+    vampytest.assert_instance(result, bytes)
+    vampytest.assert_eq(len(result), expected_size)
+    # The buffer was allocated before tracing, so no further allocation of the payload's size is expected.
+    vampytest.assert_true(peak < (expected_size >> 1))
+
+
+async def test__PayloadStream__await__expected_size_small():
+    """
+    Tests whether ``PayloadStream.__await__`` works as intended.
+    
+    This function is a coroutine.
+    
+    Case: expected size is too small to preallocate.
+    """
+    loop = get_event_loop()
+    protocol = TestProtocol(loop)
+    chunk_0 = b'hey'
+    chunk_1 = b'mister'
+    
+    payload_stream = PayloadStream(protocol)
+    payload_stream.set_expected_size(9)
+    
+    task = Task(loop, payload_stream.__await__())
+    
+    await skip_ready_cycle()
+    vampytest.assert_is(payload_stream._buffer, None)
+    
+    payload_stream.add_received_chunk(chunk_0)
+    payload_stream.add_received_chunk(chunk_1)
+    payload_stream.set_done_success()
+    
+    await skip_ready_cycle()
+    vampytest.assert_true(task.is_done())
+    
+    result = task.get_result()
+    vampytest.assert_instance(result, bytes)
+    vampytest.assert_eq(result, b'heymister')
+
+
 async def test__PayloadStream__await__abort():
     """
     Tests whether ``PayloadStream.__await__`` works as intended.
@@ -10,7 +10,7 @@ from ...top_level import get_event_loop
 from ...traps import Task, skip_ready_cycle
 
 from ..abstract import AbstractTransportLayerBase
-from ..payload_stream import PayloadStream
+from ..payload_stream import PREALLOCATION_SIZE_MIN, PayloadStream
 from ..protocol import ReadProtocolBase
 from ..transport_layer import SocketTransportLayerBase
 
@@ -861,6 +861,38 @@ async def test__ReadProtocolBase__read_exactly__exact_amount():
     vampytest.assert_eq(protocol._offset, 0)
 
 
+async def test__ReadProtocolBase__read_exactly__preallocated():
+    """
+    Tests whether ``ReadProtocolBase.read_exactly`` works as intended.
+    
+    This function is a coroutine.
+    
+    Case: big enough to preallocate.
+    """
+    loop = get_event_loop()
+    chunk_size = PREALLOCATION_SIZE_MIN >> 1
+    
+    protocol = ReadProtocolBase(loop)
+    
+    protocol.data_received(b'a' * chunk_size)
+    
+    task = Task(loop, protocol.read_exactly(chunk_size * 3))
+    await skip_ready_cycle()
+    vampytest.assert_false(task.is_done())
+    
+    protocol.data_received(b'b' * chunk_size)
+    protocol.data_received(b'c' * (chunk_size + 3))
+    await skip_ready_cycle()
+    vampytest.assert_true(task.is_done())
+    
+    result = task.get_result()
+    vampytest.assert_instance(result, bytes)
+    vampytest.assert_eq(result, b'a' * chunk_size + b'b' * chunk_size + b'c' * chunk_size)
+    
+    vampytest.assert_eq(len(protocol._chunks), 1)
+    vampytest.assert_eq(protocol._offset, chunk_size)
+
+
 async def test__ReadProtocolBase__read_exactly__eof():
     """
     Tests whether ``ReadProtocolBase.read_exactly`` works as intended.
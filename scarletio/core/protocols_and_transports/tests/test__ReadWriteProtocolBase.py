@@ -0,0 +1,62 @@
+import vampytest
+
+from ...top_level import get_event_loop
+from ...traps import Future, Task, skip_ready_cycle
+
+from ..protocol import ReadWriteProtocolBase
+
+
+def _assert_fields_set(protocol):
+    """
+    Asserts whether every fields of the given protocol.
+    
+    Parameters
+    ----------
+    protocol : ``ReadWriteProtocolBase``
+        The protocol to test.
+    """
+    vampytest.assert_instance(protocol, ReadWriteProtocolBase)
+    vampytest.assert_instance(protocol._drain_waiter, Future, nullable = True)
+    vampytest.assert_instance(protocol._writing_paused, bool)
+
+
+async def test__ReadWriteProtocolBase__new():
+    """
+    Tests whether ``ReadWriteProtocolBase.__new__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    
+    protocol = ReadWriteProtocolBase(loop)
+    _assert_fields_set(protocol)
+    
+    vampytest.assert_is(protocol._loop, loop)
+    vampytest.assert_false(protocol._writing_paused)
+
+
+async def test__ReadWriteProtocolBase__drain():
+    """
+    Tests whether ``ReadWriteProtocolBase.drain`` works as intended.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    
+    protocol = ReadWriteProtocolBase(loop)
+    
+    # Paused reading should not block writing.
+    protocol._paused = True
+    await protocol.drain()
+    
+    protocol.pause_writing()
+    task = Task(loop, protocol.drain())
+    await skip_ready_cycle()
+    vampytest.assert_false(task.is_done())
+    
+    protocol.resume_writing()
+    await skip_ready_cycle()
+    vampytest.assert_true(task.is_done())
+    
+    # Resuming writing should not resume reading.
+    vampytest.assert_true(protocol._paused)
@@ -0,0 +1,68 @@
+from socket import socketpair as create_socket_pair
+
+import vampytest
+
+from ...top_level import get_event_loop
+from ...traps import skip_ready_cycle
+
+from ..protocol import ReadProtocolBase
+from ..transport_layer import SocketTransportLayer
+
+
+async def test__SocketTransportLayer__writelines():
+    """
+    Tests whether ``SocketTransportLayer.writelines`` works as intended.
+    
+    This function is a coroutine.
+    """
+    read_socket, write_socket = create_socket_pair()
+    loop = get_event_loop()
+    
+    protocol = ReadProtocolBase(loop)
+    transport = None
+    
+    try:
+        transport = SocketTransportLayer(loop, None, write_socket, protocol, None, None)
+        await skip_ready_cycle()
+        
+        transport.writelines([b'hey', b'', bytearray(b' mister'), memoryview(b' sister')])
+        vampytest.assert_eq(transport.get_write_buffer_size(), 0)
+        
+        read_socket.setblocking(False)
+        vampytest.assert_eq(read_socket.recv(100), b'hey mister sister')
+    
+    finally:
+        if (transport is not None):
+            transport.abort()
+        
+        read_socket.close()
+        write_socket.close()
+
+
+async def test__SocketTransportLayer__writelines__type_error():
+    """
+    Tests whether ``SocketTransportLayer.writelines`` works as intended.
+    
+    Case: type error.
+    
+    This function is a coroutine.
+    """
+    read_socket, write_socket = create_socket_pair()
+    loop = get_event_loop()
+    
+    protocol = ReadProtocolBase(loop)
+    transport = None
+    
+    try:
+        transport = SocketTransportLayer(loop, None, write_socket, protocol, None, None)
+        await skip_ready_cycle()
+        
+        with vampytest.assert_raises(TypeError):
+            transport.writelines([b'hey', 'mister'])
+    
+    finally:
+        if (transport is not None):
+            transport.abort()
+        
+        read_socket.close()
+        write_socket.close()
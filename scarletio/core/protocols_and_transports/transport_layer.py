@@ -629,7 +629,73 @@ class SocketTransportLayer(SocketTransportLayerBase):
         buffer.append(data)
         self._maybe_pause_protocol()
     
-    # `.writelines` same as `SocketTransportLayerBase`'s.
+    @copy_docs(SocketTransportLayerBase.writelines)
+    def writelines(self, lines):
+        if MAX_SENT_MESSAGES <= 0:
+            self.write(b''.join(lines))
+            return
+        
+        collected = []
+        for data in lines:
+            if not isinstance(data, (bytes, bytearray, memoryview)):
+                raise TypeError(
+                    f'`lines` can contain `bytes-like`, got {type(data).__name__}; {reprlib.repr(data)}.'
+                )
+            
+            if data:
+                collected.append(data)
+        
+        if self._at_eof:
+            raise RuntimeError(
+                f'Cannot call `.writelines` after `.write_eof`; self = {self!r}.'
+            )
+        
+        if not collected:
+            return
+        
+        if self._connection_lost:
+            return
+        
+        buffer = self._buffer
+        if not buffer:
+            # Optimization: try to send all now with a single system call.
+            try:
+                bytes_sent = self._socket.sendmsg(
+                    collected if len(collected) <= MAX_SENT_MESSAGES else collected[:MAX_SENT_MESSAGES]
+                )
+            except (BlockingIOError, InterruptedError):
+                pass
+            
+            except BaseException as err:
+                self._fatal_error(err, 'Fatal write error on socket transport')
+                return
+            
+            else:
+                index = 0
+                length = len(collected)
+                while index < length:
+                    data_length = len(collected[index])
+                    if data_length > bytes_sent:
+                        break
+                    
+                    bytes_sent -= data_length
+                    index += 1
+                
+                if index == length:
+                    return
+                
+                if bytes_sent:
+                    collected[index] = memoryview(collected[index])[bytes_sent:]
+                
+                del collected[:index]
+            
+            # Not all was written; register write handler.
+            self._loop.add_writer(self._file_descriptor, self._write_ready)
+        
+        # Add them to the buffer.
+        buffer.extend(collected)
+        self._maybe_pause_protocol()
+    
     
     @copy_docs(SocketTransportLayerBase.write_eof)
     def write_eof(self):
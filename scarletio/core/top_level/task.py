@@ -31,7 +31,7 @@ def create_future(loop = None):
     return future
 
 
-def create_task(coroutine, loop = None):
+def create_task(coroutine, loop = None, *, context = ..., eager = False):
     """
     Creates a task on the local event loop.
     
@@ -41,6 +41,11 @@ def create_task(coroutine, loop = None):
         The coroutine to create task from.
     loop : `None`, ``EventThread`` = `None`, Optional
         The event loop to schedule the created task on.
+    context : `None | Context`, Optional (Keyword only)
+        The context in what the coroutine is stepped. Defaults to a copy of the current context.
+        Pass it as `None` to run the task without entering a context.
+    eager : `bool` = `False`, Optional (Keyword only)
+        Whether the first step of the coroutine should run instantly if called from the event loop's thread.
     
     Returns
     -------
@@ -52,7 +57,7 @@ def create_task(coroutine, loop = None):
         There are are no detectable event loops.
     """
     loop, is_current_thread = _get_event_loop_is_current_thread(loop)
-    task = Task(loop, coroutine)
+    task = Task(loop, coroutine, context = context, eager = eager)
     if (not is_current_thread):
         loop.wake_up()
     
@@ -389,6 +389,7 @@ def write_exception_maybe_async(
 _DEFAULT_TRACE_WRITER_HIGHLIGHTER = None
 
 
+@export
 def get_default_trace_writer_highlighter():
     """
     Returns the default highlighter for trace writer functions.
@@ -1,4 +1,5 @@
 from .async_executing import *
+from .cancel_scope import *
 from .event import *
 from .future import *
 from .future_chaining import *
@@ -14,10 +15,13 @@ from .task_group import *
 from .task_suppression import *
 from .task_thread_switcher import *
 from .timeouting import *
+from .token_bucket import *
+from .work_queues import *
 
 
 __all__ = (
     *async_executing.__all__,
+    *cancel_scope.__all__,
     *event.__all__,
     *future.__all__,
     *future_chaining.__all__,
@@ -33,4 +37,6 @@ __all__ = (
     *task_suppression.__all__,
     *task_thread_switcher.__all__,
     *timeouting.__all__,
+    *token_bucket.__all__,
+    *work_queues.__all__,
 )
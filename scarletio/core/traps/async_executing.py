@@ -1,5 +1,6 @@
-__all__ = ('ScarletExecutor',)
+__all__ = ('ScarletExecutor', 'async_map',)
 
+from collections import deque
 from threading import current_thread
 from types import MethodType
 
@@ -8,6 +9,7 @@ from ...utils import WeakReferer, ignore_frame, include
 from ..exceptions import CancelledError
 
 from .future import Future
+from .task_group import TaskGroup
 
 
 ignore_frame(__spec__.origin, 'get_result', 'raise exception',)
@@ -422,3 +424,201 @@ class ScarletExecutor:
         repr_parts.append('>')
         
         return ''.join(repr_parts)
+
+
+def async_map(function, iterable, concurrency = 10, *, buffer_size = None, ordered = True, timeout = None):
+    """
+    Calls the given coroutine function on the elements of the given iterable with limited concurrency and yields the
+    results.
+    
+    New tasks are only started while the results are consumed, so even an endless iterable creates at most
+    `concurrency` tasks at the same time. If any of the tasks raises, or the iteration is stopped, the running tasks
+    are cancelled.
+    
+    Should be used, like:
+    
+    ```py
+    async for response in async_map(http_client.get, urls, 8):
+        ...
+    ```
+    
+    Parameters
+    ----------
+    function : `async-callable`
+        Coroutine function to call with each element.
+    
+    iterable : `iterable`, `async-iterable`
+        The elements to call the function with.
+    
+    concurrency : `int` = `10`, Optional
+        The maximal amount of tasks running at the same time.
+    
+    buffer_size : `None | int` = `None`, Optional (Keyword only)
+        The maximal amount of started, but not yet yielded elements when `ordered`. When the first element in order
+        takes long, the finished ones behind it are kept till this limit is reached.
+        Cannot be less than `concurrency`. Defaults to `concurrency * 2`.
+    
+    ordered : `bool` = `True`, Optional (Keyword only)
+        Whether the results should be yielded in the order of the elements. If `False` they are yielded as completed.
+    
+    timeout : `None | float` = `None`, Optional (Keyword only)
+        Timeout for each element. On timeout ``TimeoutError`` is raised.
+    
+    Returns
+    -------
+    results : `async-generator`
+    
+    Raises
+    ------
+    TypeError
+        - If a parameter's type is incorrect.
+    ValueError
+        - If a parameter's value is incorrect.
+    """
+    if not callable(function):
+        raise TypeError(
+            f'`function` can be `callable`, got {type(function).__name__}; {function!r}.'
+        )
+    
+    if not isinstance(concurrency, int):
+        raise TypeError(
+            f'`concurrency` can be `int`, got {type(concurrency).__name__}; {concurrency!r}.'
+        )
+    
+    if concurrency < 1:
+        raise ValueError(
+            f'`concurrency` can only be positive, got {concurrency!r}.'
+        )
+    
+    if buffer_size is None:
+        buffer_size = concurrency << 1
+    
+    else:
+        if not isinstance(buffer_size, int):
+            raise TypeError(
+                f'`buffer_size` can be `None`, `int`, got {type(buffer_size).__name__}; {buffer_size!r}.'
+            )
+        
+        if buffer_size < concurrency:
+            raise ValueError(
+                f'`buffer_size` cannot be less than `concurrency`, got buffer_size = {buffer_size!r}; '
+                f'concurrency = {concurrency!r}.'
+            )
+    
+    if (timeout is not None):
+        if not isinstance(timeout, (int, float)):
+            raise TypeError(
+                f'`timeout` can be `None`, `float`, got {type(timeout).__name__}; {timeout!r}.'
+            )
+        
+        if timeout <= 0.0:
+            raise ValueError(
+                f'`timeout` can only be positive, got {timeout!r}.'
+            )
+    
+    return _async_map(function, iterable, concurrency, buffer_size, ordered, timeout)
+
+
+async def _async_map(function, iterable, concurrency, buffer_size, ordered, timeout):
+    """
+    Async generator used by ``async_map``.
+    
+    This function is an async generator.
+    
+    Parameters
+    ----------
+    function : `async-callable`
+        Coroutine function to call with each element.
+    
+    iterable : `iterable`, `async-iterable`
+        The elements to call the function with.
+    
+    concurrency : `int`
+        The maximal amount of tasks running at the same time.
+    
+    buffer_size : `int`
+        The maximal amount of started, but not yet yielded elements when `ordered`.
+    
+    ordered : `bool`
+        Whether the results should be yielded in the order of the elements.
+    
+    timeout : `None | float`
+        Timeout for each element.
+    
+    Yields
+    ------
+    result : `object`
+    
+    Raises
+    ------
+    RuntimeError
+        Called from outside of an ``EventThread``.
+    """
+    loop = current_thread()
+    if not isinstance(loop, EventThread):
+        raise RuntimeError(
+            f'`async_map` used at non `{EventThread.__name__}`, at {loop!r}.'
+        )
+    
+    if hasattr(type(iterable), '__aiter__'):
+        iterator = iterable.__aiter__()
+        is_async = True
+    else:
+        iterator = iter(iterable)
+        is_async = False
+    
+    task_group = TaskGroup(loop)
+    pending = task_group.pending
+    done = task_group.done
+    started = deque()
+    exhausted = False
+    
+    try:
+        while True:
+            while (not exhausted) and (len(pending) < concurrency) and ((not ordered) or (len(started) < buffer_size)):
+                if is_async:
+                    try:
+                        element = await iterator.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                
+                else:
+                    try:
+                        element = next(iterator)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                
+                task = task_group.create_task(function(element))
+                if (timeout is not None):
+                    task.apply_timeout(timeout)
+                
+                if ordered:
+                    started.append(task)
+            
+            if ordered:
+                if not started:
+                    break
+                
+                # Check `done` instead of the task itself, since the task might be already done, but not yet added to
+                # `done` by its callback, which would add it later, never removing it.
+                task = started[0]
+                if task in done:
+                    started.popleft()
+                    done.remove(task)
+                    yield task.get_result()
+                    continue
+            
+            else:
+                if done:
+                    yield done.pop().get_result()
+                    continue
+                
+                if not pending:
+                    break
+            
+            await task_group.wait_next()
+    
+    finally:
+        task_group.cancel_all()
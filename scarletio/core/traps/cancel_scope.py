@@ -0,0 +1,314 @@
+__all__ = ('CancelScope', 'get_deadline', 'is_within_deadline')
+
+from threading import current_thread
+
+from ...utils import include
+
+from ..exceptions import CancelledError
+from ..time import LOOP_TIME
+
+
+EventThread = include('EventThread')
+
+
+class CancelScope:
+    """
+    Deadline of the code executed within its context. When the deadline passes, cancels the task, which entered the
+    scope and the child tasks created by ``TaskGroup.create_task`` inside of it. When the cancellation reaches the
+    context manager, raises `TimeoutError` instead.
+    
+    The scope is carried by the current ``Task``, so the nested scopes and the child tasks inherit its deadline.
+    A nested scope only schedules a timer handle if its deadline is earlier than the inherited one, so the code within
+    an outer deadline can use any amount of scopes without scheduling further timers.
+    
+    Usage
+    -----
+    ```py
+    try:
+        with CancelScope(loop, 10.0):
+            await my_task(...)
+    except TimeoutError:
+        # my_task(...) did not complete within timeout.
+    ```
+    
+    Attributes
+    ----------
+    _governing_scope : `None | CancelScope`
+        The scope, whose timer handle applies the deadline. Either the scope itself or one of its parents.
+    
+    _handle : `None | TimerHandle`
+        Timer handle to cancel the scope's tasks when the deadline passes. Only set if the scope is governing.
+    
+    _loop : ``EventThread``
+        The event loop to what the scope is bound to.
+    
+    _task : `None | Task`
+        The task, which entered the scope. Set as `None` when the scope is exited.
+    
+    _tasks : `None | set<Task>`
+        The child tasks to cancel with the scope's task.
+    
+    _timed_out : `bool`
+        Whether the deadline passed.
+    
+    deadline : `None | float`
+        The scope's deadline in loop time. After entered, the earlier one of its own and the inherited one.
+    
+    parent : `None | CancelScope`
+        The scope inherited by the task when entering.
+    """
+    __slots__ = ('_governing_scope', '_handle', '_loop', '_task', '_tasks', '_timed_out', 'deadline', 'parent')
+    
+    def __new__(cls, loop, timeout = None):
+        """
+        Creates a new cancel scope bound to the given loop.
+        
+        The timeout starts when the scope is created.
+        
+        Parameters
+        ----------
+        loop : ``EventThread``
+            The event loop to what the scope will be bound to.
+        
+        timeout : `None | float` = `None`, Optional
+            Time in seconds after the scope's tasks are cancelled. If `None`, the scope only inherits the deadline.
+        """
+        if timeout is None:
+            deadline = None
+        else:
+            deadline = LOOP_TIME() + timeout
+        
+        self = object.__new__(cls)
+        self._governing_scope = None
+        self._handle = None
+        self._loop = loop
+        self._task = None
+        self._tasks = None
+        self._timed_out = False
+        self.deadline = deadline
+        self.parent = None
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the cancel scope's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        deadline = self.deadline
+        if deadline is None:
+            repr_parts.append(' no deadline')
+        else:
+            repr_parts.append(' remaining = ')
+            repr_parts.append(format(deadline - LOOP_TIME(), '.3f'))
+        
+        if self._timed_out:
+            repr_parts.append(', timed out')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __enter__(self):
+        """
+        Enters the cancel scope as a context manager.
+        
+        Returns
+        -------
+        self : `instance<cls>`
+        
+        Raises
+        ------
+        RuntimeError
+            - Entered outside of a ``Task``.
+            - Already entered.
+        """
+        task = self._loop.current_task
+        if (task is None):
+            raise RuntimeError(
+                f'`{type(self).__name__}` entered outside of a `Task`!'
+            )
+        
+        if (self._task is not None):
+            raise RuntimeError(
+                f'`{type(self).__name__}` already entered.'
+            )
+        
+        parent = task.cancel_scope
+        if (parent is not None) and (parent._task is None):
+            parent = None
+        
+        self.parent = parent
+        self._task = task
+        task.cancel_scope = self
+        
+        deadline = self.deadline
+        if (parent is not None):
+            parent_deadline = parent.deadline
+            if (parent_deadline is not None) and ((deadline is None) or (parent_deadline <= deadline)):
+                self.deadline = parent_deadline
+                self._governing_scope = parent._governing_scope
+                return self
+        
+        if (deadline is not None):
+            self._governing_scope = self
+            self._handle = self._loop.call_at(deadline, self._timeout)
+        
+        return self
+    
+    
+    def __exit__(self, exception_type, exception_value, exception_traceback):
+        """
+        Exits the cancel scope. If its deadline passed, raises ``TimeoutError`` from the received cancellation.
+        """
+        handle = self._handle
+        if (handle is not None):
+            self._handle = None
+            handle.cancel()
+        
+        task = self._task
+        if (task is not None):
+            self._task = None
+            task.cancel_scope = self.parent
+        
+        self._tasks = None
+        
+        if self._timed_out and (exception_type is not None) and issubclass(exception_type, CancelledError):
+            raise TimeoutError from None
+        
+        return False
+    
+    
+    def get_remaining(self):
+        """
+        Returns the time remaining till the scope's deadline.
+        
+        Returns
+        -------
+        remaining : `None | float`
+            Returns `None` if the scope has no deadline.
+        """
+        deadline = self.deadline
+        if deadline is None:
+            return None
+        
+        return max(deadline - LOOP_TIME(), 0.0)
+    
+    
+    def is_timed_out(self):
+        """
+        Returns whether the scope's deadline passed.
+        
+        Returns
+        -------
+        is_timed_out : `bool`
+        """
+        governing_scope = self._governing_scope
+        if governing_scope is None:
+            return False
+        
+        return governing_scope._timed_out
+    
+    
+    def _timeout(self):
+        """
+        Cancels the scope's task and the child tasks.
+        """
+        self._handle = None
+        self._timed_out = True
+        
+        task = self._task
+        if (task is not None):
+            task.cancel()
+        
+        tasks = self._tasks
+        if (tasks is not None):
+            self._tasks = None
+            for task in tasks:
+                task.cancel()
+    
+    
+    def _inherit(self, task):
+        """
+        Makes the given child task inherit the scope.
+        
+        Parameters
+        ----------
+        task : ``Task``
+            The child task.
+        """
+        task.cancel_scope = self
+        
+        governing_scope = self._governing_scope
+        if governing_scope is None:
+            return
+        
+        if governing_scope._timed_out:
+            task.cancel()
+            return
+        
+        tasks = governing_scope._tasks
+        if tasks is None:
+            tasks = set()
+            governing_scope._tasks = tasks
+        
+        tasks.add(task)
+        task.add_done_callback(governing_scope._discard_task)
+    
+    
+    def _discard_task(self, task):
+        """
+        Removes the given child task from the scope. Added as a done callback to the child tasks.
+        
+        Parameters
+        ----------
+        task : ``Task``
+            The finished child task.
+        """
+        tasks = self._tasks
+        if (tasks is not None):
+            tasks.discard(task)
+
+
+def get_deadline():
+    """
+    Returns the deadline of the current task's cancel scope.
+    
+    Returns
+    -------
+    deadline : `None | float`
+        Returns `None` if not called from a task or if the task has no deadline.
+    """
+    thread = current_thread()
+    if not isinstance(thread, EventThread):
+        return None
+    
+    task = thread.current_task
+    if task is None:
+        return None
+    
+    cancel_scope = task.cancel_scope
+    if (cancel_scope is None) or (cancel_scope._task is None):
+        return None
+    
+    return cancel_scope.deadline
+
+
+def is_within_deadline(timeout):
+    """
+    Returns whether the given timeout expires before the current task's deadline. If it does not, arming a separate
+    timer for it is unnecessary, because the cancel scope cancels the task earlier.
+    
+    Parameters
+    ----------
+    timeout : `float`
+        The timeout to check.
+    
+    Returns
+    -------
+    is_within_deadline : `bool`
+    """
+    deadline = get_deadline()
+    if deadline is None:
+        return True
+    
+    return LOOP_TIME() + timeout < deadline
@@ -34,12 +34,14 @@ class Lock:
     
     Attributes
     ----------
+    _acquired : `int`
+        How much times the lock is acquired currently.
     _loop : ``EventThread``
         The event loop to what the lock is bound to.
     _waiters : `deque` of ``Future``
-        Futures on which the suspended tasks wait.
+        Futures on which the suspended tasks wait. Only created when the lock is contended.
     """
-    __slots__ = ('_loop', '_waiters', )
+    __slots__ = ('_acquired', '_loop', '_waiters', )
     
     def __new__(cls, loop):
         """
@@ -49,6 +51,7 @@ class Lock:
             The event loop to what the lock will be bound to.
         """
         self = object.__new__(cls)
+        self._acquired = 0
         self._loop = loop
         self._waiters = deque()
         return self
@@ -60,21 +63,17 @@ class Lock:
         
         This method is a coroutine.
         """
-        future = Future(self._loop)
-        waiters = self._waiters
-        waiters.appendleft(future)
+        if (not self._acquired) and (not self._waiters):
+            self._acquired = 1
+            return
         
-        if len(waiters) > 1:
-            waiter = waiters[1]
-            try:
-                await waiter
-            except:
-                try:
-                    waiters.remove(waiter)
-                except ValueError:
-                    pass
-                
-                raise
+        future = Future(self._loop)
+        self._waiters.append(future)
+        try:
+            await future
+        except:
+            self._abandon_waiter(future)
+            raise
     
     
     async def __aexit__(self, exception_type, exception_value, exception_traceback):
@@ -83,11 +82,31 @@ class Lock:
         
         This method is a coroutine.
         """
-        future = self._waiters.pop()
-        future.set_result_if_pending(None)
+        self.release()
         return False
     
     
+    def _abandon_waiter(self, future):
+        """
+        Called when a task stops waiting on the given future because of an exception (like cancellation).
+        
+        If the lock was already handed over to the future, passes it to the next waiter, else removes the future.
+        
+        Parameters
+        ----------
+        future : ``Future``
+            The abandoned future.
+        """
+        if future.is_done() and (not future.is_cancelled()):
+            self.release()
+            return
+        
+        try:
+            self._waiters.remove(future)
+        except ValueError:
+            pass
+    
+    
     def is_locked(self):
         """
         Returns whether the lock is entered anywhere.
@@ -96,7 +115,7 @@ class Lock:
         -------
         is_locked: `bool`
         """
-        if self._waiters:
+        if self._acquired:
             return True
         
         return False
@@ -109,18 +128,43 @@ class Lock:
         
         This method is a generator. Should be used with `await` expression.
         """
-        waiters = self._waiters
-        while waiters:
-            yield from waiters[0]
+        while self._acquired:
+            future = Future(self._loop)
+            self._waiters.append(future)
+            try:
+                yield from future
+            except:
+                self._abandon_waiter(future)
+                raise
+            
+            self.release()
     
     __await__ = __iter__
     
     acquire = __aenter__
     
     def release(self):
-        """Releases the lock."""
-        future = self._waiters.pop()
-        future.set_result_if_pending(None)
+        """
+        Releases the lock.
+        
+        If there are tasks waiting on the lock, it is handed over to the first one without being released.
+        
+        Raises
+        ------
+        RuntimeError
+            - If the lock is not acquired.
+        """
+        if not self._acquired:
+            raise RuntimeError(
+                f'Cannot release a not acquired lock; self = {self!r}.'
+            )
+        
+        waiters = self._waiters
+        while waiters:
+            if waiters.popleft().set_result_if_pending(None):
+                return
+        
+        self._acquired -= 1
     
     
     def __repr__(self):
@@ -131,10 +175,13 @@ class Lock:
             ' locked = ',
         ]
         
-        count = len(self._waiters)
-        if count:
-            repr_parts.append('True, waiting = ')
-            repr_parts.append(repr(count))
+        if self._acquired:
+            repr_parts.append('True')
+            
+            count = len(self._waiters)
+            if count:
+                repr_parts.append(', waiting = ')
+                repr_parts.append(repr(count))
         else:
             repr_parts.append('False')
         
@@ -151,10 +198,12 @@ class ScarletLock(Lock):
     
     Attributes
     ----------
+    _acquired : `int`
+        How much times the lock is acquired currently.
     _loop : ``EventThread``
         The event loop to what the lock is bound to.
     _waiters : `deque` of ``Future``
-        Futures on which the suspended tasks wait.
+        Futures on which the suspended tasks wait. Only created when the lock is contended.
     _size : `int`
         The maximal amount of parallel entries to this lock.
     """
@@ -192,6 +241,7 @@ class ScarletLock(Lock):
             )
         
         self = object.__new__(cls)
+        self._acquired = 0
         self._loop = loop
         self._waiters = deque()
         self._size = size
@@ -204,22 +254,18 @@ class ScarletLock(Lock):
         
         This method is a coroutine.
         """
-        future = Future(self._loop)
-        waiters = self._waiters
-        waiters.appendleft(future)
+        acquired = self._acquired
+        if (acquired < self._size) and (not self._waiters):
+            self._acquired = acquired + 1
+            return
         
-        size = self._size
-        if len(waiters) > size:
-            waiter = waiters[size]
-            try:
-                await waiter
-            except:
-                try:
-                    waiters.remove(waiter)
-                except ValueError:
-                    pass
-                
-                raise
+        future = Future(self._loop)
+        self._waiters.append(future)
+        try:
+            await future
+        except:
+            self._abandon_waiter(future)
+            raise
     
     acquire = __aenter__
     
@@ -242,12 +288,7 @@ class ScarletLock(Lock):
         --------
         acquired : `int`
         """
-        waiter_count = len(self._waiters)
-        size = self._size
-        if waiter_count > size:
-            waiter_count = size
-        
-        return waiter_count
+        return self._acquired
     
     
     def get_waiting(self):
@@ -258,14 +299,7 @@ class ScarletLock(Lock):
         --------
         waiting : `int`
         """
-        waiter_count = len(self._waiters)
-        size = self._size
-        if waiter_count > size:
-            waiting = waiter_count - size
-        else:
-            waiting = 0
-        
-        return waiting
+        return len(self._waiters)
     
     # returns True if the Lock is entered anywhere
     def is_locked(self):
@@ -276,7 +310,7 @@ class ScarletLock(Lock):
         -------
         is_locked: `bool`
         """
-        if len(self._waiters) >= self._size:
+        if self._acquired >= self._size:
             return True
         
         return False
@@ -294,12 +328,12 @@ class ScarletLock(Lock):
         repr_parts.append(repr(size))
         
         repr_parts.append(', locked = ')
-        count = len(self._waiters)
-        if count >= size:
+        if self._acquired >= size:
             repr_parts.append('True')
         else:
             repr_parts.append('False')
         
+        count = len(self._waiters)
         if count:
             repr_parts.append(', waiting = ')
             repr_parts.append(repr(count))
@@ -4,6 +4,12 @@ import sys
 from threading import current_thread
 from types import AsyncGeneratorType as CoroutineGeneratorType, CoroutineType, GeneratorType
 
+try:
+    from contextvars import copy_context
+except ImportError:
+    # python 3.6 case
+    copy_context = None
+
 from ...utils import (
     DEFAULT_ANSI_HIGHLIGHTER, HIGHLIGHT_TOKEN_TYPES, alchemy_incendiary, copy_docs, export, get_highlight_streamer,
     ignore_frame, include
@@ -29,6 +35,8 @@ ignore_frame(__spec__.origin, 'get_result', 'raise self._result')
 ignore_frame(__spec__.origin, '__iter__', 'yield self')
 ignore_frame(__spec__.origin, '_step', 'result = self._coroutine.throw(CancelledError())')
 ignore_frame(__spec__.origin, '_step', 'result = self._coroutine.send(None)')
+ignore_frame(__spec__.origin, '_step', 'result = context.run(self._coroutine.throw, CancelledError())')
+ignore_frame(__spec__.origin, '_step', 'result = context.run(self._coroutine.send, None)')
 
 EventThread = include('EventThread')
 
@@ -54,6 +62,9 @@ class Task(Future):
         Note, if the task is already done, then the newly added callbacks are queued up instantly on the respective
         event loop to be called.
     
+    _context : `None | Context`
+        The context in what the coroutine is stepped. `None` if the task runs without entering a context.
+    
     _coroutine : `CoroutineType`, `GeneratorType`
         The wrapped coroutine.
     
@@ -68,10 +79,13 @@ class Task(Future):
     
     _waited_future : ``None | Future``
         The future on what's result the future is waiting right now.
+    
+    cancel_scope : ``None | CancelScope``
+        The innermost cancel scope entered by the task or inherited from its parent task.
     """
-    __slots__ = ('_coroutine', '_waited_future')
+    __slots__ = ('_context', '_coroutine', '_waited_future', 'cancel_scope')
     
-    def __new__(cls, loop, coroutine):
+    def __new__(cls, loop, coroutine, *, context = ..., eager = False):
         """
         Creates a new ``Task`` object running the given coroutine on the given event loop.
         
@@ -82,17 +96,36 @@ class Task(Future):
         
         coroutine : `CoroutineType`, `GeneratorType`
             The coroutine, what the task will on the respective event loop.
+        
+        context : `None | Context`, Optional (Keyword only)
+            The context in what the coroutine is stepped. Defaults to a copy of the current context, so context
+            variables set inside of the task do not leak out of it.
+            Pass it as `None` to run the task without entering a context, saving the overhead of it.
+            On python 3.6 context variables are not supported, so defaults to `None`.
+        
+        eager : `bool` = `False`, Optional (Keyword only)
+            Whether the first step of the coroutine should run instantly instead of being scheduled.
+            A coroutine finishing without suspending is done when the task is returned.
+            Applies only when called from the event loop's thread.
         """
+        if context is ...:
+            context = None if copy_context is None else copy_context()
+        
         self = object.__new__(cls)
         self._blocking = False
         self._callbacks = []
+        self._context = context
         self._coroutine = coroutine
         self._loop = loop
         self._result = None
         self._state = 0
         self._waited_future = None
+        self.cancel_scope = None
         
-        loop.call_soon(self._step)
+        if eager and (current_thread() is loop):
+            self._step_eager()
+        else:
+            loop.call_soon(self._step)
         
         return self
     
@@ -271,14 +304,22 @@ class Task(Future):
         
         try:
             # Call either coroutine.throw(err) or coroutine.send(None).
+            context = self._context
             if state & FUTURE_STATE_CANCELLING_SELF:
                 state &= ~FUTURE_STATE_CANCELLING_SELF
                 self._state = state
                 
-                result = self._coroutine.throw(CancelledError())
-            else:
+                if context is None:
+                    result = self._coroutine.throw(CancelledError())
+                else:
+                    result = context.run(self._coroutine.throw, CancelledError())
+            
+            elif context is None:
                 result = self._coroutine.send(None)
             
+            else:
+                result = context.run(self._coroutine.send, None)
+        
         except StopIteration as retrieved_exception:
             # Cancellation has higher priority than result
             state = self._state
@@ -331,6 +372,20 @@ class Task(Future):
             self = None # Need to set `self` as `None`. Else `self` might never get garbage collected.
     
     
+    def _step_eager(self):
+        """
+        Does the first step of the task instantly. Restores the current task of the event loop afterwards, since it
+        might be called from an other task.
+        """
+        loop = self._loop
+        current_task = loop.current_task
+        try:
+            self._step()
+        finally:
+            loop.current_task = current_task
+            self = None
+    
+    
     def _wake_up(self, future):
         """
         Callback used by ``._step`` when the wrapped coroutine waits on a future to be marked as done.
@@ -1,5 +1,7 @@
 __all__ = ('TaskGroup',)
 
+from threading import current_thread
+
 from ...utils import RichAttributeErrorBaseType
 
 from .future import Future
@@ -643,6 +645,10 @@ class TaskGroup(RichAttributeErrorBaseType):
         -------
         task : ``Task``
         
+        Notes
+        -----
+        If called from a task with a cancel scope, the created task inherits it.
+        
         Examples
         --------
         ```py3
@@ -654,7 +660,16 @@ class TaskGroup(RichAttributeErrorBaseType):
         task_group = TaskGroup(loop, [Task(loop, coro(11))])
         ```
         """
-        task = Task(self.loop, coroutine)
+        loop = self.loop
+        task = Task(loop, coroutine)
+        
+        if current_thread() is loop:
+            current_task = loop.current_task
+            if (current_task is not None):
+                cancel_scope = current_task.cancel_scope
+                if (cancel_scope is not None) and (cancel_scope._task is not None):
+                    cancel_scope._inherit(task)
+        
         task.add_done_callback(self._waited_done_callback)
         self.pending.add(task)
         return task
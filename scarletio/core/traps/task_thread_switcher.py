@@ -146,6 +146,7 @@ class enter_executor:
         # Set result to the enter task, so it can be retrieved.
         self._enter_future.set_result(None)
         
+        context = task._context
         coroutine = task._coroutine
         
         # If some1 await at the block, we will sync_wrap it. If the exit future is awaited, then we quit.
@@ -175,9 +176,16 @@ class enter_executor:
                 try:
                     # Call either coroutine.throw(err) or coroutine.send(None).
                     if task._state & FUTURE_STATE_CANCELLING_SELF:
-                        result = coroutine.throw(CancelledError())
-                    else:
+                        if context is None:
+                            result = coroutine.throw(CancelledError())
+                        else:
+                            result = context.run(coroutine.throw, CancelledError())
+                    
+                    elif context is None:
                         result = coroutine.send(None)
+                    
+                    else:
+                        result = context.run(coroutine.send, None)
                 
                 except StopIteration as retrieved_exception:
                     state = task._state
@@ -0,0 +1,58 @@
+import vampytest
+
+from ...top_level import get_event_loop
+
+from ..task import Task
+from ..task_suppression import skip_ready_cycle
+from ..work_queues import AsyncPriorityWorkQueue, AsyncWorkQueue
+
+
+async def test__AsyncPriorityWorkQueue__new():
+    """
+    Tests whether ``AsyncPriorityWorkQueue.__new__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    queue = AsyncPriorityWorkQueue(loop, 2)
+    
+    vampytest.assert_instance(queue, AsyncWorkQueue)
+    vampytest.assert_instance(queue._entries, list)
+    vampytest.assert_instance(queue._sequence, int)
+    vampytest.assert_eq(queue.max_length, 2)
+
+
+async def test__AsyncPriorityWorkQueue__ordering():
+    """
+    Tests whether ``AsyncPriorityWorkQueue`` delivers its elements by priority, then by insertion order.
+    
+    This function is a coroutine.
+    """
+    queue = AsyncPriorityWorkQueue(get_event_loop())
+    
+    queue.put('c', 2)
+    queue.put('a', 1)
+    queue.put('d', 2)
+    queue.put('b', 1)
+    queue.put(object)
+    
+    vampytest.assert_eq(await queue.get_many(5), [object, 'a', 'b', 'c', 'd'])
+
+
+async def test__AsyncPriorityWorkQueue__put_wait():
+    """
+    Tests whether ``AsyncPriorityWorkQueue.put_wait`` waits till the queue has free space.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    queue = AsyncPriorityWorkQueue(loop, 1)
+    queue.put('b', 1)
+    
+    task = Task(loop, queue.put_wait('a', 0))
+    await skip_ready_cycle()
+    vampytest.assert_false(task.is_done())
+    
+    vampytest.assert_eq(await queue.get(), 'b')
+    vampytest.assert_true(await task)
+    vampytest.assert_eq(await queue.get(), 'a')
@@ -0,0 +1,310 @@
+from collections import deque
+
+import vampytest
+
+from ...exceptions import CancelledError
+from ...top_level import get_event_loop
+
+from ..task import Task
+from ..task_suppression import skip_ready_cycle
+from ..work_queues import AsyncWorkQueue
+
+
+def _assert_fields_set(queue):
+    """
+    Asserts whether every fields are set of the given queue.
+    
+    Parameters
+    ----------
+    queue : ``AsyncWorkQueue``
+        The queue to check.
+    """
+    vampytest.assert_instance(queue, AsyncWorkQueue)
+    vampytest.assert_instance(queue._consumers, deque)
+    vampytest.assert_instance(queue._delivered_count, int)
+    vampytest.assert_instance(queue._exception, BaseException, nullable = True)
+    vampytest.assert_instance(queue._join_waiters, list, nullable = True)
+    vampytest.assert_instance(queue._max_length, int, nullable = True)
+    vampytest.assert_instance(queue._producers, deque)
+    vampytest.assert_instance(queue._unfinished_count, int)
+    vampytest.assert_instance(queue._wait_time_max, float)
+    vampytest.assert_instance(queue._wait_time_total, float)
+
+
+async def test__AsyncWorkQueue__new():
+    """
+    Tests whether ``AsyncWorkQueue.__new__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    queue = AsyncWorkQueue(loop, 2)
+    _assert_fields_set(queue)
+    
+    vampytest.assert_is(queue._loop, loop)
+    vampytest.assert_eq(queue.max_length, 2)
+    vampytest.assert_eq(len(queue), 0)
+
+
+def _iter_options__new__type_error():
+    yield 'a'
+    yield 1.0
+
+
+def _iter_options__new__value_error():
+    yield 0
+    yield -1
+
+
+@vampytest._(vampytest.call_from(_iter_options__new__type_error()).raising(TypeError))
+@vampytest._(vampytest.call_from(_iter_options__new__value_error()).raising(ValueError))
+async def test__AsyncWorkQueue__new__error(max_length):
+    """
+    Tests whether ``AsyncWorkQueue.__new__`` raises the correct errors.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    max_length : `object`
+        Maximal length to create the queue with.
+    
+    Raises
+    ------
+    TypeError
+    ValueError
+    """
+    AsyncWorkQueue(get_event_loop(), max_length)
+
+
+async def test__AsyncWorkQueue__repr():
+    """
+    Tests whether ``AsyncWorkQueue.__repr__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    queue = AsyncWorkQueue(get_event_loop(), 2)
+    queue.put(1)
+    queue.set_exception(CancelledError())
+    
+    output = repr(queue)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(queue).__name__, output)
+
+
+async def test__AsyncWorkQueue__put_and_get():
+    """
+    Tests whether ``AsyncWorkQueue.put`` and ``.get`` work as intended.
+    
+    This function is a coroutine.
+    """
+    queue = AsyncWorkQueue(get_event_loop(), 2)
+    
+    vampytest.assert_true(queue.put(1))
+    vampytest.assert_true(queue.put(2))
+    vampytest.assert_true(queue.is_full())
+    vampytest.assert_false(queue.put(3))
+    vampytest.assert_eq(len(queue), 2)
+    
+    vampytest.assert_eq(await queue.get(), 1)
+    vampytest.assert_eq(queue.get_no_wait(), 2)
+    
+    with vampytest.assert_raises(IndexError):
+        queue.get_no_wait()
+
+
+async def test__AsyncWorkQueue__consumers():
+    """
+    Tests whether ``AsyncWorkQueue`` delivers each element to exactly one consumer.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    queue = AsyncWorkQueue(loop)
+    
+    tasks = [Task(loop, queue.get()) for _ in range(3)]
+    await skip_ready_cycle()
+    
+    for element in range(3):
+        queue.put(element)
+    
+    results = [await task for task in tasks]
+    vampytest.assert_eq(results, [0, 1, 2])
+    vampytest.assert_eq(len(queue._consumers), 0)
+
+
+async def test__AsyncWorkQueue__cancelled_consumer():
+    """
+    Tests whether ``AsyncWorkQueue`` redelivers an element handed over to a cancelled consumer.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    queue = AsyncWorkQueue(loop)
+    
+    task_0 = Task(loop, queue.get())
+    task_1 = Task(loop, queue.get())
+    await skip_ready_cycle()
+    
+    queue.put(1)
+    task_0.cancel()
+    
+    vampytest.assert_eq(await task_1, 1)
+    
+    with vampytest.assert_raises(CancelledError):
+        await task_0
+    
+    vampytest.assert_eq(len(queue._consumers), 0)
+    
+    task_2 = Task(loop, queue.get())
+    await skip_ready_cycle()
+    task_2.cancel()
+    
+    with vampytest.assert_raises(CancelledError):
+        await task_2
+    
+    vampytest.assert_eq(len(queue._consumers), 0)
+
+
+async def test__AsyncWorkQueue__put_wait():
+    """
+    Tests whether ``AsyncWorkQueue.put_wait`` waits till the queue has free space.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    queue = AsyncWorkQueue(loop, 1)
+    
+    vampytest.assert_true(await queue.put_wait(1))
+    
+    task = Task(loop, queue.put_wait(2))
+    await skip_ready_cycle()
+    vampytest.assert_false(task.is_done())
+    vampytest.assert_eq(len(queue._producers), 1)
+    
+    vampytest.assert_eq(await queue.get(), 1)
+    vampytest.assert_true(await task)
+    vampytest.assert_eq(await queue.get(), 2)
+
+
+async def test__AsyncWorkQueue__get_many():
+    """
+    Tests whether ``AsyncWorkQueue.get_many`` works as intended.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    queue = AsyncWorkQueue(loop)
+    
+    for element in range(5):
+        queue.put(element)
+    
+    vampytest.assert_eq(await queue.get_many(3), [0, 1, 2])
+    vampytest.assert_eq(await queue.get_many(3), [3, 4])
+    
+    task = Task(loop, queue.get_many(3))
+    await skip_ready_cycle()
+    queue.put(5)
+    vampytest.assert_eq(await task, [5])
+    
+    with vampytest.assert_raises(ValueError):
+        await queue.get_many(0)
+    
+    with vampytest.assert_raises(TypeError):
+        await queue.get_many('a')
+
+
+async def test__AsyncWorkQueue__join():
+    """
+    Tests whether ``AsyncWorkQueue.task_done`` and ``.join`` work as intended.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    queue = AsyncWorkQueue(loop)
+    
+    await queue.join()
+    
+    queue.put(1)
+    queue.put(2)
+    
+    task = Task(loop, queue.join())
+    await skip_ready_cycle()
+    
+    await queue.get()
+    queue.task_done()
+    await skip_ready_cycle()
+    vampytest.assert_false(task.is_done())
+    
+    await queue.get()
+    queue.task_done()
+    await task
+    
+    with vampytest.assert_raises(ValueError):
+        queue.task_done()
+
+
+async def test__AsyncWorkQueue__set_exception():
+    """
+    Tests whether ``AsyncWorkQueue.set_exception`` stops the consumers and the producers.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    queue = AsyncWorkQueue(loop, 1)
+    queue.put(1)
+    
+    producer_task = Task(loop, queue.put_wait(2))
+    await skip_ready_cycle()
+    
+    exception = CancelledError()
+    queue.set_exception(exception)
+    vampytest.assert_false(await producer_task)
+    vampytest.assert_false(queue.put(3))
+    
+    elements = [element async for element in queue]
+    vampytest.assert_eq(elements, [1])
+    
+    with vampytest.assert_raises(exception):
+        await queue.get()
+
+
+async def test__AsyncWorkQueue__set_exception__waiting_consumer():
+    """
+    Tests whether ``AsyncWorkQueue.set_exception`` raises the exception in the waiting consumers.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    queue = AsyncWorkQueue(loop)
+    
+    task = Task(loop, queue.get())
+    await skip_ready_cycle()
+    
+    exception = ValueError()
+    queue.set_exception(exception)
+    
+    with vampytest.assert_raises(exception):
+        await task
+
+
+async def test__AsyncWorkQueue__get_statistics():
+    """
+    Tests whether ``AsyncWorkQueue.get_statistics`` works as intended.
+    
+    This function is a coroutine.
+    """
+    queue = AsyncWorkQueue(get_event_loop())
+    queue.put(1)
+    queue.put(2)
+    await queue.get()
+    
+    statistics = queue.get_statistics()
+    vampytest.assert_instance(statistics, dict)
+    vampytest.assert_eq(statistics['delivered_count'], 1)
+    vampytest.assert_eq(statistics['length'], 1)
+    vampytest.assert_eq(statistics['unfinished_count'], 2)
+    vampytest.assert_eq(statistics['consumer_count'], 0)
+    vampytest.assert_eq(statistics['producer_count'], 0)
+    vampytest.assert_instance(statistics['wait_time_average'], float)
+    vampytest.assert_instance(statistics['wait_time_max'], float)
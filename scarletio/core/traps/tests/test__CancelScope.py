@@ -0,0 +1,171 @@
+import vampytest
+
+from ...event_loop import TimerHandle
+from ...exceptions import CancelledError
+from ...top_level import get_event_loop
+
+from ..cancel_scope import CancelScope, get_deadline, is_within_deadline
+from ..task_group import TaskGroup
+from ..task_suppression import sleep
+
+
+def _assert_fields_set(cancel_scope):
+    """
+    Asserts whether every fields are set of the given cancel scope.
+    
+    Parameters
+    ----------
+    cancel_scope : ``CancelScope``
+        The cancel scope to check.
+    """
+    vampytest.assert_instance(cancel_scope, CancelScope)
+    vampytest.assert_instance(cancel_scope._governing_scope, CancelScope, nullable = True)
+    vampytest.assert_instance(cancel_scope._handle, TimerHandle, nullable = True)
+    vampytest.assert_instance(cancel_scope._tasks, set, nullable = True)
+    vampytest.assert_instance(cancel_scope._timed_out, bool)
+    vampytest.assert_instance(cancel_scope.deadline, float, nullable = True)
+    vampytest.assert_instance(cancel_scope.parent, CancelScope, nullable = True)
+
+
+async def test__CancelScope__new():
+    """
+    Tests whether ``CancelScope.__new__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    cancel_scope = CancelScope(loop, 10.0)
+    _assert_fields_set(cancel_scope)
+    
+    vampytest.assert_is(cancel_scope._loop, loop)
+    vampytest.assert_is_not(cancel_scope.deadline, None)
+    vampytest.assert_is(cancel_scope._task, None)
+
+
+async def test__CancelScope__repr():
+    """
+    Tests whether ``CancelScope.__repr__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    cancel_scope = CancelScope(get_event_loop(), 10.0)
+    
+    output = repr(cancel_scope)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(cancel_scope).__name__, output)
+
+
+async def test__CancelScope__timeout():
+    """
+    Tests whether ``CancelScope`` raises `TimeoutError` when its deadline passes.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    task = loop.current_task
+    
+    with vampytest.assert_raises(TimeoutError):
+        with CancelScope(loop, 0.01) as cancel_scope:
+            vampytest.assert_is(task.cancel_scope, cancel_scope)
+            vampytest.assert_is_not(cancel_scope._handle, None)
+            await sleep(1.0, loop)
+    
+    vampytest.assert_true(cancel_scope.is_timed_out())
+    vampytest.assert_is(task.cancel_scope, None)
+
+
+async def test__CancelScope__no_timeout():
+    """
+    Tests whether ``CancelScope`` cancels its timer handle when exited in time.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    
+    with CancelScope(loop, 10.0) as cancel_scope:
+        handle = cancel_scope._handle
+        await sleep(0.0, loop)
+    
+    vampytest.assert_false(cancel_scope.is_timed_out())
+    vampytest.assert_is(cancel_scope._handle, None)
+    vampytest.assert_true(handle.cancelled)
+
+
+async def test__CancelScope__nested_looser():
+    """
+    Tests whether a nested ``CancelScope`` with a later deadline inherits the outer one without scheduling a timer.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    
+    with vampytest.assert_raises(TimeoutError):
+        with CancelScope(loop, 0.01) as outer_scope:
+            with CancelScope(loop, 10.0) as inner_scope:
+                vampytest.assert_is(inner_scope.parent, outer_scope)
+                vampytest.assert_is(inner_scope._handle, None)
+                vampytest.assert_is(inner_scope._governing_scope, outer_scope)
+                vampytest.assert_eq(inner_scope.deadline, outer_scope.deadline)
+                await sleep(1.0, loop)
+    
+    vampytest.assert_true(inner_scope.is_timed_out())
+
+
+async def test__CancelScope__nested_tighter():
+    """
+    Tests whether a nested ``CancelScope`` with an earlier deadline times out only itself.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    
+    with CancelScope(loop, 10.0) as outer_scope:
+        with vampytest.assert_raises(TimeoutError):
+            with CancelScope(loop, 0.01) as inner_scope:
+                vampytest.assert_is_not(inner_scope._handle, None)
+                await sleep(1.0, loop)
+    
+    vampytest.assert_true(inner_scope.is_timed_out())
+    vampytest.assert_false(outer_scope.is_timed_out())
+
+
+async def test__CancelScope__task_group_inherit():
+    """
+    Tests whether the tasks created by ``TaskGroup.create_task`` inherit the cancel scope and are cancelled with it.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    task_group = TaskGroup(loop)
+    
+    async def child():
+        vampytest.assert_is_not(get_deadline(), None)
+        await sleep(1.0, loop)
+    
+    with vampytest.assert_raises(TimeoutError):
+        with CancelScope(loop, 0.01) as cancel_scope:
+            task = task_group.create_task(child())
+            vampytest.assert_is(task.cancel_scope, cancel_scope)
+            await task_group.wait_all()
+    
+    with vampytest.assert_raises(CancelledError):
+        await task
+
+
+async def test__get_deadline():
+    """
+    Tests whether ``get_deadline`` and ``is_within_deadline`` work as intended.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    
+    vampytest.assert_is(get_deadline(), None)
+    vampytest.assert_true(is_within_deadline(100.0))
+    
+    with CancelScope(loop, 10.0) as cancel_scope:
+        vampytest.assert_eq(get_deadline(), cancel_scope.deadline)
+        vampytest.assert_true(is_within_deadline(1.0))
+        vampytest.assert_false(is_within_deadline(100.0))
+    
+    vampytest.assert_is(get_deadline(), None)
@@ -0,0 +1,204 @@
+from collections import deque
+
+import vampytest
+
+from ...exceptions import CancelledError
+from ...top_level import get_event_loop
+
+from ..locks import Lock
+from ..task import Task
+from ..task_suppression import skip_ready_cycle
+
+
+def _assert_fields_set(lock):
+    """
+    Asserts whether every fields are set of the given lock.
+    
+    Parameters
+    ----------
+    lock : ``Lock``
+        The lock to check.
+    """
+    vampytest.assert_instance(lock, Lock)
+    vampytest.assert_instance(lock._acquired, int)
+    vampytest.assert_instance(lock._waiters, deque)
+
+
+async def test__Lock__new():
+    """
+    Tests whether ``Lock.__new__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    lock = Lock(loop)
+    _assert_fields_set(lock)
+    
+    vampytest.assert_is(lock._loop, loop)
+    vampytest.assert_eq(lock._acquired, 0)
+    vampytest.assert_false(lock.is_locked())
+
+
+async def test__Lock__repr():
+    """
+    Tests whether ``Lock.__repr__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    lock = Lock(get_event_loop())
+    
+    output = repr(lock)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(lock).__name__, output)
+
+
+async def test__Lock__uncontended():
+    """
+    Tests whether ``Lock`` is acquired and released without creating waiters when uncontended.
+    
+    This function is a coroutine.
+    """
+    lock = Lock(get_event_loop())
+    
+    async with lock:
+        vampytest.assert_true(lock.is_locked())
+        vampytest.assert_eq(lock._acquired, 1)
+        vampytest.assert_eq(len(lock._waiters), 0)
+    
+    vampytest.assert_false(lock.is_locked())
+    
+    await lock.acquire()
+    vampytest.assert_true(lock.is_locked())
+    lock.release()
+    vampytest.assert_false(lock.is_locked())
+
+
+async def test__Lock__release__not_acquired():
+    """
+    Tests whether ``Lock.release`` raises when the lock is not acquired.
+    
+    This function is a coroutine.
+    """
+    lock = Lock(get_event_loop())
+    
+    with vampytest.assert_raises(RuntimeError):
+        lock.release()
+
+
+async def test__Lock__contended():
+    """
+    Tests whether ``Lock`` hands itself over to the waiters in order.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    lock = Lock(loop)
+    entered = []
+    
+    async def _enter(value):
+        async with lock:
+            entered.append(value)
+            await skip_ready_cycle()
+    
+    await lock.acquire()
+    
+    tasks = [Task(loop, _enter(value)) for value in range(3)]
+    await skip_ready_cycle()
+    
+    vampytest.assert_eq(len(lock._waiters), 3)
+    vampytest.assert_eq(entered, [])
+    
+    lock.release()
+    for task in tasks:
+        await task
+    
+    vampytest.assert_eq(entered, [0, 1, 2])
+    vampytest.assert_false(lock.is_locked())
+    vampytest.assert_eq(len(lock._waiters), 0)
+
+
+async def test__Lock__cancelled_waiter():
+    """
+    Tests whether ``Lock`` is passed over a cancelled waiter.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    lock = Lock(loop)
+    entered = []
+    
+    async def _enter(value):
+        async with lock:
+            entered.append(value)
+    
+    await lock.acquire()
+    
+    task_0 = Task(loop, _enter(0))
+    task_1 = Task(loop, _enter(1))
+    await skip_ready_cycle()
+    
+    task_0.cancel()
+    await skip_ready_cycle()
+    
+    lock.release()
+    await task_1
+    
+    with vampytest.assert_raises(CancelledError):
+        await task_0
+    
+    vampytest.assert_eq(entered, [1])
+    vampytest.assert_false(lock.is_locked())
+
+
+async def test__Lock__cancelled_after_handed_over():
+    """
+    Tests whether ``Lock`` is passed to the next waiter if a waiter is cancelled after the lock was handed over to it.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    lock = Lock(loop)
+    entered = []
+    
+    async def _enter(value):
+        async with lock:
+            entered.append(value)
+    
+    await lock.acquire()
+    
+    task_0 = Task(loop, _enter(0))
+    task_1 = Task(loop, _enter(1))
+    await skip_ready_cycle()
+    
+    lock.release()
+    task_0.cancel()
+    
+    await task_1
+    
+    with vampytest.assert_raises(CancelledError):
+        await task_0
+    
+    vampytest.assert_eq(entered, [1])
+    vampytest.assert_false(lock.is_locked())
+
+
+async def test__Lock__await():
+    """
+    Tests whether awaiting ``Lock`` waits till it is unlocked.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    lock = Lock(loop)
+    
+    await lock
+    
+    await lock.acquire()
+    
+    task = Task(loop, lock.__iter__())
+    await skip_ready_cycle()
+    vampytest.assert_false(task.is_done())
+    
+    lock.release()
+    await task
+    vampytest.assert_false(lock.is_locked())
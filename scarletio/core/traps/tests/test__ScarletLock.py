@@ -0,0 +1,91 @@
+import vampytest
+
+from ...top_level import get_event_loop
+
+from ..locks import ScarletLock
+from ..task import Task
+from ..task_suppression import skip_ready_cycle
+
+
+def _assert_fields_set(lock):
+    """
+    Asserts whether every fields are set of the given lock.
+    
+    Parameters
+    ----------
+    lock : ``ScarletLock``
+        The lock to check.
+    """
+    vampytest.assert_instance(lock, ScarletLock)
+    vampytest.assert_instance(lock._acquired, int)
+    vampytest.assert_instance(lock._size, int)
+
+
+async def test__ScarletLock__new():
+    """
+    Tests whether ``ScarletLock.__new__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    lock = ScarletLock(loop, 2)
+    _assert_fields_set(lock)
+    
+    vampytest.assert_is(lock._loop, loop)
+    vampytest.assert_eq(lock.get_size(), 2)
+    vampytest.assert_eq(lock.get_acquired(), 0)
+    vampytest.assert_eq(lock.get_waiting(), 0)
+
+
+async def test__ScarletLock__repr():
+    """
+    Tests whether ``ScarletLock.__repr__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    lock = ScarletLock(get_event_loop(), 2)
+    
+    output = repr(lock)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(lock).__name__, output)
+
+
+async def test__ScarletLock__acquiring():
+    """
+    Tests whether ``ScarletLock`` is acquired without waiting till its size is reached.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    lock = ScarletLock(loop, 2)
+    entered = []
+    
+    async def _enter(value):
+        await lock.acquire()
+        entered.append(value)
+    
+    await lock.acquire()
+    await lock.acquire()
+    vampytest.assert_eq(lock.get_acquired(), 2)
+    vampytest.assert_true(lock.is_locked())
+    vampytest.assert_eq(len(lock._waiters), 0)
+    
+    tasks = [Task(loop, _enter(value)) for value in range(2)]
+    await skip_ready_cycle()
+    vampytest.assert_eq(lock.get_waiting(), 2)
+    vampytest.assert_eq(entered, [])
+    
+    lock.release()
+    await tasks[0]
+    vampytest.assert_eq(entered, [0])
+    vampytest.assert_eq(lock.get_acquired(), 2)
+    vampytest.assert_eq(lock.get_waiting(), 1)
+    
+    lock.release()
+    await tasks[1]
+    vampytest.assert_eq(entered, [0, 1])
+    
+    lock.release()
+    lock.release()
+    vampytest.assert_eq(lock.get_acquired(), 0)
+    vampytest.assert_false(lock.is_locked())
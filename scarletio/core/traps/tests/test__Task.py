@@ -1,3 +1,4 @@
+from contextvars import Context, ContextVar
 from types import CoroutineType, GeneratorType
 
 import vampytest
@@ -33,6 +34,7 @@ async def test__task__new():
     
     vampytest.assert_instance(task._blocking, bool)
     vampytest.assert_instance(task._callbacks, list, nullable = True)
+    vampytest.assert_instance(task._context, Context, nullable = True)
     vampytest.assert_instance(task._loop, EventThread)
     vampytest.assert_instance(task._result, object)
     vampytest.assert_instance(task._state, int)
@@ -69,6 +71,173 @@ async def test__Task__new__auto_start():
     vampytest.assert_is(task.get_result(), result)
 
 
+async def test__Task__new__eager__done():
+    """
+    Tests whether ``Task.__new__`` works as intended.
+    
+    Case: eager & finishes without suspending.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    outer_task = loop.current_task
+    inner_task = None
+    result = object()
+    
+    async def _test_coroutine():
+        nonlocal inner_task
+        inner_task = loop.current_task
+        return result
+    
+    task = Task(loop, _test_coroutine(), eager = True)
+    
+    vampytest.assert_true(task.is_done())
+    vampytest.assert_is(task.get_result(), result)
+    vampytest.assert_is(inner_task, task)
+    vampytest.assert_is(loop.current_task, outer_task)
+
+
+async def test__Task__new__eager__suspending():
+    """
+    Tests whether ``Task.__new__`` works as intended.
+    
+    Case: eager & suspending.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    outer_task = loop.current_task
+    future = Future(loop)
+    steps = []
+    
+    async def _test_coroutine():
+        steps.append('started')
+        result = await future
+        steps.append('resumed')
+        return result
+    
+    task = Task(loop, _test_coroutine(), eager = True)
+    
+    vampytest.assert_eq(steps, ['started'])
+    vampytest.assert_false(task.is_done())
+    vampytest.assert_is(task._waited_future, future)
+    vampytest.assert_is(loop.current_task, outer_task)
+    
+    future.set_result(12)
+    vampytest.assert_eq(await task, 12)
+    vampytest.assert_eq(steps, ['started', 'resumed'])
+
+
+async def test__Task__new__eager__raising():
+    """
+    Tests whether ``Task.__new__`` works as intended.
+    
+    Case: eager & raising.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    exception = ValueError()
+    
+    async def _test_coroutine():
+        raise exception
+    
+    task = Task(loop, _test_coroutine(), eager = True)
+    
+    vampytest.assert_true(task.is_done())
+    with vampytest.assert_raises(exception):
+        task.get_result()
+
+
+async def test__Task__new__context__copied():
+    """
+    Tests whether ``Task.__new__`` works as intended.
+    
+    Case: context copied.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    variable = ContextVar('variable')
+    variable.set(1)
+    
+    async def _test_coroutine():
+        value = variable.get()
+        variable.set(2)
+        await skip_ready_cycle()
+        return value, variable.get()
+    
+    task = Task(loop, _test_coroutine())
+    vampytest.assert_instance(task._context, Context)
+    
+    vampytest.assert_eq(await task, (1, 2))
+    vampytest.assert_eq(variable.get(), 1)
+
+
+async def test__Task__new__context__given():
+    """
+    Tests whether ``Task.__new__`` works as intended.
+    
+    Case: context given.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    variable = ContextVar('variable')
+    context = Context()
+    
+    async def _test_coroutine():
+        variable.set(3)
+    
+    task = Task(loop, _test_coroutine(), context = context)
+    vampytest.assert_is(task._context, context)
+    
+    await task
+    vampytest.assert_eq(context[variable], 3)
+    vampytest.assert_eq(variable.get(None), None)
+
+
+async def test__Task__new__context__disabled():
+    """
+    Tests whether ``Task.__new__`` works as intended.
+    
+    Case: context disabled.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    variable = ContextVar('variable')
+    variable.set(4)
+    
+    async def _test_coroutine():
+        return variable.get(None)
+    
+    task = Task(loop, _test_coroutine(), context = None)
+    vampytest.assert_is(task._context, None)
+    
+    # The task runs in the event loop's context, not in the one of the current task.
+    vampytest.assert_eq(await task, None)
+
+
+async def test__Task__new__context__unsupported():
+    """
+    Tests whether ``Task.__new__`` works as intended.
+    
+    Case: context variables not supported.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    
+    async def _test_coroutine():
+        return 5
+    
+    mocked = vampytest.mock_globals(Task.__new__, copy_context = None)
+    task = mocked(Task, loop, _test_coroutine())
+    vampytest.assert_is(task._context, None)
+    vampytest.assert_eq(await task, 5)
+
+
 async def test__Task__repr__pending():
     """
     Tests whether ``Task.__repr__`` works as intended.
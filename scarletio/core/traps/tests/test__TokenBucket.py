@@ -0,0 +1,262 @@
+from collections import deque
+
+import vampytest
+
+from ...exceptions import CancelledError
+from ...top_level import get_event_loop
+
+from ..task import Task
+from ..task_suppression import skip_ready_cycle
+from ..token_bucket import TokenBucket
+
+
+def _assert_fields_set(token_bucket):
+    """
+    Asserts whether every fields are set of the given token bucket.
+    
+    Parameters
+    ----------
+    token_bucket : ``TokenBucket``
+        The token bucket to check.
+    """
+    vampytest.assert_instance(token_bucket, TokenBucket)
+    vampytest.assert_instance(token_bucket._last_refill, float)
+    vampytest.assert_instance(token_bucket._tokens, float)
+    vampytest.assert_instance(token_bucket._waiters, deque)
+    vampytest.assert_instance(token_bucket.capacity, float)
+    vampytest.assert_instance(token_bucket.rate, float)
+
+
+async def test__TokenBucket__new():
+    """
+    Tests whether ``TokenBucket.__new__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    token_bucket = TokenBucket(loop, 5, 10)
+    _assert_fields_set(token_bucket)
+    
+    vampytest.assert_is(token_bucket._loop, loop)
+    vampytest.assert_is(token_bucket._handle, None)
+    vampytest.assert_eq(token_bucket.rate, 5.0)
+    vampytest.assert_eq(token_bucket.capacity, 10.0)
+    vampytest.assert_eq(token_bucket.get_tokens(), 10.0)
+
+
+def _iter_options__new__capacity():
+    yield 5, None, 5.0
+    yield 0.5, None, 1.0
+    yield 5, 2, 2.0
+
+
+@vampytest._(vampytest.call_from(_iter_options__new__capacity()).returning_last())
+async def test__TokenBucket__new__capacity(rate, capacity):
+    """
+    Tests whether ``TokenBucket.__new__`` sets capacity as intended.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    rate : `float`
+        Rate to create the token bucket with.
+    
+    capacity : `None | float`
+        Capacity to create the token bucket with.
+    
+    Returns
+    -------
+    output : `float`
+    """
+    token_bucket = TokenBucket(get_event_loop(), rate, capacity)
+    return token_bucket.capacity
+
+
+def _iter_options__new__type_error():
+    yield 'a', None
+    yield 1, 'a'
+
+
+def _iter_options__new__value_error():
+    yield 0, None
+    yield -1, None
+    yield 1, 0
+
+
+@vampytest._(vampytest.call_from(_iter_options__new__type_error()).raising(TypeError))
+@vampytest._(vampytest.call_from(_iter_options__new__value_error()).raising(ValueError))
+async def test__TokenBucket__new__error(rate, capacity):
+    """
+    Tests whether ``TokenBucket.__new__`` raises the correct errors.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    rate : `object`
+        Rate to create the token bucket with.
+    
+    capacity : `object`
+        Capacity to create the token bucket with.
+    
+    Raises
+    ------
+    TypeError
+    ValueError
+    """
+    TokenBucket(get_event_loop(), rate, capacity)
+
+
+async def test__TokenBucket__repr():
+    """
+    Tests whether ``TokenBucket.__repr__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    token_bucket = TokenBucket(get_event_loop(), 5, 10)
+    
+    output = repr(token_bucket)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(token_bucket).__name__, output)
+
+
+async def test__TokenBucket__try_acquire():
+    """
+    Tests whether ``TokenBucket.try_acquire`` works as intended.
+    
+    This function is a coroutine.
+    """
+    token_bucket = TokenBucket(get_event_loop(), 0.001, 3)
+    
+    vampytest.assert_true(token_bucket.try_acquire(2))
+    vampytest.assert_true(token_bucket.try_acquire())
+    vampytest.assert_false(token_bucket.try_acquire())
+
+
+def _iter_options__try_acquire__type_error():
+    yield 'a'
+    yield None
+
+
+def _iter_options__try_acquire__value_error():
+    yield 0
+    yield -1
+    yield 4
+
+
+@vampytest._(vampytest.call_from(_iter_options__try_acquire__type_error()).raising(TypeError))
+@vampytest._(vampytest.call_from(_iter_options__try_acquire__value_error()).raising(ValueError))
+async def test__TokenBucket__try_acquire__error(weight):
+    """
+    Tests whether ``TokenBucket.try_acquire`` raises the correct errors.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    weight : `object`
+        The amount of tokens to acquire.
+    
+    Raises
+    ------
+    TypeError
+    ValueError
+    """
+    token_bucket = TokenBucket(get_event_loop(), 1, 3)
+    token_bucket.try_acquire(weight)
+
+
+async def test__TokenBucket__acquire__batch():
+    """
+    Tests whether ``TokenBucket.acquire`` releases the waiters in order and by a single handle.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    token_bucket = TokenBucket(loop, 100, 3)
+    token_bucket.try_acquire(3)
+    
+    released = []
+    
+    async def acquirer(index, weight):
+        await token_bucket.acquire(weight)
+        released.append(index)
+    
+    tasks = [Task(loop, acquirer(index, weight)) for index, weight in enumerate((1, 3, 1, 1))]
+    await skip_ready_cycle()
+    
+    vampytest.assert_eq(token_bucket.get_waiting(), 4)
+    vampytest.assert_is_not(token_bucket._handle, None)
+    
+    for task in tasks:
+        await task
+    
+    vampytest.assert_eq(released, [0, 1, 2, 3])
+    vampytest.assert_eq(token_bucket.get_waiting(), 0)
+    vampytest.assert_is(token_bucket._handle, None)
+
+
+async def test__TokenBucket__acquire__cancelled():
+    """
+    Tests whether ``TokenBucket.acquire`` removes the cancelled waiters.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    token_bucket = TokenBucket(loop, 0.001, 2)
+    token_bucket.try_acquire(2)
+    
+    task_0 = Task(loop, token_bucket.acquire(2))
+    task_1 = Task(loop, token_bucket.acquire(1))
+    await skip_ready_cycle()
+    
+    task_0.cancel()
+    task_1.cancel()
+    
+    with vampytest.assert_raises(CancelledError):
+        await task_0
+    
+    with vampytest.assert_raises(CancelledError):
+        await task_1
+    
+    vampytest.assert_eq(token_bucket.get_waiting(), 0)
+    vampytest.assert_is(token_bucket._handle, None)
+
+
+async def test__TokenBucket__acquire__cancelled_after_released():
+    """
+    Tests whether ``TokenBucket.acquire`` gives the tokens back if cancelled after they were handed over.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    token_bucket = TokenBucket(loop, 0.001, 2)
+    token_bucket.try_acquire(2)
+    
+    task_0 = Task(loop, token_bucket.acquire(2))
+    await skip_ready_cycle()
+    
+    token_bucket._tokens = 2.0
+    token_bucket._release_waiters()
+    task_0.cancel()
+    
+    with vampytest.assert_raises(CancelledError):
+        await task_0
+    
+    vampytest.assert_true(token_bucket.try_acquire(2))
+
+
+async def test__TokenBucket__context():
+    """
+    Tests whether ``TokenBucket`` works as an asynchronous context manager.
+    
+    This function is a coroutine.
+    """
+    token_bucket = TokenBucket(get_event_loop(), 0.001, 2)
+    
+    async with token_bucket:
+        pass
+    
+    vampytest.assert_true(token_bucket.try_acquire(1))
+    vampytest.assert_false(token_bucket.try_acquire(1))
@@ -0,0 +1,261 @@
+import vampytest
+
+from ...exceptions import CancelledError
+from ...top_level import get_event_loop
+
+from ..async_executing import _async_map, async_map
+from ..future import Future
+from ..task import Task
+from ..task_group import TaskGroup
+from ..task_suppression import skip_ready_cycle, sleep
+
+
+async def _collect(results):
+    """
+    Collects the results of the given async iterable.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    results : `async-iterable`
+        The results to collect.
+    
+    Returns
+    -------
+    collected : `list<object>`
+    """
+    return [result async for result in results]
+
+
+def _iter_options__type_error():
+    yield 12, {}
+    yield None, {'concurrency': 'a'}
+    yield None, {'buffer_size': 'a'}
+    yield None, {'timeout': 'a'}
+
+
+def _iter_options__value_error():
+    yield None, {'concurrency': 0}
+    yield None, {'concurrency': 4, 'buffer_size': 2}
+    yield None, {'timeout': 0.0}
+
+
+@vampytest._(vampytest.call_from(_iter_options__type_error()).raising(TypeError))
+@vampytest._(vampytest.call_from(_iter_options__value_error()).raising(ValueError))
+def test__async_map__error(function, keyword_parameters):
+    """
+    Tests whether ``async_map`` raises the correct errors.
+    
+    Parameters
+    ----------
+    function : `object`
+        Function to call.
+    
+    keyword_parameters : `dict<str, object>`
+        Additional keyword parameters to call with.
+    
+    Raises
+    ------
+    TypeError
+    ValueError
+    """
+    if function is None:
+        async def function(element):
+            return element
+    
+    async_map(function, [], **keyword_parameters)
+
+
+async def test__async_map__ordered():
+    """
+    Tests whether ``async_map`` yields the results in order.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    running = 0
+    running_max = 0
+    
+    async def function(element):
+        nonlocal running, running_max
+        running += 1
+        running_max = max(running, running_max)
+        await sleep((4 - element) * 0.002, loop)
+        running -= 1
+        return element * 2
+    
+    output = await _collect(async_map(function, range(5), 2))
+    vampytest.assert_eq(output, [0, 2, 4, 6, 8])
+    vampytest.assert_eq(running_max, 2)
+
+
+async def test__async_map__ordered__done_released():
+    """
+    Tests whether ``async_map`` removes the yielded tasks from its task group, even if they are yielded before their
+    done callback ran.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    task_groups = []
+    
+    def task_group_type(loop):
+        task_group = TaskGroup(loop)
+        task_groups.append(task_group)
+        return task_group
+    
+    async def function(element):
+        await waiters[element]
+        return element
+    
+    mocked = vampytest.mock_globals(_async_map, TaskGroup = task_group_type)
+    
+    for skip_count in range(4):
+        waiters = [Future(loop) for element in range(6)]
+        waiters[0].set_result(None)
+        
+        output = []
+        async for result in mocked(function, range(6), 2, 2, True, None):
+            output.append(result)
+            if result + 1 < len(waiters):
+                waiters[result + 1].set_result(None)
+            
+            for _ in range(skip_count):
+                await skip_ready_cycle()
+        
+        for _ in range(4):
+            await skip_ready_cycle()
+        
+        vampytest.assert_eq(output, [*range(6)])
+        vampytest.assert_eq(len(task_groups[-1].done), 0)
+
+
+async def test__async_map__unordered():
+    """
+    Tests whether ``async_map`` yields the results as completed when not ordered.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    
+    async def function(element):
+        await sleep(element * 0.005, loop)
+        return element
+    
+    output = await _collect(async_map(function, [3, 1, 2], 3, ordered = False))
+    vampytest.assert_eq(output, [1, 2, 3])
+
+
+async def test__async_map__buffer_size():
+    """
+    Tests whether ``async_map`` does not start more elements than its buffer size while the first one is running.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    started = []
+    first_waiter = Future(loop)
+    
+    async def function(element):
+        started.append(element)
+        if element == 0:
+            await first_waiter
+        return element
+    
+    task = Task(loop, _collect(async_map(function, range(10), 2, buffer_size = 4)))
+    await sleep(0.01, loop)
+    vampytest.assert_eq([*started], [0, 1, 2, 3])
+    
+    first_waiter.set_result(None)
+    vampytest.assert_eq(await task, [*range(10)])
+
+
+async def test__async_map__async_iterable():
+    """
+    Tests whether ``async_map`` works with async iterables.
+    
+    This function is a coroutine.
+    """
+    async def iterable():
+        for element in range(3):
+            await skip_ready_cycle()
+            yield element
+    
+    async def function(element):
+        return element + 1
+    
+    output = await _collect(async_map(function, iterable(), 2))
+    vampytest.assert_eq(output, [1, 2, 3])
+
+
+async def test__async_map__exception():
+    """
+    Tests whether ``async_map`` propagates the exceptions and cancels the running tasks.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    waiters = []
+    
+    async def function(element):
+        if element == 1:
+            raise ValueError(element)
+        
+        waiter = Future(loop)
+        waiters.append(waiter)
+        await waiter
+    
+    with vampytest.assert_raises(ValueError(1)):
+        await _collect(async_map(function, range(3), 3, ordered = False))
+    
+    await skip_ready_cycle()
+    vampytest.assert_eq(len(waiters), 2)
+    for waiter in waiters:
+        vampytest.assert_true(waiter.is_cancelled())
+
+
+async def test__async_map__break():
+    """
+    Tests whether ``async_map`` cancels the running tasks when closed.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    waiters = []
+    
+    async def function(element):
+        if element:
+            waiter = Future(loop)
+            waiters.append(waiter)
+            await waiter
+        
+        return element
+    
+    results = async_map(function, range(3), 3)
+    vampytest.assert_eq(await results.__anext__(), 0)
+    await results.aclose()
+    
+    await skip_ready_cycle()
+    vampytest.assert_eq(len(waiters), 2)
+    for waiter in waiters:
+        vampytest.assert_true(waiter.is_cancelled())
+
+
+async def test__async_map__timeout():
+    """
+    Tests whether ``async_map`` applies timeout on the elements.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    
+    async def function(element):
+        await sleep(element, loop)
+        return element
+    
+    results = async_map(function, [0.0, 1.0], 2, timeout = 0.01)
+    vampytest.assert_eq(await results.__anext__(), 0.0)
+    
+    with vampytest.assert_raises(TimeoutError):
+        await results.__anext__()
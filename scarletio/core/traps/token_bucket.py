@@ -0,0 +1,346 @@
+__all__ = ('TokenBucket',)
+
+from collections import deque
+
+from ..time import LOOP_TIME, LOOP_TIME_RESOLUTION
+
+from .future import Future
+from .future_states import FUTURE_STATE_RESULT_RETURN
+
+
+class TokenBucket:
+    """
+    Rate limiter, which allows acquiring `rate` tokens each second and up to `capacity` tokens in a burst.
+    
+    Not like sleeping before each call, the waiters are queued in order and are released in batches by a single
+    scheduled timer handle, so the amount of wake-ups does not grow with the amount of waiters.
+    
+    Attributes
+    ----------
+    _handle : `None | TimerHandle`
+        Timer handle releasing the waiters when enough tokens are refilled.
+    
+    _last_refill : `float`
+        When the tokens were last refilled.
+    
+    _loop : ``EventThread``
+        The event loop to what the token bucket is bound to.
+    
+    _tokens : `float`
+        The available tokens as of `_last_refill`. Can go slightly negative because of timer resolution.
+    
+    _waiters : `deque<(float, Future)>`
+        The waiting acquirers with the amount of tokens they acquire.
+    
+    capacity : `float`
+        The maximal amount of tokens the bucket can hold.
+    
+    rate : `float`
+        How much tokens are refilled each second.
+    """
+    __slots__ = ('_handle', '_last_refill', '_loop', '_tokens', '_waiters', 'capacity', 'rate')
+    
+    def __new__(cls, loop, rate, capacity = None):
+        """
+        Creates a new token bucket. The bucket starts full.
+        
+        Parameters
+        ----------
+        loop : ``EventThread``
+            The event loop to what the token bucket is bound to.
+        
+        rate : `float`
+            How much tokens are refilled each second.
+        
+        capacity : `None | float` = `None`, Optional
+            The maximal amount of tokens the bucket can hold, so the largest burst it allows.
+            Defaults to `rate`, but at least `1`.
+        
+        Raises
+        ------
+        TypeError
+            - If a parameter's type is incorrect.
+        ValueError
+            - If a parameter's value is incorrect.
+        """
+        if not isinstance(rate, (int, float)):
+            raise TypeError(
+                f'`rate` can be `float`, got {type(rate).__name__}; {rate!r}.'
+            )
+        
+        if rate <= 0:
+            raise ValueError(
+                f'`rate` cannot be `0` or less, got {rate!r}.'
+            )
+        
+        if capacity is None:
+            capacity = max(rate, 1.0)
+        
+        else:
+            if not isinstance(capacity, (int, float)):
+                raise TypeError(
+                    f'`capacity` can be `None`, `float`, got {type(capacity).__name__}; {capacity!r}.'
+                )
+            
+            if capacity <= 0:
+                raise ValueError(
+                    f'`capacity` cannot be `0` or less, got {capacity!r}.'
+                )
+        
+        capacity = float(capacity)
+        
+        self = object.__new__(cls)
+        self._handle = None
+        self._last_refill = LOOP_TIME()
+        self._loop = loop
+        self._tokens = capacity
+        self._waiters = deque()
+        self.capacity = capacity
+        self.rate = float(rate)
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the token bucket's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' rate = ')
+        repr_parts.append(repr(self.rate))
+        
+        repr_parts.append(', capacity = ')
+        repr_parts.append(repr(self.capacity))
+        
+        repr_parts.append(', tokens = ')
+        repr_parts.append(format(self.get_tokens(), '.2f'))
+        
+        waiter_count = len(self._waiters)
+        if waiter_count:
+            repr_parts.append(', waiting = ')
+            repr_parts.append(repr(waiter_count))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    async def __aenter__(self):
+        """
+        Acquires a token from the bucket.
+        
+        This method is a coroutine.
+        """
+        await self.acquire()
+        return self
+    
+    
+    async def __aexit__(self, exception_type, exception_value, exception_traceback):
+        """
+        Exits the token bucket's context. Acquired tokens are not given back.
+        
+        This method is a coroutine.
+        """
+        return False
+    
+    
+    def get_tokens(self):
+        """
+        Returns the amount of available tokens.
+        
+        Returns
+        -------
+        tokens : `float`
+        """
+        self._refill(LOOP_TIME())
+        return max(self._tokens, 0.0)
+    
+    
+    def get_waiting(self):
+        """
+        Returns how much acquirers are waiting.
+        
+        Returns
+        -------
+        waiting : `int`
+        """
+        return len(self._waiters)
+    
+    
+    def try_acquire(self, weight = 1):
+        """
+        Acquires the given amount of tokens if they are available without waiting.
+        
+        Parameters
+        ----------
+        weight : `float` = `1`, Optional
+            The amount of tokens to acquire.
+        
+        Returns
+        -------
+        acquired : `bool`
+            Returns `False` if not enough tokens are available, or if an other acquirer is already waiting.
+        
+        Raises
+        ------
+        TypeError
+            - If `weight` is not `float`.
+        ValueError
+            - If `weight` is `0` or less, or is over the bucket's capacity.
+        """
+        self._validate_weight(weight)
+        
+        if self._waiters:
+            return False
+        
+        self._refill(LOOP_TIME())
+        tokens = self._tokens
+        if tokens < weight:
+            return False
+        
+        self._tokens = tokens - weight
+        return True
+    
+    
+    async def acquire(self, weight = 1):
+        """
+        Acquires the given amount of tokens. If they are not available, waits till they are refilled.
+        
+        The acquirers are served in order, so a heavier acquirer is not starved by lighter ones.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        weight : `float` = `1`, Optional
+            The amount of tokens to acquire.
+        
+        Raises
+        ------
+        TypeError
+            - If `weight` is not `float`.
+        ValueError
+            - If `weight` is `0` or less, or is over the bucket's capacity.
+        """
+        if self.try_acquire(weight):
+            return
+        
+        future = Future(self._loop)
+        self._waiters.append((weight, future))
+        if self._handle is None:
+            self._release_waiters()
+        
+        try:
+            await future
+        except:
+            self._abandon_waiter(weight, future)
+            raise
+    
+    
+    def _validate_weight(self, weight):
+        """
+        Validates the given weight.
+        
+        Parameters
+        ----------
+        weight : `float`
+            The amount of tokens to acquire.
+        
+        Raises
+        ------
+        TypeError
+            - If `weight` is not `float`.
+        ValueError
+            - If `weight` is `0` or less, or is over the bucket's capacity.
+        """
+        if not isinstance(weight, (int, float)):
+            raise TypeError(
+                f'`weight` can be `float`, got {type(weight).__name__}; {weight!r}.'
+            )
+        
+        if weight <= 0:
+            raise ValueError(
+                f'`weight` cannot be `0` or less, got {weight!r}.'
+            )
+        
+        if weight > self.capacity:
+            raise ValueError(
+                f'`weight` cannot be over the bucket\'s capacity ({self.capacity!r}), got {weight!r}.'
+            )
+    
+    
+    def _refill(self, now):
+        """
+        Refills the tokens for the time passed since the last refill.
+        
+        Parameters
+        ----------
+        now : `float`
+            The current time.
+        """
+        tokens = self._tokens + (now - self._last_refill) * self.rate
+        capacity = self.capacity
+        if tokens > capacity:
+            tokens = capacity
+        
+        self._tokens = tokens
+        self._last_refill = now
+    
+    
+    def _release_waiters(self):
+        """
+        Releases every waiter in order for which enough tokens are available, then schedules itself to be called
+        when the next waiter can be released.
+        """
+        handle = self._handle
+        if (handle is not None):
+            self._handle = None
+            handle.cancel()
+        
+        now = LOOP_TIME()
+        self._refill(now)
+        
+        # Timer handles can run earlier by the clock's resolution.
+        tolerance = self.rate * LOOP_TIME_RESOLUTION
+        tokens = self._tokens
+        waiters = self._waiters
+        
+        while waiters:
+            weight, future = waiters[0]
+            if not future.is_pending():
+                waiters.popleft()
+                continue
+            
+            if weight > tokens + tolerance:
+                self._handle = self._loop.call_at(now + (weight - tokens) / self.rate, self._release_waiters)
+                break
+            
+            waiters.popleft()
+            tokens -= weight
+            future.set_result(None)
+        
+        self._tokens = tokens
+    
+    
+    def _abandon_waiter(self, weight, future):
+        """
+        Called when an acquirer stops waiting on the given future because of an exception (like cancellation).
+        
+        If the tokens were already handed over to the future, gives them back, else removes the future.
+        
+        Parameters
+        ----------
+        weight : `float`
+            The amount of tokens the acquirer acquires.
+        
+        future : ``Future``
+            The abandoned future.
+        """
+        if future._state & FUTURE_STATE_RESULT_RETURN:
+            self._tokens += weight
+        
+        else:
+            try:
+                self._waiters.remove((weight, future))
+            except ValueError:
+                pass
+        
+        # The next waiter might be releasable earlier.
+        self._release_waiters()
@@ -0,0 +1,776 @@
+__all__ = ('AsyncPriorityWorkQueue', 'AsyncWorkQueue',)
+
+from collections import deque
+from heapq import heappop, heappush
+
+from ...utils import copy_docs
+
+from ..exceptions import CancelledError
+from ..time import LOOP_TIME
+
+from .future import Future
+from .future_states import FUTURE_STATE_RESULT_RETURN
+
+
+class AsyncWorkQueue:
+    """
+    An asynchronous FIFO queue distributing its elements between multiple consumers.
+    
+    Not like ``AsyncQueue``, each element is delivered to exactly one consumer, so it can be used as the job queue of
+    a pool of worker tasks.
+    
+    ``AsyncWorkQueue`` is async iterable, so if you iterate over it inside of an `async for` loop do
+    `.set_exception(CancelledError())` to stop it without any specific exception.
+    
+    Attributes
+    ----------
+    _consumers : `deque<Future>`
+        Futures of the consumers waiting for an element.
+    
+    _delivered_count : `int`
+        How much elements were delivered to the consumers.
+    
+    _entries : `deque<(float, object)>`
+        The queued entries. Each entry contains when the element was put on the queue and the element itself.
+    
+    _exception : `None | BaseException`
+        The exception to raise when the queue gets empty. When set, no more elements can be put on the queue.
+    
+    _join_waiters : `None | list<Future>`
+        Futures waiting for every element to be marked as done.
+    
+    _loop : ``EventThread``
+        The event loop to what the queue is bound to.
+    
+    _max_length : `None | int`
+        The maximal amount of entries the queue can hold.
+    
+    _producers : `deque<Future>`
+        Futures of the producers waiting for free space.
+    
+    _unfinished_count : `int`
+        How much elements were put on the queue and not yet marked as done.
+    
+    _wait_time_max : `float`
+        The longest time an element spent in the queue.
+    
+    _wait_time_total : `float`
+        The total time the delivered elements spent in the queue.
+    """
+    __slots__ = (
+        '_consumers', '_delivered_count', '_entries', '_exception', '_join_waiters', '_loop', '_max_length',
+        '_producers', '_unfinished_count', '_wait_time_max', '_wait_time_total'
+    )
+    
+    def __new__(cls, loop, max_length = None):
+        """
+        Creates a new work queue.
+        
+        Parameters
+        ----------
+        loop : ``EventThread``
+            The event loop to what the queue is bound to.
+        
+        max_length : `None | int` = `None`, Optional
+            The maximal amount of elements the queue can hold.
+        
+        Raises
+        ------
+        TypeError
+            - If a parameter's type is incorrect.
+        ValueError
+            - If a parameter's value is incorrect.
+        """
+        if (max_length is not None):
+            if not isinstance(max_length, int):
+                raise TypeError(
+                    f'`max_length` can be `None`, `int`, got {type(max_length).__name__}; {max_length!r}.'
+                )
+            
+            if max_length <= 0:
+                raise ValueError(
+                    f'`max_length` cannot be `0` or less, got {max_length!r}.'
+                )
+        
+        self = object.__new__(cls)
+        self._consumers = deque()
+        self._delivered_count = 0
+        self._entries = deque()
+        self._exception = None
+        self._join_waiters = None
+        self._loop = loop
+        self._max_length = max_length
+        self._producers = deque()
+        self._unfinished_count = 0
+        self._wait_time_max = 0.0
+        self._wait_time_total = 0.0
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the work queue's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' length = ')
+        repr_parts.append(repr(len(self._entries)))
+        
+        max_length = self._max_length
+        if (max_length is not None):
+            repr_parts.append(', max_length = ')
+            repr_parts.append(repr(max_length))
+        
+        repr_parts.append(', unfinished = ')
+        repr_parts.append(repr(self._unfinished_count))
+        
+        consumer_count = len(self._consumers)
+        if consumer_count:
+            repr_parts.append(', consumers waiting = ')
+            repr_parts.append(repr(consumer_count))
+        
+        producer_count = len(self._producers)
+        if producer_count:
+            repr_parts.append(', producers waiting = ')
+            repr_parts.append(repr(producer_count))
+        
+        exception = self._exception
+        if (exception is not None):
+            repr_parts.append(', exception = ')
+            repr_parts.append(repr(exception))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __len__(self):
+        """Returns the amount of elements in the queue."""
+        return len(self._entries)
+    
+    
+    @property
+    def max_length(self):
+        """
+        Returns the queue's max length.
+        
+        Returns
+        -------
+        max_length : `None | int`
+        """
+        return self._max_length
+    
+    
+    def is_full(self):
+        """
+        Returns whether the queue is full.
+        
+        Returns
+        -------
+        is_full : `bool`
+        """
+        max_length = self._max_length
+        if max_length is None:
+            return False
+        
+        return len(self._entries) >= max_length
+    
+    
+    def put(self, element):
+        """
+        Puts the given element on the queue. If a consumer is waiting, hands the element to it.
+        
+        Parameters
+        ----------
+        element : `object`
+            The element to put on the queue.
+        
+        Returns
+        -------
+        put : `bool`
+            Whether the element was put on the queue. Returns `False` if the queue is full or if it has exception set.
+        """
+        return self._put_entry((LOOP_TIME(), element))
+    
+    
+    async def put_wait(self, element):
+        """
+        Puts the given element on the queue. If the queue is full, waits till it has free space.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        element : `object`
+            The element to put on the queue.
+        
+        Returns
+        -------
+        put : `bool`
+            Whether the element was put on the queue. Returns `False` if the queue has exception set.
+        """
+        await self._wait_for_space()
+        return self.put(element)
+    
+    
+    async def get(self):
+        """
+        Returns the next element of the queue. If the queue is empty, waits till an element is put on it.
+        
+        This method is a coroutine.
+        
+        Returns
+        -------
+        element : `object`
+        
+        Raises
+        ------
+        BaseException
+            Exception set to the queue, to raise when it is empty.
+        """
+        if self._entries:
+            return self._take_next_entry()
+        
+        exception = self._exception
+        if (exception is not None):
+            raise exception
+        
+        future = Future(self._loop)
+        self._consumers.append(future)
+        try:
+            entry = await future
+        except:
+            self._abandon_consumer(future)
+            raise
+        
+        return self._take_entry(entry)
+    
+    
+    def get_no_wait(self):
+        """
+        Returns the next element of the queue.
+        
+        Returns
+        -------
+        element : `object`
+        
+        Raises
+        ------
+        IndexError
+            The queue is empty.
+        BaseException
+            Exception set to the queue, to raise when it is empty.
+        """
+        if self._entries:
+            return self._take_next_entry()
+        
+        exception = self._exception
+        if exception is None:
+            raise IndexError('The queue is empty')
+        
+        raise exception
+    
+    
+    async def get_many(self, count):
+        """
+        Returns up to `count` elements of the queue. If the queue is empty, waits till an element is put on it.
+        
+        Taking multiple elements at once saves a wake-up for each of them.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        count : `int`
+            The maximal amount of elements to return.
+        
+        Returns
+        -------
+        elements : `list<object>`
+        
+        Raises
+        ------
+        TypeError
+            - If `count` is not `int`.
+        ValueError
+            - If `count` is `0` or less.
+        BaseException
+            Exception set to the queue, to raise when it is empty.
+        """
+        if not isinstance(count, int):
+            raise TypeError(
+                f'`count` can be `int`, got {type(count).__name__}; {count!r}.'
+            )
+        
+        if count <= 0:
+            raise ValueError(
+                f'`count` cannot be `0` or less, got {count!r}.'
+            )
+        
+        entries = self._entries
+        if entries:
+            elements = []
+        else:
+            elements = [await self.get()]
+            count -= 1
+        
+        while count and entries:
+            elements.append(self._take_next_entry())
+            count -= 1
+        
+        return elements
+    
+    
+    def task_done(self):
+        """
+        Marks an element taken from the queue as done.
+        
+        Raises
+        ------
+        ValueError
+            - If called more times than elements were put on the queue.
+        """
+        unfinished_count = self._unfinished_count
+        if unfinished_count <= 0:
+            raise ValueError(
+                f'`task_done` called more times than elements were put on the queue; self = {self!r}.'
+            )
+        
+        unfinished_count -= 1
+        self._unfinished_count = unfinished_count
+        if unfinished_count:
+            return
+        
+        join_waiters = self._join_waiters
+        if (join_waiters is not None):
+            self._join_waiters = None
+            for join_waiter in join_waiters:
+                join_waiter.set_result_if_pending(None)
+    
+    
+    async def join(self):
+        """
+        Waits till every element put on the queue is marked as done.
+        
+        This method is a coroutine.
+        """
+        if not self._unfinished_count:
+            return
+        
+        join_waiters = self._join_waiters
+        if join_waiters is None:
+            join_waiters = []
+            self._join_waiters = join_waiters
+        
+        future = Future(self._loop)
+        join_waiters.append(future)
+        try:
+            await future
+        except:
+            try:
+                join_waiters.remove(future)
+            except ValueError:
+                pass
+            
+            raise
+    
+    
+    def set_exception(self, exception):
+        """
+        Sets the exception to raise when the queue gets empty. After it, no more elements can be put on the queue.
+        The waiting consumers receive the exception and the waiting producers return.
+        
+        Parameters
+        ----------
+        exception : `BaseException`
+            Exception to raise when the queue is empty.
+        
+        Raises
+        ------
+        TypeError
+            If `StopIteration` is given as `exception`.
+        """
+        if isinstance(exception, type):
+            exception = exception()
+        
+        if isinstance(exception, StopIteration):
+            raise TypeError(
+                f'{exception} cannot be raised to a(n) `{type(self).__name__}`; {self!r}.'
+            )
+        
+        self._exception = exception
+        
+        consumers = self._consumers
+        while consumers:
+            consumers.popleft().set_exception_if_pending(exception)
+        
+        producers = self._producers
+        while producers:
+            producers.popleft().set_result_if_pending(None)
+    
+    
+    def get_statistics(self):
+        """
+        Returns the queue's statistics.
+        
+        Returns
+        -------
+        statistics : `dict<str, object>`
+        """
+        delivered_count = self._delivered_count
+        if delivered_count:
+            wait_time_average = self._wait_time_total / delivered_count
+        else:
+            wait_time_average = 0.0
+        
+        return {
+            'consumer_count': len(self._consumers),
+            'delivered_count': delivered_count,
+            'length': len(self._entries),
+            'producer_count': len(self._producers),
+            'unfinished_count': self._unfinished_count,
+            'wait_time_average': wait_time_average,
+            'wait_time_max': self._wait_time_max,
+        }
+    
+    
+    def __aiter__(self):
+        """
+        Async iterating over an ``AsyncWorkQueue``, returns itself
+        
+        Returns
+        -------
+        self : ``AsyncWorkQueue``
+        """
+        return self
+    
+    
+    async def __anext__(self):
+        """
+        Returns the next element of the queue. If the queue is empty, waits till an element is put on it.
+        
+        If the queue has ``CancelledError`` set as ``._exception``, then raises ``StopAsyncIteration`` to stop the queue
+        instead.
+        
+        This method is a coroutine.
+        
+        Returns
+        -------
+        element : `object`
+        
+        Raises
+        ------
+        StopAsyncIteration
+            If the queue was cancelled with ``CancelledError``.
+        BaseException
+            Exception set to the queue, to raise when it is empty.
+        """
+        try:
+            return await self.get()
+        except CancelledError as err:
+            if err is self._exception:
+                raise StopAsyncIteration from err
+            
+            raise
+    
+    
+    def _put_entry(self, entry):
+        """
+        Hands the given entry to a waiting consumer or puts it on the queue.
+        
+        Parameters
+        ----------
+        entry : `tuple`
+            The entry to put. Its last 2 elements are when it was put on the queue and the element itself.
+        
+        Returns
+        -------
+        put : `bool`
+        """
+        if (self._exception is not None):
+            return False
+        
+        if (not self._hand_over_entry(entry)):
+            if self.is_full():
+                return False
+            
+            self._push_entry(entry)
+        
+        self._unfinished_count += 1
+        return True
+    
+    
+    def _hand_over_entry(self, entry):
+        """
+        Hands the given entry to the first waiting consumer.
+        
+        Parameters
+        ----------
+        entry : `tuple`
+            The entry to hand over.
+        
+        Returns
+        -------
+        handed_over : `bool`
+        """
+        consumers = self._consumers
+        while consumers:
+            if consumers.popleft().set_result_if_pending(entry):
+                return True
+        
+        return False
+    
+    
+    def _take_next_entry(self):
+        """
+        Removes the next entry of the queue and wakes up a waiting producer.
+        
+        Returns
+        -------
+        element : `object`
+        """
+        entry = self._pop_entry()
+        
+        producers = self._producers
+        while producers:
+            if producers.popleft().set_result_if_pending(None):
+                break
+        
+        return self._take_entry(entry)
+    
+    
+    def _take_entry(self, entry):
+        """
+        Called when a consumer takes the given entry. Updates the statistics.
+        
+        Parameters
+        ----------
+        entry : `tuple`
+            The taken entry.
+        
+        Returns
+        -------
+        element : `object`
+        """
+        wait_time = LOOP_TIME() - entry[-2]
+        self._delivered_count += 1
+        self._wait_time_total += wait_time
+        if wait_time > self._wait_time_max:
+            self._wait_time_max = wait_time
+        
+        return entry[-1]
+    
+    
+    def _abandon_consumer(self, future):
+        """
+        Called when a consumer stops waiting on the given future because of an exception (like cancellation).
+        
+        If an entry was already handed over to the future, gives it to the next consumer or puts it back to the
+        queue's front, else removes the future.
+        
+        Parameters
+        ----------
+        future : ``Future``
+            The abandoned future.
+        """
+        if future._state & FUTURE_STATE_RESULT_RETURN:
+            entry = future._result
+            if (not self._hand_over_entry(entry)):
+                self._push_entry_front(entry)
+            return
+        
+        try:
+            self._consumers.remove(future)
+        except ValueError:
+            pass
+    
+    
+    async def _wait_for_space(self):
+        """
+        Waits till the queue has free space or exception set.
+        
+        This method is a coroutine.
+        """
+        while (self._exception is None) and self.is_full():
+            future = Future(self._loop)
+            producers = self._producers
+            producers.append(future)
+            try:
+                await future
+            except:
+                if future._state & FUTURE_STATE_RESULT_RETURN:
+                    # We were woken up, pass it to the next one.
+                    while producers:
+                        if producers.popleft().set_result_if_pending(None):
+                            break
+                
+                else:
+                    try:
+                        producers.remove(future)
+                    except ValueError:
+                        pass
+                
+                raise
+    
+    
+    def _push_entry(self, entry):
+        """
+        Puts the given entry on the queue.
+        
+        Parameters
+        ----------
+        entry : `tuple`
+            The entry to put.
+        """
+        self._entries.append(entry)
+    
+    
+    def _push_entry_front(self, entry):
+        """
+        Puts back the given entry to the queue, so it is the next one to be taken.
+        
+        Parameters
+        ----------
+        entry : `tuple`
+            The entry to put back.
+        """
+        self._entries.appendleft(entry)
+    
+    
+    def _pop_entry(self):
+        """
+        Removes the next entry of the queue and returns it.
+        
+        Returns
+        -------
+        entry : `tuple`
+        """
+        return self._entries.popleft()
+
+
+class AsyncPriorityWorkQueue(AsyncWorkQueue):
+    """
+    An asynchronous priority queue distributing its elements between multiple consumers.
+    
+    Elements with lower priority value are delivered first. Elements with the same priority are delivered in the
+    order they were put on the queue.
+    
+    Attributes
+    ----------
+    _consumers : `deque<Future>`
+        Futures of the consumers waiting for an element.
+    
+    _delivered_count : `int`
+        How much elements were delivered to the consumers.
+    
+    _entries : `list<(object, int, float, object)>`
+        Heap of the queued entries. Each entry contains the element's priority, sequence number, when the element was
+        put on the queue and the element itself.
+    
+    _exception : `None | BaseException`
+        The exception to raise when the queue gets empty. When set, no more elements can be put on the queue.
+    
+    _join_waiters : `None | list<Future>`
+        Futures waiting for every element to be marked as done.
+    
+    _loop : ``EventThread``
+        The event loop to what the queue is bound to.
+    
+    _max_length : `None | int`
+        The maximal amount of entries the queue can hold.
+    
+    _producers : `deque<Future>`
+        Futures of the producers waiting for free space.
+    
+    _sequence : `int`
+        Sequence number of the next entry.
+    
+    _unfinished_count : `int`
+        How much elements were put on the queue and not yet marked as done.
+    
+    _wait_time_max : `float`
+        The longest time an element spent in the queue.
+    
+    _wait_time_total : `float`
+        The total time the delivered elements spent in the queue.
+    """
+    __slots__ = ('_sequence',)
+    
+    def __new__(cls, loop, max_length = None):
+        """
+        Creates a new priority work queue.
+        
+        Parameters
+        ----------
+        loop : ``EventThread``
+            The event loop to what the queue is bound to.
+        
+        max_length : `None | int` = `None`, Optional
+            The maximal amount of elements the queue can hold.
+        
+        Raises
+        ------
+        TypeError
+            - If a parameter's type is incorrect.
+        ValueError
+            - If a parameter's value is incorrect.
+        """
+        self = AsyncWorkQueue.__new__(cls, loop, max_length)
+        self._entries = []
+        self._sequence = 0
+        return self
+    
+    
+    def put(self, element, priority = 0):
+        """
+        Puts the given element on the queue. If a consumer is waiting, hands the element to it.
+        
+        Parameters
+        ----------
+        element : `object`
+            The element to put on the queue.
+        
+        priority : `object` = `0`, Optional
+            The element's priority. Lower is delivered first. Priorities must be comparable with each other.
+        
+        Returns
+        -------
+        put : `bool`
+            Whether the element was put on the queue. Returns `False` if the queue is full or if it has exception set.
+        """
+        sequence = self._sequence
+        self._sequence = sequence + 1
+        return self._put_entry((priority, sequence, LOOP_TIME(), element))
+    
+    
+    async def put_wait(self, element, priority = 0):
+        """
+        Puts the given element on the queue. If the queue is full, waits till it has free space.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        element : `object`
+            The element to put on the queue.
+        
+        priority : `object` = `0`, Optional
+            The element's priority. Lower is delivered first. Priorities must be comparable with each other.
+        
+        Returns
+        -------
+        put : `bool`
+            Whether the element was put on the queue. Returns `False` if the queue has exception set.
+        """
+        await self._wait_for_space()
+        return self.put(element, priority)
+    
+    
+    @copy_docs(AsyncWorkQueue._push_entry)
+    def _push_entry(self, entry):
+        heappush(self._entries, entry)
+    
+    
+    _push_entry_front = _push_entry
+    
+    
+    @copy_docs(AsyncWorkQueue._pop_entry)
+    def _pop_entry(self):
+        return heappop(self._entries)
@@ -18,7 +18,7 @@ from socket import (
 )
 from ssl import create_default_context as create_default_ssl_context
 
-from ..core import DatagramAddressedReadProtocol, ReadProtocolBase, ReadWriteProtocolBase, Task
+from ..core import DatagramAddressedReadProtocol, ReadProtocolBase, ReadWriteProtocolBase, Task, is_within_deadline
 from ..utils import export
 
 from .building_and_parsing import (
@@ -151,7 +151,10 @@ async def async_iter_execute_query_async(event_loop, query, resolve_configuratio
                 event_loop,
                 query_executor(event_loop, name_server_configuration, query, resolve_configuration, ssl_context),
             )
-            task.apply_timeout(resolve_configuration.option_timeout)
+            option_timeout = resolve_configuration.option_timeout
+            if is_within_deadline(option_timeout):
+                task.apply_timeout(option_timeout)
+            
             try:
                 result = await task
             except TimeoutError:
@@ -192,7 +195,10 @@ async def async_iter_execute_query_async(event_loop, query, resolve_configuratio
                     ssl_context,
                 ),
             )
-            task.apply_timeout(resolve_configuration.option_timeout)
+            option_timeout = resolve_configuration.option_timeout
+            if is_within_deadline(option_timeout):
+                task.apply_timeout(option_timeout)
+            
             try:
                 result = await task
             except TimeoutError:
@@ -1502,7 +1502,7 @@ class Condition:
             finally:
                 self._waiters.remove(future)
         except GeneratorExit:
-            self._lock._waiters.appendleft(self._loop.create_future())
+            self._lock._acquired += 1
             raise
         
         except BaseException as err:
@@ -1513,7 +1513,7 @@ class Condition:
         try:
             await self._lock.acquire()
         except BaseException as err:
-            self._lock._waiters.appendleft(self._loop.create_future())
+            self._lock._acquired += 1
             raise err from exception
         
         if (exception is not None):
@@ -3038,7 +3038,7 @@ class Task(ScarletTask, metaclass = TaskMeta, ignore = True):
         '__weakref__', # Required by anyio
     )
     
-    def __new__(cls, coroutine, loop = None, name = None, eager_start = False):
+    def __new__(cls, coroutine, loop = None, name = None, context = None, eager_start = False):
         """A coroutine wrapped in a Future."""
         if not iscoroutine(coroutine):
             raise TypeError(f'a coroutine was expected, got {coroutine!r}')
@@ -3046,7 +3046,10 @@ class Task(ScarletTask, metaclass = TaskMeta, ignore = True):
         if loop is None:
             loop = get_event_loop()
         
-        return ScarletTask.__new__(cls, loop, coroutine)
+        if context is None:
+            context = ...
+        
+        return ScarletTask.__new__(cls, loop, coroutine, context = context, eager = eager_start)
     
     # Required by aiohttp 3.6
     def current_task(loop = None):
@@ -3091,14 +3094,14 @@ class Task(ScarletTask, metaclass = TaskMeta, ignore = True):
         return 0
 
 
-def create_task(coroutine, *, name = None):
+def create_task(coroutine, *, name = None, context = None):
     """
     Schedule the execution of a coroutine object in a spawn task.
     
     Return a Task object.
     """
     loop = get_running_loop()
-    return Task(loop, coroutine)
+    return Task(coroutine, loop, name, context)
 
 
 FIRST_COMPLETED = 'FIRST_COMPLETED'
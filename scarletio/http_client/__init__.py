@@ -10,6 +10,10 @@ from .host_info_basket import *
 from .http_client import *
 from .request_context_manager import *
 from .request_info import *
+from .response_cache_base import *
+from .response_cache_disk import *
+from .response_cache_entry import *
+from .response_cache_memory import *
 from .protocol_basket import *  
 from .proxy import *
 from .ssl_fingerprint import *
@@ -31,6 +35,10 @@ __all__ = (
     *protocol_basket.__all__,
     *proxy.__all__,
     *request_info.__all__,
+    *response_cache_base.__all__,
+    *response_cache_disk.__all__,
+    *response_cache_entry.__all__,
+    *response_cache_memory.__all__,
     *ssl_fingerprint.__all__,
     *web_socket_context_manager.__all__,
 )
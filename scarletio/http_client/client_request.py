@@ -11,7 +11,7 @@ from ..web_common.headers import (
 )
 from ..web_common import BasicAuthorization
 from ..web_common.http_stream_writer import HTTPStreamWriter
-from ..web_common.multipart import create_payload
+from ..web_common.multipart import PayloadBase, create_payload
 
 from .client_response import ClientResponse
 from .connection_key import ConnectionKey
@@ -107,7 +107,7 @@ class ClientRequest(RichAttributeErrorBaseType):
         headers : ``IgnoreCaseMultiValueDictionary``
             Headers of the request.
         
-        data : ``None | bytes-like | io-like | FormData``
+        data : ``None | bytes-like | io-like | FormData | PayloadBase``
             Data to send as the request's body.
         
         query : `None | str | dict<None, str | bool | int | float, iterable<...>> | iterable<...>`
@@ -237,6 +237,8 @@ class ClientRequest(RichAttributeErrorBaseType):
             # form_data
             if isinstance(data, FormData):
                 data = data.generate_form()
+            elif isinstance(data, PayloadBase):
+                pass
             else:
                 try:
                     data = create_payload(data, {'disposition': None})
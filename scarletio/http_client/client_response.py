@@ -5,11 +5,13 @@ from http import HTTPStatus
 from http.cookies import CookieError, SimpleCookie
 from warnings import warn
 
-from ..utils import RichAttributeErrorBaseType, from_json
+from ..utils import (
+    JSONItemParserArray, JSONItemParserLines, RichAttributeErrorBaseType, alchemy_incendiary, from_json, from_json_async
+)
 from ..web_common import parse_content_type
 from ..web_common.headers import CONTENT_TYPE, METHOD_CONNECT, METHOD_HEAD, SET_COOKIE
 
-from .constants import JSON_RE
+from .constants import JSON_LINES_RE, JSON_RE
 
 try:
     from cchardet import detect as detect_encoding
@@ -405,7 +407,7 @@ class ClientResponse(RichAttributeErrorBaseType):
             If not given then will use the response's own encoding.
         
         loader : `callable` = ``from_json``, Optional (Keyword only)
-            Json loader. Defaults to json.loads`.
+            Json loader. Defaults to ``from_json``, which loads big bodies in an executor.
         
         Returns
         -------
@@ -447,7 +449,108 @@ class ClientResponse(RichAttributeErrorBaseType):
         if encoding is None:
             encoding = self.get_encoding()
         
-        return loader(body.decode(encoding))
+        body = body.decode(encoding)
+        
+        if loader is from_json:
+            return await from_json_async(body)
+        
+        return loader(body)
+    
+    
+    async def iter_json_items(self, path = None, *, encoding = None, in_executor = False, line_delimited = None):
+        """
+        Iterates over the elements of a json array in the response's body while it is received, instead of loading
+        the whole body at once.
+        
+        If the response's body is new line delimited json (ndjson / json lines), iterates over its lines instead.
+        
+        This method is a coroutine generator.
+        
+        Parameters
+        ----------
+        path : `None | str | tuple<str>` = `None`, Optional
+            Object keys leading to the array to iterate over.
+            If not given then iterates over the top level array.
+        
+        encoding : `None | str` = `None`, Optional (Keyword only)
+            Encoding to use instead of the response's.
+            If not given then will use the response's own encoding.
+        
+        in_executor : `bool` = `False`, Optional (Keyword only)
+            Whether the received chunks should be parsed inside of an executor.
+        
+        line_delimited : `None | bool` = `None`, Optional (Keyword only)
+            Whether the body is new line delimited json.
+            If not given then will be detected from the response's content type.
+        
+        Yields
+        ------
+        item : `object`
+        
+        Raises
+        ------
+        JSONDecodeError
+            - Invalid or incomplete json data.
+            - A key of `path` is missing or leads to a value of incorrect type.
+        TypeError
+            - `path`'s type is incorrect.
+        ValueError
+            - `path` given for a new line delimited payload.
+        """
+        if path is None:
+            path = ()
+        elif isinstance(path, str):
+            path = (path,)
+        else:
+            path = tuple(path)
+            for key in path:
+                if not isinstance(key, str):
+                    raise TypeError(
+                        f'`path` can contain only `str` elements, got {type(key).__name__}; {key!r}; path = {path!r}.'
+                    )
+        
+        if line_delimited is None:
+            headers = self.headers
+            if headers is None:
+                line_delimited = False
+            else:
+                line_delimited = (JSON_LINES_RE.match(headers.get(CONTENT_TYPE, '').casefold()) is not None)
+        
+        if encoding is None:
+            encoding = self.get_encoding()
+        
+        if line_delimited:
+            if path:
+                raise ValueError(f'`path` cannot be used with new line delimited json, got {path!r}.')
+            
+            parser = JSONItemParserLines(encoding)
+        else:
+            parser = JSONItemParserArray(path, encoding)
+        
+        payload_stream = self.payload_stream
+        if payload_stream is None:
+            body = self.body
+            if body is None:
+                return
+            
+            for item in parser.feed(body):
+                yield item
+        
+        else:
+            try:
+                async for chunk in payload_stream:
+                    if in_executor:
+                        items = await self.loop.run_in_executor(alchemy_incendiary(parser.feed, (chunk,)))
+                    else:
+                        items = parser.feed(chunk)
+                    
+                    for item in items:
+                        yield item
+            finally:
+                self.payload_stream = None
+        
+        for item in parser.end():
+            yield item
     
     
     def close(self):
@@ -2,7 +2,7 @@ __all__ = ()
 
 from http.cookies import SimpleCookie
 
-from ..core import LOOP_TIME
+from ..core import LOOP_TIME, TokenBucket
 from ..utils import RichAttributeErrorBaseType
 
 from .connection import Connection
@@ -33,12 +33,16 @@ class ConnectorBase(RichAttributeErrorBaseType):
     protocols_by_host : `dict<ConnectionKey, ConnectionBasket>`
         Protocols for each host.
     
+    rate_limiters : `dict<ConnectionKey, TokenBucket>`
+        Rate limiters to acquire a token from before connecting to their host.
+    
     Notes
     -----
     Connectors support weakreferencing.
     """
     __slots__ = (
-        '__weakref__', 'clean_up_handle', 'closed', 'cookies', 'force_close', 'loop', 'protocols_by_host'
+        '__weakref__', 'clean_up_handle', 'closed', 'cookies', 'force_close', 'loop', 'protocols_by_host',
+        'rate_limiters'
     )
     
     def __new__(cls, loop, *, force_close = False):
@@ -60,6 +64,7 @@ class ConnectorBase(RichAttributeErrorBaseType):
         self.cookies = SimpleCookie()
         self.force_close = force_close
         self.loop = loop
+        self.rate_limiters = {}
         return self
     
     
@@ -131,6 +136,8 @@ class ConnectorBase(RichAttributeErrorBaseType):
         """
         Gets connection from connection pool or creates a new one.
         
+        If a rate limiter is set for the request's connection key, acquires a token from it first.
+        
         This method is a coroutine.
         
         Parameters
@@ -150,6 +157,10 @@ class ConnectorBase(RichAttributeErrorBaseType):
         """
         key = request.connection_key
         
+        rate_limiter = self.rate_limiters.get(key, None)
+        if (rate_limiter is not None):
+            await rate_limiter.acquire()
+        
         protocol, performed_requests = self.pop_available_protocol(key)
         if protocol is None:
             protocol = await self.create_connection(request)
@@ -161,6 +172,52 @@ class ConnectorBase(RichAttributeErrorBaseType):
         return Connection(self, key, protocol, performed_requests)
     
     
+    def get_rate_limiter(self, key):
+        """
+        Returns the rate limiter of the given connection key.
+        
+        Parameters
+        ----------
+        key : ``ConnectionKey``
+            Connection key to get the rate limiter of.
+        
+        Returns
+        -------
+        rate_limiter : `None | TokenBucket`
+        """
+        return self.rate_limiters.get(key, None)
+    
+    
+    def set_rate_limiter(self, key, rate_limiter):
+        """
+        Sets the rate limiter of the given connection key. Each connection to the key's host acquires a token from it.
+        
+        Parameters
+        ----------
+        key : ``ConnectionKey``
+            Connection key to set the rate limiter of.
+        
+        rate_limiter : `None | TokenBucket`
+            The rate limiter to set. Pass it as `None` to remove the current one.
+        
+        Raises
+        ------
+        TypeError
+            - If `rate_limiter`'s type is incorrect.
+        """
+        if rate_limiter is None:
+            self.rate_limiters.pop(key, None)
+            return
+        
+        if not isinstance(rate_limiter, TokenBucket):
+            raise TypeError(
+                f'`rate_limiter` can be `None`, `{TokenBucket.__name__}`, got '
+                f'{type(rate_limiter).__name__}; {rate_limiter!r}.'
+            )
+        
+        self.rate_limiters[key] = rate_limiter
+    
+    
     def pop_available_protocol(self, key):
         """
         Gets a protocol for the given connection key.
@@ -7,6 +7,7 @@ from ssl import (
     OP_NO_SSLv3 as SSL_OPTION_SSL_NO_SSL_V3, PROTOCOL_SSLv23 as SSL_PROTOCOL_TLS, SSLContext
 )
 
+from ..web_common.compressors import ZSTD_DECOMPRESSOR
 from ..web_common.headers import ACCEPT, ACCEPT_ENCODING
 
 
@@ -17,7 +18,7 @@ CONNECTION_KEEP_ALIVE_TIMEOUT = 15.0
 
 DEFAULT_HEADERS = (
     (ACCEPT, '*/*'),
-    (ACCEPT_ENCODING, 'gzip, deflate'),
+    (ACCEPT_ENCODING, 'gzip, deflate' if ZSTD_DECOMPRESSOR is None else 'zstd, gzip, deflate'),
 )
 
 
@@ -29,6 +30,7 @@ HASH_FUNCTION_BY_DIGEST_LENGTH = {
 
 
 JSON_RE = re_compile(r'^application/(?:[\w.+-]+?\+)?json')
+JSON_LINES_RE = re_compile(r'^application/(?:x-)?(?:ndjson|jsonl|json-?lines)')
 
 
 SSL_CONTEXT_UNVERIFIED = SSLContext(SSL_PROTOCOL_TLS)
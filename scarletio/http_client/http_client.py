@@ -2,13 +2,14 @@ __all__ = ('HTTPClient', )
 
 from warnings import warn
 
+from ..core import CancelScope
 from ..utils import IgnoreCaseMultiValueDictionary, RichAttributeErrorBaseType, export
-from ..web_common import CookieJar, URL
+from ..web_common import CookieJar, FormData, URL
 from ..web_common.headers import (
     AUTHORIZATION, CONTENT_LENGTH, LOCATION, METHOD_DELETE, METHOD_GET, METHOD_HEAD, METHOD_OPTIONS, METHOD_PATCH,
     METHOD_POST, METHOD_PUT, URI
 )
-from ..web_common.helpers import Timeout, set_tcp_nodelay
+from ..web_common.helpers import set_tcp_nodelay
 from ..web_socket import WebSocketClient
 
 from .client_request import ClientRequest
@@ -16,6 +17,7 @@ from .connector_tcp import ConnectorTCP
 from .constants import REQUEST_TIMEOUT_DEFAULT
 from .proxy import Proxy
 from .request_context_manager import RequestContextManager
+from .response_cache_base import ResponseCacheBase
 from .web_socket_context_manager import WebSocketContextManager
 
 
@@ -26,6 +28,9 @@ class HTTPClient(RichAttributeErrorBaseType):
     
     Attributes
     ----------
+    cache : `None | ResponseCacheBase`
+        Response cache used for `GET` requests.
+    
     connector : ``ConnectorBase``
         Connector of the http client. Defaults to ``ConnectorTCP``.
     
@@ -38,12 +43,13 @@ class HTTPClient(RichAttributeErrorBaseType):
     proxy : `None | Proxy`
         Proxy to use for each request.
     """
-    __slots__ = ('connector', 'cookie_jar', 'loop', 'proxy')
+    __slots__ = ('cache', 'connector', 'cookie_jar', 'loop', 'proxy')
     
     def __new__(
         cls,
         loop,
         *deprecated,
+        cache = None,
         connector = None,
         proxy = ...,
         proxy_headers = ...,
@@ -58,6 +64,9 @@ class HTTPClient(RichAttributeErrorBaseType):
         loop : ``EventThread``
             The event loop used by the http client.
         
+        cache : `None | ResponseCacheBase` = `None`, Optional (Keyword only)
+            Response cache to use for `GET` requests.
+        
         connector : `None | ConnectorBase` = `None`, Optional (Keyword only)
             Connector to be used by the client.
             If not given or given as `None`, a new ``ConnectorTCP`` is created and used.
@@ -124,6 +133,13 @@ class HTTPClient(RichAttributeErrorBaseType):
             )
         
         
+        # cache
+        if (cache is not None) and (not isinstance(cache, ResponseCacheBase)):
+            raise TypeError(
+                f'`cache` can be `None`, `{ResponseCacheBase.__name__}`, got '
+                f'{type(cache).__name__}; {cache!r}.'
+            )
+        
         # connector
         if (connector is None):
             connector = ConnectorTCP(loop)
@@ -131,6 +147,7 @@ class HTTPClient(RichAttributeErrorBaseType):
         
         # Construct
         self = object.__new__(cls)
+        self.cache = cache
         self.connector = connector
         self.cookie_jar = CookieJar()
         self.loop = loop
@@ -212,10 +229,15 @@ class HTTPClient(RichAttributeErrorBaseType):
         
         headers = IgnoreCaseMultiValueDictionary(headers)
         
+        # Generate the form data here, so big json fields can be converted in an executor.
+        if isinstance(data, FormData) and data:
+            data = await data.generate_form_async()
+        
         history = []
         url = URL(url)
+        cache = self.cache
         
-        with Timeout(self.loop, REQUEST_TIMEOUT_DEFAULT):
+        with CancelScope(self.loop, REQUEST_TIMEOUT_DEFAULT):
             while True:
                 cookies = self.cookie_jar.filter_cookies(url)
                 
@@ -234,6 +256,15 @@ class HTTPClient(RichAttributeErrorBaseType):
                     None,
                 )
                 
+                if (cache is not None) and (method == METHOD_GET) and (data is None):
+                    response, cache_entry = await cache.lookup(request)
+                    if (response is not None):
+                        break
+                    
+                    use_cache = True
+                else:
+                    use_cache = False
+                
                 connection = await self.connector.connect(request)
                 
                 set_tcp_nodelay(connection.get_transport(), True)
@@ -245,6 +276,9 @@ class HTTPClient(RichAttributeErrorBaseType):
                 
                 self.cookie_jar.update_cookies(response.cookies, response.url)
                 
+                if use_cache:
+                    response = await cache.process_response(request, response, cache_entry)
+                
                 # redirects
                 if response.status in (301, 302, 303, 307) and redirects:
                     redirects -= 1
@@ -474,10 +508,15 @@ class HTTPClient(RichAttributeErrorBaseType):
                 f'{type(proxy).__name__}; {proxy!r}.'
             )
         
+        # Generate the form data here, so big json fields can be converted in an executor.
+        if isinstance(data, FormData) and data:
+            data = await data.generate_form_async()
+        
         history = []
         url = URL(url)
+        cache = self.cache
         
-        with Timeout(self.loop, timeout):
+        with CancelScope(self.loop, timeout):
             while True:
                 cookies = self.cookie_jar.filter_cookies(url)
                 
@@ -496,6 +535,15 @@ class HTTPClient(RichAttributeErrorBaseType):
                     ssl_fingerprint,
                 )
                 
+                if (cache is not None) and (method == METHOD_GET) and (data is None):
+                    response, cache_entry = await cache.lookup(request)
+                    if (response is not None):
+                        break
+                    
+                    use_cache = True
+                else:
+                    use_cache = False
+                
                 connection = await self.connector.connect(request)
                 
                 set_tcp_nodelay(connection.get_transport(), True)
@@ -507,6 +555,9 @@ class HTTPClient(RichAttributeErrorBaseType):
                 
                 self.cookie_jar.update_cookies(response.cookies, response.url)
                 
+                if use_cache:
+                    response = await cache.process_response(request, response, cache_entry)
+                
                 # redirects
                 if response.status in (301, 302, 303, 307) and redirects:
                     redirects -= 1
@@ -1094,6 +1145,18 @@ class HTTPClient(RichAttributeErrorBaseType):
             Max queue size of ``.messages``.
             If a new payload is added to a full queue, the oldest element of it is removed.
         
+        queue_backpressure : `bool`, Optional (Keyword only)
+            Whether reading from the connection should be paused when ``.messages`` is full, instead of dropping
+            messages. Defaults to `False`.
+        
+        queue_low_water : `None | int`, Optional (Keyword only)
+            With `queue_backpressure`, reading is resumed when the length of ``.messages`` drops to it.
+            Defaults to the half of `max_queue`.
+        
+        binary_as_memoryview : `bool`, Optional (Keyword only)
+            Whether binary messages should be delivered as `memoryview`-s over a single buffer, into what the payload
+            of each frame of the message is read directly. Defaults to `False`.
+        
         Returns
         -------
         web_socket_context_manager : ``WebSocketContextManager``
@@ -0,0 +1,291 @@
+__all__ = ('ResponseCacheBase',)
+
+from time import time as get_unix_time
+
+from ..utils import RichAttributeErrorBaseType
+from ..web_common.headers import CONTENT_LENGTH, IF_MODIFIED_SINCE, IF_NONE_MATCH, PRAGMA
+
+from .response_cache_entry import ResponseCacheEntry, parse_cache_control
+
+
+RESPONSE_CACHE_SIZE_LIMIT_DEFAULT = 1 << 26
+
+
+class ResponseCacheBase(RichAttributeErrorBaseType):
+    """
+    Base type for http response caches used by ``HTTPClient``.
+    
+    Only `GET` requests without body are cached. Responses are stored respecting their `Cache-Control` & `Expires`
+    headers, and stale entries with `ETag` or `Last-Modified` headers are revalidated with conditional requests.
+    
+    Attributes
+    ----------
+    hit_count : `int`
+        The amount of responses served from the cache without a request.
+    
+    miss_count : `int`
+        The amount of responses received with their whole body.
+    
+    revalidation_count : `int`
+        The amount of stale entries revalidated by a `304 Not Modified` response.
+    
+    size : `int`
+        The approximate size of the stored entries in bytes.
+    
+    size_limit : `int`
+        The maximal size of the stored entries in bytes.
+    """
+    __slots__ = ('hit_count', 'miss_count', 'revalidation_count', 'size', 'size_limit')
+    
+    def __new__(cls, *, size_limit = RESPONSE_CACHE_SIZE_LIMIT_DEFAULT):
+        """
+        Creates a new response cache.
+        
+        Parameters
+        ----------
+        size_limit : `int` = `RESPONSE_CACHE_SIZE_LIMIT_DEFAULT`, Optional (Keyword only)
+            The maximal size of the stored entries in bytes.
+        
+        Raises
+        ------
+        TypeError
+            - If a parameter's type is incorrect.
+        ValueError
+            - If a parameter's value is incorrect.
+        """
+        if not isinstance(size_limit, int):
+            raise TypeError(
+                f'`size_limit` can be `int`, got {type(size_limit).__name__}; {size_limit!r}.'
+            )
+        
+        if size_limit <= 0:
+            raise ValueError(
+                f'`size_limit` can be only positive, got {size_limit!r}.'
+            )
+        
+        self = object.__new__(cls)
+        self.hit_count = 0
+        self.miss_count = 0
+        self.revalidation_count = 0
+        self.size = 0
+        self.size_limit = size_limit
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the response cache's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' size = ')
+        repr_parts.append(repr(self.size))
+        
+        repr_parts.append(', size_limit = ')
+        repr_parts.append(repr(self.size_limit))
+        
+        repr_parts.append(', hit_count = ')
+        repr_parts.append(repr(self.hit_count))
+        
+        repr_parts.append(', miss_count = ')
+        repr_parts.append(repr(self.miss_count))
+        
+        repr_parts.append(', revalidation_count = ')
+        repr_parts.append(repr(self.revalidation_count))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    async def get_entry(self, key):
+        """
+        Returns the entry stored with the given key.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        key : `str`
+            The entry's key.
+        
+        Returns
+        -------
+        entry : `None | ResponseCacheEntry`
+        """
+        return None
+    
+    
+    async def set_entry(self, key, entry):
+        """
+        Stores the given entry, removing the least recently used ones if the size limit is reached.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        key : `str`
+            The entry's key.
+        
+        entry : ``ResponseCacheEntry``
+            The entry to store.
+        """
+        pass
+    
+    
+    async def remove_entry(self, key):
+        """
+        Removes the entry stored with the given key.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        key : `str`
+            The entry's key.
+        """
+        pass
+    
+    
+    async def clear(self):
+        """
+        Removes every stored entry.
+        
+        This method is a coroutine.
+        """
+        pass
+    
+    
+    def get_statistics(self):
+        """
+        Returns the cache's statistics.
+        
+        Returns
+        -------
+        statistics : `dict<str, int>`
+        """
+        return {
+            'hit_count': self.hit_count,
+            'miss_count': self.miss_count,
+            'revalidation_count': self.revalidation_count,
+            'size': self.size,
+        }
+    
+    
+    async def lookup(self, request):
+        """
+        Looks up the given request in the cache.
+        
+        If a fresh entry is found, returns a response created from it. If a stale entry is found, extends the
+        request's headers with its validators.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        request : ``ClientRequest``
+            The request to look up.
+        
+        Returns
+        -------
+        response : `None | ClientResponse`
+            Response created from a fresh entry.
+        
+        entry : `None | ResponseCacheEntry`
+            The stale entry to revalidate.
+        """
+        request_headers = request.headers
+        
+        # The user is doing conditional requests on their own.
+        if (IF_NONE_MATCH in request_headers) or (IF_MODIFIED_SINCE in request_headers):
+            return None, None
+        
+        directives = parse_cache_control(request_headers)
+        if 'no-store' in directives:
+            return None, None
+        
+        entry = await self.get_entry(str(request.url))
+        if (entry is None) or (not entry.is_matching_request(request_headers)):
+            return None, None
+        
+        if (
+            ('no-cache' not in directives) and
+            (request_headers.get(PRAGMA, None) != 'no-cache') and
+            entry.is_fresh(get_unix_time())
+        ):
+            self.hit_count += 1
+            return entry.create_response(request), None
+        
+        # Copy the headers, so the validators do not leak into the requests following redirects.
+        request_headers = request_headers.copy()
+        if not entry.add_validators(request_headers):
+            return None, None
+        
+        request.headers = request_headers
+        
+        return None, entry
+    
+    
+    async def process_response(self, request, response, entry):
+        """
+        Processes the response of a request that was looked up in the cache.
+        
+        If the response is `304 Not Modified`, returns a response created from the revalidated entry. If it is
+        storable, reads its body and stores it. Bodies not yet received are only read if their content length is
+        known and fits the cache.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        request : ``ClientRequest``
+            The sent request.
+        
+        response : ``ClientResponse``
+            The received response.
+        
+        entry : `None | ResponseCacheEntry`
+            The stale entry returned by ``.lookup``.
+        
+        Returns
+        -------
+        response : ``ClientResponse``
+        """
+        request_headers = request.headers
+        key = str(request.url)
+        now = get_unix_time()
+        
+        if (entry is not None) and (response.status == 304):
+            self.revalidation_count += 1
+            
+            entry.update_not_modified(response.headers, now)
+            response.release()
+            
+            await self.set_entry(key, entry)
+            return entry.create_response(request)
+        
+        self.miss_count += 1
+        
+        if 'no-store' in parse_cache_control(request_headers):
+            return response
+        
+        # Do not read the body if it would not fit anyways. Without content length the body's size is unknown till
+        # the whole of it is read, so leave it to be streamed.
+        if (response.payload_stream is not None):
+            content_length = response.headers.get(CONTENT_LENGTH, None)
+            if (
+                (content_length is None) or
+                (not content_length.isdigit()) or
+                (int(content_length) > self.size_limit)
+            ):
+                return response
+        
+        if ResponseCacheEntry.from_response(response, None, request_headers, now) is None:
+            if (entry is not None):
+                await self.remove_entry(key)
+            
+            return response
+        
+        body = await response.read()
+        new_entry = ResponseCacheEntry.from_response(response, body, request_headers, now)
+        if new_entry.size <= self.size_limit:
+            await self.set_entry(key, new_entry)
+        
+        return response
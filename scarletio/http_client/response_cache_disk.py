@@ -0,0 +1,325 @@
+__all__ = ('ResponseCacheDisk',)
+
+from collections import OrderedDict
+from hashlib import sha256
+from os import (
+    fdopen as open_file_descriptor, listdir as list_directory, makedirs as make_directories, replace as replace_file,
+    stat, unlink, utime
+)
+from os.path import dirname as get_directory_name, join as join_paths
+from tempfile import mkstemp as make_temporary_file
+
+from ..core import get_event_loop
+from ..utils import alchemy_incendiary, copy_docs, from_json, to_json
+
+from .response_cache_base import RESPONSE_CACHE_SIZE_LIMIT_DEFAULT, ResponseCacheBase
+from .response_cache_entry import ResponseCacheEntry
+
+
+ENTRY_FILE_EXTENSION = '.cache'
+
+
+def get_entry_file_name(key):
+    """
+    Returns the file name of the entry stored with the given key.
+    
+    Parameters
+    ----------
+    key : `str`
+        The entry's key.
+    
+    Returns
+    -------
+    file_name : `str`
+    """
+    return sha256(key.encode('utf-8', 'surrogatepass')).hexdigest() + ENTRY_FILE_EXTENSION
+
+
+def read_entry_file(path, key):
+    """
+    Reads the entry from the given file. Marks the file as recently used.
+    
+    Parameters
+    ----------
+    path : `str`
+        Path to the file.
+    
+    key : `str`
+        The entry's key.
+    
+    Returns
+    -------
+    entry : `None | ResponseCacheEntry`
+        Returns `None` if the file is missing, corrupted or it belongs to an other key.
+    """
+    try:
+        with open(path, 'rb') as file:
+            data = file.read()
+        
+        utime(path)
+    except OSError:
+        return None
+    
+    metadata, separator, body = data.partition(b'\n')
+    if not separator:
+        return None
+    
+    try:
+        metadata = from_json(metadata)
+        if metadata['key'] != key:
+            return None
+        
+        return ResponseCacheEntry.from_data(metadata, body)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def write_entry_file(path, key, entry):
+    """
+    Writes the entry to the given file.
+    
+    The entry is written into a uniquely named temporary file first, so concurrent writes of the same entry never
+    share a file and the entry is replaced atomically.
+    
+    Parameters
+    ----------
+    path : `str`
+        Path to the file.
+    
+    key : `str`
+        The entry's key.
+    
+    entry : ``ResponseCacheEntry``
+        The entry to write.
+    
+    Returns
+    -------
+    size : `int`
+        The written file's size.
+    """
+    metadata = entry.to_data()
+    metadata['key'] = key
+    
+    file_descriptor, temporary_path = make_temporary_file(suffix = '.tmp', dir = get_directory_name(path))
+    try:
+        with open_file_descriptor(file_descriptor, 'wb') as file:
+            file.write(to_json(metadata).encode('utf-8'))
+            file.write(b'\n')
+            file.write(entry.body)
+            size = file.tell()
+        
+        replace_file(temporary_path, path)
+    except:
+        try:
+            unlink(temporary_path)
+        except FileNotFoundError:
+            pass
+        raise
+    
+    return size
+
+
+def remove_entry_files(paths):
+    """
+    Removes the given entry files.
+    
+    Parameters
+    ----------
+    paths : `list<str>`
+        Paths to the files.
+    """
+    for path in paths:
+        try:
+            unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+class ResponseCacheDisk(ResponseCacheBase):
+    """
+    Http response cache storing the entries in a directory, removing the least recently used ones above the size
+    limit. The file operations are executed in executor.
+    
+    Attributes
+    ----------
+    directory : `str`
+        The directory to store the entries in.
+    
+    file_sizes : `OrderedDict<str, int>`
+        The stored entries' file names and sizes from the least to the most recently used one.
+    
+    hit_count : `int`
+        The amount of responses served from the cache without a request.
+    
+    miss_count : `int`
+        The amount of responses received with their whole body.
+    
+    revalidation_count : `int`
+        The amount of stale entries revalidated by a `304 Not Modified` response.
+    
+    size : `int`
+        The size of the stored entry files in bytes.
+    
+    size_limit : `int`
+        The maximal size of the stored entry files in bytes.
+    """
+    __slots__ = ('directory', 'file_sizes')
+    
+    def __new__(cls, directory, *, size_limit = RESPONSE_CACHE_SIZE_LIMIT_DEFAULT):
+        """
+        Creates a new disk response cache. Loads the entries stored in the given directory.
+        
+        Parameters
+        ----------
+        directory : `str`
+            The directory to store the entries in. Created if does not exist.
+        
+        size_limit : `int` = `RESPONSE_CACHE_SIZE_LIMIT_DEFAULT`, Optional (Keyword only)
+            The maximal size of the stored entry files in bytes.
+        
+        Raises
+        ------
+        OSError
+            - Cannot create or list the directory.
+        TypeError
+            - If a parameter's type is incorrect.
+        ValueError
+            - If a parameter's value is incorrect.
+        """
+        if not isinstance(directory, str):
+            raise TypeError(
+                f'`directory` can be `str`, got {type(directory).__name__}; {directory!r}.'
+            )
+        
+        self = ResponseCacheBase.__new__(cls, size_limit = size_limit)
+        
+        make_directories(directory, exist_ok = True)
+        
+        files = []
+        for file_name in list_directory(directory):
+            if not file_name.endswith(ENTRY_FILE_EXTENSION):
+                continue
+            
+            try:
+                file_stat = stat(join_paths(directory, file_name))
+            except OSError:
+                continue
+            
+            files.append((file_stat.st_mtime, file_name, file_stat.st_size))
+        
+        files.sort()
+        
+        file_sizes = OrderedDict()
+        size = 0
+        for modified_at, file_name, file_size in files:
+            file_sizes[file_name] = file_size
+            size += file_size
+        
+        self.directory = directory
+        self.file_sizes = file_sizes
+        self.size = size
+        return self
+    
+    
+    def __len__(self):
+        """Returns the amount of stored entries."""
+        return len(self.file_sizes)
+    
+    
+    @copy_docs(ResponseCacheBase.__repr__)
+    def __repr__(self):
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' directory = ')
+        repr_parts.append(repr(self.directory))
+        
+        repr_parts.append(', size = ')
+        repr_parts.append(repr(self.size))
+        
+        repr_parts.append(', size_limit = ')
+        repr_parts.append(repr(self.size_limit))
+        
+        repr_parts.append(', hit_count = ')
+        repr_parts.append(repr(self.hit_count))
+        
+        repr_parts.append(', miss_count = ')
+        repr_parts.append(repr(self.miss_count))
+        
+        repr_parts.append(', revalidation_count = ')
+        repr_parts.append(repr(self.revalidation_count))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    @copy_docs(ResponseCacheBase.get_entry)
+    async def get_entry(self, key):
+        file_name = get_entry_file_name(key)
+        file_sizes = self.file_sizes
+        if file_name not in file_sizes:
+            return None
+        
+        file_sizes.move_to_end(file_name)
+        
+        entry = await get_event_loop().run_in_executor(
+            alchemy_incendiary(read_entry_file, (join_paths(self.directory, file_name), key)),
+        )
+        if entry is None:
+            await self.remove_entry(key)
+        
+        return entry
+    
+    
+    @copy_docs(ResponseCacheBase.set_entry)
+    async def set_entry(self, key, entry):
+        file_name = get_entry_file_name(key)
+        directory = self.directory
+        
+        try:
+            file_size = await get_event_loop().run_in_executor(
+                alchemy_incendiary(write_entry_file, (join_paths(directory, file_name), key, entry)),
+            )
+        except OSError:
+            await self.remove_entry(key)
+            return
+        
+        file_sizes = self.file_sizes
+        old_file_size = file_sizes.pop(file_name, None)
+        if (old_file_size is not None):
+            self.size -= old_file_size
+        
+        file_sizes[file_name] = file_size
+        self.size += file_size
+        
+        paths_to_remove = []
+        while self.size > self.size_limit:
+            file_name, file_size = file_sizes.popitem(last = False)
+            self.size -= file_size
+            paths_to_remove.append(join_paths(directory, file_name))
+        
+        if paths_to_remove:
+            await get_event_loop().run_in_executor(alchemy_incendiary(remove_entry_files, (paths_to_remove,)))
+    
+    
+    @copy_docs(ResponseCacheBase.remove_entry)
+    async def remove_entry(self, key):
+        file_name = get_entry_file_name(key)
+        file_size = self.file_sizes.pop(file_name, None)
+        if file_size is None:
+            return
+        
+        self.size -= file_size
+        await get_event_loop().run_in_executor(
+            alchemy_incendiary(remove_entry_files, ([join_paths(self.directory, file_name)],)),
+        )
+    
+    
+    @copy_docs(ResponseCacheBase.clear)
+    async def clear(self):
+        directory = self.directory
+        paths_to_remove = [join_paths(directory, file_name) for file_name in self.file_sizes.keys()]
+        self.file_sizes.clear()
+        self.size = 0
+        
+        if paths_to_remove:
+            await get_event_loop().run_in_executor(alchemy_incendiary(remove_entry_files, (paths_to_remove,)))
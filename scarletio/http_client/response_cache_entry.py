@@ -0,0 +1,572 @@
+__all__ = ('ResponseCacheEntry',)
+
+from email.utils import parsedate_to_datetime as parse_date_to_date_time
+
+from ..utils import IgnoreCaseMultiValueDictionary, RichAttributeErrorBaseType
+from ..web_common.headers import (
+    AGE, CACHE_CONTROL, CONTENT_ENCODING, CONTENT_LENGTH, DATE, ETAG, EXPIRES, IF_MODIFIED_SINCE, IF_NONE_MATCH,
+    LAST_MODIFIED, TRANSFER_ENCODING, VARY
+)
+from ..web_common.helpers import HttpVersion
+from ..web_common.http_message import RawResponseMessage
+
+from .client_response import ClientResponse
+
+
+CACHEABLE_STATUSES = frozenset((200,))
+
+# Headers describing the received body's encoding instead of the stored (decoded) one. Not stored and not merged from
+# `304 Not Modified` responses.
+NOT_MODIFIED_IGNORED_HEADERS = (CONTENT_ENCODING, CONTENT_LENGTH, TRANSFER_ENCODING)
+
+
+def parse_cache_control(headers):
+    """
+    Parses the `Cache-Control` headers of the given headers.
+    
+    Parameters
+    ----------
+    headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+        Headers to parse from.
+    
+    Returns
+    -------
+    directives : `dict<str, None | str>`
+        The directives' names lowered as keys, and their values (if any) as values.
+    """
+    directives = {}
+    
+    for header in headers.get_all(CACHE_CONTROL, ()):
+        for directive in header.split(','):
+            name, separator, value = directive.partition('=')
+            name = name.strip().casefold()
+            if not name:
+                continue
+            
+            if separator:
+                value = value.strip().strip('"')
+            else:
+                value = None
+            
+            directives.setdefault(name, value)
+    
+    return directives
+
+
+def parse_delta_seconds(value):
+    """
+    Parses the given delta seconds value.
+    
+    Parameters
+    ----------
+    value : `None | str`
+        The value to parse.
+    
+    Returns
+    -------
+    delta_seconds : `None | int`
+        Returns `None` if the value is not a valid delta seconds.
+    """
+    if (value is None) or (not value.isdigit()):
+        return None
+    
+    return int(value)
+
+
+def parse_http_date(value):
+    """
+    Parses the given http date.
+    
+    Parameters
+    ----------
+    value : `None | str`
+        The value to parse.
+    
+    Returns
+    -------
+    timestamp : `None | float`
+        Returns `None` if the value is not a valid http date.
+    """
+    if value is None:
+        return None
+    
+    try:
+        date_time = parse_date_to_date_time(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    
+    if date_time is None:
+        return None
+    
+    return date_time.timestamp()
+
+
+def get_freshness_lifetime(headers, now):
+    """
+    Calculates for how long a response can be served from cache without revalidation.
+    
+    Parameters
+    ----------
+    headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+        The response's headers.
+    
+    now : `float`
+        The current unix time.
+    
+    Returns
+    -------
+    freshness_lifetime : `float`
+        The remaining freshness in seconds. `-1.0` if the response must not be stored.
+    """
+    directives = parse_cache_control(headers)
+    if 'no-store' in directives:
+        return -1.0
+    
+    if 'no-cache' in directives:
+        return 0.0
+    
+    max_age = parse_delta_seconds(directives.get('max-age', None))
+    if (max_age is not None):
+        freshness_lifetime = float(max_age)
+    
+    else:
+        expires = parse_http_date(headers.get(EXPIRES, None))
+        if expires is None:
+            return 0.0
+        
+        date = parse_http_date(headers.get(DATE, None))
+        if date is None:
+            date = now
+        
+        freshness_lifetime = expires - date
+    
+    age = parse_delta_seconds(headers.get(AGE, None))
+    if (age is not None):
+        freshness_lifetime -= age
+    
+    return max(freshness_lifetime, 0.0)
+
+
+def get_stored_headers(headers, body):
+    """
+    Returns a copy of the given response headers to store with the decoded body.
+    
+    The body is stored decompressed and de-chunked, so the headers describing the received body's encoding are dropped
+    and `Content-Length` is set to the stored body's length.
+    
+    Parameters
+    ----------
+    headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+        The response's headers.
+    
+    body : `bytes`
+        The stored body.
+    
+    Returns
+    -------
+    stored_headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+    """
+    stored_headers = headers.copy()
+    
+    for header_name in NOT_MODIFIED_IGNORED_HEADERS:
+        stored_headers.pop_all(header_name, None)
+    
+    if CONTENT_LENGTH in headers:
+        stored_headers[CONTENT_LENGTH] = str(len(body))
+    
+    return stored_headers
+
+
+def get_vary(response_headers, request_headers):
+    """
+    Collects the request header values the response varies on.
+    
+    Parameters
+    ----------
+    response_headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+        The response's headers.
+    
+    request_headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+        The request's headers.
+    
+    Returns
+    -------
+    vary : `None | tuple<(str, None | str)>`
+        Returns `None` if the response varies on everything (`Vary: *`).
+    """
+    vary = []
+    
+    for header in response_headers.get_all(VARY, ()):
+        for header_name in header.split(','):
+            header_name = header_name.strip()
+            if not header_name:
+                continue
+            
+            if header_name == '*':
+                return None
+            
+            vary.append((header_name.casefold(), request_headers.get(header_name, None)))
+    
+    return tuple(vary)
+
+
+class ResponseCacheEntry(RichAttributeErrorBaseType):
+    """
+    A cached http response.
+    
+    Attributes
+    ----------
+    body : `bytes`
+        The response's body.
+    
+    freshness_lifetime : `float`
+        For how long the entry can be served without revalidation after storing it.
+    
+    headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+        The response's headers.
+    
+    reason : `None | str`
+        The response's reason.
+    
+    status : `int`
+        The response's status.
+    
+    stored_at : `float`
+        Unix time when the entry was stored or last revalidated.
+    
+    vary : `tuple<(str, None | str)>`
+        The request header values the response varies on.
+    
+    version : ``HttpVersion``
+        The response's http version.
+    """
+    __slots__ = ('body', 'freshness_lifetime', 'headers', 'reason', 'status', 'stored_at', 'vary', 'version')
+    
+    def __new__(cls, version, status, reason, headers, body, stored_at, freshness_lifetime, vary):
+        """
+        Creates a new response cache entry.
+        
+        Parameters
+        ----------
+        version : ``HttpVersion``
+            The response's http version.
+        
+        status : `int`
+            The response's status.
+        
+        reason : `None | str`
+            The response's reason.
+        
+        headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+            The response's headers.
+        
+        body : `bytes`
+            The response's body.
+        
+        stored_at : `float`
+            Unix time when the entry was stored or last revalidated.
+        
+        freshness_lifetime : `float`
+            For how long the entry can be served without revalidation after storing it.
+        
+        vary : `tuple<(str, None | str)>`
+            The request header values the response varies on.
+        """
+        self = object.__new__(cls)
+        self.body = body
+        self.freshness_lifetime = freshness_lifetime
+        self.headers = headers
+        self.reason = reason
+        self.status = status
+        self.stored_at = stored_at
+        self.vary = vary
+        self.version = version
+        return self
+    
+    
+    @classmethod
+    def from_response(cls, response, body, request_headers, now):
+        """
+        Creates a new response cache entry from the given response if it can be stored.
+        
+        Parameters
+        ----------
+        response : ``ClientResponse``
+            The received response.
+        
+        body : `None | bytes-like`
+            The response's body.
+        
+        request_headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+            The respective request's headers.
+        
+        now : `float`
+            The current unix time.
+        
+        Returns
+        -------
+        self : `None | instance<cls>`
+        """
+        raw_message = response.raw_message
+        if (raw_message is None) or (raw_message.status not in CACHEABLE_STATUSES):
+            return None
+        
+        headers = raw_message.headers
+        freshness_lifetime = get_freshness_lifetime(headers, now)
+        if freshness_lifetime < 0.0:
+            return None
+        
+        # Nothing to gain from storing a response we could neither serve nor revalidate.
+        if (freshness_lifetime == 0.0) and (ETAG not in headers) and (LAST_MODIFIED not in headers):
+            return None
+        
+        vary = get_vary(headers, request_headers)
+        if vary is None:
+            return None
+        
+        body = b'' if body is None else bytes(body)
+        
+        return cls(
+            raw_message.version,
+            raw_message.status,
+            raw_message.reason,
+            get_stored_headers(headers, body),
+            body,
+            now,
+            freshness_lifetime,
+            vary,
+        )
+    
+    
+    def __repr__(self):
+        """Returns the response cache entry's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' status = ')
+        repr_parts.append(repr(self.status))
+        
+        repr_parts.append(', size = ')
+        repr_parts.append(repr(self.size))
+        
+        repr_parts.append(', freshness_lifetime = ')
+        repr_parts.append(repr(self.freshness_lifetime))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __eq__(self, other):
+        """Returns whether the two response cache entries are equal."""
+        if type(self) is not type(other):
+            return False
+        
+        if self.body != other.body:
+            return False
+        
+        if self.freshness_lifetime != other.freshness_lifetime:
+            return False
+        
+        if self.headers != other.headers:
+            return False
+        
+        if self.reason != other.reason:
+            return False
+        
+        if self.status != other.status:
+            return False
+        
+        if self.stored_at != other.stored_at:
+            return False
+        
+        if self.vary != other.vary:
+            return False
+        
+        if self.version != other.version:
+            return False
+        
+        return True
+    
+    
+    @property
+    def size(self):
+        """
+        Returns the approximate size of the entry in bytes.
+        
+        Returns
+        -------
+        size : `int`
+        """
+        size = len(self.body)
+        
+        for key, value in self.headers.items():
+            size += len(key) + len(value)
+        
+        return size
+    
+    
+    def is_fresh(self, now):
+        """
+        Returns whether the entry can be served without revalidation.
+        
+        Parameters
+        ----------
+        now : `float`
+            The current unix time.
+        
+        Returns
+        -------
+        is_fresh : `bool`
+        """
+        return now - self.stored_at < self.freshness_lifetime
+    
+    
+    def is_matching_request(self, request_headers):
+        """
+        Returns whether the entry can be used for a request with the given headers.
+        
+        Parameters
+        ----------
+        request_headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+            The request's headers.
+        
+        Returns
+        -------
+        is_matching_request : `bool`
+        """
+        for header_name, value in self.vary:
+            if request_headers.get(header_name, None) != value:
+                return False
+        
+        return True
+    
+    
+    def add_validators(self, request_headers):
+        """
+        Adds the conditional headers to the given request headers for revalidating the entry.
+        
+        Parameters
+        ----------
+        request_headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+            The request's headers to extend.
+        
+        Returns
+        -------
+        added : `bool`
+            Whether any validator was added.
+        """
+        added = False
+        headers = self.headers
+        
+        entity_tag = headers.get(ETAG, None)
+        if (entity_tag is not None):
+            request_headers[IF_NONE_MATCH] = entity_tag
+            added = True
+        
+        last_modified = headers.get(LAST_MODIFIED, None)
+        if (last_modified is not None):
+            request_headers[IF_MODIFIED_SINCE] = last_modified
+            added = True
+        
+        return added
+    
+    
+    def update_not_modified(self, response_headers, now):
+        """
+        Updates the entry with the headers of a `304 Not Modified` response.
+        
+        Parameters
+        ----------
+        response_headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+            The `304` response's headers.
+        
+        now : `float`
+            The current unix time.
+        """
+        headers = self.headers
+        
+        for header_name in {*response_headers.keys()}:
+            if header_name in NOT_MODIFIED_IGNORED_HEADERS:
+                continue
+            
+            headers.pop_all(header_name, None)
+            for value in response_headers.get_all(header_name):
+                headers[header_name] = value
+        
+        freshness_lifetime = get_freshness_lifetime(headers, now)
+        self.freshness_lifetime = max(freshness_lifetime, 0.0)
+        self.stored_at = now
+    
+    
+    def create_response(self, request):
+        """
+        Creates a client response from the entry.
+        
+        Parameters
+        ----------
+        request : ``ClientRequest``
+            The request to create the response for.
+        
+        Returns
+        -------
+        response : ``ClientResponse``
+        """
+        response = ClientResponse(request, None)
+        response.raw_message = RawResponseMessage(self.version, self.status, self.reason, self.headers.copy())
+        response.body = self.body
+        response.closed = True
+        response._released = True
+        return response
+    
+    
+    def to_data(self):
+        """
+        Converts the entry's metadata to json serializable data. The body is not included.
+        
+        Returns
+        -------
+        data : `dict<str, object>`
+        """
+        return {
+            'freshness_lifetime': self.freshness_lifetime,
+            'headers': [*self.headers.items()],
+            'reason': self.reason,
+            'status': self.status,
+            'stored_at': self.stored_at,
+            'vary': [*self.vary],
+            'version': [*self.version],
+        }
+    
+    
+    @classmethod
+    def from_data(cls, data, body):
+        """
+        Creates a new response cache entry from the data created by ``.to_data``.
+        
+        Parameters
+        ----------
+        data : `dict<str, object>`
+            The entry's metadata.
+        
+        body : `bytes`
+            The response's body.
+        
+        Returns
+        -------
+        self : `instance<cls>`
+        
+        Raises
+        ------
+        KeyError
+        TypeError
+        ValueError
+        """
+        return cls(
+            HttpVersion(*data['version']),
+            data['status'],
+            data['reason'],
+            IgnoreCaseMultiValueDictionary([(key, value) for key, value in data['headers']]),
+            body,
+            data['stored_at'],
+            data['freshness_lifetime'],
+            tuple((header_name, value) for header_name, value in data['vary']),
+        )
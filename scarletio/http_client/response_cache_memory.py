@@ -0,0 +1,89 @@
+__all__ = ('ResponseCacheMemory',)
+
+from collections import OrderedDict
+
+from ..utils import copy_docs
+
+from .response_cache_base import RESPONSE_CACHE_SIZE_LIMIT_DEFAULT, ResponseCacheBase
+
+
+class ResponseCacheMemory(ResponseCacheBase):
+    """
+    Http response cache storing the entries in memory, removing the least recently used ones above the size limit.
+    
+    Attributes
+    ----------
+    entries : `OrderedDict<str, ResponseCacheEntry>`
+        The stored entries from the least to the most recently used one.
+    
+    entry_sizes : `dict<str, int>`
+        The entries' sizes at the time they were stored.
+    
+    hit_count : `int`
+        The amount of responses served from the cache without a request.
+    
+    miss_count : `int`
+        The amount of responses received with their whole body.
+    
+    revalidation_count : `int`
+        The amount of stale entries revalidated by a `304 Not Modified` response.
+    
+    size : `int`
+        The approximate size of the stored entries in bytes.
+    
+    size_limit : `int`
+        The maximal size of the stored entries in bytes.
+    """
+    __slots__ = ('entries', 'entry_sizes')
+    
+    @copy_docs(ResponseCacheBase.__new__)
+    def __new__(cls, *, size_limit = RESPONSE_CACHE_SIZE_LIMIT_DEFAULT):
+        self = ResponseCacheBase.__new__(cls, size_limit = size_limit)
+        self.entries = OrderedDict()
+        self.entry_sizes = {}
+        return self
+    
+    
+    def __len__(self):
+        """Returns the amount of stored entries."""
+        return len(self.entries)
+    
+    
+    @copy_docs(ResponseCacheBase.get_entry)
+    async def get_entry(self, key):
+        entries = self.entries
+        entry = entries.get(key, None)
+        if (entry is not None):
+            entries.move_to_end(key)
+        
+        return entry
+    
+    
+    @copy_docs(ResponseCacheBase.set_entry)
+    async def set_entry(self, key, entry):
+        entries = self.entries
+        entry_sizes = self.entry_sizes
+        
+        await self.remove_entry(key)
+        
+        size = entry.size
+        entries[key] = entry
+        entry_sizes[key] = size
+        self.size += size
+        
+        while self.size > self.size_limit:
+            key, old_entry = entries.popitem(last = False)
+            self.size -= entry_sizes.pop(key)
+    
+    
+    @copy_docs(ResponseCacheBase.remove_entry)
+    async def remove_entry(self, key):
+        if (self.entries.pop(key, None) is not None):
+            self.size -= self.entry_sizes.pop(key)
+    
+    
+    @copy_docs(ResponseCacheBase.clear)
+    async def clear(self):
+        self.entries.clear()
+        self.entry_sizes.clear()
+        self.size = 0
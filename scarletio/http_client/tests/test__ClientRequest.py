@@ -464,6 +464,26 @@ def _iter_options__new():
         ),
     )
 
+    
+    # With payload -> use as is
+    yield (
+        {
+            **keyword_parameters,
+            'data': BytesPayload(b'koishi', {'content_type': 'text/plain'}),
+        },
+        ('body', 'chunked', 'compression', 'headers'),
+        (
+            BytesPayload(b'koishi', {'content_type': 'text/plain'}),
+            False,
+            None,
+            IgnoreCaseMultiValueDictionary([
+                *DEFAULT_HEADERS,
+                (HOST, 'orindance.party'),
+                (CONTENT_LENGTH, '6'),
+                (CONTENT_TYPE, 'text/plain'),
+            ]),
+        ),
+    )
 
 @vampytest._(vampytest.call_from(_iter_options__new()).returning_last())
 async def test__ClientRequest__new__processing(keyword_parameters, return_attribute_names):
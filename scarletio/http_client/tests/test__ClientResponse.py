@@ -633,3 +633,161 @@ async def test__ClientResponse__json():
     finally:
         read_socket.close()
         write_socket.close()
+
+
+async def _collect_async_iterable(async_iterable):
+    """
+    Collects the elements of the given async iterable into a list.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    async_iterable : `AsyncIterable`
+        The async iterable to collect from.
+    
+    Returns
+    -------
+    output : `list<object>`
+    """
+    return [element async for element in async_iterable]
+
+
+def _iter_options__iter_json_items():
+    yield (
+        [b'[{"hey": "mis', b'ter"}, 1', b'2, "sister"]'],
+        None,
+        {},
+        [{'hey': 'mister'}, 12, 'sister'],
+    )
+    
+    yield (
+        [b'{"data": {"items": [1, ', b'2]}, "items": [3]}'],
+        None,
+        {'path': ('data', 'items')},
+        [1, 2],
+    )
+    
+    yield (
+        [b'{"hey": "mis', b'ter"}\n1', b'2\n"sister"'],
+        None,
+        {'line_delimited': True},
+        [{'hey': 'mister'}, 12, 'sister'],
+    )
+    
+    yield (
+        [b'[{"hey": "mis', b'ter"}, 1', b'2, "sister"]'],
+        None,
+        {'in_executor': True},
+        [{'hey': 'mister'}, 12, 'sister'],
+    )
+    
+    yield (
+        None,
+        b'[1, 2]',
+        {},
+        [1, 2],
+    )
+    
+    yield (
+        None,
+        None,
+        {},
+        [],
+    )
+
+
+@vampytest._(vampytest.call_from(_iter_options__iter_json_items()).returning_last())
+async def test__ClientResponse__iter_json_items(chunks, body, keyword_parameters):
+    """
+    Tests whether ``ClientResponse.iter_json_items`` works as intended.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    chunks : `None | list<bytes>`
+        Chunks to feed into the payload stream. If given as `None`, no payload stream is created.
+    
+    body : `None | bytes`
+        Already received body to set.
+    
+    keyword_parameters : `dict<str, object>`
+        Keyword parameters to pass to the method.
+    
+    Returns
+    -------
+    output : `list<object>`
+    """
+    loop = get_event_loop()
+    
+    read_socket, write_socket = create_socket_pair()
+    
+    try:
+        connector = ConnectorBase(loop)
+        client_request = _get_default_request()
+        protocol = HttpReadWriteProtocol(loop)
+        transport = SocketTransportLayerBase(loop, None, write_socket, protocol, None)
+        protocol.connection_made(transport)
+        connection = Connection(connector, client_request.connection_key, protocol, 2)
+        
+        client_response = ClientResponse(
+            client_request,
+            connection,
+        )
+        
+        if (chunks is not None):
+            payload_stream = PayloadStream(protocol)
+            for chunk in chunks:
+                payload_stream.add_received_chunk(chunk)
+            payload_stream.set_done_success()
+            client_response.payload_stream = payload_stream
+        
+        client_response.body = body
+        
+        task = Task(loop, _collect_async_iterable(client_response.iter_json_items(**keyword_parameters)))
+        task.apply_timeout(0.1)
+        
+        output = await task
+        
+        vampytest.assert_instance(output, list)
+        vampytest.assert_is(client_response.payload_stream, None)
+        return output
+    
+    finally:
+        read_socket.close()
+        write_socket.close()
+
+
+async def test__ClientResponse__iter_json_items__value_error():
+    """
+    Tests whether ``ClientResponse.iter_json_items`` works as intended.
+    
+    This function is a coroutine.
+    
+    Case: path given for new line delimited json.
+    """
+    loop = get_event_loop()
+    
+    read_socket, write_socket = create_socket_pair()
+    
+    try:
+        connector = ConnectorBase(loop)
+        client_request = _get_default_request()
+        protocol = HttpReadWriteProtocol(loop)
+        transport = SocketTransportLayerBase(loop, None, write_socket, protocol, None)
+        protocol.connection_made(transport)
+        connection = Connection(connector, client_request.connection_key, protocol, 2)
+        
+        client_response = ClientResponse(
+            client_request,
+            connection,
+        )
+        client_response.body = b'[1]'
+        
+        with vampytest.assert_raises(ValueError):
+            await _collect_async_iterable(client_response.iter_json_items('items', line_delimited = True))
+    
+    finally:
+        read_socket.close()
+        write_socket.close()
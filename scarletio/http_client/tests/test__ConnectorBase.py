@@ -4,7 +4,8 @@ from socket import socketpair as create_socket_pair
 import vampytest
 
 from ...core import (
-    AbstractProtocolBase, EventThread, LOOP_TIME, SocketTransportLayerBase, TimerWeakHandle, get_event_loop
+    AbstractProtocolBase, EventThread, LOOP_TIME, SocketTransportLayerBase, TimerWeakHandle, TokenBucket,
+    get_event_loop
 )
 from ...utils import IgnoreCaseMultiValueDictionary
 from ...web_common import HttpReadWriteProtocol, URL
@@ -34,6 +35,7 @@ def _assert_fields_set(connector):
     vampytest.assert_instance(connector.force_close, bool)
     vampytest.assert_instance(connector.loop, EventThread)
     vampytest.assert_instance(connector.protocols_by_host, dict)
+    vampytest.assert_instance(connector.rate_limiters, dict)
 
 
 async def test__ConnectorBase__new():
@@ -563,6 +565,88 @@ async def test__ConnectorBase__connect__cache_miss():
         write_socket.close()
 
 
+async def test__ConnectorBase__connect__rate_limited():
+    """
+    Tests whether ``ConnectorBase.connect`` works as intended.
+    
+    Case: rate limited.
+    
+    This function is a coroutine.
+    """
+    read_socket, write_socket = create_socket_pair()
+    protocol = None
+    
+    async def mock_create_connection(self, request):
+        nonlocal protocol
+        if protocol is None:
+            raise RuntimeError
+        
+        return protocol
+    
+    original_create_connection = ConnectorBase.create_connection
+    try:
+        ConnectorBase.create_connection = mock_create_connection
+        loop = get_event_loop()
+        
+        client_request = ClientRequest(
+            loop,
+            METHOD_GET,
+            URL('https://orindance.party/'),
+            IgnoreCaseMultiValueDictionary(),
+            None,
+            None,
+            None,
+            None,
+            None,
+            None,
+            None,
+            None,
+        )
+        
+        connector = ConnectorBase(loop)
+        rate_limiter = TokenBucket(loop, 0.001, 2)
+        connector.set_rate_limiter(client_request.connection_key, rate_limiter)
+        
+        protocol = HttpReadWriteProtocol(loop)
+        transport = SocketTransportLayerBase(loop, None, write_socket, protocol, None)
+        protocol.connection_made(transport)
+        
+        output = await connector.connect(client_request)
+        
+        vampytest.assert_instance(output, Connection)
+        vampytest.assert_is(output.protocol, protocol)
+        vampytest.assert_true(rate_limiter.try_acquire(1))
+        vampytest.assert_false(rate_limiter.try_acquire(1))
+    
+    finally:
+        ConnectorBase.create_connection = original_create_connection
+        read_socket.close()
+        write_socket.close()
+
+
+async def test__ConnectorBase__rate_limiter():
+    """
+    Tests whether ``ConnectorBase.set_rate_limiter`` and ``.get_rate_limiter`` work as intended.
+    
+    This function is a coroutine.
+    """
+    connection_key = _get_default_connection_key()
+    loop = get_event_loop()
+    
+    connector = ConnectorBase(loop)
+    vampytest.assert_is(connector.get_rate_limiter(connection_key), None)
+    
+    rate_limiter = TokenBucket(loop, 1)
+    connector.set_rate_limiter(connection_key, rate_limiter)
+    vampytest.assert_is(connector.get_rate_limiter(connection_key), rate_limiter)
+    
+    connector.set_rate_limiter(connection_key, None)
+    vampytest.assert_is(connector.get_rate_limiter(connection_key), None)
+    
+    with vampytest.assert_raises(TypeError):
+        connector.set_rate_limiter(connection_key, 'a')
+
+
 async def test__ConnectorBase__get_closest_expiration__no_available_protocols():
     """
     Tests whether ``ConnectorBase.get_closest_expiration`` works as intended.
@@ -0,0 +1,185 @@
+from os import listdir as list_directory
+from os.path import join as join_paths
+from tempfile import TemporaryDirectory
+
+import vampytest
+
+from ...core import get_event_loop
+from ...utils import IgnoreCaseMultiValueDictionary
+from ...web_common import HttpVersion11
+from ...web_common.headers import ETAG
+
+from ..response_cache_disk import ResponseCacheDisk, get_entry_file_name
+from ..response_cache_entry import ResponseCacheEntry
+
+
+def _assert_fields_set(cache):
+    """
+    Asserts whether every fields are set of the given response cache.
+    
+    Parameters
+    ----------
+    cache : ``ResponseCacheDisk``
+        The cache to check.
+    """
+    vampytest.assert_instance(cache, ResponseCacheDisk)
+    vampytest.assert_instance(cache.directory, str)
+    vampytest.assert_instance(cache.file_sizes, dict)
+    vampytest.assert_instance(cache.hit_count, int)
+    vampytest.assert_instance(cache.miss_count, int)
+    vampytest.assert_instance(cache.revalidation_count, int)
+    vampytest.assert_instance(cache.size, int)
+    vampytest.assert_instance(cache.size_limit, int)
+
+
+def _create_entry(body):
+    """
+    Creates a response cache entry.
+    
+    Parameters
+    ----------
+    body : `bytes`
+        Response body.
+    
+    Returns
+    -------
+    entry : ``ResponseCacheEntry``
+    """
+    return ResponseCacheEntry(
+        HttpVersion11,
+        200,
+        'OK',
+        IgnoreCaseMultiValueDictionary([(ETAG, '"koishi"')]),
+        body,
+        1000.0,
+        60.0,
+        (('accept', None),),
+    )
+
+
+def test__ResponseCacheDisk__new():
+    """
+    Tests whether ``ResponseCacheDisk.__new__`` works as intended.
+    """
+    size_limit = 1000
+    
+    with TemporaryDirectory() as directory:
+        directory = join_paths(directory, 'cache')
+        
+        cache = ResponseCacheDisk(directory, size_limit = size_limit)
+        _assert_fields_set(cache)
+        
+        vampytest.assert_eq(cache.directory, directory)
+        vampytest.assert_eq(cache.size_limit, size_limit)
+        vampytest.assert_eq(cache.size, 0)
+        vampytest.assert_eq(len(cache), 0)
+        vampytest.assert_eq(list_directory(directory), [])
+
+
+def test__ResponseCacheDisk__repr():
+    """
+    Tests whether ``ResponseCacheDisk.__repr__`` works as intended.
+    """
+    with TemporaryDirectory() as directory:
+        cache = ResponseCacheDisk(directory)
+        
+        output = repr(cache)
+        vampytest.assert_instance(output, str)
+        vampytest.assert_in(type(cache).__name__, output)
+
+
+async def test__ResponseCacheDisk__entries():
+    """
+    Tests whether ``ResponseCacheDisk`` stores, returns and evicts entries as intended.
+    
+    This function is a coroutine.
+    """
+    with TemporaryDirectory() as directory:
+        cache = ResponseCacheDisk(directory)
+        
+        entry_0 = _create_entry(b'a' * 100)
+        entry_1 = _create_entry(b'b' * 100)
+        
+        await cache.set_entry('0', entry_0)
+        await cache.set_entry('1', entry_1)
+        vampytest.assert_eq(len(cache), 2)
+        vampytest.assert_eq(sorted(list_directory(directory)), sorted([get_entry_file_name('0'), get_entry_file_name('1')]))
+        
+        vampytest.assert_eq(await cache.get_entry('0'), entry_0)
+        vampytest.assert_eq(await cache.get_entry('1'), entry_1)
+        vampytest.assert_is(await cache.get_entry('2'), None)
+        
+        # Reloading the cache should find the same entries.
+        reloaded_cache = ResponseCacheDisk(directory)
+        vampytest.assert_eq(len(reloaded_cache), 2)
+        vampytest.assert_eq(reloaded_cache.size, cache.size)
+        vampytest.assert_eq(await reloaded_cache.get_entry('0'), entry_0)
+        
+        # Evict the least recently used entry.
+        cache.size_limit = cache.size - 1
+        await cache.set_entry('1', entry_1)
+        vampytest.assert_eq(len(cache), 1)
+        vampytest.assert_is(await cache.get_entry('0'), None)
+        vampytest.assert_eq(list_directory(directory), [get_entry_file_name('1')])
+        
+        await cache.remove_entry('1')
+        vampytest.assert_eq(len(cache), 0)
+        vampytest.assert_eq(cache.size, 0)
+        vampytest.assert_eq(list_directory(directory), [])
+
+
+async def test__ResponseCacheDisk__set_entry__concurrent():
+    """
+    Tests whether ``ResponseCacheDisk.set_entry`` works as intended.
+    
+    Case: the same entry is written concurrently.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    
+    with TemporaryDirectory() as directory:
+        cache = ResponseCacheDisk(directory)
+        
+        entries = [_create_entry(bytes([index]) * 100000) for index in range(8)]
+        tasks = [loop.create_task(cache.set_entry('0', entry)) for entry in entries]
+        for task in tasks:
+            await task
+        
+        vampytest.assert_eq(list_directory(directory), [get_entry_file_name('0')])
+        vampytest.assert_in(await cache.get_entry('0'), entries)
+
+
+async def test__ResponseCacheDisk__get_entry__corrupted():
+    """
+    Tests whether ``ResponseCacheDisk.get_entry`` drops corrupted entries.
+    
+    This function is a coroutine.
+    """
+    with TemporaryDirectory() as directory:
+        cache = ResponseCacheDisk(directory)
+        await cache.set_entry('0', _create_entry(b'satori'))
+        
+        with open(join_paths(directory, get_entry_file_name('0')), 'wb') as file:
+            file.write(b'koishi')
+        
+        vampytest.assert_is(await cache.get_entry('0'), None)
+        vampytest.assert_eq(len(cache), 0)
+        vampytest.assert_eq(list_directory(directory), [])
+
+
+async def test__ResponseCacheDisk__clear():
+    """
+    Tests whether ``ResponseCacheDisk.clear`` works as intended.
+    
+    This function is a coroutine.
+    """
+    with TemporaryDirectory() as directory:
+        cache = ResponseCacheDisk(directory)
+        await cache.set_entry('0', _create_entry(b'satori'))
+        await cache.set_entry('1', _create_entry(b'koishi'))
+        
+        await cache.clear()
+        vampytest.assert_eq(len(cache), 0)
+        vampytest.assert_eq(cache.size, 0)
+        vampytest.assert_eq(list_directory(directory), [])
@@ -0,0 +1,526 @@
+import vampytest
+
+from ...utils import IgnoreCaseMultiValueDictionary
+from ...web_common import HttpVersion11
+from ...web_common.headers import (
+    CACHE_CONTROL, CONTENT_ENCODING, CONTENT_LENGTH, ETAG, IF_MODIFIED_SINCE, IF_NONE_MATCH, LAST_MODIFIED,
+    TRANSFER_ENCODING, VARY
+)
+from ...web_common.http_message import RawResponseMessage
+
+from ..client_response import ClientResponse
+from ..response_cache_entry import ResponseCacheEntry, get_freshness_lifetime, get_stored_headers, parse_cache_control
+
+from .helpers import _get_default_request
+
+
+def _create_response(status, headers, body):
+    """
+    Creates a response with the given fields.
+    
+    Parameters
+    ----------
+    status : `int`
+        Response status.
+    
+    headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+        Response headers.
+    
+    body : `bytes`
+        Response body.
+    
+    Returns
+    -------
+    response : ``ClientResponse``
+    """
+    response = ClientResponse(_get_default_request(), None)
+    response.raw_message = RawResponseMessage(HttpVersion11, status, 'OK', headers)
+    response.body = body
+    response.closed = True
+    response._released = True
+    return response
+
+
+def _assert_fields_set(entry):
+    """
+    Asserts whether every fields are set of the given response cache entry.
+    
+    Parameters
+    ----------
+    entry : ``ResponseCacheEntry``
+        The entry to check.
+    """
+    vampytest.assert_instance(entry, ResponseCacheEntry)
+    vampytest.assert_instance(entry.body, bytes)
+    vampytest.assert_instance(entry.freshness_lifetime, float)
+    vampytest.assert_instance(entry.headers, IgnoreCaseMultiValueDictionary)
+    vampytest.assert_instance(entry.reason, str, nullable = True)
+    vampytest.assert_instance(entry.status, int)
+    vampytest.assert_instance(entry.stored_at, float)
+    vampytest.assert_instance(entry.vary, tuple)
+    vampytest.assert_instance(entry.version, tuple)
+
+
+def _get_default_entry():
+    """
+    Creates a response cache entry.
+    
+    Returns
+    -------
+    entry : ``ResponseCacheEntry``
+    """
+    return ResponseCacheEntry(
+        HttpVersion11,
+        200,
+        'OK',
+        IgnoreCaseMultiValueDictionary([(ETAG, '"koishi"'), (CACHE_CONTROL, 'max-age=60')]),
+        b'satori',
+        1000.0,
+        60.0,
+        (('accept', 'text/plain'),),
+    )
+
+
+def test__ResponseCacheEntry__new():
+    """
+    Tests whether ``ResponseCacheEntry.__new__`` works as intended.
+    """
+    version = HttpVersion11
+    status = 200
+    reason = 'OK'
+    headers = IgnoreCaseMultiValueDictionary([(ETAG, '"koishi"')])
+    body = b'satori'
+    stored_at = 1000.0
+    freshness_lifetime = 60.0
+    vary = (('accept', 'text/plain'),)
+    
+    entry = ResponseCacheEntry(version, status, reason, headers, body, stored_at, freshness_lifetime, vary)
+    _assert_fields_set(entry)
+    
+    vampytest.assert_eq(entry.version, version)
+    vampytest.assert_eq(entry.status, status)
+    vampytest.assert_eq(entry.reason, reason)
+    vampytest.assert_eq(entry.headers, headers)
+    vampytest.assert_eq(entry.body, body)
+    vampytest.assert_eq(entry.stored_at, stored_at)
+    vampytest.assert_eq(entry.freshness_lifetime, freshness_lifetime)
+    vampytest.assert_eq(entry.vary, vary)
+
+
+def test__ResponseCacheEntry__repr():
+    """
+    Tests whether ``ResponseCacheEntry.__repr__`` works as intended.
+    """
+    entry = _get_default_entry()
+    
+    output = repr(entry)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(entry).__name__, output)
+
+
+def _iter_options__from_response():
+    yield (
+        200,
+        IgnoreCaseMultiValueDictionary([(CACHE_CONTROL, 'max-age=60')]),
+        IgnoreCaseMultiValueDictionary(),
+        (True, 60.0, ()),
+    )
+    
+    yield (
+        200,
+        IgnoreCaseMultiValueDictionary([(CACHE_CONTROL, 'max-age=60, no-store')]),
+        IgnoreCaseMultiValueDictionary(),
+        (False, 0.0, None),
+    )
+    
+    yield (
+        200,
+        IgnoreCaseMultiValueDictionary([(ETAG, '"koishi"')]),
+        IgnoreCaseMultiValueDictionary(),
+        (True, 0.0, ()),
+    )
+    
+    yield (
+        200,
+        IgnoreCaseMultiValueDictionary(),
+        IgnoreCaseMultiValueDictionary(),
+        (False, 0.0, None),
+    )
+    
+    yield (
+        404,
+        IgnoreCaseMultiValueDictionary([(CACHE_CONTROL, 'max-age=60')]),
+        IgnoreCaseMultiValueDictionary(),
+        (False, 0.0, None),
+    )
+    
+    yield (
+        200,
+        IgnoreCaseMultiValueDictionary([(CACHE_CONTROL, 'max-age=60'), (VARY, '*')]),
+        IgnoreCaseMultiValueDictionary(),
+        (False, 0.0, None),
+    )
+    
+    yield (
+        200,
+        IgnoreCaseMultiValueDictionary([(CACHE_CONTROL, 'max-age=60, s-maxage=120'), (VARY, 'Accept, Origin')]),
+        IgnoreCaseMultiValueDictionary([('Accept', 'text/plain')]),
+        (True, 60.0, (('accept', 'text/plain'), ('origin', None))),
+    )
+
+
+@vampytest._(vampytest.call_from(_iter_options__from_response()).returning_last())
+async def test__ResponseCacheEntry__from_response(status, response_headers, request_headers):
+    """
+    Tests whether ``ResponseCacheEntry.from_response`` works as intended.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    status : `int`
+        Response status.
+    
+    response_headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+        Response headers.
+    
+    request_headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+        Request headers.
+    
+    Returns
+    -------
+    output : `(bool, float, None | tuple<(str, None | str)>)`
+    """
+    response = _create_response(status, response_headers, b'satori')
+    entry = ResponseCacheEntry.from_response(response, response.body, request_headers, 1000.0)
+    if entry is None:
+        return False, 0.0, None
+    
+    _assert_fields_set(entry)
+    vampytest.assert_eq(entry.body, b'satori')
+    vampytest.assert_eq(entry.stored_at, 1000.0)
+    vampytest.assert_eq(entry.headers, response_headers)
+    vampytest.assert_is_not(entry.headers, response_headers)
+    return True, entry.freshness_lifetime, entry.vary
+
+
+async def test__ResponseCacheEntry__from_response__encoded():
+    """
+    Tests whether ``ResponseCacheEntry.from_response`` works as intended.
+    
+    Case: the received body was compressed, but the stored one is decompressed.
+    
+    This function is a coroutine.
+    """
+    response_headers = IgnoreCaseMultiValueDictionary([
+        (CACHE_CONTROL, 'max-age=60'),
+        (CONTENT_ENCODING, 'gzip'),
+        (CONTENT_LENGTH, '3'),
+    ])
+    response = _create_response(200, response_headers, b'satori')
+    
+    entry = ResponseCacheEntry.from_response(response, response.body, IgnoreCaseMultiValueDictionary(), 1000.0)
+    vampytest.assert_is_not(entry, None)
+    vampytest.assert_eq(
+        entry.headers,
+        IgnoreCaseMultiValueDictionary([(CACHE_CONTROL, 'max-age=60'), (CONTENT_LENGTH, '6')]),
+    )
+    
+    created_response = entry.create_response(_get_default_request())
+    vampytest.assert_not_in(CONTENT_ENCODING, created_response.headers)
+    vampytest.assert_eq(created_response.headers[CONTENT_LENGTH], str(len(created_response.body)))
+
+
+def _iter_options__get_stored_headers():
+    yield (
+        IgnoreCaseMultiValueDictionary([(ETAG, '"koishi"')]),
+        b'satori',
+        IgnoreCaseMultiValueDictionary([(ETAG, '"koishi"')]),
+    )
+    yield (
+        IgnoreCaseMultiValueDictionary([(ETAG, '"koishi"'), (CONTENT_ENCODING, 'br'), (CONTENT_LENGTH, '2')]),
+        b'satori',
+        IgnoreCaseMultiValueDictionary([(ETAG, '"koishi"'), (CONTENT_LENGTH, '6')]),
+    )
+    yield (
+        IgnoreCaseMultiValueDictionary([(ETAG, '"koishi"'), (TRANSFER_ENCODING, 'chunked')]),
+        b'satori',
+        IgnoreCaseMultiValueDictionary([(ETAG, '"koishi"')]),
+    )
+
+
+@vampytest._(vampytest.call_from(_iter_options__get_stored_headers()).returning_last())
+def test__get_stored_headers(headers, body):
+    """
+    Tests whether ``get_stored_headers`` works as intended.
+    
+    Parameters
+    ----------
+    headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+        The response's headers.
+    
+    body : `bytes`
+        The stored body.
+    
+    Returns
+    -------
+    output : ``IgnoreCaseMultiValueDictionary<str, str>``
+    """
+    output = get_stored_headers(headers, body)
+    vampytest.assert_is_not(output, headers)
+    return output
+
+
+def _iter_options__is_fresh():
+    yield 1000.0, True
+    yield 1059.0, True
+    yield 1060.0, False
+    yield 2000.0, False
+
+
+@vampytest._(vampytest.call_from(_iter_options__is_fresh()).returning_last())
+def test__ResponseCacheEntry__is_fresh(now):
+    """
+    Tests whether ``ResponseCacheEntry.is_fresh`` works as intended.
+    
+    Parameters
+    ----------
+    now : `float`
+        The current unix time.
+    
+    Returns
+    -------
+    output : `bool`
+    """
+    entry = _get_default_entry()
+    output = entry.is_fresh(now)
+    vampytest.assert_instance(output, bool)
+    return output
+
+
+def _iter_options__is_matching_request():
+    yield IgnoreCaseMultiValueDictionary([('Accept', 'text/plain')]), True
+    yield IgnoreCaseMultiValueDictionary([('Accept', 'text/html')]), False
+    yield IgnoreCaseMultiValueDictionary(), False
+
+
+@vampytest._(vampytest.call_from(_iter_options__is_matching_request()).returning_last())
+def test__ResponseCacheEntry__is_matching_request(request_headers):
+    """
+    Tests whether ``ResponseCacheEntry.is_matching_request`` works as intended.
+    
+    Parameters
+    ----------
+    request_headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+        Request headers.
+    
+    Returns
+    -------
+    output : `bool`
+    """
+    entry = _get_default_entry()
+    output = entry.is_matching_request(request_headers)
+    vampytest.assert_instance(output, bool)
+    return output
+
+
+def _iter_options__add_validators():
+    yield (
+        IgnoreCaseMultiValueDictionary(),
+        (False, IgnoreCaseMultiValueDictionary()),
+    )
+    
+    yield (
+        IgnoreCaseMultiValueDictionary([(ETAG, '"koishi"')]),
+        (True, IgnoreCaseMultiValueDictionary([(IF_NONE_MATCH, '"koishi"')])),
+    )
+    
+    yield (
+        IgnoreCaseMultiValueDictionary([(ETAG, '"koishi"'), (LAST_MODIFIED, 'Sat, 01 Jan 2000 00:00:00 GMT')]),
+        (
+            True,
+            IgnoreCaseMultiValueDictionary([
+                (IF_NONE_MATCH, '"koishi"'),
+                (IF_MODIFIED_SINCE, 'Sat, 01 Jan 2000 00:00:00 GMT'),
+            ]),
+        ),
+    )
+
+
+@vampytest._(vampytest.call_from(_iter_options__add_validators()).returning_last())
+def test__ResponseCacheEntry__add_validators(headers):
+    """
+    Tests whether ``ResponseCacheEntry.add_validators`` works as intended.
+    
+    Parameters
+    ----------
+    headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+        The entry's headers.
+    
+    Returns
+    -------
+    output : `(bool, IgnoreCaseMultiValueDictionary<str, str>)`
+    """
+    entry = _get_default_entry()
+    entry.headers = headers
+    
+    request_headers = IgnoreCaseMultiValueDictionary()
+    output = entry.add_validators(request_headers)
+    vampytest.assert_instance(output, bool)
+    return output, request_headers
+
+
+def test__ResponseCacheEntry__update_not_modified():
+    """
+    Tests whether ``ResponseCacheEntry.update_not_modified`` works as intended.
+    """
+    entry = _get_default_entry()
+    
+    entry.update_not_modified(
+        IgnoreCaseMultiValueDictionary([(CACHE_CONTROL, 'max-age=120'), ('Content-Length', '0')]),
+        2000.0,
+    )
+    
+    vampytest.assert_eq(entry.stored_at, 2000.0)
+    vampytest.assert_eq(entry.freshness_lifetime, 120.0)
+    vampytest.assert_eq(
+        entry.headers,
+        IgnoreCaseMultiValueDictionary([(ETAG, '"koishi"'), (CACHE_CONTROL, 'max-age=120')]),
+    )
+    vampytest.assert_eq(entry.body, b'satori')
+
+
+async def test__ResponseCacheEntry__create_response():
+    """
+    Tests whether ``ResponseCacheEntry.create_response`` works as intended.
+    
+    This function is a coroutine.
+    """
+    entry = _get_default_entry()
+    request = _get_default_request()
+    
+    response = entry.create_response(request)
+    vampytest.assert_instance(response, ClientResponse)
+    vampytest.assert_eq(response.status, entry.status)
+    vampytest.assert_eq(response.headers, entry.headers)
+    vampytest.assert_is_not(response.headers, entry.headers)
+    vampytest.assert_eq(response.body, entry.body)
+    vampytest.assert_true(response.closed)
+
+
+def test__ResponseCacheEntry__to_data__from_data():
+    """
+    Tests whether ``ResponseCacheEntry.to_data`` and ``.from_data`` works as intended.
+    """
+    entry = _get_default_entry()
+    
+    data = entry.to_data()
+    vampytest.assert_instance(data, dict)
+    
+    output = ResponseCacheEntry.from_data(data, entry.body)
+    _assert_fields_set(output)
+    vampytest.assert_eq(output, entry)
+
+
+def _iter_options__eq():
+    keyword_parameters = {
+        'version': HttpVersion11,
+        'status': 200,
+        'reason': 'OK',
+        'headers': IgnoreCaseMultiValueDictionary([(ETAG, '"koishi"')]),
+        'body': b'satori',
+        'stored_at': 1000.0,
+        'freshness_lifetime': 60.0,
+        'vary': (),
+    }
+    
+    yield keyword_parameters, keyword_parameters, True
+    yield keyword_parameters, {**keyword_parameters, 'status': 203}, False
+    yield keyword_parameters, {**keyword_parameters, 'body': b'orin'}, False
+    yield keyword_parameters, {**keyword_parameters, 'stored_at': 1001.0}, False
+    yield keyword_parameters, {**keyword_parameters, 'vary': (('accept', None),)}, False
+
+
+@vampytest._(vampytest.call_from(_iter_options__eq()).returning_last())
+def test__ResponseCacheEntry__eq(keyword_parameters_0, keyword_parameters_1):
+    """
+    Tests whether ``ResponseCacheEntry.__eq__`` works as intended.
+    
+    Parameters
+    ----------
+    keyword_parameters_0 : `dict<str, object>`
+        Keyword parameters to create instance with.
+    
+    keyword_parameters_1 : `dict<str, object>`
+        Keyword parameters to create instance with.
+    
+    Returns
+    -------
+    output : `bool`
+    """
+    entry_0 = ResponseCacheEntry(**keyword_parameters_0)
+    entry_1 = ResponseCacheEntry(**keyword_parameters_1)
+    
+    output = entry_0 == entry_1
+    vampytest.assert_instance(output, bool)
+    return output
+
+
+def _iter_options__parse_cache_control():
+    yield IgnoreCaseMultiValueDictionary(), {}
+    yield (
+        IgnoreCaseMultiValueDictionary([(CACHE_CONTROL, 'Max-Age=60, no-cache'), (CACHE_CONTROL, 'private="a"')]),
+        {'max-age': '60', 'no-cache': None, 'private': 'a'},
+    )
+
+
+@vampytest._(vampytest.call_from(_iter_options__parse_cache_control()).returning_last())
+def test__parse_cache_control(headers):
+    """
+    Tests whether ``parse_cache_control`` works as intended.
+    
+    Parameters
+    ----------
+    headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+        Headers to parse from.
+    
+    Returns
+    -------
+    output : `dict<str, None | str>`
+    """
+    return parse_cache_control(headers)
+
+
+def _iter_options__get_freshness_lifetime():
+    yield IgnoreCaseMultiValueDictionary(), 0.0
+    yield IgnoreCaseMultiValueDictionary([(CACHE_CONTROL, 'no-store')]), -1.0
+    yield IgnoreCaseMultiValueDictionary([(CACHE_CONTROL, 'no-cache, max-age=60')]), 0.0
+    yield IgnoreCaseMultiValueDictionary([(CACHE_CONTROL, 'max-age=60'), ('Age', '20')]), 40.0
+    yield IgnoreCaseMultiValueDictionary([(CACHE_CONTROL, 'max-age=60'), ('Age', '80')]), 0.0
+    yield (
+        IgnoreCaseMultiValueDictionary([
+            ('Date', 'Sat, 01 Jan 2000 00:00:00 GMT'),
+            ('Expires', 'Sat, 01 Jan 2000 00:01:00 GMT'),
+        ]),
+        60.0,
+    )
+    yield IgnoreCaseMultiValueDictionary([('Expires', '0')]), 0.0
+
+
+@vampytest._(vampytest.call_from(_iter_options__get_freshness_lifetime()).returning_last())
+def test__get_freshness_lifetime(headers):
+    """
+    Tests whether ``get_freshness_lifetime`` works as intended.
+    
+    Parameters
+    ----------
+    headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+        Response headers.
+    
+    Returns
+    -------
+    output : `float`
+    """
+    output = get_freshness_lifetime(headers, 1000.0)
+    vampytest.assert_instance(output, float)
+    return output
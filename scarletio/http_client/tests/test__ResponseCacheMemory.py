@@ -0,0 +1,285 @@
+import vampytest
+
+from ...core import PayloadStream, get_event_loop
+from ...utils import IgnoreCaseMultiValueDictionary
+from ...web_common import HttpReadWriteProtocol, HttpVersion11
+from ...web_common.headers import CACHE_CONTROL, CONTENT_LENGTH, ETAG, IF_NONE_MATCH
+from ...web_common.http_message import RawResponseMessage
+
+from ..client_response import ClientResponse
+from ..response_cache_entry import ResponseCacheEntry
+from ..response_cache_memory import ResponseCacheMemory
+
+from .helpers import _get_default_request
+
+
+def _assert_fields_set(cache):
+    """
+    Asserts whether every fields are set of the given response cache.
+    
+    Parameters
+    ----------
+    cache : ``ResponseCacheMemory``
+        The cache to check.
+    """
+    vampytest.assert_instance(cache, ResponseCacheMemory)
+    vampytest.assert_instance(cache.entries, dict)
+    vampytest.assert_instance(cache.entry_sizes, dict)
+    vampytest.assert_instance(cache.hit_count, int)
+    vampytest.assert_instance(cache.miss_count, int)
+    vampytest.assert_instance(cache.revalidation_count, int)
+    vampytest.assert_instance(cache.size, int)
+    vampytest.assert_instance(cache.size_limit, int)
+
+
+def _create_entry(body):
+    """
+    Creates a response cache entry.
+    
+    Parameters
+    ----------
+    body : `bytes`
+        Response body.
+    
+    Returns
+    -------
+    entry : ``ResponseCacheEntry``
+    """
+    return ResponseCacheEntry(HttpVersion11, 200, 'OK', IgnoreCaseMultiValueDictionary(), body, 1000.0, 60.0, ())
+
+
+def _create_response(request, status, headers, body):
+    """
+    Creates a response with the given fields.
+    
+    Parameters
+    ----------
+    request : ``ClientRequest``
+        The respective request.
+    
+    status : `int`
+        Response status.
+    
+    headers : ``IgnoreCaseMultiValueDictionary<str, str>``
+        Response headers.
+    
+    body : `bytes`
+        Response body.
+    
+    Returns
+    -------
+    response : ``ClientResponse``
+    """
+    response = ClientResponse(request, None)
+    response.raw_message = RawResponseMessage(HttpVersion11, status, 'OK', headers)
+    response.body = body
+    response.closed = True
+    response._released = True
+    return response
+
+
+def test__ResponseCacheMemory__new():
+    """
+    Tests whether ``ResponseCacheMemory.__new__`` works as intended.
+    """
+    size_limit = 1000
+    
+    cache = ResponseCacheMemory(size_limit = size_limit)
+    _assert_fields_set(cache)
+    
+    vampytest.assert_eq(cache.size_limit, size_limit)
+    vampytest.assert_eq(cache.size, 0)
+    vampytest.assert_eq(len(cache), 0)
+
+
+def _iter_options__new__type_error():
+    yield {'size_limit': 'hey'}
+
+
+def _iter_options__new__value_error():
+    yield {'size_limit': 0}
+
+
+@vampytest._(vampytest.call_from(_iter_options__new__type_error()).raising(TypeError))
+@vampytest._(vampytest.call_from(_iter_options__new__value_error()).raising(ValueError))
+def test__ResponseCacheMemory__new__error(keyword_parameters):
+    """
+    Tests whether ``ResponseCacheMemory.__new__`` raises on invalid parameters.
+    
+    Parameters
+    ----------
+    keyword_parameters : `dict<str, object>`
+        Keyword parameters to create the cache with.
+    
+    Raises
+    ------
+    TypeError
+    ValueError
+    """
+    ResponseCacheMemory(**keyword_parameters)
+
+
+def test__ResponseCacheMemory__repr():
+    """
+    Tests whether ``ResponseCacheMemory.__repr__`` works as intended.
+    """
+    cache = ResponseCacheMemory()
+    
+    output = repr(cache)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(cache).__name__, output)
+
+
+async def test__ResponseCacheMemory__entries():
+    """
+    Tests whether ``ResponseCacheMemory`` stores, returns and evicts entries as intended.
+    
+    This function is a coroutine.
+    """
+    cache = ResponseCacheMemory(size_limit = 20)
+    
+    entry_0 = _create_entry(b'a' * 8)
+    entry_1 = _create_entry(b'b' * 8)
+    entry_2 = _create_entry(b'c' * 8)
+    
+    await cache.set_entry('0', entry_0)
+    await cache.set_entry('1', entry_1)
+    vampytest.assert_eq(cache.size, 16)
+    
+    # Use `0`, so `1` becomes the least recently used.
+    vampytest.assert_is(await cache.get_entry('0'), entry_0)
+    
+    await cache.set_entry('2', entry_2)
+    vampytest.assert_eq(len(cache), 2)
+    vampytest.assert_eq(cache.size, 16)
+    vampytest.assert_is(await cache.get_entry('1'), None)
+    vampytest.assert_is(await cache.get_entry('0'), entry_0)
+    vampytest.assert_is(await cache.get_entry('2'), entry_2)
+    
+    await cache.remove_entry('0')
+    vampytest.assert_eq(len(cache), 1)
+    vampytest.assert_eq(cache.size, 8)
+    
+    await cache.clear()
+    vampytest.assert_eq(len(cache), 0)
+    vampytest.assert_eq(cache.size, 0)
+
+
+async def test__ResponseCacheMemory__lookup__fresh():
+    """
+    Tests whether ``ResponseCacheMemory.lookup`` and ``.process_response`` serves fresh entries.
+    
+    This function is a coroutine.
+    """
+    cache = ResponseCacheMemory()
+    
+    request = _get_default_request()
+    response, entry = await cache.lookup(request)
+    vampytest.assert_is(response, None)
+    vampytest.assert_is(entry, None)
+    
+    response = _create_response(
+        request, 200, IgnoreCaseMultiValueDictionary([(CACHE_CONTROL, 'max-age=60')]), b'satori'
+    )
+    output = await cache.process_response(request, response, entry)
+    vampytest.assert_is(output, response)
+    vampytest.assert_eq(len(cache), 1)
+    vampytest.assert_eq(cache.miss_count, 1)
+    
+    request = _get_default_request()
+    response, entry = await cache.lookup(request)
+    vampytest.assert_instance(response, ClientResponse)
+    vampytest.assert_is(entry, None)
+    vampytest.assert_eq(response.status, 200)
+    vampytest.assert_eq(await response.read(), b'satori')
+    vampytest.assert_eq(cache.hit_count, 1)
+    
+    # `no-cache` requests are not served from the cache.
+    request = _get_default_request()
+    request.headers[CACHE_CONTROL] = 'no-cache'
+    response, entry = await cache.lookup(request)
+    vampytest.assert_is(response, None)
+
+
+async def test__ResponseCacheMemory__lookup__revalidate():
+    """
+    Tests whether ``ResponseCacheMemory.lookup`` and ``.process_response`` revalidates stale entries.
+    
+    This function is a coroutine.
+    """
+    cache = ResponseCacheMemory()
+    
+    request = _get_default_request()
+    response = _create_response(
+        request, 200, IgnoreCaseMultiValueDictionary([(CACHE_CONTROL, 'no-cache'), (ETAG, '"koishi"')]), b'satori'
+    )
+    await cache.process_response(request, response, None)
+    vampytest.assert_eq(len(cache), 1)
+    
+    request = _get_default_request()
+    request_headers = request.headers
+    response, entry = await cache.lookup(request)
+    vampytest.assert_is(response, None)
+    vampytest.assert_instance(entry, ResponseCacheEntry)
+    vampytest.assert_eq(request.headers.get(IF_NONE_MATCH, None), '"koishi"')
+    # The original headers should not be modified.
+    vampytest.assert_not_in(IF_NONE_MATCH, request_headers)
+    
+    response = _create_response(request, 304, IgnoreCaseMultiValueDictionary([(ETAG, '"koishi"')]), b'')
+    output = await cache.process_response(request, response, entry)
+    vampytest.assert_instance(output, ClientResponse)
+    vampytest.assert_eq(output.status, 200)
+    vampytest.assert_eq(await output.read(), b'satori')
+    vampytest.assert_eq(cache.revalidation_count, 1)
+
+
+async def test__ResponseCacheMemory__process_response__not_storable():
+    """
+    Tests whether ``ResponseCacheMemory.process_response`` does not store responses which should not be.
+    
+    This function is a coroutine.
+    """
+    cache = ResponseCacheMemory(size_limit = 100)
+    
+    request = _get_default_request()
+    response = _create_response(
+        request, 200, IgnoreCaseMultiValueDictionary([(CACHE_CONTROL, 'no-store')]), b'satori'
+    )
+    await cache.process_response(request, response, None)
+    vampytest.assert_eq(len(cache), 0)
+    
+    request = _get_default_request()
+    response = _create_response(
+        request, 200, IgnoreCaseMultiValueDictionary([(CACHE_CONTROL, 'max-age=60')]), b'a' * 200
+    )
+    await cache.process_response(request, response, None)
+    vampytest.assert_eq(len(cache), 0)
+    
+    vampytest.assert_eq(cache.miss_count, 2)
+
+
+async def test__ResponseCacheMemory__process_response__unknown_length():
+    """
+    Tests whether ``ResponseCacheMemory.process_response`` does not read bodies of unknown length.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    cache = ResponseCacheMemory(size_limit = 100)
+    
+    for headers, expected_length in (
+        (IgnoreCaseMultiValueDictionary([(CACHE_CONTROL, 'max-age=60')]), 0),
+        (IgnoreCaseMultiValueDictionary([(CACHE_CONTROL, 'max-age=60'), (CONTENT_LENGTH, '6')]), 1),
+    ):
+        request = _get_default_request()
+        response = _create_response(request, 200, headers, None)
+        
+        payload_stream = PayloadStream(HttpReadWriteProtocol(loop))
+        payload_stream.add_received_chunk(b'satori')
+        payload_stream.set_done_success()
+        response.payload_stream = payload_stream
+        
+        output = await cache.process_response(request, response, None)
+        vampytest.assert_is(output, response)
+        vampytest.assert_eq(len(cache), expected_length)
+        vampytest.assert_eq(await response.read(), b'satori')
@@ -18,6 +18,7 @@ from .hybrid_value_dictionary import *
 from .ignore_case_multi_value_dictionary import *
 from .ignore_case_string import *
 from .json import *
+from .json_item_parsing import *
 from .keep_type import *
 from .method_like import *
 from .multi_value_dictionary import *
@@ -59,6 +60,7 @@ __all__ = (
     *ignore_case_multi_value_dictionary.__all__,
     *ignore_case_string.__all__,
     *json.__all__,
+    *json_item_parsing.__all__,
     *keep_type.__all__,
     *method_like.__all__,
     *multi_value_dictionary.__all__,
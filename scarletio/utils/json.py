@@ -1,9 +1,30 @@
-__all__ = ('JSONDecodeError', 'from_json', 'to_json')
+__all__ = (
+    'JSONBackend', 'JSONDecodeError', 'from_json', 'from_json_async', 'get_json_backend', 'register_json_backend',
+    'set_json_backend', 'to_json', 'to_json_async'
+)
 
 from enum import Enum
-from json import JSONDecodeError, dumps as dump_to_json, loads as from_json
+from json import JSONDecodeError, dumps as dump_to_json, loads as load_from_json
+from re import compile as re_compile
 
 from .docs import has_docs
+from .export_include import include
+from .function_tools import alchemy_incendiary
+from .rich_attribute_error import RichAttributeErrorBaseType
+
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+get_event_loop = include('get_event_loop')
+
+
+JSON_EXECUTOR_THRESHOLD = 1 << 18
+
+NON_ASCII_RP = re_compile('[^\\x00-\\x7f]')
 
 
 @has_docs
@@ -34,6 +55,116 @@ def added_json_serializer(obj):
     raise TypeError(f'Object of type {type(obj).__name__!r} is not JSON serializable, got {obj!r}')
 
 
+class JSONBackend(RichAttributeErrorBaseType):
+    """
+    Json encoder and decoder pair used by ``to_json`` and ``from_json``.
+    
+    Attributes
+    ----------
+    dump : `FunctionType`
+        Converts an object to json string. Should produce ascii output with compact separators and handle the object
+        types ``added_json_serializer`` handles.
+    
+    load : `FunctionType`
+        Loads a json string, `bytes` or `bytearray`.
+    
+    name : `str`
+        The backend's name.
+    """
+    __slots__ = ('dump', 'load', 'name')
+    
+    def __new__(cls, name, dump, load):
+        """
+        Creates a new json backend.
+        
+        Parameters
+        ----------
+        name : `str`
+            The backend's name.
+        
+        dump : `FunctionType`
+            Converts an object to json string.
+        
+        load : `FunctionType`
+            Loads a json string, `bytes` or `bytearray`.
+        """
+        self = object.__new__(cls)
+        self.dump = dump
+        self.load = load
+        self.name = name
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the json backend's representation."""
+        return f'<{type(self).__name__} name = {self.name!r}>'
+
+
+JSON_BACKENDS = {}
+JSON_BACKEND = None
+
+
+@has_docs
+def register_json_backend(backend):
+    """
+    Registers a json backend, so it can be selected by ``set_json_backend``.
+    
+    Parameters
+    ----------
+    backend : ``JSONBackend``
+        The backend to register.
+    
+    Raises
+    ------
+    TypeError
+        - If `backend`'s type is incorrect.
+    """
+    if not isinstance(backend, JSONBackend):
+        raise TypeError(
+            f'`backend` can be `{JSONBackend.__name__}`, got {type(backend).__name__}; {backend!r}.'
+        )
+    
+    JSON_BACKENDS[backend.name] = backend
+
+
+@has_docs
+def set_json_backend(name):
+    """
+    Sets the json backend used by ``to_json`` and ``from_json``.
+    
+    Parameters
+    ----------
+    name : `str`
+        The registered backend's name.
+    
+    Raises
+    ------
+    LookupError
+        - No backend is registered with the given name.
+    """
+    try:
+        backend = JSON_BACKENDS[name]
+    except KeyError:
+        raise LookupError(
+            f'No json backend is registered as {name!r}; registered: {sorted(JSON_BACKENDS.keys())!r}.'
+        ) from None
+    
+    global JSON_BACKEND
+    JSON_BACKEND = backend
+
+
+@has_docs
+def get_json_backend():
+    """
+    Returns the json backend used by ``to_json`` and ``from_json``.
+    
+    Returns
+    -------
+    backend : ``JSONBackend``
+    """
+    return JSON_BACKEND
+
+
 @has_docs
 def to_json(data):
     """
@@ -47,9 +178,270 @@ def to_json(data):
     -------
     json : `str`
     
+    Raises
+    ------
+    TypeError
+        If the given object is /or contains an object with a non convertible type.
+    """
+    return JSON_BACKEND.dump(data)
+
+
+@has_docs
+def from_json(data):
+    """
+    Loads the given json data.
+    
+    Parameters
+    ----------
+    data : `str`, `bytes`, `bytearray`
+        The json data to load.
+    
+    Returns
+    -------
+    obj : `object`
+    
+    Raises
+    ------
+    JSONDecodeError
+        Invalid json data.
+    """
+    return JSON_BACKEND.load(data)
+
+
+def _is_json_encoding_heavy(data, threshold):
+    """
+    Returns whether the encoded size of the given object is likely to be over the given threshold.
+    
+    The object is walked only until the threshold is reached, so the check costs a fraction of the encoding itself.
+    
+    Parameters
+    ----------
+    data : `object`
+        The object to check.
+    
+    threshold : `int`
+        Size threshold.
+    
+    Returns
+    -------
+    is_json_encoding_heavy : `bool`
+    """
+    size = 0
+    stack = [data]
+    
+    while stack:
+        element = stack.pop()
+        if isinstance(element, str):
+            size += len(element) + 2
+        
+        elif isinstance(element, dict):
+            size += 2
+            for key, value in element.items():
+                if isinstance(key, str):
+                    size += len(key) + 3
+                else:
+                    size += 8
+                
+                stack.append(value)
+        
+        elif isinstance(element, (list, tuple)):
+            size += 2
+            stack.extend(element)
+        
+        else:
+            size += 8
+        
+        if size >= threshold:
+            return True
+    
+    return False
+
+
+@has_docs
+async def to_json_async(data, *, threshold = JSON_EXECUTOR_THRESHOLD):
+    """
+    Converts the given object to json. If the output is expected to be big, the conversion is done in an executor, so
+    the event loop is not blocked.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    data : `object`
+        The object to convert.
+    
+    threshold : `int` = `JSON_EXECUTOR_THRESHOLD`, Optional (Keyword only)
+        The approximate output size in characters from which the conversion is done in an executor.
+    
+    Returns
+    -------
+    json : `str`
+    
+    Raises
+    ------
+    TypeError
+        If the given object is /or contains an object with a non convertible type.
+    """
+    if not _is_json_encoding_heavy(data, threshold):
+        return to_json(data)
+    
+    return await get_event_loop().run_in_executor(alchemy_incendiary(to_json, (data,)))
+
+
+@has_docs
+async def from_json_async(data, *, threshold = JSON_EXECUTOR_THRESHOLD):
+    """
+    Loads the given json data. If the data is big, it is loaded in an executor, so the event loop is not blocked.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    data : `str`, `bytes`, `bytearray`
+        The json data to load.
+    
+    threshold : `int` = `JSON_EXECUTOR_THRESHOLD`, Optional (Keyword only)
+        The data's length from which it is loaded in an executor.
+    
+    Returns
+    -------
+    obj : `object`
+    
+    Raises
+    ------
+    JSONDecodeError
+        Invalid json data.
+    """
+    if len(data) < threshold:
+        return from_json(data)
+    
+    return await get_event_loop().run_in_executor(alchemy_incendiary(from_json, (data,)))
+
+
+def _standard_dump(data):
+    """
+    Converts the given object to json using the standard library's `json` module.
+    
+    Parameters
+    ----------
+    data : `object`
+        The object to convert.
+    
+    Returns
+    -------
+    json : `str`
+    
     Raises
     ------
     TypeError
         If the given object is /or contains an object with a non convertible type.
     """
     return dump_to_json(data, separators = (',', ':'), ensure_ascii = True, default = added_json_serializer)
+
+
+register_json_backend(JSONBackend('standard', _standard_dump, load_from_json))
+set_json_backend('standard')
+
+
+if (orjson is not None):
+    ORJSON_DUMP_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+    
+    # Signed integers are supported from the negative side, unsigned ones from the positive.
+    ORJSON_INTEGER_MIN = -(1 << 63)
+    ORJSON_INTEGER_MAX = (1 << 64) - 1
+    
+    def _escape_non_ascii_character(match):
+        """
+        Escapes the matched non-ascii character as the standard library's `json` module does with `ensure_ascii`.
+        
+        Parameters
+        ----------
+        match : `re.Match`
+            The matched character.
+        
+        Returns
+        -------
+        escaped : `str`
+        """
+        code_point = ord(match.group(0))
+        if code_point < 0x10000:
+            return f'\\u{code_point:04x}'
+        
+        code_point -= 0x10000
+        return f'\\u{0xd800 | (code_point >> 10):04x}\\u{0xdc00 | (code_point & 0x3ff):04x}'
+    
+    
+    def _contains_big_integer(data):
+        """
+        Returns whether the given object is / or contains an integer outside of the 64 bit range.
+        
+        Parameters
+        ----------
+        data : `object`
+            The object to check.
+        
+        Returns
+        -------
+        contains_big_integer : `bool`
+        """
+        stack = [data]
+        while stack:
+            element = stack.pop()
+            if isinstance(element, int):
+                if (element < ORJSON_INTEGER_MIN) or (element > ORJSON_INTEGER_MAX):
+                    return True
+            
+            elif isinstance(element, dict):
+                stack.extend(element.keys())
+                stack.extend(element.values())
+            
+            elif isinstance(element, (list, tuple)):
+                stack.extend(element)
+        
+        return False
+    
+    
+    def _orjson_dump(data):
+        """
+        Converts the given object to json using `orjson`.
+        
+        Falls back to the standard library for integers over 64 bits, which `orjson` cannot handle.
+        
+        The output differs from the standard library's one:
+        - `NaN` and infinite floats are converted to `null`.
+        - Floats with exponent are written without a sign and leading zeros (`1e16` instead of `1e+16`).
+        - Enum dictionary keys, `uuid.UUID`-s and `datetime`-s are serialized instead of raising `TypeError`.
+        
+        Parameters
+        ----------
+        data : `object`
+            The object to convert.
+        
+        Returns
+        -------
+        json : `str`
+        
+        Raises
+        ------
+        TypeError
+            If the given object is /or contains an object with a non convertible type.
+        """
+        try:
+            output = orjson.dumps(data, default = added_json_serializer, option = ORJSON_DUMP_OPTIONS)
+        except TypeError:
+            # Only retry for big integers, so non-serializable data is not encoded twice.
+            if not _contains_big_integer(data):
+                raise
+            
+            return _standard_dump(data)
+        
+        output = output.decode('utf-8')
+        if not output.isascii():
+            output = NON_ASCII_RP.sub(_escape_non_ascii_character, output)
+        
+        return output
+    
+    
+    # `orjson.loads` is barely faster than the standard library's loader, but turns integers over 64 bits into floats.
+    # Not set as default since its output differs from the standard library's; opt-in with `set_json_backend`.
+    register_json_backend(JSONBackend('orjson', _orjson_dump, load_from_json))
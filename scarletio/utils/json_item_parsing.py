@@ -0,0 +1,537 @@
+__all__ = ('JSONItemParserArray', 'JSONItemParserBase', 'JSONItemParserLines',)
+
+from codecs import getincrementaldecoder as get_incremental_decoder
+from json import JSONDecodeError, JSONDecoder
+from re import compile as re_compile
+
+from .docs import copy_docs
+from .rich_attribute_error import RichAttributeErrorBaseType
+
+
+WHITESPACE_RP = re_compile(r'[ \t\n\r]*')
+
+JSON_DECODER = JSONDecoder()
+
+NUMBER_CONTINUATION_CHARACTERS = frozenset('0123456789+-.eE')
+
+STATE_VALUE = 0
+STATE_KEY_OR_OBJECT_END = 1
+STATE_KEY = 2
+STATE_COLON = 3
+STATE_SKIP_VALUE = 4
+STATE_COMMA_OR_OBJECT_END = 5
+STATE_ITEM_OR_ARRAY_END = 6
+STATE_ITEM = 7
+STATE_COMMA_OR_ARRAY_END = 8
+STATE_DONE = 9
+
+
+class JSONItemParserBase(RichAttributeErrorBaseType):
+    """
+    Base type for incremental json item parsers.
+    
+    Data is fed to the parser chunk by chunk and every item is decoded as soon as it is complete, so the whole
+    payload is never required to be held in memory at once.
+    
+    Attributes
+    ----------
+    _buffer : `str`
+        Received, but not yet processed data.
+    
+    _decoder : `codecs.IncrementalDecoder`
+        Decoder to decode the received chunks with.
+    
+    _offset : `int`
+        The amount of characters dropped from the start of ``._buffer``.
+    
+    _position : `int`
+        The position where processing should be continued at in ``._buffer``.
+    
+    _retry_size : `int`
+        The size ``._buffer`` should reach before trying to decode an incomplete value again.
+    """
+    __slots__ = ('_buffer', '_decoder', '_offset', '_position', '_retry_size')
+    
+    def __new__(cls, encoding):
+        """
+        Creates a new json item parser.
+        
+        Parameters
+        ----------
+        encoding : `str`
+            Encoding to decode the received data with.
+        
+        Raises
+        ------
+        LookupError
+            Unknown encoding.
+        """
+        self = object.__new__(cls)
+        self._buffer = ''
+        self._decoder = get_incremental_decoder(encoding)()
+        self._offset = 0
+        self._position = 0
+        self._retry_size = 0
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the parser's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' processed = ')
+        repr_parts.append(repr(self._offset + self._position))
+        
+        repr_parts.append(', buffered = ')
+        repr_parts.append(repr(len(self._buffer) - self._position))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def feed(self, chunk):
+        """
+        Feeds a chunk to the parser.
+        
+        Parameters
+        ----------
+        chunk : `bytes-like`
+            The chunk to process.
+        
+        Returns
+        -------
+        items : `list<object>`
+            The items completed by the chunk.
+        
+        Raises
+        ------
+        JSONDecodeError
+            Invalid json data.
+        UnicodeDecodeError
+            Cannot decode the data with the parser's encoding.
+        """
+        items = []
+        
+        data = self._decoder.decode(chunk)
+        if data:
+            self._extend_buffer(data)
+            if len(self._buffer) >= self._retry_size:
+                self._process(items, False)
+        
+        return items
+    
+    
+    def end(self):
+        """
+        Marks the end of the data.
+        
+        Returns
+        -------
+        items : `list<object>`
+            The items completed by the end of the data.
+        
+        Raises
+        ------
+        JSONDecodeError
+            Invalid or incomplete json data.
+        UnicodeDecodeError
+            Cannot decode the data with the parser's encoding.
+        """
+        items = []
+        
+        data = self._decoder.decode(b'', True)
+        if data:
+            self._extend_buffer(data)
+        
+        self._process(items, True)
+        return items
+    
+    
+    def _extend_buffer(self, data):
+        """
+        Extends the buffer with the given data dropping the already processed part of it.
+        
+        Parameters
+        ----------
+        data : `str`
+            The data to extend with.
+        """
+        position = self._position
+        if position:
+            self._buffer = self._buffer[position:] + data
+            self._offset += position
+            self._position = 0
+            
+            retry_size = self._retry_size
+            if retry_size:
+                self._retry_size = retry_size - position
+        
+        else:
+            self._buffer += data
+    
+    
+    def _process(self, items, at_end):
+        """
+        Processes the buffered data.
+        
+        Parameters
+        ----------
+        items : `list<object>`
+            List to extend with the completed items.
+        
+        at_end : `bool`
+            Whether no more data will be received.
+        
+        Raises
+        ------
+        JSONDecodeError
+            Invalid json data.
+        """
+        pass
+    
+    
+    def _decode_value(self, position, at_end):
+        """
+        Decodes the value starting at the given position.
+        
+        If the value is incomplete, marks that decoding should be retried only after the buffer grew enough, so big
+        values are not decoded over and over again.
+        
+        Parameters
+        ----------
+        position : `int`
+            The value's start index in ``._buffer``.
+        
+        at_end : `bool`
+            Whether no more data will be received.
+        
+        Returns
+        -------
+        value : `object`
+            The decoded value. `None` if incomplete.
+        end : `int`
+            The end index of the value. `-1` if incomplete.
+        
+        Raises
+        ------
+        JSONDecodeError
+            Invalid json data. Only raised if `at_end` is `True`.
+        """
+        buffer = self._buffer
+        buffer_length = len(buffer)
+        
+        try:
+            value, end = JSON_DECODER.raw_decode(buffer, position)
+        except JSONDecodeError as exception:
+            if at_end:
+                raise self._create_decode_error(exception.msg, exception.pos) from None
+        
+        else:
+            # Numbers might continue in the next chunk.
+            if at_end or ((end < buffer_length) and (buffer[end] not in NUMBER_CONTINUATION_CHARACTERS)):
+                self._retry_size = 0
+                return value, end
+        
+        self._retry_size = buffer_length + (buffer_length - position)
+        return None, -1
+    
+    
+    def _create_decode_error(self, message, index):
+        """
+        Creates a decode error pointing at the given buffer index.
+        
+        Parameters
+        ----------
+        message : `str`
+            Error message.
+        
+        index : `int`
+            Index in the buffer.
+        
+        Returns
+        -------
+        exception : `JSONDecodeError`
+        """
+        return JSONDecodeError(message, '', self._offset + index)
+
+
+class JSONItemParserArray(JSONItemParserBase):
+    """
+    Incremental json parser yielding the elements of an array inside of the json payload.
+    
+    Attributes
+    ----------
+    _buffer : `str`
+        Received, but not yet processed data.
+    
+    _decoder : `codecs.IncrementalDecoder`
+        Decoder to decode the received chunks with.
+    
+    _depth : `int`
+        The amount of keys matched from ``._path``. After the array is processed, it is negated and counts the
+        objects left to be closed.
+    
+    _key : `None | str`
+        The last key decoded on the path.
+    
+    _offset : `int`
+        The amount of characters dropped from the start of ``._buffer``.
+    
+    _path : `tuple<str>`
+        Object keys leading to the array to yield the elements of.
+    
+    _position : `int`
+        The position where processing should be continued at in ``._buffer``.
+    
+    _retry_size : `int`
+        The size ``._buffer`` should reach before trying to decode an incomplete value again.
+    
+    _state : `int`
+        The parser's state.
+    """
+    __slots__ = ('_depth', '_key', '_path', '_state')
+    
+    def __new__(cls, path, encoding):
+        """
+        Creates a new json array item parser.
+        
+        Parameters
+        ----------
+        path : `tuple<str>`
+            Object keys leading to the array to yield the elements of.
+            Pass it as an empty tuple to yield the elements of a top level array.
+        
+        encoding : `str`
+            Encoding to decode the received data with.
+        
+        Raises
+        ------
+        LookupError
+            Unknown encoding.
+        """
+        self = JSONItemParserBase.__new__(cls, encoding)
+        self._depth = 0
+        self._key = None
+        self._path = path
+        self._state = STATE_VALUE
+        return self
+    
+    
+    @copy_docs(JSONItemParserBase._process)
+    def _process(self, items, at_end):
+        buffer = self._buffer
+        buffer_length = len(buffer)
+        position = self._position
+        state = self._state
+        path = self._path
+        
+        while True:
+            position = WHITESPACE_RP.match(buffer, position).end()
+            if position == buffer_length:
+                break
+            
+            if state == STATE_DONE:
+                raise self._create_decode_error('Extra data', position)
+            
+            if (state == STATE_ITEM) or (state == STATE_ITEM_OR_ARRAY_END):
+                if (state == STATE_ITEM_OR_ARRAY_END) and (buffer[position] == ']'):
+                    position += 1
+                    state = self._close_array()
+                    continue
+                
+                item, end = self._decode_value(position, at_end)
+                if end == -1:
+                    break
+                
+                items.append(item)
+                position = end
+                state = STATE_COMMA_OR_ARRAY_END
+                continue
+            
+            if state == STATE_COMMA_OR_ARRAY_END:
+                character = buffer[position]
+                if character == ',':
+                    state = STATE_ITEM
+                elif character == ']':
+                    state = self._close_array()
+                else:
+                    raise self._create_decode_error('Expecting \',\' delimiter', position)
+                
+                position += 1
+                continue
+            
+            if state == STATE_VALUE:
+                character = buffer[position]
+                if self._depth == len(path):
+                    if character != '[':
+                        raise self._create_decode_error('Expecting array', position)
+                    
+                    state = STATE_ITEM_OR_ARRAY_END
+                
+                else:
+                    if character != '{':
+                        raise self._create_decode_error('Expecting object', position)
+                    
+                    state = STATE_KEY_OR_OBJECT_END
+                
+                position += 1
+                continue
+            
+            if (state == STATE_KEY) or (state == STATE_KEY_OR_OBJECT_END):
+                if (state == STATE_KEY_OR_OBJECT_END) and (buffer[position] == '}'):
+                    state = self._close_object(position)
+                    position += 1
+                    continue
+                
+                if buffer[position] != '"':
+                    raise self._create_decode_error('Expecting property name enclosed in double quotes', position)
+                
+                key, end = self._decode_value(position, at_end)
+                if end == -1:
+                    break
+                
+                self._key = key
+                position = end
+                state = STATE_COLON
+                continue
+            
+            if state == STATE_COLON:
+                if buffer[position] != ':':
+                    raise self._create_decode_error('Expecting \':\' delimiter', position)
+                
+                position += 1
+                depth = self._depth
+                if (depth >= 0) and (self._key == path[depth]):
+                    self._depth += 1
+                    state = STATE_VALUE
+                else:
+                    state = STATE_SKIP_VALUE
+                continue
+            
+            if state == STATE_SKIP_VALUE:
+                value, end = self._decode_value(position, at_end)
+                if end == -1:
+                    break
+                
+                value = None
+                position = end
+                state = STATE_COMMA_OR_OBJECT_END
+                continue
+            
+            # state == STATE_COMMA_OR_OBJECT_END
+            character = buffer[position]
+            if character == ',':
+                state = STATE_KEY
+            elif character == '}':
+                state = self._close_object(position)
+            else:
+                raise self._create_decode_error('Expecting \',\' delimiter', position)
+            
+            position += 1
+            continue
+        
+        if at_end and (state != STATE_DONE):
+            raise self._create_decode_error('Unexpected end of data', buffer_length)
+        
+        self._position = position
+        self._state = state
+    
+    
+    def _close_array(self):
+        """
+        Called when the array is closed. Starts skipping the rest of the objects leading to it.
+        
+        Returns
+        -------
+        state : `int`
+        """
+        depth = self._depth
+        if not depth:
+            return STATE_DONE
+        
+        self._depth = -depth
+        return STATE_COMMA_OR_OBJECT_END
+    
+    
+    def _close_object(self, position):
+        """
+        Called when an object is closed.
+        
+        Parameters
+        ----------
+        position : `int`
+            The object end's index in the buffer.
+        
+        Returns
+        -------
+        state : `int`
+        
+        Raises
+        ------
+        JSONDecodeError
+            - If the object is on the path, but the next key of the path was not in it.
+        """
+        depth = self._depth
+        if depth >= 0:
+            raise self._create_decode_error(f'Missing key {self._path[depth]!r}', position)
+        
+        depth += 1
+        self._depth = depth
+        if depth:
+            return STATE_COMMA_OR_OBJECT_END
+        
+        return STATE_DONE
+
+
+class JSONItemParserLines(JSONItemParserBase):
+    """
+    Incremental json parser yielding the lines of a new line delimited json (ndjson / json lines) payload.
+    
+    Attributes
+    ----------
+    _buffer : `str`
+        Received, but not yet processed data.
+    
+    _decoder : `codecs.IncrementalDecoder`
+        Decoder to decode the received chunks with.
+    
+    _offset : `int`
+        The amount of characters dropped from the start of ``._buffer``.
+    
+    _position : `int`
+        The position where processing should be continued at in ``._buffer``.
+    
+    _retry_size : `int`
+        The size ``._buffer`` should reach before trying to decode an incomplete value again.
+    """
+    __slots__ = ()
+    
+    @copy_docs(JSONItemParserBase._process)
+    def _process(self, items, at_end):
+        buffer = self._buffer
+        buffer_length = len(buffer)
+        position = self._position
+        
+        while True:
+            index = buffer.find('\n', position)
+            if index == -1:
+                if not at_end:
+                    break
+                
+                index = buffer_length
+            
+            if (index != position) and (not buffer[position : index].isspace()):
+                try:
+                    item = JSON_DECODER.decode(buffer[position : index])
+                except JSONDecodeError as exception:
+                    raise self._create_decode_error(exception.msg, position + exception.pos) from None
+                
+                items.append(item)
+            
+            if index == buffer_length:
+                position = buffer_length
+                break
+            
+            position = index + 1
+        
+        self._position = position
@@ -0,0 +1,91 @@
+import vampytest
+
+from ..json import (
+    JSON_BACKENDS, JSONBackend, from_json, get_json_backend, register_json_backend, set_json_backend, to_json
+)
+
+
+def _assert_fields_set(backend):
+    """
+    Asserts whether every fields are set of the given json backend.
+    
+    Parameters
+    ----------
+    backend : ``JSONBackend``
+        The backend to check.
+    """
+    vampytest.assert_instance(backend, JSONBackend)
+    vampytest.assert_true(callable(backend.dump))
+    vampytest.assert_true(callable(backend.load))
+    vampytest.assert_instance(backend.name, str)
+
+
+def _dump(data):
+    return 'dumped'
+
+
+def _load(data):
+    return 'loaded'
+
+
+def test__JSONBackend__new():
+    """
+    Tests whether ``JSONBackend.__new__`` works as intended.
+    """
+    backend = JSONBackend('test', _dump, _load)
+    _assert_fields_set(backend)
+    
+    vampytest.assert_is(backend.dump, _dump)
+    vampytest.assert_is(backend.load, _load)
+    vampytest.assert_eq(backend.name, 'test')
+
+
+def test__JSONBackend__repr():
+    """
+    Tests whether ``JSONBackend.__repr__`` works as intended.
+    """
+    backend = JSONBackend('test', _dump, _load)
+    
+    output = repr(backend)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in('test', output)
+
+
+def test__set_json_backend():
+    """
+    Tests whether ``register_json_backend`` and ``set_json_backend`` work as intended.
+    """
+    original_backend = get_json_backend()
+    backend = JSONBackend('test', _dump, _load)
+    
+    register_json_backend(backend)
+    set_json_backend('test')
+    try:
+        vampytest.assert_is(get_json_backend(), backend)
+        vampytest.assert_eq(to_json(None), 'dumped')
+        vampytest.assert_eq(from_json('null'), 'loaded')
+    finally:
+        set_json_backend(original_backend.name)
+        del JSON_BACKENDS['test']
+    
+    vampytest.assert_is(get_json_backend(), original_backend)
+
+
+def test__set_json_backend__lookup_error():
+    """
+    Tests whether ``set_json_backend`` works as intended.
+    
+    Case: not registered.
+    """
+    with vampytest.assert_raises(LookupError):
+        set_json_backend('not registered')
+
+
+def test__register_json_backend__type_error():
+    """
+    Tests whether ``register_json_backend`` works as intended.
+    
+    Case: type error.
+    """
+    with vampytest.assert_raises(TypeError):
+        register_json_backend(object())
@@ -0,0 +1,193 @@
+from json import JSONDecodeError
+
+import vampytest
+
+from ..json_item_parsing import JSONItemParserArray
+
+
+def _assert_fields_set(parser):
+    """
+    Asserts whether every fields are set of the given parser.
+    
+    Parameters
+    ----------
+    parser : ``JSONItemParserArray``
+        The parser to check.
+    """
+    vampytest.assert_instance(parser, JSONItemParserArray)
+    vampytest.assert_instance(parser._buffer, str)
+    vampytest.assert_instance(parser._depth, int)
+    vampytest.assert_instance(parser._key, str, nullable = True)
+    vampytest.assert_instance(parser._offset, int)
+    vampytest.assert_instance(parser._path, tuple)
+    vampytest.assert_instance(parser._position, int)
+    vampytest.assert_instance(parser._retry_size, int)
+    vampytest.assert_instance(parser._state, int)
+
+
+def test__JSONItemParserArray__new():
+    """
+    Tests whether ``JSONItemParserArray.__new__`` works as intended.
+    """
+    path = ('data', 'items')
+    
+    parser = JSONItemParserArray(path, 'utf-8')
+    _assert_fields_set(parser)
+    
+    vampytest.assert_eq(parser._path, path)
+
+
+def test__JSONItemParserArray__repr():
+    """
+    Tests whether ``JSONItemParserArray.__repr__`` works as intended.
+    """
+    parser = JSONItemParserArray((), 'utf-8')
+    
+    output = repr(parser)
+    vampytest.assert_instance(output, str)
+
+
+def _iter_options__feed():
+    yield (
+        (),
+        b'[1, "2", [3], {"4": 4}, null, true]',
+        [1, '2', [3], {'4': 4}, None, True],
+    )
+    
+    yield (
+        (),
+        b' [ ] ',
+        [],
+    )
+    
+    yield (
+        (),
+        b'[12345, -1.5e3]',
+        [12345, -1.5e3],
+    )
+    
+    yield (
+        ('items',),
+        b'{"before": {"items": [1]}, "x": "items", "items": ["a", {"items": [2]}], "after": [3]}',
+        ['a', {'items': [2]}],
+    )
+    
+    yield (
+        ('data', 'items'),
+        b'{"data": {"other": "[{\\"", "items": [{"v": "a,]\\\\"}, 2]}}',
+        [{'v': 'a,]\\'}, 2],
+    )
+    
+    yield (
+        ('data', 'items'),
+        b'{"data": {"items": [1], "data": {"items": 2}}, "items": {"data": 3}} \n',
+        [1],
+    )
+    
+    yield (
+        (),
+        '["ü€", "あ"]'.encode('utf-8'),
+        ['ü€', 'あ'],
+    )
+
+
+@vampytest._(vampytest.call_from(_iter_options__feed()).returning_last())
+def test__JSONItemParserArray__feed(path, data):
+    """
+    Tests whether ``JSONItemParserArray.feed`` works as intended.
+    
+    Feeds the data in every possible chunk size and checks whether the results are the same.
+    
+    Parameters
+    ----------
+    path : `tuple<str>`
+        Path to create the parser with.
+    
+    data : `bytes`
+        Data to feed.
+    
+    Returns
+    -------
+    output : `list<object>`
+    """
+    outputs = []
+    
+    for chunk_size in range(1, len(data) + 1):
+        parser = JSONItemParserArray(path, 'utf-8')
+        output = []
+        
+        for index in range(0, len(data), chunk_size):
+            output.extend(parser.feed(data[index : index + chunk_size]))
+        
+        output.extend(parser.end())
+        outputs.append(output)
+    
+    for output in outputs[1:]:
+        vampytest.assert_eq(output, outputs[0])
+    
+    return outputs[0]
+
+
+def test__JSONItemParserArray__feed__items_released():
+    """
+    Tests whether ``JSONItemParserArray.feed`` works as intended.
+    
+    Case: items are returned as soon as they are complete and their data is dropped.
+    """
+    parser = JSONItemParserArray((), 'utf-8')
+    
+    output = parser.feed(b'[{"a": 1}, {"b"')
+    vampytest.assert_eq(output, [{'a': 1}])
+    vampytest.assert_eq(parser._buffer[parser._position:], '{"b"')
+    
+    output = parser.feed(b': 2}, 3')
+    vampytest.assert_eq(output, [{'b': 2}])
+    
+    output = parser.feed(b'4]')
+    vampytest.assert_eq(output, [34])
+    
+    output = parser.end()
+    vampytest.assert_eq(output, [])
+
+
+def _iter_options__end__json_decode_error():
+    yield (), b'[1, 2'
+    yield (), b'[1 2]'
+    yield (), b'[1, {]'
+    yield (), b'[1, "2'
+    yield ('items',), b'{"items" [1]}'
+    yield ('items',), b'{items: [1]}'
+    yield (), b'{"items": [1]}'
+    yield ('items',), b'{"items": 1}'
+    yield ('items',), b'[{"items": [1]}]'
+    yield ('missing',), b'{"items": [1]}'
+    yield ('missing',), b'{}'
+    yield (), b'[1] 2'
+    yield (), b'[1]]'
+    yield ('items',), b'{"items": [1]}}'
+    yield ('items',), b'{"items": [1], "after": 2} []'
+    yield ('items',), b'{"items": [1], "after": 2'
+
+
+@vampytest._(vampytest.call_from(_iter_options__end__json_decode_error()).raising(JSONDecodeError))
+def test__JSONItemParserArray__end__json_decode_error(path, data):
+    """
+    Tests whether ``JSONItemParserArray.end`` works as intended.
+    
+    Case: json decode error.
+    
+    Parameters
+    ----------
+    path : `tuple<str>`
+        Path to create the parser with.
+    
+    data : `bytes`
+        Data to feed.
+    
+    Raises
+    ------
+    JSONDecodeError
+    """
+    parser = JSONItemParserArray(path, 'utf-8')
+    parser.feed(data)
+    parser.end()
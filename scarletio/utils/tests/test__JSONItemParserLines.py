@@ -0,0 +1,93 @@
+from json import JSONDecodeError
+
+import vampytest
+
+from ..json_item_parsing import JSONItemParserLines
+
+
+def _assert_fields_set(parser):
+    """
+    Asserts whether every fields are set of the given parser.
+    
+    Parameters
+    ----------
+    parser : ``JSONItemParserLines``
+        The parser to check.
+    """
+    vampytest.assert_instance(parser, JSONItemParserLines)
+    vampytest.assert_instance(parser._buffer, str)
+    vampytest.assert_instance(parser._offset, int)
+    vampytest.assert_instance(parser._position, int)
+    vampytest.assert_instance(parser._retry_size, int)
+
+
+def test__JSONItemParserLines__new():
+    """
+    Tests whether ``JSONItemParserLines.__new__`` works as intended.
+    """
+    parser = JSONItemParserLines('utf-8')
+    _assert_fields_set(parser)
+
+
+def _iter_options__feed():
+    yield (
+        b'{"a": 1}\n[2]\n"3"\n',
+        [{'a': 1}, [2], '3'],
+    )
+    
+    yield (
+        b'{"a": 1}\r\n\n  \n[2]',
+        [{'a': 1}, [2]],
+    )
+    
+    yield (
+        b'',
+        [],
+    )
+
+
+@vampytest._(vampytest.call_from(_iter_options__feed()).returning_last())
+def test__JSONItemParserLines__feed(data):
+    """
+    Tests whether ``JSONItemParserLines.feed`` works as intended.
+    
+    Feeds the data in every possible chunk size and checks whether the results are the same.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        Data to feed.
+    
+    Returns
+    -------
+    output : `list<object>`
+    """
+    outputs = []
+    
+    for chunk_size in range(1, len(data) + 2):
+        parser = JSONItemParserLines('utf-8')
+        output = []
+        
+        for index in range(0, len(data), chunk_size):
+            output.extend(parser.feed(data[index : index + chunk_size]))
+        
+        output.extend(parser.end())
+        outputs.append(output)
+    
+    for output in outputs[1:]:
+        vampytest.assert_eq(output, outputs[0])
+    
+    return outputs[0]
+
+
+def test__JSONItemParserLines__end__json_decode_error():
+    """
+    Tests whether ``JSONItemParserLines.end`` works as intended.
+    
+    Case: json decode error.
+    """
+    parser = JSONItemParserLines('utf-8')
+    parser.feed(b'[1]\n[2')
+    
+    with vampytest.assert_raises(JSONDecodeError):
+        parser.end()
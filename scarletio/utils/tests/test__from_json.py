@@ -0,0 +1,52 @@
+import vampytest
+
+from ..json import JSONDecodeError, from_json
+
+
+def _iter_options():
+    yield 'null', None
+    yield '{"hey":[1,2.5,true,null]}', {'hey': [1, 2.5, True, None]}
+    yield b'{"hey":"mister"}', {'hey': 'mister'}
+    yield bytearray(b'[1,2]'), [1, 2]
+    yield str(1 << 80), 1 << 80
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__from_json(data):
+    """
+    Tests whether ``from_json`` works as intended.
+    
+    Parameters
+    ----------
+    data : `str`, `bytes`, `bytearray`
+        The data to load.
+    
+    Returns
+    -------
+    output : `object`
+    """
+    return from_json(data)
+
+
+def _iter_options__json_decode_error():
+    yield '['
+    yield '{"hey":}'
+
+
+@vampytest._(vampytest.call_from(_iter_options__json_decode_error()).raising(JSONDecodeError))
+def test__from_json__json_decode_error(data):
+    """
+    Tests whether ``from_json`` works as intended.
+    
+    Case: json decode error.
+    
+    Parameters
+    ----------
+    data : `str`
+        The data to load.
+    
+    Raises
+    ------
+    JSONDecodeError
+    """
+    from_json(data)
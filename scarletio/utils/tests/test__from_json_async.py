@@ -0,0 +1,46 @@
+import vampytest
+
+from ..json import JSONDecodeError, from_json_async
+
+
+def _iter_options():
+    yield '{"hey":"mister"}', 1 << 18, {'hey': 'mister'}
+    yield '{"hey":"mister"}', 1, {'hey': 'mister'}
+    yield b'[1,2]', 1, [1, 2]
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+async def test__from_json_async(data, threshold):
+    """
+    Tests whether ``from_json_async`` works as intended.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    data : `str`, `bytes`, `bytearray`
+        The data to load.
+    threshold : `int`
+        The data's length from which it is loaded in an executor.
+    
+    Returns
+    -------
+    output : `object`
+    """
+    return await from_json_async(data, threshold = threshold)
+
+
+@vampytest.raising(JSONDecodeError)
+async def test__from_json_async__json_decode_error():
+    """
+    Tests whether ``from_json_async`` works as intended.
+    
+    Case: json decode error in executor.
+    
+    This function is a coroutine.
+    
+    Raises
+    ------
+    JSONDecodeError
+    """
+    await from_json_async('[1,', threshold = 1)
@@ -0,0 +1,131 @@
+from enum import Enum
+from json import dumps as dump_to_json
+
+import vampytest
+
+from ..json import JSON_BACKENDS, get_json_backend, to_json
+
+
+class TestEnum(Enum):
+    ayaya = 'ayaya'
+
+
+BACKEND_NAMES = tuple(backend_name for backend_name in ('orjson', 'standard') if backend_name in JSON_BACKENDS)
+
+
+def _iter_options():
+    for backend_name in BACKEND_NAMES:
+        yield backend_name, None, 'null'
+        yield backend_name, {'hey': [1, 2.5, True, None]}, '{"hey":[1,2.5,true,null]}'
+        yield backend_name, {1: 'mister'}, '{"1":"mister"}'
+        yield backend_name, 'koïshi \U0001f600', '"ko\\u00efshi \\ud83d\\ude00"'
+        yield backend_name, 'a"b\\c\n', '"a\\"b\\\\c\\n"'
+        yield backend_name, 1 << 80, str(1 << 80)
+        yield backend_name, {'hey': [(1 << 64) - 1, -(1 << 63)]}, f'{{"hey":[{(1 << 64) - 1},{-(1 << 63)}]}}'
+        yield backend_name, {'hey': [1, (1 << 64)]}, f'{{"hey":[1,{1 << 64}]}}'
+        yield backend_name, [-(1 << 63) - 1], f'[{-(1 << 63) - 1}]'
+        yield backend_name, {1 << 80: 'mister'}, f'{{"{1 << 80}":"mister"}}'
+        yield backend_name, (1, 2), '[1,2]'
+        yield backend_name, {3}, '[3]'
+        yield backend_name, TestEnum.ayaya, '"ayaya"'
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__to_json(backend_name, data):
+    """
+    Tests whether ``to_json`` works as intended.
+    
+    Parameters
+    ----------
+    backend_name : `str`
+        The json backend's name to test with.
+    data : `object`
+        The data to convert.
+    
+    Returns
+    -------
+    output : `str`
+    """
+    output = JSON_BACKENDS[backend_name].dump(data)
+    vampytest.assert_instance(output, str)
+    return output
+
+
+def _iter_options__type_error():
+    for backend_name in BACKEND_NAMES:
+        yield backend_name, object()
+        yield backend_name, {(1, 2): 'mister'}
+        yield backend_name, [1 << 80, object()]
+
+
+@vampytest._(vampytest.call_from(_iter_options__type_error()).raising(TypeError))
+def test__to_json__type_error(backend_name, data):
+    """
+    Tests whether ``to_json`` works as intended.
+    
+    Case: type error.
+    
+    Parameters
+    ----------
+    backend_name : `str`
+        The json backend's name to test with.
+    data : `object`
+        The data to convert.
+    
+    Raises
+    ------
+    TypeError
+    """
+    JSON_BACKENDS[backend_name].dump(data)
+
+
+def test__to_json__default_backend():
+    """
+    Tests whether ``to_json`` works as intended.
+    
+    Case: default backend.
+    """
+    output = to_json({'hey': 'mister'})
+    vampytest.assert_instance(output, str)
+    vampytest.assert_eq(output, '{"hey":"mister"}')
+
+
+def test__to_json__default_backend__standard():
+    """
+    Tests whether ``to_json`` works as intended.
+    
+    Case: the standard library is the default backend, even if other ones are installed.
+    """
+    vampytest.assert_eq(get_json_backend().name, 'standard')
+
+
+def _iter_options__float():
+    values = (float('nan'), float('inf'), float('-inf'), 1e16, 1.5e-7, 0.1)
+    
+    for value in values:
+        yield 'standard', value, dump_to_json(value)
+    
+    if 'orjson' in JSON_BACKENDS:
+        for value, expected_output in zip(values, ('null', 'null', 'null', '1e16', '1.5e-7', '0.1')):
+            yield 'orjson', value, expected_output
+
+
+@vampytest._(vampytest.call_from(_iter_options__float()).returning_last())
+def test__to_json__float(backend_name, data):
+    """
+    Tests whether ``to_json`` works as intended.
+    
+    Case: compares the backends on special and exponent floats.
+    
+    Parameters
+    ----------
+    backend_name : `str`
+        The json backend's name to test with.
+    data : `float`
+        The data to convert.
+    
+    Returns
+    -------
+    output : `str`
+    """
+    return JSON_BACKENDS[backend_name].dump(data)
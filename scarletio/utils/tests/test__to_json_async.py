@@ -0,0 +1,48 @@
+import vampytest
+
+from ..json import to_json_async
+
+
+def _iter_options():
+    yield {'hey': 'mister'}, 1 << 18, '{"hey":"mister"}'
+    yield {'hey': 'mister'}, 1, '{"hey":"mister"}'
+    yield [{'hey': 'mister'}, 'ayaya'], 4, '[{"hey":"mister"},"ayaya"]'
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+async def test__to_json_async(data, threshold):
+    """
+    Tests whether ``to_json_async`` works as intended.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    data : `object`
+        The data to convert.
+    threshold : `int`
+        The approximate output size from which the conversion is done in an executor.
+    
+    Returns
+    -------
+    output : `str`
+    """
+    output = await to_json_async(data, threshold = threshold)
+    vampytest.assert_instance(output, str)
+    return output
+
+
+@vampytest.raising(TypeError)
+async def test__to_json_async__type_error():
+    """
+    Tests whether ``to_json_async`` works as intended.
+    
+    Case: type error in executor.
+    
+    This function is a coroutine.
+    
+    Raises
+    ------
+    TypeError
+    """
+    await to_json_async([object()], threshold = 1)
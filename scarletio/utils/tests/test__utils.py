@@ -1,6 +1,6 @@
 from bisect import bisect
 
-from ..utils import any_to_any, change_on_switch, get_short_executable, relative_index, where
+from ..utils import any_to_any, change_on_switch, get_short_executable, relative_index, validate_duration, where
 
 import vampytest
 
@@ -56,3 +56,60 @@ def test__relative_index():
     vampytest.assert_eq(relative_index(container_0, 20), bisect(container_0, 20))
     vampytest.assert_eq(relative_index(container_1, 2), bisect(container_1, 2))
     vampytest.assert_eq(relative_index(container_2, 8), bisect(container_2, 8))
+
+
+def _iter_options__validate_duration__passing():
+    yield 1, 1.0
+    yield 0.5, 0.5
+
+
+@vampytest._(vampytest.call_from(_iter_options__validate_duration__passing()).returning_last())
+def test__validate_duration__passing(duration):
+    """
+    Tests whether ``validate_duration`` works as intended.
+    
+    Case: passing.
+    
+    Parameters
+    ----------
+    duration : `float`
+        The duration to validate.
+    
+    Returns
+    -------
+    output : `float`
+    """
+    output = validate_duration(duration, 'duration')
+    vampytest.assert_instance(output, float)
+    return output
+
+
+def _iter_options__validate_duration__type_error():
+    yield 'a'
+    yield None
+
+
+def _iter_options__validate_duration__value_error():
+    yield 0
+    yield -1.0
+
+
+@vampytest._(vampytest.call_from(_iter_options__validate_duration__type_error()).raising(TypeError))
+@vampytest._(vampytest.call_from(_iter_options__validate_duration__value_error()).raising(ValueError))
+def test__validate_duration__error(duration):
+    """
+    Tests whether ``validate_duration`` works as intended.
+    
+    Case: error.
+    
+    Parameters
+    ----------
+    duration : `object`
+        The duration to validate.
+    
+    Raises
+    ------
+    TypeError
+    ValueError
+    """
+    validate_duration(duration, 'duration')
@@ -1,6 +1,6 @@
 __all__ = (
     'IS_UNIX', 'any_to_any', 'change_on_switch', 'get_short_executable', 'is_hashable', 'is_iterable',
-    'list_difference', 'relative_index', 'un_map_pack', 'where'
+    'list_difference', 'relative_index', 'un_map_pack', 'validate_duration', 'where'
 )
 
 import sys
@@ -377,3 +377,41 @@ def is_hashable(object_):
         return False
     
     return True
+
+
+@has_docs
+def validate_duration(duration, parameter_name):
+    """
+    Validates the given duration.
+    
+    Parameters
+    ----------
+    duration : `float`
+        The duration to validate.
+    
+    parameter_name : `str`
+        The parameter's name to use in exception messages.
+    
+    Returns
+    -------
+    duration : `float`
+    
+    Raises
+    ------
+    TypeError
+        - If `duration` is not `float`, neither `int`.
+    ValueError
+        - If `duration` is `0` or less.
+    """
+    if not isinstance(duration, (int, float)):
+        raise TypeError(
+            f'`{parameter_name}` can be `float`, got {type(duration).__name__}; {duration!r}.'
+        )
+    
+    duration = float(duration)
+    if duration <= 0.0:
+        raise ValueError(
+            f'`{parameter_name}` cannot be `0` or less, got {duration!r}.'
+        )
+    
+    return duration
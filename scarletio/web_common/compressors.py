@@ -1,6 +1,7 @@
 __all__ = (
     'BROTLI_COMPRESSOR', 'BROTLI_DECOMPRESSOR', 'COMPRESSION_ERRORS', 'ZLIB_DECOMPRESSOR', 'ZLIB_COMPRESSOR',
-    'ZLIB_MAX_WBITS', 'get_decompressor_for'
+    'ZLIB_MAX_WBITS', 'ZSTD_COMPRESSOR', 'ZSTD_DECOMPRESSOR', 'get_decompressor_for', 'get_zstd_dictionary',
+    'set_zstd_dictionary'
 )
 
 import zlib
@@ -12,12 +13,9 @@ try:
     import brotli
 except ImportError:
     brotli = None
-    COMPRESSION_ERRORS = zlib.error
     BROTLI_DECOMPRESSOR = None
     BROTLI_COMPRESSOR = None
 else:
-    COMPRESSION_ERRORS = (zlib.error, brotli.error)
-    
     if hasattr(brotli, 'Error'):
         # brotlipy case
         BROTLI_DECOMPRESSOR = brotli.Decompressor
@@ -41,11 +39,145 @@ else:
                 return self._compressor.process(value)
 
 
+ZSTD_LEVEL_DEFAULT = 3
+
+try:
+    # python 3.14 case
+    from compression import zstd
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
+if zstd is None:
+    ZSTD_DECOMPRESSOR = None
+    ZSTD_COMPRESSOR = None
+    ZSTD_DICTIONARY_TYPE = None
+
+else:
+    if hasattr(zstd, 'ZstdDict'):
+        # compression.zstd case
+        ZSTD_DICTIONARY_TYPE = zstd.ZstdDict
+        
+        def _create_zstd_decompressor(dictionary):
+            return zstd.ZstdDecompressor(zstd_dict = dictionary)
+        
+        def _create_zstd_compressor(level, dictionary):
+            return zstd.ZstdCompressor(level = level, zstd_dict = dictionary)
+    
+    else:
+        # zstandard case
+        ZSTD_DICTIONARY_TYPE = zstd.ZstdCompressionDict
+        
+        def _create_zstd_decompressor(dictionary):
+            return zstd.ZstdDecompressor(dict_data = dictionary).decompressobj()
+        
+        def _create_zstd_compressor(level, dictionary):
+            return zstd.ZstdCompressor(level = level, dict_data = dictionary).compressobj()
+    
+    
+    class ZSTD_DECOMPRESSOR:
+        __slots__ = ('_decompressor', '_dictionary')
+        def __init__(self, dictionary = None):
+            self._decompressor = _create_zstd_decompressor(dictionary)
+            self._dictionary = dictionary
+        
+        def decompress(self, value):
+            decompressor = self._decompressor
+            output = decompressor.decompress(value)
+            
+            # A payload can contain multiple frames, but the decompressors stop at the end of the first one.
+            while decompressor.eof:
+                value = decompressor.unused_data
+                self._decompressor = decompressor = _create_zstd_decompressor(self._dictionary)
+                if not value:
+                    break
+                
+                output += decompressor.decompress(value)
+            
+            return output
+        
+        def flush(self):
+            return b''
+    
+    
+    class ZSTD_COMPRESSOR:
+        __slots__ = ('_compressor', )
+        def __init__(self, level = ZSTD_LEVEL_DEFAULT, dictionary = None):
+            self._compressor = _create_zstd_compressor(level, dictionary)
+        
+        def compress(self, value):
+            return self._compressor.compress(value)
+        
+        def flush(self):
+            return self._compressor.flush()
+
+
+COMPRESSION_ERRORS = (
+    zlib.error,
+    *((brotli.error,) if (brotli is not None) else ()),
+    *((zstd.ZstdError,) if (zstd is not None) else ()),
+)
+
+ZSTD_DICTIONARY = None
+
+
 ZLIB_DECOMPRESSOR = zlib.decompressobj
 ZLIB_COMPRESSOR = zlib.compressobj
 
 ZLIB_MAX_WBITS = zlib.MAX_WBITS
 
+
+def set_zstd_dictionary(dictionary):
+    """
+    Sets the dictionary to use for `zstd` compression and decompression.
+    
+    Dictionaries improve the compression of small payloads sharing a lot of content, but the other side has to use
+    the same one. So only set it if every `zstd` encoded content is exchanged with such peers.
+    
+    Parameters
+    ----------
+    dictionary : `None | bytes`
+        The dictionary's data. Pass it as `None` to remove it.
+    
+    Raises
+    ------
+    RuntimeError
+        - If zstd is not available.
+    TypeError
+        - If `dictionary`'s type is incorrect.
+    """
+    global ZSTD_DICTIONARY
+    
+    if dictionary is None:
+        ZSTD_DICTIONARY = None
+        return
+    
+    if ZSTD_DICTIONARY_TYPE is None:
+        raise RuntimeError(
+            'Can not set zstd dictionary: zstd is not available. Please install `zstandard`.'
+        )
+    
+    if not isinstance(dictionary, (bytes, bytearray, memoryview)):
+        raise TypeError(
+            f'`dictionary` can be `None`, `bytes-like`, got {type(dictionary).__name__}; {dictionary!r}.'
+        )
+    
+    ZSTD_DICTIONARY = ZSTD_DICTIONARY_TYPE(bytes(dictionary))
+
+
+def get_zstd_dictionary():
+    """
+    Returns the dictionary used for `zstd` compression and decompression.
+    
+    Returns
+    -------
+    dictionary : `None | ZSTD_DICTIONARY_TYPE`
+    """
+    return ZSTD_DICTIONARY
+
+
 def get_decompressor_for(content_encoding):
     """
     Gets decompress object for the given content-encoding if applicable.
@@ -57,12 +189,13 @@ def get_decompressor_for(content_encoding):
     
     Returns
     -------
-    decompressor : `None`, `ZLIB_DECOMPRESSOR`, `BROTLI_DECOMPRESSOR`
+    decompressor : `None`, `ZLIB_DECOMPRESSOR`, `BROTLI_DECOMPRESSOR`, `ZSTD_DECOMPRESSOR`
     
     Raises
     ------
     ContentEncodingError
         - `'content_encoding'` was given as `'br'` meanwhile brotli or brotlipy are not installed.
+        - `'content_encoding'` was given as `'zstd'` meanwhile zstd is not available.
         - `'content_encoding'` is not an from the expected values.
     """
     if (content_encoding is None):
@@ -81,6 +214,13 @@ def get_decompressor_for(content_encoding):
             )
         decompressor = BROTLI_DECOMPRESSOR()
     
+    elif content_encoding == 'zstd':
+        if ZSTD_DECOMPRESSOR is None:
+            raise ContentEncodingError(
+                'Can not decode content-encoding: zstandard (zstd). Please install `zstandard`.'
+            )
+        decompressor = ZSTD_DECOMPRESSOR(ZSTD_DICTIONARY)
+    
     elif content_encoding == 'identity':
         # I assume this is no encoding
         decompressor = None
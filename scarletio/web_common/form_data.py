@@ -3,7 +3,9 @@ __all__ = ('FormData', )
 from io import IOBase
 from urllib.parse import urlencode
 
-from ..utils import IgnoreCaseMultiValueDictionary, MultiValueDictionary, RichAttributeErrorBaseType, to_json
+from ..utils import (
+    IgnoreCaseMultiValueDictionary, MultiValueDictionary, RichAttributeErrorBaseType, to_json, to_json_async
+)
 
 from .headers import CONTENT_LENGTH, CONTENT_TRANSFER_ENCODING, CONTENT_TYPE
 from .multipart import BytesPayload, MultipartWriter, create_payload
@@ -74,6 +76,28 @@ class FormDataField(RichAttributeErrorBaseType):
         return value
     
     
+    async def get_value_async(self):
+        """
+        Returns the value of the form data field after applying type specific conversion.
+        Big json values are converted in an executor.
+        
+        This method is a coroutine.
+        
+        Returns
+        -------
+        value : `object`
+        """
+        field_type = self.type
+        value = self.value
+        
+        # json
+        if field_type == FORM_DATA_FIELD_TYPE_JSON:
+            return await to_json_async(value)
+        
+        # none & unknown
+        return value
+    
+    
     def __repr__(self):
         """Returns the field's representation."""
         repr_parts = ['<', type(self).__name__]
@@ -313,7 +337,63 @@ class FormData(RichAttributeErrorBaseType):
         self.fields.append(FormDataField(FORM_DATA_FIELD_TYPE_NONE, type_options, headers, value))
     
     
-    def _generate_form_data(self, encoding):
+    def _get_field_values(self):
+        """
+        Returns the values of the form data's fields after applying type specific conversion.
+        
+        Returns
+        -------
+        values : `list<object>`
+        
+        Raises
+        ------
+        TypeError
+            Cannot serialize a field.
+        """
+        values = []
+        for field in self.fields:
+            try:
+                value = field.get_value()
+            except Exception as err:
+                raise TypeError(
+                    f'Can not serialize field: {field!r}.'
+                ) from err
+            
+            values.append(value)
+        
+        return values
+    
+    
+    async def _get_field_values_async(self):
+        """
+        Returns the values of the form data's fields after applying type specific conversion.
+        
+        This method is a coroutine.
+        
+        Returns
+        -------
+        values : `list<object>`
+        
+        Raises
+        ------
+        TypeError
+            Cannot serialize a field.
+        """
+        values = []
+        for field in self.fields:
+            try:
+                value = await field.get_value_async()
+            except Exception as err:
+                raise TypeError(
+                    f'Can not serialize field: {field!r}.'
+                ) from err
+            
+            values.append(value)
+        
+        return values
+    
+    
+    def _generate_form_data(self, encoding, values):
         """
         Generates `multipart/form-data` payload from the form data fields.
         
@@ -322,6 +402,9 @@ class FormData(RichAttributeErrorBaseType):
         encoding : `str`
             The encoding to use to encode the form data's fields.
         
+        values : `list<object>`
+            The converted values of the fields.
+        
         Returns
         -------
         payload : ``MultipartWriter``
@@ -336,11 +419,10 @@ class FormData(RichAttributeErrorBaseType):
             - If a field's content has unknown content-transfer-encoding.
         """
         writer = MultipartWriter('form-data')
-        for field in self.fields:    
+        for field, value in zip(self.fields, values):
             try:
                 type_options = field.type_options
                 headers = field.headers
-                value = field.get_value()
             
                 payload_keyword_parameters = {
                     'headers': headers,
@@ -373,7 +455,7 @@ class FormData(RichAttributeErrorBaseType):
         return writer
     
     
-    def _generate_form_urlencoded(self, encoding):
+    def _generate_form_urlencoded(self, encoding, values):
         """
         Generates `application/x-www-form-urlencoded` payload from the form data's fields.
         
@@ -382,14 +464,17 @@ class FormData(RichAttributeErrorBaseType):
         encoding : `str`
             The encoding to use to encode the form data's fields.
         
+        values : `list<object>`
+            The converted values of the fields.
+        
         Returns
         -------
         payload : ``BytesPayload``
             The generated payload.
         """
         data = []
-        for field in self.fields:
-            data.append((field.type_options['name'], field.get_value()))
+        for field, value in zip(self.fields, values):
+            data.append((field.type_options['name'], value))
         
         if encoding == 'utf-8':
             content_type = 'application/x-www-form-urlencoded'
@@ -418,10 +503,42 @@ class FormData(RichAttributeErrorBaseType):
         TypeError
             Cannot serialize a field.
         """
+        values = self._get_field_values()
+        
+        if self.multipart:
+            return self._generate_form_data(encoding, values)
+        else:
+            return self._generate_form_urlencoded(encoding, values)
+    
+    
+    async def generate_form_async(self, encoding = 'utf-8'):
+        """
+        Gets the payload of the form data. Big json fields are converted in an executor, so the event loop is not
+        blocked.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        encoding : `str` = `'utf-8'`, Optional
+            The encoding to use to encode the form data's fields.
+        
+        Returns
+        -------
+        payload : ``BytesPayload``, ``MultipartWriter``
+            The generated payload.
+        
+        Raises
+        ------
+        TypeError
+            Cannot serialize a field.
+        """
+        values = await self._get_field_values_async()
+        
         if self.multipart:
-            return self._generate_form_data(encoding)
+            return self._generate_form_data(encoding, values)
         else:
-            return self._generate_form_urlencoded(encoding)
+            return self._generate_form_urlencoded(encoding, values)
     
     
     def __repr__(self):
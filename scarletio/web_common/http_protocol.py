@@ -18,7 +18,7 @@ from .helpers import (
 )
 from .http_message import RawRequestMessage, RawResponseMessage
 from .content_type import parse_content_type
-from .web_socket_frame import WebSocketFrame, apply_web_socket_mask
+from .web_socket_frame import WebSocketFrame, apply_web_socket_mask, apply_web_socket_mask_in_place
 
 
 PAYLOAD_ERROR_EOF_AT_HTTP_HEADER = 'EOF received meanwhile reading http headers.'
@@ -32,6 +32,36 @@ PACK_LENGTH_2 = Struct('!BBH').pack
 PACK_LENGTH_3 = Struct('!BBQ').pack
 
 
+def create_web_socket_frame_header(head_0, length, masked):
+    """
+    Creates the header of a web socket frame (without its mask).
+    
+    Parameters
+    ----------
+    head_0 : `int`
+        The 0th byte of web socket frame.
+    
+    length : `int`
+        The frame's payload length.
+    
+    masked : `bool`
+        Whether the frame is masked.
+    
+    Returns
+    -------
+    header : `bytes`
+    """
+    head_1 = masked << 7
+    
+    if length < 126:
+        return PACK_LENGTH_1(head_0, head_1 | length)
+    
+    if length < 65536:
+        return PACK_LENGTH_2(head_0, head_1 | 126, length)
+    
+    return PACK_LENGTH_3(head_0, head_1 | 127, length)
+
+
 class HttpReadProtocol(ReadProtocolBase):
     """
     Asynchronous read protocol implementation. Stuffed full of http read methods.
@@ -286,6 +316,7 @@ class HttpReadProtocol(ReadProtocolBase):
             If the reader task is cancelled not by receiving eof.
         ContentEncodingError
             - `'content_encoding'` was given as `'br'` meanwhile brotli or brotlipy are not installed.
+            - `'content_encoding'` was given as `'zstd'` meanwhile zstd is not available.
             - `'content_encoding'` is not an from the expected values.
         StopAsyncIteration
             The payload contains no more fields.
@@ -343,12 +374,27 @@ class HttpReadProtocol(ReadProtocolBase):
             continue
     
     
-    async def read_web_socket_frame(self, client_side, max_size):
+    async def read_web_socket_frame(self, client_side, max_size, buffer = None):
         """
         Reads a web socket frame.
         
+        If the whole frame is already buffered, it is parsed directly out of the received chunks, without setting up
+        a payload reader.
+        
         This method is a coroutine.
         
+        Parameters
+        ----------
+        client_side : `bool`
+            Whether we are on client side.
+        
+        max_size : `None | int`
+            The maximal allowed payload length.
+        
+        buffer : `None | bytearray` = `None`, Optional
+            Buffer to append the payload of data frames to. If given, the returned data frame's data is the buffer
+            itself. The payload of control frames is never appended to it.
+        
         Returns
         -------
         frame : ``WebSocketFrame``
@@ -356,14 +402,85 @@ class HttpReadProtocol(ReadProtocolBase):
         
         Raises
         ------
-        EofError
+        ConnectionError
             Connection lost before a full frame was received.
         PayloadError
             Payload length over max size limit.
         CancelledError
             If the reader task is cancelled not by receiving eof.
+        WebSocketProtocolError
+            Incorrect masking.
         """
-        head_0, head_1 = await self.read_exactly(2)
+        frame = self._read_web_socket_frame_from_buffer(client_side, max_size, buffer)
+        if (frame is not None):
+            return frame
+        
+        if (buffer is not None):
+            buffer_start = len(buffer)
+        
+        frame_head = []
+        data = await self.set_payload_reader(
+            partial_func(self._read_web_socket_frame, client_side, max_size, frame_head, buffer)
+        )
+        head_0, mask = frame_head
+        
+        if (buffer is not None) and (not head_0 & 0b00001000):
+            if (mask is not None):
+                apply_web_socket_mask_in_place(mask, buffer, buffer_start, len(buffer))
+            
+            data = buffer
+        
+        elif (mask is not None):
+            # Big payloads are received into a preallocated buffer, mask them in place.
+            if isinstance(data, bytearray):
+                apply_web_socket_mask_in_place(mask, data, 0, len(data))
+            else:
+                data = apply_web_socket_mask(mask, data)
+        
+        return WebSocketFrame._from_fields(head_0, data)
+    
+    
+    def _read_web_socket_frame_from_buffer(self, client_side, max_size, buffer):
+        """
+        Reads a web socket frame if it is fully contained by the first buffered chunk.
+        
+        Parameters
+        ----------
+        client_side : `bool`
+            Whether we are on client side.
+        
+        max_size : `None | int`
+            The maximal allowed payload length.
+        
+        buffer : `None | bytearray`
+            Buffer to append the payload of data frames to.
+        
+        Returns
+        -------
+        frame : `None | WebSocketFrame`
+            Returns `None` if the frame is not fully buffered.
+        
+        Raises
+        ------
+        PayloadError
+            Payload length over max size limit.
+        WebSocketProtocolError
+            Incorrect masking.
+        """
+        chunks = self._chunks
+        if (not chunks) or (self._payload_reader is not None) or (self._exception is not None):
+            return None
+        
+        chunk = chunks[0]
+        chunk_size = len(chunk)
+        offset = self._offset
+        
+        position = offset + 2
+        if position > chunk_size:
+            return None
+        
+        head_0 = chunk[offset]
+        head_1 = chunk[offset + 1]
         
         if ((head_1 & 0b10000000) >> 7) == client_side:
             raise WebSocketProtocolError('Incorrect masking.')
@@ -371,26 +488,126 @@ class HttpReadProtocol(ReadProtocolBase):
         length = head_1 & 0b01111111
         
         if length == 126:
-            data = await self.read_exactly(2)
-            length, = UNPACK_LENGTH_2(data)
+            if position + 2 > chunk_size:
+                return None
+            
+            length, = UNPACK_LENGTH_2(chunk, position)
+            position += 2
+        
         elif length == 127:
-            data = await self.read_exactly(8)
-            length, = UNPACK_LENGTH_3(data)
+            if position + 8 > chunk_size:
+                return None
+            
+            length, = UNPACK_LENGTH_3(chunk, position)
+            position += 8
         
         if (max_size is not None) and length > max_size:
             raise PayloadError(f'Payload length exceeds size limit ({length} > {max_size} bytes).')
         
-        # Read the data.
         if client_side:
-            data = await self.read_exactly(length)
+            end = position + length
+            if end > chunk_size:
+                return None
+            
+            if (buffer is None) or (head_0 & 0b00001000):
+                data = chunk[position : end]
+            else:
+                buffer += memoryview(chunk)[position : end]
+                data = buffer
+        
+        else:
+            end = position + 4 + length
+            if end > chunk_size:
+                return None
+            
+            mask = chunk[position : position + 4]
+            if (buffer is None) or (head_0 & 0b00001000):
+                data = apply_web_socket_mask(mask, memoryview(chunk)[position + 4 : end])
+            else:
+                buffer_start = len(buffer)
+                buffer += memoryview(chunk)[position + 4 : end]
+                apply_web_socket_mask_in_place(mask, buffer, buffer_start, len(buffer))
+                data = buffer
+        
+        if end == chunk_size:
+            del chunks[0]
+            self._offset = 0
         else:
-            mask = await self.read_exactly(4)
-            data = await self.read_exactly(length)
-            data = apply_web_socket_mask(mask, data)
+            self._offset = end
         
         return WebSocketFrame._from_fields(head_0, data)
     
     
+    async def _read_web_socket_frame(self, client_side, max_size, frame_head, buffer, payload_stream):
+        """
+        Payload reader task, what reads a web socket frame. The frame's payload is fed into the payload stream, meanwhile
+        its first byte and mask are appended to the given `frame_head`.
+        
+        This method is a coroutine generator.
+        
+        Parameters
+        ----------
+        client_side : `bool`
+            Whether we are on client side.
+        
+        max_size : `None | int`
+            The maximal allowed payload length.
+        
+        frame_head : `list<int | None | bytes>`
+            List to append the frame's first byte and mask to.
+        
+        buffer : `None | bytearray`
+            Buffer to append the payload of data frames to, instead of feeding it into the payload stream.
+        
+        payload_stream : ``PayloadStream``
+            Payload buffer to read into.
+        
+        Raises
+        ------
+        EofError
+            Connection lost before a full frame was received.
+        PayloadError
+            Payload length over max size limit.
+        WebSocketProtocolError
+            Incorrect masking.
+        """
+        head_0, head_1 = await self._read_exactly_as_one(2)
+        
+        if ((head_1 & 0b10000000) >> 7) == client_side:
+            raise WebSocketProtocolError('Incorrect masking.')
+        
+        length = head_1 & 0b01111111
+        
+        if length == 126:
+            length, = UNPACK_LENGTH_2(await self._read_exactly_as_one(2))
+        elif length == 127:
+            length, = UNPACK_LENGTH_3(await self._read_exactly_as_one(8))
+        
+        if (max_size is not None) and length > max_size:
+            raise PayloadError(f'Payload length exceeds size limit ({length} > {max_size} bytes).')
+        
+        if client_side:
+            mask = None
+        else:
+            mask = await self._read_exactly_as_one(4)
+        
+        frame_head.append(head_0)
+        frame_head.append(mask)
+        
+        if length:
+            if (buffer is None) or (head_0 & 0b00001000):
+                payload_stream.set_expected_size(length)
+                
+                async for chunk in self._read_exactly_by_chunk(length):
+                    payload_stream.add_received_chunk(chunk)
+            
+            else:
+                async for chunk in self._read_exactly_by_chunk(length):
+                    buffer += chunk
+        
+        payload_stream.set_done_success()
+    
+    
     def get_payload_reader_task(self, message):
         """
         Gets payload reader task for the given raw http message.
@@ -541,7 +758,7 @@ class HttpReadProtocol(ReadProtocolBase):
         length : `int`
             The amount of bytes to read.
         
-        decompressor : `ZLIB_DECOMPRESSOR`, `BROTLI_DECOMPRESSOR`
+        decompressor : `ZLIB_DECOMPRESSOR`, `BROTLI_DECOMPRESSOR`, `ZSTD_DECOMPRESSOR`
             Decompressor used to decompress the data after receiving it.
         
         payload_stream : ``PayloadStream``
@@ -586,7 +803,7 @@ class HttpReadProtocol(ReadProtocolBase):
         
         Parameters
         ----------
-        decompressor : `ZLIB_DECOMPRESSOR`, `BROTLI_DECOMPRESSOR`
+        decompressor : `ZLIB_DECOMPRESSOR`, `BROTLI_DECOMPRESSOR`, `ZSTD_DECOMPRESSOR`
             Decompressor used to decompress the data after receiving it.
         
         payload_stream : ``PayloadStream``
@@ -684,6 +901,9 @@ class HttpReadWriteProtocol(ReadWriteProtocolBase, HttpReadProtocol):
         Asynchronous transport implementation. Is set meanwhile the protocol is alive.
     _drain_waiter : ``None | Future``
         A future, what is used to block the writing task, till it's writen data is drained.
+    
+    _writing_paused : `bool`
+        Whether the protocol's respective transport asked it to pause writing. Defaults to `False`.
     """
     __slots__ = ()
     
@@ -786,28 +1006,19 @@ class HttpReadWriteProtocol(ReadWriteProtocolBase, HttpReadProtocol):
         if transport is None:
             raise RuntimeError(f'Protocol has no attached transport; self = {self!r}.')
         
-        # Prepare the header.
-        head_0 = frame.head_0
-        head_1 = client_side << 7
-        
-        length = len(frame.data)
-        if length < 126:
-            header = PACK_LENGTH_1(head_0, head_1 | length)
-        elif length < 65536:
-            header = PACK_LENGTH_2(head_0, head_1 | 126, length)
-        else:
-            header = PACK_LENGTH_3(head_0, head_1 | 127, length)
-        transport.write(header)
+        header = create_web_socket_frame_header(frame.head_0, len(frame.data), client_side)
         
         # prepare the data.
         if client_side:
+            # Mask the data in place inside of the sent buffer.
             mask = getrandbits(32).to_bytes(4, 'big')
-            transport.write(mask)
-            data = apply_web_socket_mask(mask, frame.data,)
-        else:
-            data = frame.data
+            buffer = bytearray().join((header, mask, frame.data))
+            apply_web_socket_mask_in_place(mask, buffer, len(header) + 4, len(buffer))
+            transport.write(buffer)
         
-        transport.write(data)
+        else:
+            transport.write(header)
+            transport.write(frame.data)
 
     
     @copy_docs(HttpReadProtocol.isekai_into)
@@ -815,5 +1026,6 @@ class HttpReadWriteProtocol(ReadWriteProtocolBase, HttpReadProtocol):
         new = HttpReadProtocol.isekai_into(self, other_class)
         
         new._drain_waiter = self._drain_waiter
+        new._writing_paused = self._writing_paused
         
         return new
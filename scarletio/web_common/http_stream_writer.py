@@ -1,6 +1,6 @@
 __all__ = ()
 
-from .compressors import ZLIB_COMPRESSOR, ZLIB_MAX_WBITS
+from .compressors import ZLIB_COMPRESSOR, ZLIB_MAX_WBITS, ZSTD_COMPRESSOR, get_zstd_dictionary
 
 
 WRITE_CHUNK_LIMIT = 65536
@@ -18,7 +18,7 @@ class HTTPStreamWriter:
         The amount of written data in bytes. If reaches a limit, drain lock is awaited.
     chunked : `bool`
         Whether the http message's content is chunked.
-    compressor : `None`, `ZLIB_COMPRESSOR`, `BROTLI_COMPRESSOR`
+    compressor : `None`, `ZLIB_COMPRESSOR`, `BROTLI_COMPRESSOR`, `ZSTD_COMPRESSOR`
         Decompressor used to compress the sent data. Defaults to `None` if no compression is given.
     protocol : `AbstractProtocolBase`
         Asynchronous transport implementation.
@@ -46,6 +46,8 @@ class HTTPStreamWriter:
             compressor = ZLIB_COMPRESSOR(wbits = 16 + ZLIB_MAX_WBITS)
         elif compression == 'deflate':
             compressor = ZLIB_COMPRESSOR(wbits = ZLIB_MAX_WBITS)
+        elif (compression == 'zstd') and (ZSTD_COMPRESSOR is not None):
+            compressor = ZSTD_COMPRESSOR(dictionary = get_zstd_dictionary())
         else:
             compressor = None
         
@@ -12,7 +12,7 @@ from uuid import uuid4 as create_uuid_4
 from ..core import AsyncIO
 from ..utils import IgnoreCaseMultiValueDictionary, to_json
 
-from .compressors import BROTLI_COMPRESSOR, ZLIB_COMPRESSOR, ZLIB_MAX_WBITS
+from .compressors import BROTLI_COMPRESSOR, ZLIB_COMPRESSOR, ZLIB_MAX_WBITS, ZSTD_COMPRESSOR, get_zstd_dictionary
 from .exceptions import ContentEncodingError
 from .header_building_and_parsing import CHARS, TOKENS, build_content_disposition_header
 from .headers import CONTENT_DISPOSITION, CONTENT_ENCODING, CONTENT_LENGTH, CONTENT_TRANSFER_ENCODING, CONTENT_TYPE
@@ -1410,7 +1410,7 @@ class MultipartPayloadWriter:
     
     Attributes
     ----------
-    compressor : `None`, `ZLIB_COMPRESSOR`, `BROTLI_COMPRESSOR`
+    compressor : `None`, `ZLIB_COMPRESSOR`, `BROTLI_COMPRESSOR`, `ZSTD_COMPRESSOR`
         The compressor matching the respective payload's content-encoding.
          used by the respective payload
     encoding_buffer : `None`, `bytearray`
@@ -1458,10 +1458,13 @@ class MultipartPayloadWriter:
             +---------------+-------------------------------------------------+
             | `'br'`        | `BROTLI_COMPRESSOR()`                           |
             +---------------+-------------------------------------------------+
+            | `'zstd'`      | `ZSTD_COMPRESSOR()`                             |
+            +---------------+-------------------------------------------------+
             | `'identity'`  | `None`                                          |
             +---------------+-------------------------------------------------+
             
-            You need to have `brotlipy` installed to handle `'br'` encoding.
+            You need to have `brotlipy` installed to handle `'br'` encoding and `zstandard` (or python 3.14) to
+            handle `'zstd'`.
         
         transfer_encoding : `None`, `str`
             Transfer encoding to write the data with.
@@ -1501,6 +1504,14 @@ class MultipartPayloadWriter:
             
             compressor = BROTLI_COMPRESSOR()
         
+        elif content_encoding == 'zstd':
+            if ZSTD_COMPRESSOR is None:
+                raise ContentEncodingError(
+                    'Can not encode content-encoding: zstandard (zstd). Please install `zstandard`.'
+                )
+            
+            compressor = ZSTD_COMPRESSOR(dictionary = get_zstd_dictionary())
+        
         elif content_encoding == 'identity':
             # I assume this is no encoding
             compressor = None
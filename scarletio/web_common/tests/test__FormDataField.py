@@ -65,6 +65,28 @@ def test__FormDataField__get_value(field_type, value):
     return form_data_field.get_value()
 
 
+@vampytest._(vampytest.call_from(_iter_options__get_value()).returning_last())
+async def test__FormDataField__get_value_async(field_type, value):
+    """
+    Tests whether ``FormDataField.get_value_async`` works as intended.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    field_type : `int`
+        The field's type.
+    value : `object`
+        The field's value.
+    
+    Returns
+    -------
+    output : `object`
+    """
+    form_data_field = FormDataField(field_type, MultiValueDictionary(), IgnoreCaseMultiValueDictionary(), value)
+    return await form_data_field.get_value_async()
+
+
 def test__FormDataField__repr():
     """
     Tests whether ``FormDataField.__repr__`` works as intended.
@@ -7,12 +7,14 @@ from ...core import AbstractTransportLayerBase, EventThread, PayloadStream, Task
 from ...utils import IgnoreCaseMultiValueDictionary
 
 from ..compressors import ZLIB_COMPRESSOR, ZLIB_MAX_WBITS
-from ..exceptions import PayloadError
+from ..exceptions import PayloadError, WebSocketProtocolError
 from ..headers import CONTENT_ENCODING, CONTENT_LENGTH, TRANSFER_ENCODING
 from ..helpers import HttpVersion
 from ..http_message import RawRequestMessage, RawResponseMessage
 from ..http_protocol import HttpReadProtocol
-from ..web_socket_frame import WEB_SOCKET_OPERATION_BINARY, WebSocketFrame, apply_web_socket_mask
+from ..web_socket_frame import (
+    WEB_SOCKET_OPERATION_BINARY, WEB_SOCKET_OPERATION_PING, WebSocketFrame, apply_web_socket_mask
+)
 
 
 def _assert_fields_set(protocol):
@@ -323,6 +325,160 @@ async def test__HTTPReadProtocol__read_web_socket_frame__failure():
         task.get_result()
 
 
+async def test__HTTPReadProtocol__read_web_socket_frame__buffered():
+    """
+    Tests whether ``HttpReadProtocol.read_web_socket`` works as intended.
+    
+    This function is a coroutine.
+    
+    Case: multiple frames buffered in a single chunk.
+    """
+    loop = get_event_loop()
+    data_0 = b'hey mister'
+    data_1 = b'a' * 300
+    mask = b'orin'
+    
+    protocol = HttpReadProtocol(loop)
+    
+    web_socket_frame_0 = WebSocketFrame(True, WEB_SOCKET_OPERATION_BINARY, data_0)
+    web_socket_frame_1 = WebSocketFrame(True, WEB_SOCKET_OPERATION_BINARY, data_1)
+    
+    protocol.data_received(b''.join([
+        web_socket_frame_0.head_0.to_bytes(1, 'big'),
+        (len(data_0) | (1 << 7)).to_bytes(1, 'big'),
+        mask,
+        apply_web_socket_mask(mask, data_0),
+        web_socket_frame_1.head_0.to_bytes(1, 'big'),
+        (126 | (1 << 7)).to_bytes(1, 'big'),
+        len(data_1).to_bytes(2, 'big'),
+        mask,
+        apply_web_socket_mask(mask, data_1),
+        web_socket_frame_0.head_0.to_bytes(1, 'big'),
+    ]))
+    
+    output = await protocol.read_web_socket_frame(False, 10000)
+    vampytest.assert_eq(output, web_socket_frame_0)
+    
+    output = await protocol.read_web_socket_frame(False, 10000)
+    vampytest.assert_eq(output, web_socket_frame_1)
+    
+    # The next frame is only partially buffered.
+    task = Task(loop, protocol.read_web_socket_frame(False, 10000))
+    await skip_ready_cycle()
+    vampytest.assert_false(task.is_done())
+    
+    protocol.data_received((len(data_0) | (1 << 7)).to_bytes(1, 'big') + mask + apply_web_socket_mask(mask, data_0))
+    await skip_ready_cycle()
+    vampytest.assert_true(task.is_done())
+    
+    output = task.get_result()
+    vampytest.assert_eq(output, web_socket_frame_0)
+    
+    vampytest.assert_eq(len(protocol._chunks), 0)
+
+
+async def test__HTTPReadProtocol__read_web_socket_frame__incorrect_masking():
+    """
+    Tests whether ``HttpReadProtocol.read_web_socket`` works as intended.
+    
+    This function is a coroutine.
+    
+    Case: incorrect masking.
+    """
+    loop = get_event_loop()
+    data = b'hey mister'
+    
+    protocol = HttpReadProtocol(loop)
+    
+    web_socket_frame = WebSocketFrame(True, WEB_SOCKET_OPERATION_BINARY, data)
+    protocol.data_received(web_socket_frame.head_0.to_bytes(1, 'big') + len(data).to_bytes(1, 'big') + data)
+    
+    with vampytest.assert_raises(WebSocketProtocolError):
+        await protocol.read_web_socket_frame(False, 10000)
+
+
+async def test__HTTPReadProtocol__read_web_socket_frame__too_large():
+    """
+    Tests whether ``HttpReadProtocol.read_web_socket`` works as intended.
+    
+    This function is a coroutine.
+    
+    Case: payload over max size.
+    """
+    loop = get_event_loop()
+    data = b'hey mister'
+    
+    protocol = HttpReadProtocol(loop)
+    
+    web_socket_frame = WebSocketFrame(True, WEB_SOCKET_OPERATION_BINARY, data)
+    protocol.data_received(web_socket_frame.head_0.to_bytes(1, 'big') + len(data).to_bytes(1, 'big'))
+    
+    with vampytest.assert_raises(PayloadError):
+        await protocol.read_web_socket_frame(True, 4)
+
+
+async def test__HTTPReadProtocol__read_web_socket_frame__into_buffer():
+    """
+    Tests whether ``HttpReadProtocol.read_web_socket`` works as intended.
+    
+    This function is a coroutine.
+    
+    Case: reading into buffer.
+    """
+    loop = get_event_loop()
+    data_0 = b'hey mister'
+    data_1 = b'a' * 300
+    mask = b'orin'
+    
+    protocol = HttpReadProtocol(loop)
+    buffer = bytearray(b'koishi')
+    
+    web_socket_frame_0 = WebSocketFrame(True, WEB_SOCKET_OPERATION_BINARY, data_0)
+    web_socket_frame_1 = WebSocketFrame(True, WEB_SOCKET_OPERATION_PING, data_0)
+    
+    # Fully buffered frame.
+    protocol.data_received(b''.join([
+        web_socket_frame_0.head_0.to_bytes(1, 'big'),
+        (len(data_0) | (1 << 7)).to_bytes(1, 'big'),
+        mask,
+        apply_web_socket_mask(mask, data_0),
+    ]))
+    
+    output = await protocol.read_web_socket_frame(False, 10000, buffer)
+    vampytest.assert_is(output.data, buffer)
+    vampytest.assert_eq(buffer, b'koishi' + data_0)
+    
+    # Control frames are not read into the buffer.
+    protocol.data_received(b''.join([
+        web_socket_frame_1.head_0.to_bytes(1, 'big'),
+        (len(data_0) | (1 << 7)).to_bytes(1, 'big'),
+        mask,
+        apply_web_socket_mask(mask, data_0),
+    ]))
+    
+    output = await protocol.read_web_socket_frame(False, 10000, buffer)
+    vampytest.assert_eq(output, web_socket_frame_1)
+    vampytest.assert_eq(buffer, b'koishi' + data_0)
+    
+    # Frame received in parts.
+    masked_data_1 = apply_web_socket_mask(mask, data_1)
+    protocol.data_received(web_socket_frame_0.head_0.to_bytes(1, 'big'))
+    
+    task = Task(loop, protocol.read_web_socket_frame(False, 10000, buffer))
+    await skip_ready_cycle()
+    
+    protocol.data_received((126 | (1 << 7)).to_bytes(1, 'big') + len(data_1).to_bytes(2, 'big') + mask)
+    protocol.data_received(masked_data_1[: 100])
+    await skip_ready_cycle()
+    protocol.data_received(masked_data_1[100 :])
+    await skip_ready_cycle()
+    vampytest.assert_true(task.is_done())
+    
+    output = task.get_result()
+    vampytest.assert_is(output.data, buffer)
+    vampytest.assert_eq(buffer, b'koishi' + data_0 + data_1)
+
+
 async def test__HTTPReadProtocol__get_payload_reader_task__read_chunked():
     """
     Tests whether ``HttpReadProtocol.get_payload_reader_task`` works as intended.
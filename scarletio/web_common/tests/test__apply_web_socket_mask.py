@@ -0,0 +1,105 @@
+import vampytest
+
+from ..web_socket_frame import MASK_NUMPY_SIZE_MIN, apply_web_socket_mask, apply_web_socket_mask_in_place
+
+
+def _mask_naive(mask, data):
+    """
+    Masks the given data byte by byte.
+    
+    Parameters
+    ----------
+    mask : `bytes`
+        `uint32` web socket mask in bytes.
+    
+    data : `bytes`
+        Data to apply the mask to.
+    
+    Returns
+    -------
+    data : `bytearray`
+    """
+    return bytearray(value ^ mask[index & 3] for index, value in enumerate(data))
+
+
+def _iter_options():
+    mask = b'orin'
+    
+    for size in (0, 1, 3, 4, 10, 125, MASK_NUMPY_SIZE_MIN - 1, MASK_NUMPY_SIZE_MIN, MASK_NUMPY_SIZE_MIN + 3):
+        data = bytes(index * 7 & 0xff for index in range(size))
+        yield mask, data, _mask_naive(mask, data)
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__apply_web_socket_mask(mask, data):
+    """
+    Tests whether ``apply_web_socket_mask`` works as intended.
+    
+    Parameters
+    ----------
+    mask : `bytes`
+        `uint32` web socket mask in bytes.
+    
+    data : `bytes`
+        Data to apply the mask to.
+    
+    Returns
+    -------
+    output : `bytearray`
+    """
+    output = apply_web_socket_mask(mask, data)
+    vampytest.assert_instance(output, bytearray)
+    
+    # Masking twice should return the original data.
+    vampytest.assert_eq(apply_web_socket_mask(mask, output), data)
+    return output
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__apply_web_socket_mask_in_place__without_numpy(mask, data):
+    """
+    Tests whether ``apply_web_socket_mask_in_place`` works as intended.
+    
+    Case: `numpy` not available.
+    
+    Parameters
+    ----------
+    mask : `bytes`
+        `uint32` web socket mask in bytes.
+    
+    data : `bytes`
+        Data to apply the mask to.
+    
+    Returns
+    -------
+    output : `bytearray`
+    """
+    buffer = bytearray(data)
+    mocked = vampytest.mock_globals(apply_web_socket_mask_in_place, numpy = None)
+    mocked(mask, buffer, 0, len(buffer))
+    return buffer
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__apply_web_socket_mask_in_place(mask, data):
+    """
+    Tests whether ``apply_web_socket_mask_in_place`` works as intended.
+    
+    Parameters
+    ----------
+    mask : `bytes`
+        `uint32` web socket mask in bytes.
+    
+    data : `bytes`
+        Data to apply the mask to.
+    
+    Returns
+    -------
+    output : `bytearray`
+    """
+    # Use an unaligned offset and add some data around to check that it is not touched.
+    buffer = bytearray(b'aya' + data + b'momiji')
+    apply_web_socket_mask_in_place(mask, buffer, 3, 3 + len(data))
+    vampytest.assert_eq(buffer[:3], b'aya')
+    vampytest.assert_eq(buffer[3 + len(data):], b'momiji')
+    return buffer[3 : 3 + len(data)]
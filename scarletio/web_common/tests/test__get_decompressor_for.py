@@ -0,0 +1,110 @@
+from gzip import compress as gzip_compress
+from zlib import compressobj as create_zlib_compressor
+
+import vampytest
+
+from ..compressors import ZSTD_COMPRESSOR, ZSTD_DECOMPRESSOR, get_decompressor_for, set_zstd_dictionary
+from ..exceptions import ContentEncodingError
+
+
+def _deflate_compress(data):
+    compressor = create_zlib_compressor(wbits = -15)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _iter_options():
+    yield None, None
+    yield 'identity', None
+    yield 'gzip', gzip_compress
+    yield 'deflate', _deflate_compress
+
+
+@vampytest._(vampytest.call_from(_iter_options()))
+def test__get_decompressor_for(content_encoding, compress):
+    """
+    Tests whether ``get_decompressor_for`` works as intended.
+    
+    Parameters
+    ----------
+    content_encoding : `None | str`
+        Content encoding to get decompressor for.
+    compress : `None | FunctionType`
+        Function to compress data with.
+    """
+    output = get_decompressor_for(content_encoding)
+    if compress is None:
+        vampytest.assert_is(output, None)
+        return
+    
+    data = b'orindance' * 20
+    vampytest.assert_eq(output.decompress(compress(data)) + output.flush(), data)
+
+
+def _iter_options__content_encoding_error():
+    yield 'koishi'
+    
+    if ZSTD_DECOMPRESSOR is None:
+        yield 'zstd'
+
+
+@vampytest._(vampytest.call_from(_iter_options__content_encoding_error()).raising(ContentEncodingError))
+def test__get_decompressor_for__content_encoding_error(content_encoding):
+    """
+    Tests whether ``get_decompressor_for`` works as intended.
+    
+    Case: content encoding error.
+    
+    Parameters
+    ----------
+    content_encoding : `str`
+        Content encoding to get decompressor for.
+    
+    Raises
+    ------
+    ContentEncodingError
+    """
+    get_decompressor_for(content_encoding)
+
+
+def _compress_zstd(data, dictionary):
+    compressor = ZSTD_COMPRESSOR(dictionary = dictionary)
+    return compressor.compress(data) + compressor.flush()
+
+
+@vampytest.skip_if(ZSTD_DECOMPRESSOR is None)
+def test__get_decompressor_for__zstd():
+    """
+    Tests whether ``get_decompressor_for`` works as intended.
+    
+    Case: zstd with multiple frames.
+    """
+    data_0 = b'orindance' * 20
+    data_1 = b'okuu' * 20
+    
+    decompressor = get_decompressor_for('zstd')
+    
+    compressed = _compress_zstd(data_0, None) + _compress_zstd(data_1, None)
+    output = b''.join([decompressor.decompress(compressed[index : index + 7]) for index in range(0, len(compressed), 7)])
+    output += decompressor.flush()
+    
+    vampytest.assert_eq(output, data_0 + data_1)
+
+
+@vampytest.skip_if(ZSTD_DECOMPRESSOR is None)
+def test__get_decompressor_for__zstd_dictionary():
+    """
+    Tests whether ``get_decompressor_for`` works as intended.
+    
+    Case: zstd with dictionary.
+    """
+    dictionary_data = b'{"id":"","name":"","avatar":null,"flags":0}' * 8
+    data = b'{"id":"1","name":"koishi","avatar":null,"flags":0}'
+    
+    set_zstd_dictionary(dictionary_data)
+    try:
+        decompressor = get_decompressor_for('zstd')
+        output = decompressor.decompress(_compress_zstd(data, decompressor._dictionary)) + decompressor.flush()
+    finally:
+        set_zstd_dictionary(None)
+    
+    vampytest.assert_eq(output, data)
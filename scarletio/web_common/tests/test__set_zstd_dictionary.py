@@ -0,0 +1,49 @@
+import vampytest
+
+from ..compressors import ZSTD_DECOMPRESSOR, get_zstd_dictionary, set_zstd_dictionary
+
+
+def test__set_zstd_dictionary__none():
+    """
+    Tests whether ``set_zstd_dictionary`` works as intended.
+    
+    Case: removing the dictionary.
+    """
+    set_zstd_dictionary(None)
+    vampytest.assert_is(get_zstd_dictionary(), None)
+
+
+@vampytest.skip_if(ZSTD_DECOMPRESSOR is None)
+def test__set_zstd_dictionary():
+    """
+    Tests whether ``set_zstd_dictionary`` works as intended.
+    
+    Case: setting the dictionary.
+    """
+    set_zstd_dictionary(b'orindance' * 20)
+    try:
+        vampytest.assert_is_not(get_zstd_dictionary(), None)
+    finally:
+        set_zstd_dictionary(None)
+
+
+@vampytest.skip_if(ZSTD_DECOMPRESSOR is None)
+def test__set_zstd_dictionary__type_error():
+    """
+    Tests whether ``set_zstd_dictionary`` works as intended.
+    
+    Case: type error.
+    """
+    with vampytest.assert_raises(TypeError):
+        set_zstd_dictionary('orindance')
+
+
+@vampytest.skip_if(ZSTD_DECOMPRESSOR is not None)
+def test__set_zstd_dictionary__runtime_error():
+    """
+    Tests whether ``set_zstd_dictionary`` works as intended.
+    
+    Case: zstd not available.
+    """
+    with vampytest.assert_raises(RuntimeError):
+        set_zstd_dictionary(b'orindance')
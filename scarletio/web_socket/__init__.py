@@ -1,5 +1,9 @@
 from .web_socket_client import *
 from .web_socket_common_protocol import *
+from .web_socket_extension_base import *
+from .web_socket_extension_per_message_deflate import *
+from .web_socket_keepalive_manager import *
+from .web_socket_message_queue import *
 from .web_socket_server import *
 from .web_socket_server_protocol import *
 
@@ -7,6 +11,10 @@ from .web_socket_server_protocol import *
 __all__ = (
     *web_socket_client.__all__,
     *web_socket_common_protocol.__all__,
+    *web_socket_extension_base.__all__,
+    *web_socket_extension_per_message_deflate.__all__,
+    *web_socket_keepalive_manager.__all__,
+    *web_socket_message_queue.__all__,
     *web_socket_server.__all__,
     *web_socket_server_protocol.__all__,
 )
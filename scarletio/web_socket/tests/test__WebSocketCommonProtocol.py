@@ -0,0 +1,386 @@
+import vampytest
+
+from ...core import AsyncQueue, Future, Task, get_event_loop, skip_ready_cycle
+
+from ...web_common import WebSocketFrame
+from ...web_common.web_socket_frame import WEB_SOCKET_OPERATION_PONG
+
+from ..web_socket_common_protocol import WEB_SOCKET_STATE_OPEN, WebSocketCommonProtocol
+from ..web_socket_message_queue import WebSocketMessageQueue
+
+
+class TestTransport:
+    """
+    Transport used for testing, tracking whether reading is paused and collecting the written data.
+    
+    Attributes
+    ----------
+    reading_paused : `bool`
+        Whether reading is paused.
+    
+    written : `list<bytes>`
+        The written data. Lines written together are joined.
+    """
+    __slots__ = ('reading_paused', 'written')
+    
+    def __new__(cls):
+        """
+        Creates a new test transport.
+        """
+        self = object.__new__(cls)
+        self.reading_paused = False
+        self.written = []
+        return self
+    
+    
+    def pause_reading(self):
+        self.reading_paused = True
+    
+    
+    def resume_reading(self):
+        self.reading_paused = False
+    
+    
+    def get_write_buffer_size(self):
+        return 0
+    
+    
+    def is_closing(self):
+        return False
+    
+    
+    def writelines(self, lines):
+        self.written.append(b''.join(lines))
+
+
+class TestServerSideProtocol(WebSocketCommonProtocol):
+    """
+    Server side web socket protocol used for testing, so the written frames are not masked.
+    """
+    __slots__ = ()
+    
+    is_client = False
+
+
+def _create_open_protocol():
+    """
+    Creates an open server side protocol with a test transport.
+    
+    Returns
+    -------
+    protocol : ``TestServerSideProtocol``
+    """
+    loop = get_event_loop()
+    
+    protocol = TestServerSideProtocol(loop, 'localhost', 80)
+    protocol._transport = TestTransport()
+    protocol.state = WEB_SOCKET_STATE_OPEN
+    protocol.transfer_data_task = Future(loop)
+    protocol.close_connection_task = Future(loop)
+    return protocol
+
+
+def _iter_options__messages():
+    yield {}, AsyncQueue, None
+    yield {'max_queue': 10}, AsyncQueue, 10
+    yield {'queue_backpressure': True}, AsyncQueue, None
+    yield {'max_queue': 10, 'queue_backpressure': True}, WebSocketMessageQueue, None
+
+
+@vampytest.call_from(_iter_options__messages())
+async def test__WebSocketCommonProtocol__new__messages(keyword_parameters, expected_type, expected_max_length):
+    """
+    Tests whether ``WebSocketCommonProtocol.__new__`` creates the correct message queue.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    keyword_parameters : `dict<str, object>`
+        Keyword parameters to create the protocol with.
+    
+    expected_type : `type`
+        The expected type of the message queue.
+    
+    expected_max_length : `None | int`
+        The expected max length of the message queue.
+    """
+    protocol = WebSocketCommonProtocol(get_event_loop(), 'localhost', 80, **keyword_parameters)
+    vampytest.assert_is(type(protocol.messages), expected_type)
+    vampytest.assert_eq(protocol.messages.max_length, expected_max_length)
+    vampytest.assert_eq(protocol.queue_backpressure, expected_type is WebSocketMessageQueue)
+
+
+async def test__WebSocketCommonProtocol__new__queue_low_water():
+    """
+    Tests whether ``WebSocketCommonProtocol.__new__`` sets the message queue's low water mark as intended.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    
+    protocol = WebSocketCommonProtocol(loop, 'localhost', 80, max_queue = 10, queue_backpressure = True)
+    vampytest.assert_eq(protocol.messages.high_water, 10)
+    vampytest.assert_eq(protocol.messages.low_water, 5)
+    
+    protocol = WebSocketCommonProtocol(
+        loop, 'localhost', 80, max_queue = 10, queue_backpressure = True, queue_low_water = 8
+    )
+    vampytest.assert_eq(protocol.messages.low_water, 8)
+
+
+async def test__WebSocketCommonProtocol__wait_for_queue_drain():
+    """
+    Tests whether ``WebSocketCommonProtocol._wait_for_queue_drain`` works as intended.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    
+    protocol = WebSocketCommonProtocol(loop, 'localhost', 80, max_queue = 2, queue_backpressure = True)
+    transport = TestTransport()
+    protocol._transport = transport
+    
+    protocol.messages.set_result('a')
+    protocol.messages.set_result('b')
+    vampytest.assert_eq(protocol.queue_depth, 2)
+    vampytest.assert_eq(protocol.queue_paused_duration, 0.0)
+    
+    task = loop.create_task(protocol._wait_for_queue_drain())
+    await skip_ready_cycle()
+    vampytest.assert_false(task.is_done())
+    vampytest.assert_true(transport.reading_paused)
+    vampytest.assert_true(protocol._paused)
+    
+    vampytest.assert_eq(await protocol.receive(), 'a')
+    await skip_ready_cycle()
+    vampytest.assert_true(task.is_done())
+    vampytest.assert_false(transport.reading_paused)
+    vampytest.assert_false(protocol._paused)
+    vampytest.assert_eq(protocol.queue_depth, 1)
+    
+    output = protocol.queue_paused_duration
+    vampytest.assert_instance(output, float)
+    vampytest.assert_true(output >= 0.0)
+
+
+async def test__WebSocketCommonProtocol__send__coalesced():
+    """
+    Tests whether ``WebSocketCommonProtocol.send`` coalesces the frames sent meanwhile the same loop iteration.
+    
+    This function is a coroutine.
+    """
+    protocol = _create_open_protocol()
+    transport = protocol._transport
+    
+    await protocol.send('hey')
+    await protocol.send(b'mister')
+    vampytest.assert_eq(transport.written, [])
+    vampytest.assert_eq(protocol.get_write_buffer_size(), 13)
+    
+    await skip_ready_cycle()
+    vampytest.assert_eq(transport.written, [b'\x81\x03hey\x82\x06mister'])
+    vampytest.assert_eq(protocol.get_write_buffer_size(), 0)
+
+
+async def test__WebSocketCommonProtocol__send__large():
+    """
+    Tests whether ``WebSocketCommonProtocol.send`` flushes the write buffer right away when it grows too big.
+    
+    This function is a coroutine.
+    """
+    protocol = _create_open_protocol()
+    transport = protocol._transport
+    
+    await protocol.send(b'a')
+    await protocol.send(b'b' * 70000)
+    vampytest.assert_eq(transport.written, [b'\x82\x01a' + b'\x82\x7f' + (70000).to_bytes(8, 'big') + b'b' * 70000])
+
+
+async def test__WebSocketCommonProtocol__send_many():
+    """
+    Tests whether ``WebSocketCommonProtocol.send_many`` works as intended.
+    
+    This function is a coroutine.
+    """
+    protocol = _create_open_protocol()
+    transport = protocol._transport
+    
+    await protocol.send_many(['hey', b'mister', bytearray(b'sister')])
+    await skip_ready_cycle()
+    vampytest.assert_eq(transport.written, [b'\x81\x03hey\x82\x06mister\x82\x06sister'])
+
+
+async def test__WebSocketCommonProtocol__send__mutated_after():
+    """
+    Tests whether ``WebSocketCommonProtocol.send`` sends the data as it was at the time of sending, even if it is
+    modified before the write buffer is flushed.
+    
+    This function is a coroutine.
+    """
+    protocol = _create_open_protocol()
+    transport = protocol._transport
+    
+    data = bytearray(b'hey')
+    await protocol.send(data)
+    await protocol.send(memoryview(data))
+    data[:] = b'bye'
+    
+    await skip_ready_cycle()
+    vampytest.assert_eq(transport.written, [b'\x82\x03hey\x82\x03hey'])
+
+
+async def test__WebSocketCommonProtocol__send_many__type_error():
+    """
+    Tests whether ``WebSocketCommonProtocol.send_many`` works as intended.
+    
+    Case: type error.
+    
+    This function is a coroutine.
+    """
+    protocol = _create_open_protocol()
+    transport = protocol._transport
+    
+    with vampytest.assert_raises(TypeError):
+        await protocol.send_many(['hey', 12])
+    
+    # Nothing should be written if a message is invalid.
+    await skip_ready_cycle()
+    vampytest.assert_eq(transport.written, [])
+
+
+async def test__WebSocketCommonProtocol__fail_connection__ordering():
+    """
+    Tests whether ``WebSocketCommonProtocol.fail_connection`` writes the close frame after the buffered frames.
+    
+    This function is a coroutine.
+    """
+    protocol = _create_open_protocol()
+    transport = protocol._transport
+    
+    await protocol.send('hey')
+    protocol.fail_connection(1000)
+    vampytest.assert_eq(transport.written, [b'\x81\x03hey\x88\x02\x03\xe8'])
+    
+    await skip_ready_cycle()
+    vampytest.assert_eq(len(transport.written), 1)
+
+
+async def test__WebSocketCommonProtocol__send__writing_paused():
+    """
+    Tests whether ``WebSocketCommonProtocol.send`` works as intended.
+    
+    Case: writing paused, multiple senders.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    protocol = _create_open_protocol()
+    transport = protocol._transport
+    
+    protocol.pause_writing()
+    task_0 = Task(loop, protocol.send('hey'))
+    task_1 = Task(loop, protocol.send('mister'))
+    await skip_ready_cycle()
+    await skip_ready_cycle()
+    vampytest.assert_false(task_0.is_done())
+    vampytest.assert_false(task_1.is_done())
+    vampytest.assert_eq(transport.written, [b'\x81\x03hey\x81\x06mister'])
+    
+    protocol.resume_writing()
+    for _ in range(3):
+        await skip_ready_cycle()
+    
+    vampytest.assert_true(task_0.is_done())
+    vampytest.assert_true(task_1.is_done())
+
+
+async def test__WebSocketCommonProtocol__process_control_frame__pong():
+    """
+    Tests whether ``WebSocketCommonProtocol._process_control_frame`` works as intended.
+    
+    Case: pong with `bytearray` data.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    protocol = _create_open_protocol()
+    
+    waiter_0 = Future(loop)
+    waiter_1 = Future(loop)
+    waiter_2 = Future(loop)
+    protocol.pings[b'koishi'] = waiter_0
+    protocol.pings[b'satori'] = waiter_1
+    protocol.pings[b'orin'] = waiter_2
+    
+    output = await protocol._process_control_frame(
+        WebSocketFrame(True, WEB_SOCKET_OPERATION_PONG, bytearray(b'satori'))
+    )
+    vampytest.assert_true(output)
+    vampytest.assert_true(waiter_0.is_done())
+    vampytest.assert_true(waiter_1.is_done())
+    vampytest.assert_false(waiter_2.is_done())
+    vampytest.assert_eq([*protocol.pings.keys()], [b'orin'])
+
+
+async def test__WebSocketCommonProtocol__ping_no_wait():
+    """
+    Tests whether ``WebSocketCommonProtocol.ping_no_wait`` works as intended.
+    
+    This function is a coroutine.
+    """
+    protocol = _create_open_protocol()
+    transport = protocol._transport
+    
+    output = protocol.ping_no_wait()
+    vampytest.assert_true(output)
+    
+    await skip_ready_cycle()
+    vampytest.assert_eq(transport.written, [b'\x89\x00'])
+
+
+def _iter_options__read_message__binary_as_memoryview():
+    yield False, [b'\x82\x03hey'], b'hey'
+    yield True, [b'\x82\x03hey'], b'hey'
+    yield True, [b'\x02\x03hey', b'\x89\x00', b'\x00\x07 mister', b'\x80\x07 sister'], b'hey mister sister'
+    yield True, [b'\x01\x03hey', b'\x80\x07 mister'], 'hey mister'
+
+
+@vampytest._(vampytest.call_from(_iter_options__read_message__binary_as_memoryview()).returning_last())
+async def test__WebSocketCommonProtocol__read_message__binary_as_memoryview(binary_as_memoryview, chunks):
+    """
+    Tests whether ``WebSocketCommonProtocol.read_message`` works as intended.
+    
+    Case: binary as memoryview.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    binary_as_memoryview : `bool`
+        Whether binary messages should be delivered as `memoryview`-s.
+    
+    chunks : `list<bytes>`
+        Chunks to feed to the protocol.
+    
+    Returns
+    -------
+    output : `bytes | str`
+    """
+    loop = get_event_loop()
+    protocol = WebSocketCommonProtocol(loop, 'localhost', 80, binary_as_memoryview = binary_as_memoryview)
+    protocol._transport = TestTransport()
+    protocol.state = WEB_SOCKET_STATE_OPEN
+    protocol.transfer_data_task = Future(loop)
+    protocol.close_connection_task = Future(loop)
+    
+    for chunk in chunks:
+        protocol.data_received(chunk)
+    
+    output = await protocol.read_message()
+    
+    if isinstance(output, str):
+        return output
+    
+    vampytest.assert_instance(output, memoryview if binary_as_memoryview else bytes)
+    return bytes(output)
@@ -0,0 +1,425 @@
+import vampytest
+
+from ...web_common import PayloadError, WebSocketFrame
+from ...web_common.web_socket_frame import (
+    WEB_SOCKET_OPERATION_BINARY, WEB_SOCKET_OPERATION_CONTINUOUS, WEB_SOCKET_OPERATION_PING, WEB_SOCKET_OPERATION_TEXT
+)
+
+from ..web_socket_extension_per_message_deflate import (
+    WebSocketExtensionPerMessageDeflate, parse_per_message_deflate_parameters
+)
+
+
+def _assert_fields_set(extension):
+    """
+    Asserts whether every fields are set of the given extension.
+    
+    Parameters
+    ----------
+    extension : ``WebSocketExtensionPerMessageDeflate``
+        The extension to check.
+    """
+    vampytest.assert_instance(extension, WebSocketExtensionPerMessageDeflate)
+    vampytest.assert_instance(extension.client_max_window_bits, int, nullable = True)
+    vampytest.assert_instance(extension.client_no_context_takeover, bool)
+    vampytest.assert_instance(extension.compression_level, int)
+    vampytest.assert_instance(extension.compression_threshold, int)
+    vampytest.assert_instance(extension.decoding_compressed, bool)
+    vampytest.assert_instance(extension.encoding_compressed, bool)
+    vampytest.assert_instance(extension.executor_threshold, int)
+    vampytest.assert_instance(extension.local_max_window_bits, int)
+    vampytest.assert_instance(extension.local_no_context_takeover, bool)
+    vampytest.assert_instance(extension.remote_max_window_bits, int)
+    vampytest.assert_instance(extension.remote_no_context_takeover, bool)
+    vampytest.assert_instance(extension.response_parameters, list, nullable = True)
+    vampytest.assert_instance(extension.server_max_window_bits, int, nullable = True)
+    vampytest.assert_instance(extension.server_no_context_takeover, bool)
+
+
+def _create_extension_pair(client_keyword_parameters, server_keyword_parameters):
+    """
+    Negotiates a client and a server side extension.
+    
+    Parameters
+    ----------
+    client_keyword_parameters : `dict<str, object>`
+        Keyword parameters to create the client side extension with.
+    
+    server_keyword_parameters : `dict<str, object>`
+        Keyword parameters to create the server side extension with.
+    
+    Returns
+    -------
+    client_extension : ``WebSocketExtensionPerMessageDeflate``
+    server_extension : ``WebSocketExtensionPerMessageDeflate``
+    """
+    client_offer = WebSocketExtensionPerMessageDeflate(**client_keyword_parameters)
+    server_extension = WebSocketExtensionPerMessageDeflate(**server_keyword_parameters).negotiate(
+        client_offer.request_params, False
+    )
+    vampytest.assert_is_not(server_extension, None)
+    
+    client_extension = client_offer.negotiate(server_extension.request_params, True)
+    vampytest.assert_is_not(client_extension, None)
+    return client_extension, server_extension
+
+
+def test__WebSocketExtensionPerMessageDeflate__new():
+    """
+    Tests whether ``WebSocketExtensionPerMessageDeflate.__new__`` works as intended.
+    """
+    client_max_window_bits = 12
+    client_no_context_takeover = True
+    compression_level = 9
+    compression_threshold = 20
+    executor_threshold = 2000
+    server_max_window_bits = 10
+    server_no_context_takeover = True
+    
+    extension = WebSocketExtensionPerMessageDeflate(
+        client_max_window_bits = client_max_window_bits,
+        client_no_context_takeover = client_no_context_takeover,
+        compression_level = compression_level,
+        compression_threshold = compression_threshold,
+        executor_threshold = executor_threshold,
+        server_max_window_bits = server_max_window_bits,
+        server_no_context_takeover = server_no_context_takeover,
+    )
+    _assert_fields_set(extension)
+    
+    vampytest.assert_eq(extension.client_max_window_bits, client_max_window_bits)
+    vampytest.assert_eq(extension.client_no_context_takeover, client_no_context_takeover)
+    vampytest.assert_eq(extension.compression_level, compression_level)
+    vampytest.assert_eq(extension.compression_threshold, compression_threshold)
+    vampytest.assert_eq(extension.executor_threshold, executor_threshold)
+    vampytest.assert_eq(extension.server_max_window_bits, server_max_window_bits)
+    vampytest.assert_eq(extension.server_no_context_takeover, server_no_context_takeover)
+    vampytest.assert_is(extension.compressor, None)
+    vampytest.assert_is(extension.decompressor, None)
+
+
+def _iter_options__new__type_error():
+    yield {'client_max_window_bits': 'hey'}
+    yield {'compression_level': 'hey'}
+    yield {'compression_threshold': 'hey'}
+    yield {'executor_threshold': 'hey'}
+
+
+def _iter_options__new__value_error():
+    yield {'client_max_window_bits': 8}
+    yield {'server_max_window_bits': 16}
+    yield {'compression_level': 10}
+
+
+@vampytest._(vampytest.call_from(_iter_options__new__type_error()).raising(TypeError))
+@vampytest._(vampytest.call_from(_iter_options__new__value_error()).raising(ValueError))
+def test__WebSocketExtensionPerMessageDeflate__new__error(keyword_parameters):
+    """
+    Tests whether ``WebSocketExtensionPerMessageDeflate.__new__`` raises on invalid parameters.
+    
+    Parameters
+    ----------
+    keyword_parameters : `dict<str, object>`
+        Keyword parameters to create the extension with.
+    
+    Raises
+    ------
+    TypeError
+    ValueError
+    """
+    WebSocketExtensionPerMessageDeflate(**keyword_parameters)
+
+
+def test__WebSocketExtensionPerMessageDeflate__repr():
+    """
+    Tests whether ``WebSocketExtensionPerMessageDeflate.__repr__`` works as intended.
+    """
+    extension = WebSocketExtensionPerMessageDeflate()
+    
+    output = repr(extension)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(extension).__name__, output)
+
+
+def _iter_options__request_params():
+    yield {}, [('client_max_window_bits', None)]
+    yield (
+        {
+            'client_max_window_bits': 12,
+            'client_no_context_takeover': True,
+            'server_max_window_bits': 10,
+            'server_no_context_takeover': True,
+        },
+        [
+            ('server_no_context_takeover', None),
+            ('client_no_context_takeover', None),
+            ('server_max_window_bits', '10'),
+            ('client_max_window_bits', '12'),
+        ],
+    )
+
+
+@vampytest._(vampytest.call_from(_iter_options__request_params()).returning_last())
+def test__WebSocketExtensionPerMessageDeflate__request_params(keyword_parameters):
+    """
+    Tests whether ``WebSocketExtensionPerMessageDeflate.request_params`` works as intended.
+    
+    Parameters
+    ----------
+    keyword_parameters : `dict<str, object>`
+        Keyword parameters to create the extension with.
+    
+    Returns
+    -------
+    output : `list<(str, None | str)>`
+    """
+    extension = WebSocketExtensionPerMessageDeflate(**keyword_parameters)
+    output = extension.request_params
+    vampytest.assert_instance(output, list)
+    return output
+
+
+def _iter_options__parse_per_message_deflate_parameters():
+    yield [], {}
+    yield [('client_max_window_bits', None)], {'client_max_window_bits': None}
+    yield (
+        [('server_max_window_bits', '10'), ('server_no_context_takeover', None)],
+        {'server_max_window_bits': 10, 'server_no_context_takeover': None},
+    )
+    yield [('server_max_window_bits', None)], None
+    yield [('server_max_window_bits', '16')], None
+    yield [('server_max_window_bits', 'a')], None
+    yield [('server_no_context_takeover', '1')], None
+    yield [('server_no_context_takeover', None), ('server_no_context_takeover', None)], None
+    yield [('hey', None)], None
+
+
+@vampytest._(vampytest.call_from(_iter_options__parse_per_message_deflate_parameters()).returning_last())
+def test__parse_per_message_deflate_parameters(parameters):
+    """
+    Tests whether ``parse_per_message_deflate_parameters`` works as intended.
+    
+    Parameters
+    ----------
+    parameters : `list<(str, None | str)>`
+        Parameters to parse.
+    
+    Returns
+    -------
+    output : `None | dict<str, None | int>`
+    """
+    return parse_per_message_deflate_parameters(parameters)
+
+
+def _iter_options__negotiate__server_side():
+    yield {}, [('client_max_window_bits', None)], (15, False, 15, False, [])
+    yield {}, [], (15, False, 15, False, [])
+    yield (
+        {},
+        [('server_max_window_bits', '10'), ('client_max_window_bits', '12'), ('server_no_context_takeover', None)],
+        (10, True, 12, False, [('server_no_context_takeover', None), ('server_max_window_bits', '10')]),
+    )
+    yield (
+        {'server_max_window_bits': 11, 'client_max_window_bits': 10, 'client_no_context_takeover': True},
+        [('client_max_window_bits', None)],
+        (11, False, 10, True, [('client_no_context_takeover', None), ('client_max_window_bits', '10')]),
+    )
+    yield {'client_max_window_bits': 10}, [], None
+    yield {}, [('hey', None)], None
+
+
+@vampytest._(vampytest.call_from(_iter_options__negotiate__server_side()).returning_last())
+def test__WebSocketExtensionPerMessageDeflate__negotiate__server_side(keyword_parameters, parameters):
+    """
+    Tests whether ``WebSocketExtensionPerMessageDeflate.negotiate`` works as intended on server side.
+    
+    Parameters
+    ----------
+    keyword_parameters : `dict<str, object>`
+        Keyword parameters to create the extension with.
+    
+    parameters : `list<(str, None | str)>`
+        The client's offer.
+    
+    Returns
+    -------
+    output : `None | (int, bool, int, bool, list<(str, None | str)>)`
+    """
+    extension = WebSocketExtensionPerMessageDeflate(**keyword_parameters)
+    negotiated = extension.negotiate(parameters, False)
+    if negotiated is None:
+        return None
+    
+    _assert_fields_set(negotiated)
+    vampytest.assert_is_not(negotiated, extension)
+    vampytest.assert_eq(negotiated.request_params, negotiated.response_parameters)
+    return (
+        negotiated.local_max_window_bits,
+        negotiated.local_no_context_takeover,
+        negotiated.remote_max_window_bits,
+        negotiated.remote_no_context_takeover,
+        negotiated.response_parameters,
+    )
+
+
+def _iter_options__negotiate__client_side():
+    yield {}, [], (15, False, 15, False)
+    yield {}, [('client_max_window_bits', '10')], (10, False, 15, False)
+    yield {}, [('client_max_window_bits', None)], None
+    yield {}, [('server_max_window_bits', '10')], (15, False, 10, False)
+    yield {}, [('server_max_window_bits', '8')], (15, False, 8, False)
+    yield {}, [('server_max_window_bits', '16')], None
+    yield {'server_max_window_bits': 10}, [], None
+    yield {'server_max_window_bits': 10}, [('server_max_window_bits', '11')], None
+    yield {'server_max_window_bits': 10}, [('server_max_window_bits', '9')], (15, False, 9, False)
+    yield {'server_no_context_takeover': True}, [], None
+    yield (
+        {'client_max_window_bits': 12},
+        [('server_no_context_takeover', None), ('client_no_context_takeover', None)],
+        (12, True, 15, True),
+    )
+    yield {'client_max_window_bits': 12}, [('client_max_window_bits', '13')], None
+
+
+@vampytest._(vampytest.call_from(_iter_options__negotiate__client_side()).returning_last())
+def test__WebSocketExtensionPerMessageDeflate__negotiate__client_side(keyword_parameters, parameters):
+    """
+    Tests whether ``WebSocketExtensionPerMessageDeflate.negotiate`` works as intended on client side.
+    
+    Parameters
+    ----------
+    keyword_parameters : `dict<str, object>`
+        Keyword parameters to create the extension with.
+    
+    parameters : `list<(str, None | str)>`
+        The server's response.
+    
+    Returns
+    -------
+    output : `None | (int, bool, int, bool)`
+    """
+    extension = WebSocketExtensionPerMessageDeflate(**keyword_parameters)
+    negotiated = extension.negotiate(parameters, True)
+    if negotiated is None:
+        return None
+    
+    _assert_fields_set(negotiated)
+    return (
+        negotiated.local_max_window_bits,
+        negotiated.local_no_context_takeover,
+        negotiated.remote_max_window_bits,
+        negotiated.remote_no_context_takeover,
+    )
+
+
+def test__WebSocketExtensionPerMessageDeflate__negotiate__window_bits_8():
+    """
+    Tests whether ``WebSocketExtensionPerMessageDeflate.negotiate`` disables compression if the negotiated window size
+    is not supported by zlib.
+    """
+    extension = WebSocketExtensionPerMessageDeflate()
+    negotiated = extension.negotiate([('client_max_window_bits', '8')], True)
+    vampytest.assert_is_not(negotiated, None)
+    vampytest.assert_is(negotiated.compressor, None)
+    
+    frame = WebSocketFrame(True, WEB_SOCKET_OPERATION_TEXT, b'a' * 1000)
+    vampytest.assert_is(negotiated.encode(frame), frame)
+
+
+def _iter_options__encode_decode():
+    yield {}, {}, [b'a' * 1000, b'koishi' * 100, b'a' * 1000]
+    yield {'client_no_context_takeover': True}, {'server_no_context_takeover': True}, [b'a' * 1000, b'a' * 1000]
+    yield {'client_max_window_bits': 9}, {'server_max_window_bits': 9}, [bytes(range(100)) * 50]
+
+
+@vampytest.call_from(_iter_options__encode_decode())
+def test__WebSocketExtensionPerMessageDeflate__encode_decode(
+    client_keyword_parameters, server_keyword_parameters, messages
+):
+    """
+    Tests whether ``WebSocketExtensionPerMessageDeflate.encode`` and ``.decode`` works as intended.
+    
+    Parameters
+    ----------
+    client_keyword_parameters : `dict<str, object>`
+        Keyword parameters to create the client side extension with.
+    
+    server_keyword_parameters : `dict<str, object>`
+        Keyword parameters to create the server side extension with.
+    
+    messages : `list<bytes>`
+        Messages to send.
+    """
+    client_extension, server_extension = _create_extension_pair(client_keyword_parameters, server_keyword_parameters)
+    
+    for sender, receiver in ((client_extension, server_extension), (server_extension, client_extension)):
+        for message in messages:
+            frame = sender.encode(WebSocketFrame(True, WEB_SOCKET_OPERATION_BINARY, message))
+            vampytest.assert_true(frame.head_0 & 0b01000000)
+            vampytest.assert_true(len(frame.data) < len(message))
+            
+            frame = receiver.decode(frame, max_size = len(message))
+            frame.check()
+            vampytest.assert_eq(frame.operation_code, WEB_SOCKET_OPERATION_BINARY)
+            vampytest.assert_eq(frame.data, message)
+
+
+def test__WebSocketExtensionPerMessageDeflate__encode_decode__fragmented():
+    """
+    Tests whether ``WebSocketExtensionPerMessageDeflate.encode`` and ``.decode`` works as intended on fragmented
+    messages.
+    """
+    client_extension, server_extension = _create_extension_pair({}, {})
+    
+    frames = [
+        client_extension.encode(WebSocketFrame(False, WEB_SOCKET_OPERATION_TEXT, b'a' * 500)),
+        client_extension.encode(WebSocketFrame(False, WEB_SOCKET_OPERATION_CONTINUOUS, b'b' * 500)),
+        client_extension.encode(WebSocketFrame(True, WEB_SOCKET_OPERATION_CONTINUOUS, b'c' * 50)),
+    ]
+    vampytest.assert_true(frames[0].head_0 & 0b01000000)
+    vampytest.assert_false(frames[1].head_0 & 0b01000000)
+    vampytest.assert_false(frames[2].head_0 & 0b01000000)
+    
+    data = b''.join(server_extension.decode(frame).data for frame in frames)
+    vampytest.assert_eq(data, b'a' * 500 + b'b' * 500 + b'c' * 50)
+
+
+def test__WebSocketExtensionPerMessageDeflate__encode__skipped():
+    """
+    Tests whether ``WebSocketExtensionPerMessageDeflate.encode`` leaves small messages and control frames uncompressed.
+    """
+    client_extension, server_extension = _create_extension_pair({'compression_threshold': 100}, {})
+    
+    for frame in (
+        WebSocketFrame(True, WEB_SOCKET_OPERATION_TEXT, b'a' * 99),
+        WebSocketFrame(True, WEB_SOCKET_OPERATION_PING, b'a' * 120),
+    ):
+        output = client_extension.encode(frame)
+        vampytest.assert_is(output, frame)
+        vampytest.assert_is(server_extension.decode(output), frame)
+
+
+def test__WebSocketExtensionPerMessageDeflate__decode__max_size():
+    """
+    Tests whether ``WebSocketExtensionPerMessageDeflate.decode`` raises if the decompressed data is over `max_size`.
+    """
+    client_extension, server_extension = _create_extension_pair({}, {})
+    
+    frame = client_extension.encode(WebSocketFrame(True, WEB_SOCKET_OPERATION_BINARY, b'a' * 1000))
+    with vampytest.assert_raises(PayloadError):
+        server_extension.decode(frame, max_size = 999)
+
+
+async def test__WebSocketExtensionPerMessageDeflate__encode_async_decode_async():
+    """
+    Tests whether ``WebSocketExtensionPerMessageDeflate.encode_async`` and ``.decode_async`` works as intended when
+    offloading into executor.
+    
+    This function is a coroutine.
+    """
+    client_extension, server_extension = _create_extension_pair({'executor_threshold': 100}, {'executor_threshold': 1})
+    
+    message = b'koishi' * 1000
+    frame = await client_extension.encode_async(WebSocketFrame(True, WEB_SOCKET_OPERATION_BINARY, message))
+    frame = await server_extension.decode_async(frame, max_size = None)
+    vampytest.assert_eq(frame.data, message)
@@ -0,0 +1,244 @@
+import vampytest
+
+from ...core import Cycler, get_event_loop, skip_ready_cycle
+
+from ..web_socket_common_protocol import WEB_SOCKET_STATE_CONNECTING, WEB_SOCKET_STATE_OPEN, WebSocketCommonProtocol
+from ..web_socket_keepalive_manager import WebSocketKeepaliveManager
+
+
+class TestProtocol:
+    """
+    Web socket protocol used for testing.
+    
+    Attributes
+    ----------
+    aborted_with : `None | (int, str)`
+        The code and reason the connection was aborted with.
+    
+    last_activity : `float`
+        The loop time when the last frame was received.
+    
+    ping_count : `int`
+        How much pings were sent.
+    
+    state : `int`
+        The web socket's state.
+    
+    _queue_paused_at : `None | float`
+        When reading was paused because of the full message queue.
+    """
+    __slots__ = ('_queue_paused_at', 'aborted_with', 'last_activity', 'ping_count', 'state')
+    
+    def __new__(cls, state, last_activity):
+        """
+        Creates a new test protocol.
+        
+        Parameters
+        ----------
+        state : `int`
+            The web socket's state.
+        
+        last_activity : `float`
+            The loop time when the last frame was received.
+        """
+        self = object.__new__(cls)
+        self.aborted_with = None
+        self.last_activity = last_activity
+        self.ping_count = 0
+        self.state = state
+        self._queue_paused_at = None
+        return self
+    
+    
+    def ping_no_wait(self):
+        self.ping_count += 1
+        return True
+    
+    
+    def abort_connection(self, code = 1006, reason = ''):
+        self.aborted_with = (code, reason)
+
+
+def _assert_fields_set(keepalive_manager):
+    """
+    Asserts whether every fields are set of the given keepalive manager.
+    
+    Parameters
+    ----------
+    keepalive_manager : ``WebSocketKeepaliveManager``
+        The keepalive manager to check.
+    """
+    vampytest.assert_instance(keepalive_manager, WebSocketKeepaliveManager)
+    vampytest.assert_instance(keepalive_manager._bucket_index, int)
+    vampytest.assert_instance(keepalive_manager.buckets, list)
+    vampytest.assert_instance(keepalive_manager.cycler, Cycler, nullable = True)
+    vampytest.assert_instance(keepalive_manager.interval, float)
+    vampytest.assert_instance(keepalive_manager.timeout, float)
+
+
+async def test__WebSocketKeepaliveManager__new():
+    """
+    Tests whether ``WebSocketKeepaliveManager.__new__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    
+    keepalive_manager = WebSocketKeepaliveManager(loop, 20, 10.0, bucket_count = 4)
+    try:
+        _assert_fields_set(keepalive_manager)
+        
+        vampytest.assert_is(keepalive_manager.loop, loop)
+        vampytest.assert_eq(keepalive_manager.interval, 20.0)
+        vampytest.assert_eq(keepalive_manager.timeout, 10.0)
+        vampytest.assert_eq(len(keepalive_manager.buckets), 4)
+        vampytest.assert_eq(keepalive_manager.cycler.cycle_time, 5.0)
+    finally:
+        keepalive_manager.close()
+    
+    vampytest.assert_is(keepalive_manager.cycler, None)
+    
+    keepalive_manager = WebSocketKeepaliveManager(loop, 20.0)
+    try:
+        vampytest.assert_eq(keepalive_manager.timeout, 20.0)
+    finally:
+        keepalive_manager.close()
+
+
+def _iter_options__new__type_error():
+    yield ('20',), {}
+    yield (20.0, '10'), {}
+    yield (20.0,), {'bucket_count': 4.0}
+
+
+def _iter_options__new__value_error():
+    yield (0.0,), {}
+    yield (20.0, -1.0), {}
+    yield (20.0,), {'bucket_count': 0}
+
+
+@vampytest._(vampytest.call_from(_iter_options__new__type_error()).raising(TypeError))
+@vampytest._(vampytest.call_from(_iter_options__new__value_error()).raising(ValueError))
+async def test__WebSocketKeepaliveManager__new__error(positional_parameters, keyword_parameters):
+    """
+    Tests whether ``WebSocketKeepaliveManager.__new__`` raises on invalid parameters.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    positional_parameters : `tuple<object>`
+        Positional parameters to create the keepalive manager with.
+    
+    keyword_parameters : `dict<str, object>`
+        Keyword parameters to create the keepalive manager with.
+    
+    Raises
+    ------
+    TypeError
+    ValueError
+    """
+    WebSocketKeepaliveManager(get_event_loop(), *positional_parameters, **keyword_parameters)
+
+
+async def test__WebSocketKeepaliveManager__repr():
+    """
+    Tests whether ``WebSocketKeepaliveManager.__repr__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    keepalive_manager = WebSocketKeepaliveManager(get_event_loop(), 20.0)
+    try:
+        output = repr(keepalive_manager)
+        vampytest.assert_instance(output, str)
+        vampytest.assert_in(type(keepalive_manager).__name__, output)
+    finally:
+        keepalive_manager.close()
+
+
+async def test__WebSocketKeepaliveManager__add_and_remove():
+    """
+    Tests whether ``WebSocketKeepaliveManager.add`` and ``.remove`` works as intended.
+    
+    This function is a coroutine.
+    """
+    keepalive_manager = WebSocketKeepaliveManager(get_event_loop(), 20.0, bucket_count = 4)
+    try:
+        protocols = [TestProtocol(WEB_SOCKET_STATE_OPEN, 0.0) for index in range(10)]
+        for protocol in protocols:
+            keepalive_manager.add(protocol)
+        
+        vampytest.assert_eq(len(keepalive_manager), 10)
+        
+        keepalive_manager.remove(protocols[0])
+        keepalive_manager.remove(protocols[0])
+        vampytest.assert_eq(len(keepalive_manager), 9)
+    finally:
+        keepalive_manager.close()
+
+
+async def test__WebSocketKeepaliveManager__check_bucket():
+    """
+    Tests whether ``WebSocketKeepaliveManager.check_bucket`` works as intended.
+    
+    This function is a coroutine.
+    """
+    keepalive_manager = WebSocketKeepaliveManager(get_event_loop(), 20.0, 10.0, bucket_count = 1)
+    try:
+        protocol_active = TestProtocol(WEB_SOCKET_STATE_OPEN, 95.0)
+        protocol_idle = TestProtocol(WEB_SOCKET_STATE_OPEN, 75.0)
+        protocol_dead = TestProtocol(WEB_SOCKET_STATE_OPEN, 65.0)
+        protocol_connecting = TestProtocol(WEB_SOCKET_STATE_CONNECTING, 0.0)
+        
+        for protocol in (protocol_active, protocol_idle, protocol_dead, protocol_connecting):
+            keepalive_manager.add(protocol)
+        
+        keepalive_manager.check_bucket(keepalive_manager.buckets[0], 100.0)
+        
+        vampytest.assert_eq(protocol_active.ping_count, 0)
+        vampytest.assert_is(protocol_active.aborted_with, None)
+        
+        vampytest.assert_eq(protocol_idle.ping_count, 1)
+        vampytest.assert_is(protocol_idle.aborted_with, None)
+        
+        vampytest.assert_eq(protocol_dead.ping_count, 0)
+        vampytest.assert_eq(protocol_dead.aborted_with, (1011, 'Keepalive ping timeout.'))
+        
+        vampytest.assert_eq(protocol_connecting.ping_count, 0)
+        vampytest.assert_is(protocol_connecting.aborted_with, None)
+        
+        # Dead ones are removed.
+        vampytest.assert_eq(len(keepalive_manager), 3)
+    finally:
+        keepalive_manager.close()
+
+
+async def test__WebSocketKeepaliveManager__check_bucket__queue_paused():
+    """
+    Tests whether ``WebSocketKeepaliveManager.check_bucket`` works as intended.
+    
+    Case: reading is paused because of the full message queue.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    
+    protocol = WebSocketCommonProtocol(loop, 'localhost', 80, max_queue = 1, queue_backpressure = True)
+    protocol.state = WEB_SOCKET_STATE_OPEN
+    protocol.last_activity = 0.0
+    protocol.messages.set_result('a')
+    
+    task = loop.create_task(protocol._wait_for_queue_drain())
+    await skip_ready_cycle()
+    
+    keepalive_manager = WebSocketKeepaliveManager(loop, 20.0, 10.0, bucket_count = 1)
+    try:
+        keepalive_manager.add(protocol)
+        keepalive_manager.check_bucket(keepalive_manager.buckets[0], 100.0)
+        
+        vampytest.assert_eq(protocol.state, WEB_SOCKET_STATE_OPEN)
+        vampytest.assert_eq(protocol.last_activity, 100.0)
+        vampytest.assert_eq(len(keepalive_manager), 1)
+    finally:
+        keepalive_manager.close()
+        task.cancel()
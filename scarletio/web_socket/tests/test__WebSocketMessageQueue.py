@@ -0,0 +1,108 @@
+import vampytest
+
+from ...core import AsyncQueue, get_event_loop, skip_ready_cycle
+
+from ..web_socket_message_queue import WebSocketMessageQueue
+
+
+def _assert_fields_set(queue):
+    """
+    Asserts whether every fields are set of the given queue.
+    
+    Parameters
+    ----------
+    queue : ``WebSocketMessageQueue``
+        The queue to check.
+    """
+    vampytest.assert_instance(queue, WebSocketMessageQueue)
+    vampytest.assert_instance(queue, AsyncQueue)
+    vampytest.assert_instance(queue.high_water, int)
+    vampytest.assert_instance(queue.low_water, int)
+
+
+async def test__WebSocketMessageQueue__new():
+    """
+    Tests whether ``WebSocketMessageQueue.__new__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    high_water = 4
+    low_water = 2
+    
+    queue = WebSocketMessageQueue(get_event_loop(), high_water, low_water)
+    _assert_fields_set(queue)
+    
+    vampytest.assert_eq(queue.high_water, high_water)
+    vampytest.assert_eq(queue.low_water, low_water)
+    vampytest.assert_eq(len(queue), 0)
+
+
+async def test__WebSocketMessageQueue__is_full():
+    """
+    Tests whether ``WebSocketMessageQueue.is_full`` works as intended.
+    
+    This function is a coroutine.
+    """
+    queue = WebSocketMessageQueue(get_event_loop(), 2, 1)
+    
+    queue.set_result('a')
+    vampytest.assert_false(queue.is_full())
+    
+    queue.set_result('b')
+    vampytest.assert_true(queue.is_full())
+    
+    # Not limited by its length.
+    queue.set_result('c')
+    vampytest.assert_eq(len(queue), 3)
+
+
+async def test__WebSocketMessageQueue__wait_for_drain():
+    """
+    Tests whether ``WebSocketMessageQueue.wait_for_drain`` works as intended.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    queue = WebSocketMessageQueue(loop, 3, 1)
+    
+    # Already drained
+    await queue.wait_for_drain()
+    
+    for element in ('a', 'b', 'c'):
+        queue.set_result(element)
+    
+    task = loop.create_task(queue.wait_for_drain())
+    await skip_ready_cycle()
+    vampytest.assert_false(task.is_done())
+    
+    vampytest.assert_eq(await queue, 'a')
+    await skip_ready_cycle()
+    vampytest.assert_false(task.is_done())
+    
+    vampytest.assert_eq(queue.get_result_no_wait(), 'b')
+    await skip_ready_cycle()
+    vampytest.assert_true(task.is_done())
+
+
+async def test__WebSocketMessageQueue__wait_for_drain__exception():
+    """
+    Tests whether ``WebSocketMessageQueue.wait_for_drain`` works as intended.
+    
+    Case: exception set.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    queue = WebSocketMessageQueue(loop, 1, 0)
+    queue.set_result('a')
+    
+    task = loop.create_task(queue.wait_for_drain())
+    await skip_ready_cycle()
+    vampytest.assert_false(task.is_done())
+    
+    queue.set_exception(ConnectionError())
+    await skip_ready_cycle()
+    vampytest.assert_true(task.is_done())
+    
+    # Should not wait anymore.
+    await queue.wait_for_drain()
@@ -0,0 +1,200 @@
+import vampytest
+
+from ...core import get_event_loop, skip_ready_cycle
+
+from ..web_socket_common_protocol import WEB_SOCKET_STATE_CLOSED, WEB_SOCKET_STATE_OPEN
+from ..web_socket_server import WebSocketServer
+
+
+class TestTransport:
+    """
+    Transport used for testing, collecting the written data.
+    
+    Attributes
+    ----------
+    buffer_size : `int`
+        The transport's write buffer's size to report.
+    
+    written : `list<bytes-like>`
+        The written data.
+    """
+    __slots__ = ('buffer_size', 'written')
+    
+    def __new__(cls, buffer_size):
+        """
+        Creates a new test transport.
+        
+        Parameters
+        ----------
+        buffer_size : `int`
+            The transport's write buffer's size to report.
+        """
+        self = object.__new__(cls)
+        self.buffer_size = buffer_size
+        self.written = []
+        return self
+    
+    
+    def get_write_buffer_size(self):
+        return self.buffer_size
+    
+    
+    def write(self, data):
+        self.written.append(data)
+
+
+class TestProtocol:
+    """
+    Web socket protocol used for testing.
+    
+    Attributes
+    ----------
+    extensions : `None | list<object>`
+        The negotiated extensions.
+    
+    failed_with : `None | int`
+        The code the connection was failed with.
+    
+    sent : `list<bytes | str>`
+        Data sent with ``.send``.
+    
+    state : `int`
+        The web socket's state.
+    
+    transport : ``TestTransport``
+        The protocol's transport.
+    """
+    __slots__ = ('extensions', 'failed_with', 'sent', 'state', 'transport')
+    
+    def __new__(cls, state, buffer_size, extensions):
+        """
+        Creates a new test protocol.
+        
+        Parameters
+        ----------
+        state : `int`
+            The web socket's state.
+        
+        buffer_size : `int`
+            The transport's write buffer's size to report.
+        
+        extensions : `None | list<object>`
+            The negotiated extensions.
+        """
+        self = object.__new__(cls)
+        self.extensions = extensions
+        self.failed_with = None
+        self.sent = []
+        self.state = state
+        self.transport = TestTransport(buffer_size)
+        return self
+    
+    
+    def get_transport(self):
+        return self.transport
+    
+    
+    def get_write_buffer_size(self):
+        return self.transport.get_write_buffer_size()
+    
+    
+    def write_buffered(self, data):
+        self.transport.write(data)
+    
+    
+    def fail_connection(self, code = 1006, reason = ''):
+        self.failed_with = code
+    
+    
+    async def send(self, data):
+        self.sent.append(data)
+
+
+def _create_server(protocols):
+    """
+    Creates a web socket server without binding it to any address.
+    
+    Parameters
+    ----------
+    protocols : `list<TestProtocol>`
+        Protocols to register.
+    
+    Returns
+    -------
+    server : ``WebSocketServer``
+    """
+    server = object.__new__(WebSocketServer)
+    server.loop = get_event_loop()
+    server.web_sockets = set()
+    server.keepalive_manager = None
+    for protocol in protocols:
+        server.register(protocol)
+    return server
+
+
+async def test__WebSocketServer__broadcast():
+    """
+    Tests whether ``WebSocketServer.broadcast`` works as intended.
+    
+    This function is a coroutine.
+    """
+    protocol_0 = TestProtocol(WEB_SOCKET_STATE_OPEN, 0, None)
+    protocol_1 = TestProtocol(WEB_SOCKET_STATE_OPEN, 0, None)
+    protocol_2 = TestProtocol(WEB_SOCKET_STATE_CLOSED, 0, None)
+    protocol_3 = TestProtocol(WEB_SOCKET_STATE_OPEN, 2000, None)
+    protocol_4 = TestProtocol(WEB_SOCKET_STATE_OPEN, 0, [object()])
+    
+    server = _create_server([protocol_0, protocol_1, protocol_2, protocol_3, protocol_4])
+    
+    output = server.broadcast('hey mister', write_buffer_limit = 1000)
+    vampytest.assert_instance(output, int)
+    vampytest.assert_eq(output, 2)
+    
+    # The same frame should be written.
+    vampytest.assert_eq(protocol_0.transport.written, [b'\x81\x0ahey mister'])
+    vampytest.assert_is(protocol_0.transport.written[0], protocol_1.transport.written[0])
+    vampytest.assert_eq(protocol_2.transport.written, [])
+    vampytest.assert_eq(protocol_3.transport.written, [])
+    vampytest.assert_is(protocol_3.failed_with, None)
+    
+    # Extensions cannot share the frame, so they are sent with `.send`.
+    vampytest.assert_eq(protocol_4.transport.written, [])
+    await skip_ready_cycle()
+    vampytest.assert_eq(protocol_4.sent, ['hey mister'])
+
+
+async def test__WebSocketServer__broadcast__disconnect_slow():
+    """
+    Tests whether ``WebSocketServer.broadcast`` works as intended.
+    
+    Case: disconnect slow & protocols given.
+    
+    This function is a coroutine.
+    """
+    protocol_0 = TestProtocol(WEB_SOCKET_STATE_OPEN, 0, None)
+    protocol_1 = TestProtocol(WEB_SOCKET_STATE_OPEN, 2000, None)
+    protocol_2 = TestProtocol(WEB_SOCKET_STATE_OPEN, 0, None)
+    
+    server = _create_server([protocol_0, protocol_1, protocol_2])
+    
+    output = server.broadcast(b'hey', [protocol_0, protocol_1], disconnect_slow = True, write_buffer_limit = 1000)
+    vampytest.assert_eq(output, 1)
+    
+    vampytest.assert_eq(protocol_0.transport.written, [b'\x82\x03hey'])
+    vampytest.assert_eq(protocol_1.transport.written, [])
+    vampytest.assert_eq(protocol_1.failed_with, 1008)
+    vampytest.assert_eq(protocol_2.transport.written, [])
+
+
+async def test__WebSocketServer__broadcast__type_error():
+    """
+    Tests whether ``WebSocketServer.broadcast`` works as intended.
+    
+    Case: type error.
+    
+    This function is a coroutine.
+    """
+    server = _create_server([])
+    
+    with vampytest.assert_raises(TypeError):
+        server.broadcast(12)
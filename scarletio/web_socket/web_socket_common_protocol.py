@@ -4,15 +4,20 @@ import codecs, reprlib
 import http as module_http
 from collections import OrderedDict
 from os import urandom
+from random import getrandbits
 
-from ..core import AsyncQueue, CancelledError, Future, Lock, Task, shield, write_exception_async
+from ..core import AsyncQueue, CancelledError, Future, LOOP_TIME, Lock, Task, shield, write_exception_async
 from ..utils import include
 from ..web_common import ConnectionClosed, HttpReadWriteProtocol, PayloadError, WebSocketFrame, WebSocketProtocolError
+from ..web_common.http_protocol import create_web_socket_frame_header
 from ..web_common.web_socket_frame import (
     WEB_SOCKET_DATA_OPERATIONS, WEB_SOCKET_OPERATION_BINARY, WEB_SOCKET_OPERATION_CLOSE, WEB_SOCKET_OPERATION_CONTINUOUS,
-    WEB_SOCKET_OPERATION_PING, WEB_SOCKET_OPERATION_PONG, WEB_SOCKET_OPERATION_TEXT
+    WEB_SOCKET_OPERATION_PING, WEB_SOCKET_OPERATION_PONG, WEB_SOCKET_OPERATION_TEXT, apply_web_socket_mask_in_place
 )
 
+from .web_socket_extension_base import WebSocketExtensionBase
+from .web_socket_message_queue import WebSocketMessageQueue
+
 
 FORBIDDEN = module_http.HTTPStatus.FORBIDDEN
 UPGRADE_REQUIRED = module_http.HTTPStatus.UPGRADE_REQUIRED
@@ -30,6 +35,9 @@ WEB_SOCKET_KEY = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
 
 EXTERNAL_CLOSE_CODES = (1000, 1001, 1002, 1003, 1007, 1008, 1009, 1010, 1011, 1013)
 
+# The write buffer is flushed right away when it reaches this size instead of waiting for the end of the loop iteration.
+WRITE_BUFFER_FLUSH_SIZE = 65536
+
 HTTPClient = include('HTTPClient')
 
 DECODER = codecs.getincrementaldecoder('utf-8')(errors = 'strict')
@@ -66,7 +74,21 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
     _drain_waiter : ``None | Future``
         A future, what is used to block the writing task, till it's writen data is drained.
     _drain_lock : ``Lock``
-        Asynchronous lock to ensure, that only `1` frame is written in `1` time.
+        Asynchronous lock to ensure, that extensions encode only `1` frame in `1` time and that only `1` writer waits
+        for drain.
+    _queue_paused_at : `None | float`
+        When reading was paused because of the full ``.messages`` queue. Set only meanwhile it is paused.
+    _queue_paused_duration : `float`
+        The total duration in seconds while reading was paused because of the full ``.messages`` queue, excluding the
+        current pause.
+    _write_buffer : `list<bytes-like>`
+        Frame data written meanwhile the current loop iteration, flushed to the transport together.
+    _write_buffer_size : `int`
+        The total size of ``._write_buffer``.
+    _write_flush_handle : ``None | Handle``
+        Handle scheduled to flush ``._write_buffer``. Set only meanwhile it is not empty.
+    _writing_paused : `bool`
+        Whether the protocol's respective transport asked it to pause writing. Defaults to `False`.
     close_code : `int`
         The web socket's close code if applicable. Defaults to `0`.
     close_connection_task : `None`, ``Task`` of ``.close_connection``
@@ -76,6 +98,9 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
     close_reason : `None`, `str`
         The reason, why the web socket was closed. Set only after the web socket is closed. Close reason might not be
         received tho.
+    binary_as_memoryview : `bool`
+        Whether binary messages are delivered as `memoryview`-s over a single buffer, into what the payload of each
+        frame of the message is read directly. Defaults to `False`.
     connection_lost_waiter : ``Future``
         A future, what's result is set as `None`, when the connection is closed. Used to wait for close frames.
         
@@ -87,16 +112,23 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
     max_queue : `None | int`
         Max queue size of ``.messages``. If a new payload is added to a full queue, the oldest element of it is removed.
          Defaults to `None`.
+        
+        If ``.queue_backpressure`` is enabled, instead of dropping messages, reading from the connection is paused.
     max_size : `int`
         Max payload size to receive. If a payload exceeds it, ``PayloadError`` is raised. Defaults to `67108864` bytes.
     messages : ``AsyncQueue``
         An asynchronous queue of the received messages.
     is_ssl : `bool`
         Whether the connection is secure. Defaults to `False`.
+    last_activity : `float`
+        The loop time when the last frame was received (or when the web socket was created).
     pings : `OrderedDict` of (`bytes`, ``Future``) items
         An ordered dictionary of ping payloads and of their waiter futures.
     port : `int`
         The respective server's port to connect to.
+    queue_backpressure : `bool`
+        Whether reading from the connection is paused when ``.messages`` is full, so tcp flow control pushes back on
+        the other side. Defaults to `False`.
     state : `str`
         The web socket's state.
         
@@ -129,14 +161,28 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
         Whether the web socket protocol is client or server side.
     """
     __slots__ = (
-        '_drain_lock', 'close_code', 'close_connection_task', 'close_timeout', 'close_reason',
-        'connection_lost_waiter', 'extensions', 'host', 'is_ssl', 'max_queue', 'max_size', 'messages', 'pings', 'port',
-        'state', 'subprotocol', 'transfer_data_exception', 'transfer_data_task'
+        '_drain_lock', '_queue_paused_at', '_queue_paused_duration', '_write_buffer', '_write_buffer_size',
+        '_write_flush_handle', 'binary_as_memoryview', 'close_code', 'close_connection_task', 'close_timeout', 'close_reason',
+        'connection_lost_waiter', 'extensions', 'host', 'is_ssl', 'last_activity', 'max_queue', 'max_size', 'messages',
+        'pings', 'port', 'queue_backpressure', 'state', 'subprotocol', 'transfer_data_exception', 'transfer_data_task'
     )
     
     is_client = True # placeholder for subclasses
     
-    def __new__(cls, loop, host, port, *, is_ssl = False, close_timeout = 10.0, max_size = 1 << 26, max_queue = None):
+    def __new__(
+        cls,
+        loop,
+        host,
+        port,
+        *,
+        is_ssl = False,
+        close_timeout = 10.0,
+        max_size = 1 << 26,
+        max_queue = None,
+        queue_backpressure = False,
+        queue_low_water = None,
+        binary_as_memoryview = False,
+    ):
         """
         Initializes the ``WebSocketCommonProtocol`` with setting it's common attributes.
         
@@ -157,14 +203,42 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
         max_queue : `None | int` = `None`, Optional (Keyword only)
             Max queue size of ``.messages``. If a new payload is added to a full queue, the oldest element of it is
             removed.
+        queue_backpressure : `bool` = `False`, Optional (Keyword only)
+            Whether reading from the connection should be paused when ``.messages`` is full, instead of dropping
+            messages.
+        queue_low_water : `None | int` = `None`, Optional (Keyword only)
+            With `queue_backpressure`, reading is resumed when the length of ``.messages`` drops to it.
+            Defaults to the half of `max_queue`.
+        binary_as_memoryview : `bool` = `False`, Optional (Keyword only)
+            Whether binary messages should be delivered as `memoryview`-s over a single buffer, into what the payload
+            of each frame of the message is read directly.
         """
         self = HttpReadWriteProtocol.__new__(cls, loop)
-        self._set_common_web_socket_attributes(host, port, is_ssl, close_timeout, max_size, max_queue)
+        self._set_common_web_socket_attributes(
+            host,
+            port,
+            is_ssl,
+            close_timeout,
+            max_size,
+            max_queue,
+            queue_backpressure,
+            queue_low_water,
+            binary_as_memoryview,
+        )
         return self
     
     
     def _set_common_web_socket_attributes(
-        self, host, port, is_ssl, close_timeout = 10.0, max_size = 1 << 26, max_queue = None
+        self,
+        host,
+        port,
+        is_ssl,
+        close_timeout = 10.0,
+        max_size = 1 << 26,
+        max_queue = None,
+        queue_backpressure = False,
+        queue_low_water = None,
+        binary_as_memoryview = False,
     ):
         """
         Sets the common web socket specific attributes for the protocol.
@@ -185,6 +259,15 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
         max_queue : `None | int` = `None`, Optional
             Max queue size of ``.messages``. If a new payload is added to a full queue, the oldest element of it is
             removed.
+        queue_backpressure : `bool` = `False`, Optional
+            Whether reading from the connection should be paused when ``.messages`` is full, instead of dropping
+            messages.
+        queue_low_water : `None | int` = `None`, Optional
+            With `queue_backpressure`, reading is resumed when the length of ``.messages`` drops to it.
+            Defaults to the half of `max_queue`.
+        binary_as_memoryview : `bool` = `False`, Optional
+            Whether binary messages should be delivered as `memoryview`-s over a single buffer, into what the payload
+            of each frame of the message is read directly.
         """
         self.host = host
         self.port = port
@@ -192,8 +275,12 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
         self.close_timeout = close_timeout
         self.max_size = max_size # set it to a BIG number if u wanna ignore max size
         self.max_queue = max_queue
+        self.binary_as_memoryview = binary_as_memoryview
         
         self._drain_lock = Lock(self._loop)
+        self._write_buffer = []
+        self._write_buffer_size = 0
+        self._write_flush_handle = None
         
         self.state = WEB_SOCKET_STATE_CONNECTING
         
@@ -204,7 +291,19 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
         self.close_reason = None
         
         self.connection_lost_waiter = Future(self._loop)
-        self.messages = AsyncQueue(loop = self._loop, max_length = max_queue)
+        self.last_activity = LOOP_TIME()
+        queue_backpressure = queue_backpressure and (max_queue is not None)
+        self.queue_backpressure = queue_backpressure
+        self._queue_paused_at = None
+        self._queue_paused_duration = 0.0
+        
+        if queue_backpressure:
+            if queue_low_water is None:
+                queue_low_water = max_queue >> 1
+            
+            self.messages = WebSocketMessageQueue(self._loop, max_queue, queue_low_water)
+        else:
+            self.messages = AsyncQueue(loop = self._loop, max_length = max_queue)
         
         self.pings = OrderedDict()
         
@@ -289,6 +388,37 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
         return self.state == WEB_SOCKET_STATE_CLOSED
     
     
+    @property
+    def queue_depth(self):
+        """
+        Returns how much received messages are waiting in ``.messages``.
+        
+        Returns
+        -------
+        queue_depth : `int`
+        """
+        return len(self.messages)
+    
+    
+    @property
+    def queue_paused_duration(self):
+        """
+        Returns the total duration in seconds while reading from the connection was paused because of the full
+        ``.messages``.
+        
+        Returns
+        -------
+        queue_paused_duration : `float`
+        """
+        duration = self._queue_paused_duration
+        
+        paused_at = self._queue_paused_at
+        if (paused_at is not None):
+            duration += LOOP_TIME() - paused_at
+        
+        return duration
+    
+    
     def receive(self):
         """
         Returns a future, what can be awaited to receive the next message of the web socket.
@@ -356,6 +486,47 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
         await self.write_frame(operation_code, data)
     
     
+    async def send_many(self, messages):
+        """
+        Sends the given messages with the web socket. The messages are written together and drained only once.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        messages : `iterable<bytes-like | str>`
+            The messages to send.
+        
+        Raises
+        ------
+        TypeError
+            A message was not given as `bytes-like`, neither as `str`.
+        ConnectionClosed
+            WebSocket connection closed.
+        Exception
+            WebSocket connection not yet established.
+        """
+        await self.ensure_open()
+        
+        frames = []
+        
+        for data in messages:
+            if isinstance(data, (bytes, bytearray, memoryview)):
+                operation_code = WEB_SOCKET_OPERATION_BINARY
+            elif isinstance(data, str):
+                operation_code = WEB_SOCKET_OPERATION_TEXT
+                data = data.encode('utf-8')
+            else:
+                raise TypeError(
+                    f'Messages must be `bytes-like`, `str`, got: {type(data).__name__}; {reprlib.repr(data)}.'
+                )
+            
+            frames.append(WebSocketFrame(True, operation_code, data))
+        
+        if frames:
+            await self._write_frames(frames)
+    
+    
     async def close(self, code = 1000, reason = ''):
         """
         Closes the web socket.
@@ -465,7 +636,7 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
         if data is None:
             data = urandom(4)
         elif isinstance(data, (bytes, bytearray, memoryview)):
-            pass
+            data = bytes(data)
         elif isinstance(data, str):
             data = data.encode('utf-8')
         else:
@@ -519,6 +690,62 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
         
         await self.write_frame(WEB_SOCKET_OPERATION_PONG, data)
     
+    
+    def ping_no_wait(self):
+        """
+        Sends an empty ping to the other side without waiting for its answer. Used to keep the connection alive, as the
+        answer updates ``.last_activity`` as well.
+        
+        Returns
+        -------
+        sent : `bool`
+            Whether the ping was sent. Returns `False` if the web socket is not open.
+        
+        Raises
+        ------
+        WebSocketProtocolError
+            - If an extension set a reserved bit not to `0`.
+            - If an extension modified the frame to a control frame, what is too long one.
+            - If an extension modified the frame to be a fragmented one. (Might be supported if people request is.)
+            - If an extension modified the frame's op code to not any of the expected ones.
+        """
+        if (self.state != WEB_SOCKET_STATE_OPEN) or (self._transport is None):
+            return False
+        
+        frame = WebSocketFrame(True, WEB_SOCKET_OPERATION_PING, b'')
+        
+        extensions = self.extensions
+        if (extensions is not None):
+            frame.check()
+            
+            for extension in extensions:
+                frame = extension.encode(frame)
+        
+        self._buffer_frame(frame)
+        return True
+    
+    
+    def abort_connection(self, code = 1006, reason = ''):
+        """
+        Closes the connection right away without closing handshake. Used when the other side is not responding.
+        
+        Parameters
+        ----------
+        code : `int` = `1006`, Optional
+            WebSocket close code to report.
+        reason : `str` = `''`, Optional
+            WebSocket close reason to report.
+        """
+        if not self.close_code:
+            self.close_code = code
+            self.close_reason = reason
+        
+        self.fail_connection()
+        
+        transport = self._transport
+        if (transport is not None):
+            transport.abort()
+    
     # Private methods - no guarantees.
     
     async def ensure_open(self):
@@ -572,7 +799,11 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
                 if message is None:
                     break
                 
-                self.messages.set_result(message)
+                messages = self.messages
+                messages.set_result(message)
+                
+                if self.queue_backpressure and messages.is_full():
+                    await self._wait_for_queue_drain()
         
         except GeneratorExit as exception:
             transfer_data_exception = ConnectionClosed(1013, exception)
@@ -637,6 +868,33 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
             raise to_reraise
     
     
+    async def _wait_for_queue_drain(self):
+        """
+        Pauses reading from the transport till ``.messages`` is drained.
+        
+        This method is a coroutine.
+        """
+        transport = self._transport
+        if (transport is not None) and (not self._paused):
+            try:
+                transport.pause_reading()
+            except (AttributeError, NotImplementedError):
+                # cant be paused
+                pass
+            else:
+                self._paused = True
+        
+        self._queue_paused_at = LOOP_TIME()
+        try:
+            await self.messages.wait_for_drain()
+        finally:
+            self._queue_paused_duration += LOOP_TIME() - self._queue_paused_at
+            self._queue_paused_at = None
+        
+        if (self._transport is not None):
+            self._resume_reading()
+    
+    
     async def read_message(self):
         """
         Reads a message from the web socket.
@@ -645,8 +903,9 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
         
         Returns
         -------
-        message : `None`, `bytes`, `str`
+        message : `None`, `bytes`, `memoryview`, `str`
             A received message. It's type depend on the frame's type. returns `None` if close frame was received.
+            Binary messages are `memoryview`-s if ``.binary_as_memoryview`` is enabled.
         
         Raises
         ------
@@ -662,7 +921,13 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
         CancelledError
             ``.transfer_data_task`` cancelled.
         """
-        frame = await self.read_data_frame(max_size = self.max_size)
+        # Extensions decode the frames one by one, so with them the payload cannot be read into a shared buffer.
+        if self.binary_as_memoryview and (not self.extensions):
+            buffer = bytearray()
+        else:
+            buffer = None
+        
+        frame = await self.read_data_frame(max_size = self.max_size, buffer = buffer)
         if frame is None: # close frame
             return
         
@@ -676,6 +941,23 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
                 f'{WEB_SOCKET_OPERATION_BINARY!r}.'
             )
         
+        if (buffer is not None):
+            while not frame.final:
+                frame = await self.read_data_frame(max_size = self.max_size - len(buffer), buffer = buffer)
+                if frame is None:
+                    raise WebSocketProtocolError('Incomplete fragmented message.')
+                
+                if frame.operation_code != WEB_SOCKET_OPERATION_CONTINUOUS:
+                    raise WebSocketProtocolError(
+                        f'Unexpected operation_code, got {frame.operation_code!r}, expected '
+                        f'{WEB_SOCKET_OPERATION_CONTINUOUS!r}.'
+                    )
+            
+            if text:
+                return buffer.decode('utf-8')
+            
+            return memoryview(buffer)
+        
         # we got a whole frame, nice
         if frame.final:
             message = frame.data
@@ -717,7 +999,7 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
         return message
     
     
-    async def read_data_frame(self, max_size):
+    async def read_data_frame(self, max_size, buffer = None):
         """
         Reads a web socket frame from the web socket.
         If the frame is a control frame processes and loops for reading an another one.
@@ -726,6 +1008,12 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
         
         Parameters
         ----------
+        max_size : `int`
+            The maximal allowed payload length.
+        
+        buffer : `None | bytearray` = `None`, Optional
+            Buffer to append the payload of the data frame to. If given, the returned frame's data is the buffer
+            itself. Should not be given if the web socket has extensions.
         
         Returns
         -------
@@ -746,12 +1034,16 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
         """
         while True:
             
-            frame = await self.read_web_socket_frame(self.is_client, max_size)
+            frame = await self.read_web_socket_frame(self.is_client, max_size, buffer)
+            self.last_activity = LOOP_TIME()
             
             extensions = self.extensions
             if (extensions is not None):
                 for extension in reversed(extensions):
-                    frame = extension.decode(frame, max_size = max_size)
+                    if isinstance(extension, WebSocketExtensionBase):
+                        frame = await extension.decode_async(frame, max_size = max_size)
+                    else:
+                        frame = extension.decode(frame, max_size = max_size)
             
             frame.check()
             
@@ -813,12 +1105,14 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
             return True
         
         # operation_code == OP_PONG:
-        if frame.data in self.pings:
+        # Received data might be `bytearray`, which is not hashable.
+        data = bytes(frame.data)
+        if data in self.pings:
             #checking all pings up to the one matching this pong.
             ping_id = b''
-            while ping_id != frame.data:
+            while ping_id != data:
                 ping_id, pong_waiter = self.pings.popitem(0)
-                pong_waiter.set_resultd_if_pending(None)
+                pong_waiter.set_result_if_pending(None)
         
         return True
     
@@ -892,25 +1186,173 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
         # Defensive assertion for protocol compliance.
         if self.state != _expected_state:
             raise RuntimeError(f'Cannot write to a WebSocket in the {self.state} state.')
-
-        # we write only 1 frame at a time, so we 'queue' it
-        async with self._drain_lock:
-            try:
-                frame = WebSocketFrame(True, operation_code, data)
+        
+        await self._write_frames([WebSocketFrame(True, operation_code, data)])
+    
+    
+    async def _write_frames(self, frames):
+        """
+        Writes the given frames to the web socket, then drains it.
+        
+        Without extensions the frames are only added to the write buffer, which is flushed at the end of the current
+        loop iteration, so frames written meanwhile the same iteration are sent together.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        frames : `list<WebSocketFrame>`
+            The frames to write.
+        
+        Raises
+        ------
+        WebSocketProtocolError
+            - If an extension set a reserved bit not to `0`.
+            - If an extension modified the frame to a control frame, what is too long one.
+            - If an extension modified the frame to be a fragmented one. (Might be supported if people request is.)
+            - If an extension modified the frame's op code to not any of the expected ones.
+        ConnectionClosed
+            WebSocket connection closed.
+        RuntimeError
+            Protocol has no attached transport.
+        """
+        try:
+            extensions = self.extensions
+            if not extensions:
+                for frame in frames:
+                    self._buffer_frame(frame)
                 
-                extensions = self.extensions
-                if (extensions is not None):
+                if self._writing_paused:
+                    # Only 1 writer can wait for the transport to drain at a time.
+                    async with self._drain_lock:
+                        await self.drain()
+                else:
+                    await self.drain()
+                return
+            
+            # Extensions might keep state (like compression context) and might suspend meanwhile encoding, so we
+            # encode 1 frame at a time.
+            async with self._drain_lock:
+                for frame in frames:
+                    # Extensions are allowed to set the reserved bits, so check the frame before encoding.
+                    frame.check()
+                    
                     for extension in extensions:
-                        frame = extension.encode(frame)
+                        if isinstance(extension, WebSocketExtensionBase):
+                            frame = await extension.encode_async(frame)
+                        else:
+                            frame = extension.encode(frame)
                     
-                    frame.check()
+                    self._buffer_frame(frame)
                 
-                self.write_web_socket_frame(frame, self.is_client)
                 await self.drain()
-            except ConnectionError:
-                self.fail_connection()
-                # raise ConnectionClosed with the correct code and reason.
-                await self.ensure_open()
+        
+        except ConnectionError:
+            self.fail_connection()
+            # raise ConnectionClosed with the correct code and reason.
+            await self.ensure_open()
+    
+    
+    def _buffer_frame(self, frame):
+        """
+        Adds the given frame to the write buffer.
+        
+        Parameters
+        ----------
+        frame : ``WebSocketFrame``
+            The frame to write.
+        
+        Raises
+        ------
+        RuntimeError
+            Protocol has no attached transport.
+        """
+        data = frame.data
+        header = create_web_socket_frame_header(frame.head_0, len(data), self.is_client)
+        
+        if self.is_client:
+            # Mask the data in place inside of the buffered chunk.
+            mask = getrandbits(32).to_bytes(4, 'big')
+            buffer = bytearray().join((header, mask, data))
+            apply_web_socket_mask_in_place(mask, buffer, len(header) + 4, len(buffer))
+            self.write_buffered(buffer)
+        
+        elif isinstance(data, bytes):
+            self.write_buffered(header)
+            self.write_buffered(data)
+        
+        else:
+            # Mutable data is only flushed later, so take a snapshot to not send the modifications done meanwhile.
+            self.write_buffered(b''.join((header, data)))
+    
+    
+    def write_buffered(self, data):
+        """
+        Adds the given already built frame data to the write buffer. The buffer is flushed to the transport at the end
+        of the current loop iteration or when it grows too big.
+        
+        The data is buffered by reference, so it should not be modified afterwards.
+        
+        Parameters
+        ----------
+        data : `bytes-like`
+            The data to write.
+        
+        Raises
+        ------
+        RuntimeError
+            Protocol has no attached transport.
+        """
+        if self._transport is None:
+            raise RuntimeError(f'Protocol has no attached transport; self = {self!r}.')
+        
+        self._write_buffer.append(data)
+        write_buffer_size = self._write_buffer_size + len(data)
+        self._write_buffer_size = write_buffer_size
+        
+        if write_buffer_size >= WRITE_BUFFER_FLUSH_SIZE:
+            self._flush_write_buffer()
+        
+        elif self._write_flush_handle is None:
+            self._write_flush_handle = self._loop.call_soon(self._flush_write_buffer)
+    
+    
+    def _flush_write_buffer(self):
+        """
+        Writes the buffered data to the transport with a single write.
+        """
+        write_flush_handle = self._write_flush_handle
+        if (write_flush_handle is not None):
+            self._write_flush_handle = None
+            write_flush_handle.cancel()
+        
+        write_buffer = self._write_buffer
+        if not write_buffer:
+            return
+        
+        self._write_buffer = []
+        self._write_buffer_size = 0
+        
+        transport = self._transport
+        if (transport is not None):
+            transport.writelines(write_buffer)
+    
+    
+    def get_write_buffer_size(self):
+        """
+        Returns the amount of written, but not yet sent bytes, including the ones of the transport.
+        
+        Returns
+        -------
+        write_buffer_size : `int`
+        """
+        write_buffer_size = self._write_buffer_size
+        
+        transport = self._transport
+        if (transport is not None):
+            write_buffer_size += transport.get_write_buffer_size()
+        
+        return write_buffer_size
     
     
     async def write_close_frame(self, data = b''):
@@ -975,6 +1417,7 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
                     return
             
             if self.can_write_eof():
+                self._flush_write_buffer()
                 self.write_eof()
                 if (await self.wait_for_connection_lost()):
                     return
@@ -991,6 +1434,7 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
             # Close the TCP connection
             transport = self._transport
             if (transport is not None):
+                self._flush_write_buffer()
                 transport.close()
                 
                 if not generator_destroyed:
@@ -1075,12 +1519,14 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
             
             extensions = self.extensions
             if (extensions is not None):
+                frame.check()
+                
                 for extension in extensions:
                     frame = extension.encode(frame)
-                
-                frame.check()
             
-            self.write_web_socket_frame(frame, self.is_client)
+            # Write the close frame after the buffered ones, but do not wait for the end of the loop iteration.
+            self._buffer_frame(frame)
+            self._flush_write_buffer()
         
         # start close_connection_task if the opening handshake didn't succeed.
         close_connection_task = self.close_connection_task
@@ -1111,6 +1557,14 @@ class WebSocketCommonProtocol(HttpReadWriteProtocol):
         # `self.connection_lost_waiter` should be pending
         self.connection_lost_waiter.set_result_if_pending(None)
         
+        write_flush_handle = self._write_flush_handle
+        if (write_flush_handle is not None):
+            self._write_flush_handle = None
+            write_flush_handle.cancel()
+        
+        self._write_buffer.clear()
+        self._write_buffer_size = 0
+        
         HttpReadWriteProtocol.connection_lost(self, exception)
     
     
@@ -0,0 +1,171 @@
+__all__ = ('WebSocketExtensionBase',)
+
+from ..utils import RichAttributeErrorBaseType
+
+
+class WebSocketExtensionBase(RichAttributeErrorBaseType):
+    """
+    Base type for web socket extensions.
+    
+    The instances passed as `available_extensions` describe the offered / supported extension and every connection
+    receives its own negotiated instance created by ``.negotiate``, so the extensions can keep their state per
+    connection.
+    
+    Class Attributes
+    ----------------
+    name : `str`
+        The extension's name.
+    """
+    __slots__ = ()
+    
+    name = ''
+    
+    def __repr__(self):
+        """Returns the web socket extension's representation."""
+        return f'<{type(self).__name__} name = {self.name!r}>'
+    
+    
+    @property
+    def request_params(self):
+        """
+        Returns the extension's header parameters. For the offered extensions these are sent with the request, for the
+        negotiated ones on server side these are sent with the response.
+        
+        Returns
+        -------
+        parameters : `list<(str, None | str)>`
+        """
+        return []
+    
+    
+    def are_valid_parameters(self, parameters, accepted_extensions):
+        """
+        Returns whether the extension can be accepted with the given parameters.
+        
+        Parameters
+        ----------
+        parameters : `list<(str, None | str)>`
+            The received parameters.
+        
+        accepted_extensions : `list<object>`
+            The already accepted extensions.
+        
+        Returns
+        -------
+        are_valid_parameters : `bool`
+        """
+        name = self.name
+        for extension in accepted_extensions:
+            if extension.name == name:
+                return False
+        
+        return True
+    
+    
+    def negotiate(self, parameters, is_client):
+        """
+        Creates a negotiated extension for a connection.
+        
+        Parameters
+        ----------
+        parameters : `list<(str, None | str)>`
+            On client side the parameters of the server's response, on server side the parameters of the client's
+            offer.
+        
+        is_client : `bool`
+            Whether the negotiation happens on client side.
+        
+        Returns
+        -------
+        extension : `None | instance<type<self>>`
+            Returns `None` if the parameters cannot be accepted.
+        """
+        return None
+    
+    
+    def decode(self, frame, *, max_size = None):
+        """
+        Processes a received web socket frame.
+        
+        Parameters
+        ----------
+        frame : ``WebSocketFrame``
+            The received frame.
+        
+        max_size : `None | int` = `None`, Optional (Keyword only)
+            The maximal size of the frame's data after processing.
+        
+        Returns
+        -------
+        frame : ``WebSocketFrame``
+        
+        Raises
+        ------
+        PayloadError
+            - The frame's data is over `max_size`.
+        WebSocketProtocolError
+            - Invalid frame.
+        """
+        return frame
+    
+    
+    def encode(self, frame):
+        """
+        Processes a web socket frame to send.
+        
+        Parameters
+        ----------
+        frame : ``WebSocketFrame``
+            The frame to send.
+        
+        Returns
+        -------
+        frame : ``WebSocketFrame``
+        """
+        return frame
+    
+    
+    async def decode_async(self, frame, *, max_size = None):
+        """
+        Processes a received web socket frame. Subclasses may offload expensive processing into an executor.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        frame : ``WebSocketFrame``
+            The received frame.
+        
+        max_size : `None | int` = `None`, Optional (Keyword only)
+            The maximal size of the frame's data after processing.
+        
+        Returns
+        -------
+        frame : ``WebSocketFrame``
+        
+        Raises
+        ------
+        PayloadError
+            - The frame's data is over `max_size`.
+        WebSocketProtocolError
+            - Invalid frame.
+        """
+        return self.decode(frame, max_size = max_size)
+    
+    
+    async def encode_async(self, frame):
+        """
+        Processes a web socket frame to send. Subclasses may offload expensive processing into an executor.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        frame : ``WebSocketFrame``
+            The frame to send.
+        
+        Returns
+        -------
+        frame : ``WebSocketFrame``
+        """
+        return self.encode(frame)
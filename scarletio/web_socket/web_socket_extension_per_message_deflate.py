@@ -0,0 +1,635 @@
+__all__ = ('WebSocketExtensionPerMessageDeflate',)
+
+from zlib import (
+    DEFLATED, Z_SYNC_FLUSH, compressobj as create_zlib_compressor, decompressobj as create_zlib_decompressor,
+    error as ZlibError
+)
+
+from ..core import get_event_loop
+from ..utils import alchemy_incendiary, copy_docs
+from ..web_common import PayloadError, WebSocketFrame, WebSocketProtocolError
+from ..web_common.web_socket_frame import WEB_SOCKET_CONTROL_OPERATIONS, WEB_SOCKET_OPERATION_CONTINUOUS
+
+from .web_socket_extension_base import WebSocketExtensionBase
+
+
+HEAD_FINAL = 0b10000000
+HEAD_RSV1 = 0b01000000
+HEAD_OPERATION_CODE = 0b00001111
+
+# Every deflate block flushed with `Z_SYNC_FLUSH` ends with it. It is removed from the end of every sent message and
+# added back before decompressing.
+DEFLATE_TAIL = b'\x00\x00\xff\xff'
+
+# zlib cannot compress with 8 bit window size, but can decompress the data compressed with it with bigger window.
+MAX_WINDOW_BITS_MIN = 8
+MAX_WINDOW_BITS_MAX = 15
+ZLIB_WINDOW_BITS_MIN = 9
+
+COMPRESSION_LEVEL_DEFAULT = 6
+COMPRESSION_THRESHOLD_DEFAULT = 128
+EXECUTOR_THRESHOLD_DEFAULT = 1 << 18
+
+PARAMETER_CLIENT_MAX_WINDOW_BITS = 'client_max_window_bits'
+PARAMETER_CLIENT_NO_CONTEXT_TAKEOVER = 'client_no_context_takeover'
+PARAMETER_SERVER_MAX_WINDOW_BITS = 'server_max_window_bits'
+PARAMETER_SERVER_NO_CONTEXT_TAKEOVER = 'server_no_context_takeover'
+
+
+def parse_per_message_deflate_parameters(parameters):
+    """
+    Parses the parameters of a permessage-deflate extension offer or response.
+    
+    Parameters
+    ----------
+    parameters : `list<(str, None | str)>`
+        The received parameters.
+    
+    Returns
+    -------
+    parsed : `None | dict<str, None | int>`
+        Returns `None` if any of the parameters is unknown, duplicated or has incorrect value.
+        The window bits parameters' values are converted to `int`, `client_max_window_bits` is `None` if given without
+        value.
+    """
+    parsed = {}
+    
+    for key, value in parameters:
+        if key in parsed:
+            return None
+        
+        if key in (PARAMETER_CLIENT_NO_CONTEXT_TAKEOVER, PARAMETER_SERVER_NO_CONTEXT_TAKEOVER):
+            if (value is not None):
+                return None
+        
+        elif key in (PARAMETER_CLIENT_MAX_WINDOW_BITS, PARAMETER_SERVER_MAX_WINDOW_BITS):
+            if value is None:
+                if key != PARAMETER_CLIENT_MAX_WINDOW_BITS:
+                    return None
+            
+            else:
+                if not value.isdigit():
+                    return None
+                
+                value = int(value)
+                if (value < MAX_WINDOW_BITS_MIN) or (value > MAX_WINDOW_BITS_MAX):
+                    return None
+        
+        else:
+            return None
+        
+        parsed[key] = value
+    
+    return parsed
+
+
+def _validate_max_window_bits(max_window_bits, parameter_name):
+    """
+    Validates the given max window bits.
+    
+    Parameters
+    ----------
+    max_window_bits : `None | int`
+        The value to validate.
+    
+    parameter_name : `str`
+        The parameter's name to use in exception messages.
+    
+    Returns
+    -------
+    max_window_bits : `None | int`
+    
+    Raises
+    ------
+    TypeError
+        - If `max_window_bits`'s type is incorrect.
+    ValueError
+        - If `max_window_bits`'s value is incorrect.
+    """
+    if max_window_bits is None:
+        return None
+    
+    if not isinstance(max_window_bits, int):
+        raise TypeError(
+            f'`{parameter_name}` can be `None`, `int`, got {type(max_window_bits).__name__}; {max_window_bits!r}.'
+        )
+    
+    if (max_window_bits < ZLIB_WINDOW_BITS_MIN) or (max_window_bits > MAX_WINDOW_BITS_MAX):
+        raise ValueError(
+            f'`{parameter_name}` can be in range [{ZLIB_WINDOW_BITS_MIN}, {MAX_WINDOW_BITS_MAX}], '
+            f'got {max_window_bits!r}.'
+        )
+    
+    return max_window_bits
+
+
+class WebSocketExtensionPerMessageDeflate(WebSocketExtensionBase):
+    """
+    The permessage-deflate web socket extension compressing the sent and decompressing the received messages.
+    (RFC 7692)
+    
+    Messages under ``.compression_threshold`` are sent uncompressed and messages over ``.executor_threshold`` are
+    compressed / decompressed in an executor.
+    
+    Attributes
+    ----------
+    client_max_window_bits : `None | int`
+        The client's maximal compression window size. On client side it is offered, on server side it is requested.
+    
+    client_no_context_takeover : `bool`
+        Whether the client should reset its compressor after each message.
+    
+    compression_level : `int`
+        Compression level used for compressing messages.
+    
+    compression_threshold : `int`
+        Messages under this size are not compressed.
+    
+    compressor : `None | zlib.Compress`
+        The compressor of the negotiated extension. `None` if compression is not possible with the negotiated
+        parameters.
+    
+    decoding_compressed : `bool`
+        Whether the message being received is compressed.
+    
+    decompressor : `None | zlib.Decompress`
+        The decompressor of the negotiated extension.
+    
+    encoding_compressed : `bool`
+        Whether the message being sent is compressed.
+    
+    executor_threshold : `int`
+        Messages over this size are compressed / decompressed in an executor.
+    
+    local_max_window_bits : `int`
+        The negotiated window size used for compressing.
+    
+    local_no_context_takeover : `bool`
+        Whether the compressor is reset after each message.
+    
+    remote_max_window_bits : `int`
+        The negotiated window size used for decompressing.
+    
+    remote_no_context_takeover : `bool`
+        Whether the decompressor is reset after each message.
+    
+    response_parameters : `None | list<(str, None | str)>`
+        The parameters to respond with on server side.
+    
+    server_max_window_bits : `None | int`
+        The server's maximal compression window size. On client side it is requested, on server side it is applied.
+    
+    server_no_context_takeover : `bool`
+        Whether the server should reset its compressor after each message.
+    
+    Class Attributes
+    ----------------
+    name : `str` = `'permessage-deflate'`
+        The extension's name.
+    """
+    __slots__ = (
+        'client_max_window_bits', 'client_no_context_takeover', 'compression_level', 'compression_threshold',
+        'compressor', 'decoding_compressed', 'decompressor', 'encoding_compressed', 'executor_threshold',
+        'local_max_window_bits', 'local_no_context_takeover', 'remote_max_window_bits', 'remote_no_context_takeover',
+        'response_parameters', 'server_max_window_bits', 'server_no_context_takeover'
+    )
+    
+    name = 'permessage-deflate'
+    
+    def __new__(
+        cls,
+        *,
+        client_max_window_bits = None,
+        client_no_context_takeover = False,
+        compression_level = COMPRESSION_LEVEL_DEFAULT,
+        compression_threshold = COMPRESSION_THRESHOLD_DEFAULT,
+        executor_threshold = EXECUTOR_THRESHOLD_DEFAULT,
+        server_max_window_bits = None,
+        server_no_context_takeover = False,
+    ):
+        """
+        Creates a new permessage-deflate extension.
+        
+        Parameters
+        ----------
+        client_max_window_bits : `None | int` = `None`, Optional (Keyword only)
+            The client's maximal compression window size in range [9, 15].
+        
+        client_no_context_takeover : `bool` = `False`, Optional (Keyword only)
+            Whether the client should reset its compressor after each message.
+        
+        compression_level : `int` = `6`, Optional (Keyword only)
+            Compression level in range [0, 9].
+        
+        compression_threshold : `int` = `128`, Optional (Keyword only)
+            Messages under this size are not compressed.
+        
+        executor_threshold : `int` = `262144`, Optional (Keyword only)
+            Messages over this size are compressed / decompressed in an executor.
+        
+        server_max_window_bits : `None | int` = `None`, Optional (Keyword only)
+            The server's maximal compression window size in range [9, 15].
+        
+        server_no_context_takeover : `bool` = `False`, Optional (Keyword only)
+            Whether the server should reset its compressor after each message.
+        
+        Raises
+        ------
+        TypeError
+            - If a parameter's type is incorrect.
+        ValueError
+            - If a parameter's value is incorrect.
+        """
+        client_max_window_bits = _validate_max_window_bits(client_max_window_bits, 'client_max_window_bits')
+        server_max_window_bits = _validate_max_window_bits(server_max_window_bits, 'server_max_window_bits')
+        
+        if not isinstance(compression_level, int):
+            raise TypeError(
+                f'`compression_level` can be `int`, got {type(compression_level).__name__}; {compression_level!r}.'
+            )
+        
+        if (compression_level < 0) or (compression_level > 9):
+            raise ValueError(
+                f'`compression_level` can be in range [0, 9], got {compression_level!r}.'
+            )
+        
+        if not isinstance(compression_threshold, int):
+            raise TypeError(
+                f'`compression_threshold` can be `int`, got {type(compression_threshold).__name__}; '
+                f'{compression_threshold!r}.'
+            )
+        
+        if not isinstance(executor_threshold, int):
+            raise TypeError(
+                f'`executor_threshold` can be `int`, got {type(executor_threshold).__name__}; '
+                f'{executor_threshold!r}.'
+            )
+        
+        self = object.__new__(cls)
+        self.client_max_window_bits = client_max_window_bits
+        self.client_no_context_takeover = True if client_no_context_takeover else False
+        self.compression_level = compression_level
+        self.compression_threshold = compression_threshold
+        self.compressor = None
+        self.decoding_compressed = False
+        self.decompressor = None
+        self.encoding_compressed = False
+        self.executor_threshold = executor_threshold
+        self.local_max_window_bits = MAX_WINDOW_BITS_MAX
+        self.local_no_context_takeover = False
+        self.remote_max_window_bits = MAX_WINDOW_BITS_MAX
+        self.remote_no_context_takeover = False
+        self.response_parameters = None
+        self.server_max_window_bits = server_max_window_bits
+        self.server_no_context_takeover = True if server_no_context_takeover else False
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the web socket extension's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' compression_level = ')
+        repr_parts.append(repr(self.compression_level))
+        
+        repr_parts.append(', compression_threshold = ')
+        repr_parts.append(repr(self.compression_threshold))
+        
+        if (self.decompressor is not None):
+            repr_parts.append(', local_max_window_bits = ')
+            repr_parts.append(repr(self.local_max_window_bits))
+            
+            repr_parts.append(', remote_max_window_bits = ')
+            repr_parts.append(repr(self.remote_max_window_bits))
+            
+            if self.local_no_context_takeover:
+                repr_parts.append(', local_no_context_takeover = True')
+            
+            if self.remote_no_context_takeover:
+                repr_parts.append(', remote_no_context_takeover = True')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    @property
+    @copy_docs(WebSocketExtensionBase.request_params)
+    def request_params(self):
+        response_parameters = self.response_parameters
+        if (response_parameters is not None):
+            return response_parameters.copy()
+        
+        parameters = []
+        
+        if self.server_no_context_takeover:
+            parameters.append((PARAMETER_SERVER_NO_CONTEXT_TAKEOVER, None))
+        
+        if self.client_no_context_takeover:
+            parameters.append((PARAMETER_CLIENT_NO_CONTEXT_TAKEOVER, None))
+        
+        server_max_window_bits = self.server_max_window_bits
+        if (server_max_window_bits is not None):
+            parameters.append((PARAMETER_SERVER_MAX_WINDOW_BITS, str(server_max_window_bits)))
+        
+        client_max_window_bits = self.client_max_window_bits
+        parameters.append((
+            PARAMETER_CLIENT_MAX_WINDOW_BITS,
+            None if client_max_window_bits is None else str(client_max_window_bits),
+        ))
+        
+        return parameters
+    
+    
+    @copy_docs(WebSocketExtensionBase.negotiate)
+    def negotiate(self, parameters, is_client):
+        parsed = parse_per_message_deflate_parameters(parameters)
+        if parsed is None:
+            return None
+        
+        if is_client:
+            negotiated = self._negotiate_client_side(parsed)
+        else:
+            negotiated = self._negotiate_server_side(parsed)
+        
+        if (negotiated is None):
+            return None
+        
+        local_max_window_bits, local_no_context_takeover, remote_max_window_bits, remote_no_context_takeover, \
+            response_parameters = negotiated
+        
+        new = type(self)(
+            client_max_window_bits = self.client_max_window_bits,
+            client_no_context_takeover = self.client_no_context_takeover,
+            compression_level = self.compression_level,
+            compression_threshold = self.compression_threshold,
+            executor_threshold = self.executor_threshold,
+            server_max_window_bits = self.server_max_window_bits,
+            server_no_context_takeover = self.server_no_context_takeover,
+        )
+        new.local_max_window_bits = local_max_window_bits
+        new.local_no_context_takeover = local_no_context_takeover
+        new.remote_max_window_bits = remote_max_window_bits
+        new.remote_no_context_takeover = remote_no_context_takeover
+        new.response_parameters = response_parameters
+        new.compressor = new._create_compressor()
+        new.decompressor = new._create_decompressor()
+        return new
+    
+    
+    def _negotiate_client_side(self, parsed):
+        """
+        Negotiates the extension's parameters on client side from the server's response.
+        
+        Parameters
+        ----------
+        parsed : `dict<str, None | int>`
+            The parsed parameters of the server's response.
+        
+        Returns
+        -------
+        negotiated : `None | (int, bool, int, bool, None)`
+            Returns `None` if the response does not match the offer.
+        """
+        if self.server_no_context_takeover and (PARAMETER_SERVER_NO_CONTEXT_TAKEOVER not in parsed):
+            return None
+        
+        # Server max window bits
+        server_max_window_bits = self.server_max_window_bits
+        response_server_max_window_bits = parsed.get(PARAMETER_SERVER_MAX_WINDOW_BITS, None)
+        if server_max_window_bits is None:
+            # The server can limit its own window even if not offered (RFC 7692 7.1.2.1).
+            if (response_server_max_window_bits is None):
+                remote_max_window_bits = MAX_WINDOW_BITS_MAX
+            else:
+                remote_max_window_bits = response_server_max_window_bits
+        
+        else:
+            if (response_server_max_window_bits is None):
+                return None
+            
+            if response_server_max_window_bits > server_max_window_bits:
+                return None
+            
+            remote_max_window_bits = response_server_max_window_bits
+        
+        # Client max window bits
+        client_max_window_bits = self.client_max_window_bits
+        if PARAMETER_CLIENT_MAX_WINDOW_BITS in parsed:
+            response_client_max_window_bits = parsed[PARAMETER_CLIENT_MAX_WINDOW_BITS]
+            if response_client_max_window_bits is None:
+                return None
+            
+            if (client_max_window_bits is not None) and (response_client_max_window_bits > client_max_window_bits):
+                return None
+            
+            local_max_window_bits = response_client_max_window_bits
+        
+        elif (client_max_window_bits is None):
+            local_max_window_bits = MAX_WINDOW_BITS_MAX
+        
+        else:
+            local_max_window_bits = client_max_window_bits
+        
+        return (
+            local_max_window_bits,
+            self.client_no_context_takeover or (PARAMETER_CLIENT_NO_CONTEXT_TAKEOVER in parsed),
+            remote_max_window_bits,
+            PARAMETER_SERVER_NO_CONTEXT_TAKEOVER in parsed,
+            None,
+        )
+    
+    
+    def _negotiate_server_side(self, parsed):
+        """
+        Negotiates the extension's parameters on server side from the client's offer.
+        
+        Parameters
+        ----------
+        parsed : `dict<str, None | int>`
+            The parsed parameters of the client's offer.
+        
+        Returns
+        -------
+        negotiated : `None | (int, bool, int, bool, list<(str, None | str)>)`
+            Returns `None` if the offer cannot be accepted.
+        """
+        response_parameters = []
+        
+        # No context takeover
+        local_no_context_takeover = self.server_no_context_takeover or (PARAMETER_SERVER_NO_CONTEXT_TAKEOVER in parsed)
+        if local_no_context_takeover:
+            response_parameters.append((PARAMETER_SERVER_NO_CONTEXT_TAKEOVER, None))
+        
+        remote_no_context_takeover = self.client_no_context_takeover or (PARAMETER_CLIENT_NO_CONTEXT_TAKEOVER in parsed)
+        if remote_no_context_takeover:
+            response_parameters.append((PARAMETER_CLIENT_NO_CONTEXT_TAKEOVER, None))
+        
+        # Server max window bits
+        server_max_window_bits = self.server_max_window_bits
+        offer_server_max_window_bits = parsed.get(PARAMETER_SERVER_MAX_WINDOW_BITS, None)
+        if offer_server_max_window_bits is None:
+            # Using a smaller window than the client expects does not need to be announced.
+            local_max_window_bits = MAX_WINDOW_BITS_MAX if server_max_window_bits is None else server_max_window_bits
+        
+        else:
+            if server_max_window_bits is None:
+                local_max_window_bits = offer_server_max_window_bits
+            else:
+                local_max_window_bits = min(offer_server_max_window_bits, server_max_window_bits)
+            
+            response_parameters.append((PARAMETER_SERVER_MAX_WINDOW_BITS, str(local_max_window_bits)))
+        
+        # Client max window bits
+        client_max_window_bits = self.client_max_window_bits
+        if PARAMETER_CLIENT_MAX_WINDOW_BITS in parsed:
+            offer_client_max_window_bits = parsed[PARAMETER_CLIENT_MAX_WINDOW_BITS]
+            if client_max_window_bits is None:
+                if offer_client_max_window_bits is None:
+                    remote_max_window_bits = MAX_WINDOW_BITS_MAX
+                else:
+                    remote_max_window_bits = offer_client_max_window_bits
+            
+            else:
+                if offer_client_max_window_bits is None:
+                    remote_max_window_bits = client_max_window_bits
+                else:
+                    remote_max_window_bits = min(offer_client_max_window_bits, client_max_window_bits)
+                
+                response_parameters.append((PARAMETER_CLIENT_MAX_WINDOW_BITS, str(remote_max_window_bits)))
+        
+        elif (client_max_window_bits is None):
+            remote_max_window_bits = MAX_WINDOW_BITS_MAX
+        
+        else:
+            # The client cannot limit its window size.
+            return None
+        
+        return (
+            local_max_window_bits,
+            local_no_context_takeover,
+            remote_max_window_bits,
+            remote_no_context_takeover,
+            response_parameters,
+        )
+    
+    
+    def _create_compressor(self):
+        """
+        Creates a compressor with the negotiated parameters.
+        
+        Returns
+        -------
+        compressor : `None | zlib.Compress`
+            Returns `None` if the negotiated window size is not supported by zlib.
+        """
+        local_max_window_bits = self.local_max_window_bits
+        if local_max_window_bits < ZLIB_WINDOW_BITS_MIN:
+            return None
+        
+        return create_zlib_compressor(self.compression_level, DEFLATED, -local_max_window_bits)
+    
+    
+    def _create_decompressor(self):
+        """
+        Creates a decompressor with the negotiated parameters.
+        
+        Returns
+        -------
+        decompressor : `zlib.Decompress`
+        """
+        return create_zlib_decompressor(-max(self.remote_max_window_bits, ZLIB_WINDOW_BITS_MIN))
+    
+    
+    @copy_docs(WebSocketExtensionBase.encode)
+    def encode(self, frame):
+        head_0 = frame.head_0
+        operation_code = head_0 & HEAD_OPERATION_CODE
+        if operation_code in WEB_SOCKET_CONTROL_OPERATIONS:
+            return frame
+        
+        compressor = self.compressor
+        if operation_code == WEB_SOCKET_OPERATION_CONTINUOUS:
+            if not self.encoding_compressed:
+                return frame
+        
+        else:
+            if (compressor is None) or (len(frame.data) < self.compression_threshold):
+                self.encoding_compressed = False
+                return frame
+            
+            self.encoding_compressed = True
+            head_0 |= HEAD_RSV1
+        
+        data = compressor.compress(frame.data) + compressor.flush(Z_SYNC_FLUSH)
+        
+        if head_0 & HEAD_FINAL:
+            if data.endswith(DEFLATE_TAIL):
+                data = data[:-len(DEFLATE_TAIL)]
+            
+            if not data:
+                data = b'\x00'
+            
+            if self.local_no_context_takeover:
+                self.compressor = self._create_compressor()
+        
+        return WebSocketFrame._from_fields(head_0, data)
+    
+    
+    @copy_docs(WebSocketExtensionBase.decode)
+    def decode(self, frame, *, max_size = None):
+        head_0 = frame.head_0
+        operation_code = head_0 & HEAD_OPERATION_CODE
+        if operation_code in WEB_SOCKET_CONTROL_OPERATIONS:
+            return frame
+        
+        if operation_code == WEB_SOCKET_OPERATION_CONTINUOUS:
+            if head_0 & HEAD_RSV1:
+                raise WebSocketProtocolError('Reserved bit 1 set on continuation frame.')
+            
+            if not self.decoding_compressed:
+                return frame
+        
+        else:
+            if not head_0 & HEAD_RSV1:
+                self.decoding_compressed = False
+                return frame
+            
+            self.decoding_compressed = True
+            head_0 ^= HEAD_RSV1
+        
+        data = frame.data
+        final = head_0 & HEAD_FINAL
+        if final:
+            data = bytes(data) + DEFLATE_TAIL
+        
+        decompressor = self.decompressor
+        try:
+            data = decompressor.decompress(data, 0 if max_size is None else max_size)
+        except ZlibError as exception:
+            raise WebSocketProtocolError(f'Decompression failed: {exception!s}.') from exception
+        
+        if decompressor.unconsumed_tail:
+            raise PayloadError(f'Payload length exceeds size limit (> {max_size} bytes).')
+        
+        if final and self.remote_no_context_takeover:
+            self.decompressor = self._create_decompressor()
+        
+        return WebSocketFrame._from_fields(head_0, data)
+    
+    
+    @copy_docs(WebSocketExtensionBase.decode_async)
+    async def decode_async(self, frame, *, max_size = None):
+        if len(frame.data) < self.executor_threshold:
+            return self.decode(frame, max_size = max_size)
+        
+        return await get_event_loop().run_in_executor(
+            alchemy_incendiary(self.decode, (frame,), {'max_size': max_size}),
+        )
+    
+    
+    @copy_docs(WebSocketExtensionBase.encode_async)
+    async def encode_async(self, frame):
+        if len(frame.data) < self.executor_threshold:
+            return self.encode(frame)
+        
+        return await get_event_loop().run_in_executor(alchemy_incendiary(self.encode, (frame,)))
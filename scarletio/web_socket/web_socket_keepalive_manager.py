@@ -0,0 +1,225 @@
+__all__ = ('WebSocketKeepaliveManager',)
+
+from ..core import LOOP_TIME
+from ..utils import RichAttributeErrorBaseType, validate_duration
+
+from .web_socket_common_protocol import WEB_SOCKET_STATE_OPEN
+
+
+KEEPALIVE_BUCKET_COUNT_DEFAULT = 16
+
+
+class WebSocketKeepaliveManager(RichAttributeErrorBaseType):
+    """
+    Keeps many web sockets alive with a single cycler.
+    
+    The web sockets are distributed into buckets and on every cycle only 1 bucket is checked, so each web socket is
+    checked once in every `interval`. Web sockets from which nothing was received for `interval` seconds are pinged
+    and the ones from which nothing was received for `interval + timeout` seconds are closed.
+    
+    Attributes
+    ----------
+    _bucket_index : `int`
+        The index of the bucket to check on the next cycle.
+    
+    buckets : `list<set<WebSocketCommonProtocol>>`
+        The web sockets distributed into buckets.
+    
+    cycler : ``None | Cycler``
+        The cycler checking the buckets. Set only meanwhile the manager is running.
+    
+    interval : `float`
+        After how much idle time should the web sockets be pinged.
+    
+    loop : ``EventThread``
+        The event loop to what the manager is bound to.
+    
+    timeout : `float`
+        How much idle time is tolerated after `interval` before closing the web sockets.
+    """
+    __slots__ = ('_bucket_index', 'buckets', 'cycler', 'interval', 'loop', 'timeout')
+    
+    def __new__(cls, loop, interval, timeout = None, *, bucket_count = KEEPALIVE_BUCKET_COUNT_DEFAULT):
+        """
+        Creates a new keepalive manager and starts it.
+        
+        Parameters
+        ----------
+        loop : ``EventThread``
+            The event loop to what the manager is bound to.
+        
+        interval : `float`
+            After how much idle time should the web sockets be pinged.
+        
+        timeout : `None | float` = `None`, Optional
+            How much idle time is tolerated after `interval` before closing the web sockets.
+            Defaults to `interval`.
+        
+        bucket_count : `int` = `16`, Optional (Keyword only)
+            Into how much buckets should the web sockets be distributed.
+        
+        Raises
+        ------
+        TypeError
+            - If a parameter's type is incorrect.
+        ValueError
+            - If a parameter's value is incorrect.
+        """
+        interval = validate_duration(interval, 'interval')
+        
+        if timeout is None:
+            timeout = interval
+        else:
+            timeout = validate_duration(timeout, 'timeout')
+        
+        if not isinstance(bucket_count, int):
+            raise TypeError(
+                f'`bucket_count` can be `int`, got {type(bucket_count).__name__}; {bucket_count!r}.'
+            )
+        
+        if bucket_count <= 0:
+            raise ValueError(
+                f'`bucket_count` cannot be `0` or less, got {bucket_count!r}.'
+            )
+        
+        self = object.__new__(cls)
+        self._bucket_index = 0
+        self.buckets = [set() for index in range(bucket_count)]
+        self.cycler = None
+        self.interval = interval
+        self.loop = loop
+        self.timeout = timeout
+        
+        self.cycler = loop.cycle(interval / bucket_count, self._check_next_bucket)
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the keepalive manager's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' interval = ')
+        repr_parts.append(repr(self.interval))
+        
+        repr_parts.append(', timeout = ')
+        repr_parts.append(repr(self.timeout))
+        
+        repr_parts.append(', web_socket_count = ')
+        repr_parts.append(repr(len(self)))
+        
+        if self.cycler is None:
+            repr_parts.append(', closed')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __len__(self):
+        """Returns how much web sockets are managed."""
+        length = 0
+        
+        for bucket in self.buckets:
+            length += len(bucket)
+        
+        return length
+    
+    
+    def add(self, protocol):
+        """
+        Adds the given web socket to the manager.
+        
+        Parameters
+        ----------
+        protocol : ``WebSocketCommonProtocol``
+            The web socket to add.
+        """
+        buckets = self.buckets
+        buckets[hash(protocol) % len(buckets)].add(protocol)
+    
+    
+    def remove(self, protocol):
+        """
+        Removes the given web socket from the manager.
+        
+        Parameters
+        ----------
+        protocol : ``WebSocketCommonProtocol``
+            The web socket to remove.
+        """
+        buckets = self.buckets
+        buckets[hash(protocol) % len(buckets)].discard(protocol)
+    
+    
+    def _check_next_bucket(self, cycler):
+        """
+        Checks the next bucket. Called by ``.cycler``.
+        
+        Parameters
+        ----------
+        cycler : ``Cycler``
+            The cycler calling the manager.
+        """
+        buckets = self.buckets
+        bucket_index = self._bucket_index
+        self._bucket_index = (bucket_index + 1) % len(buckets)
+        
+        self.check_bucket(buckets[bucket_index], LOOP_TIME())
+    
+    
+    def check_bucket(self, bucket, now):
+        """
+        Pings the idle web sockets of the given bucket and closes the dead ones.
+        
+        Web sockets, which paused reading because of their full message queue, are considered active.
+        
+        Parameters
+        ----------
+        bucket : `set<WebSocketCommonProtocol>`
+            The bucket to check.
+        
+        now : `float`
+            The current loop time.
+        """
+        ping_before = now - self.interval
+        dead_before = ping_before - self.timeout
+        dead_protocols = None
+        
+        for protocol in bucket:
+            # Web sockets are added when connected, so they might be not yet open; closing ones are removed by their
+            # server when their handler returns.
+            if protocol.state != WEB_SOCKET_STATE_OPEN:
+                continue
+            
+            # Reading is paused meanwhile the protocol's message queue is full, so no frames are received; the peer
+            # is not idle, the consumer is just slow.
+            if (protocol._queue_paused_at is not None):
+                protocol.last_activity = now
+                continue
+            
+            last_activity = protocol.last_activity
+            if last_activity > ping_before:
+                continue
+            
+            if last_activity > dead_before:
+                protocol.ping_no_wait()
+                continue
+            
+            if dead_protocols is None:
+                dead_protocols = []
+            
+            dead_protocols.append(protocol)
+        
+        if (dead_protocols is not None):
+            for protocol in dead_protocols:
+                bucket.discard(protocol)
+                protocol.abort_connection(1011, 'Keepalive ping timeout.')
+    
+    
+    def close(self):
+        """
+        Stops the manager.
+        """
+        cycler = self.cycler
+        if (cycler is not None):
+            self.cycler = None
+            cycler.cancel()
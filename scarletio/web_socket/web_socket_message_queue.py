@@ -0,0 +1,145 @@
+__all__ = ('WebSocketMessageQueue',)
+
+from ..core import AsyncQueue, Future
+from ..utils import copy_docs, copy_func, to_coroutine
+
+
+class WebSocketMessageQueue(AsyncQueue):
+    """
+    Message queue of a web socket, which is not limited by its length, but tells its producer to wait when it fills up.
+    
+    Attributes
+    ----------
+    _drain_waiter : ``None | Future``
+        Waiter set meanwhile the producer waits for the queue to be drained.
+    
+    _exception : `None`, `BaseException`
+        The exception set as the queue's result to raise, when the queue gets empty.
+    
+    _loop : ``EventThread``
+        The loop to what the queue is bound to.
+    
+    _results : `deque`
+        The results of the queue, which can be retrieved by ``.result``, ``.result_no_wait``, or by awaiting it.
+    
+    _set_result_waiters : `None`, `list` of ``Future``
+        Result setter waiters for the queue to become empty.
+    
+    _waiter : ``None | Future``
+        If the queue is empty and it's result is already waited, then this future is set. It's result is set, by the
+        first ``.set_result``, ``.set_exception`` call.
+    
+    high_water : `int`
+        The queue is full when its length reaches it.
+    
+    low_water : `int`
+        The queue is drained when its length drops to it.
+    """
+    __slots__ = ('_drain_waiter', 'high_water', 'low_water')
+    
+    def __new__(cls, loop, high_water, low_water):
+        """
+        Creates a new web socket message queue.
+        
+        Parameters
+        ----------
+        loop : ``EventThread``
+            The loop to what the created queue will be bound to.
+        
+        high_water : `int`
+            The queue is full when its length reaches it.
+        
+        low_water : `int`
+            The queue is drained when its length drops to it.
+        """
+        self = AsyncQueue.__new__(cls, loop)
+        self._drain_waiter = None
+        self.high_water = high_water
+        self.low_water = low_water
+        return self
+    
+    
+    def is_full(self):
+        """
+        Returns whether the queue is full.
+        
+        Returns
+        -------
+        is_full : `bool`
+        """
+        return len(self._results) >= self.high_water
+    
+    
+    async def wait_for_drain(self):
+        """
+        Waits till the queue's length drops to its low water mark or till exception is set to it.
+        
+        This method is a coroutine.
+        """
+        if (len(self._results) <= self.low_water) or (self._exception is not None):
+            return
+        
+        waiter = self._drain_waiter
+        if (waiter is None) or waiter.is_done():
+            waiter = Future(self._loop)
+            self._drain_waiter = waiter
+        
+        await waiter
+    
+    
+    def _check_drained(self):
+        """
+        Wakes up the producer if the queue is drained.
+        """
+        waiter = self._drain_waiter
+        if (waiter is not None) and (len(self._results) <= self.low_water):
+            self._drain_waiter = None
+            waiter.set_result_if_pending(None)
+    
+    
+    @copy_docs(AsyncQueue.set_exception)
+    def set_exception(self, exception):
+        AsyncQueue.set_exception(self, exception)
+        
+        waiter = self._drain_waiter
+        if (waiter is not None):
+            self._drain_waiter = None
+            waiter.set_result_if_pending(None)
+    
+    
+    @copy_docs(AsyncQueue.__await__)
+    def __await__(self):
+        result = yield from AsyncQueue.__await__(self)
+        self._check_drained()
+        return result
+    
+    get_result = to_coroutine(copy_func(__await__))
+    
+    
+    @copy_docs(AsyncQueue.get_result_no_wait)
+    def get_result_no_wait(self):
+        result = AsyncQueue.get_result_no_wait(self)
+        self._check_drained()
+        return result
+    
+    
+    @copy_docs(AsyncQueue.__anext__)
+    async def __anext__(self):
+        result = await AsyncQueue.__anext__(self)
+        self._check_drained()
+        return result
+    
+    
+    @copy_docs(AsyncQueue.clear)
+    def clear(self):
+        AsyncQueue.clear(self)
+        self._check_drained()
+    
+    
+    @copy_docs(AsyncQueue.copy)
+    def copy(self):
+        new = AsyncQueue.copy(self)
+        new._drain_waiter = None
+        new.high_water = self.high_water
+        new.low_water = self.low_water
+        return new
@@ -1,14 +1,43 @@
 __all__ = ('WebSocketServer', )
 
+import reprlib
 from functools import partial as partial_func
 
 from ..core import Task, TaskGroup, skip_poll_cycle
 from ..core.event_loop.event_loop_functionality_helpers import _ssl_deprecation_precheck
 from ..utils import IgnoreCaseMultiValueDictionary
+from ..web_common import ConnectionClosed, WebSocketFrame
+from ..web_common.http_protocol import create_web_socket_frame_header
+from ..web_common.web_socket_frame import WEB_SOCKET_OPERATION_BINARY, WEB_SOCKET_OPERATION_TEXT
 
+from .web_socket_common_protocol import WEB_SOCKET_STATE_OPEN
+from .web_socket_keepalive_manager import WebSocketKeepaliveManager
 from .web_socket_server_protocol import WebSocketServerProtocol
 
 
+BROADCAST_WRITE_BUFFER_LIMIT = 1 << 20
+
+
+async def _broadcast_send(protocol, data):
+    """
+    Sends the data to a web socket which cannot share the broadcast frame, because of its negotiated extensions.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    protocol : ``WebSocketServerProtocol``
+        The web socket to send to.
+    
+    data : `bytes-like`, `str`
+        The data to send.
+    """
+    try:
+        await protocol.send(data)
+    except ConnectionClosed:
+        pass
+
+
 class WebSocketServer:
     """
     Asynchronous web socket server implementation.
@@ -30,6 +59,8 @@ class WebSocketServer:
         
         Should be given as an `async-callable` accepting `1` parameter the respective asynchronous server side
         web socket protocol implementations.
+    keepalive_manager : ``None | WebSocketKeepaliveManager``
+        Keeps the web sockets alive if keepalive is enabled.
     server : ``None | Server``
         Asynchronous server instance. Set meanwhile the web socket server is running.
     protocol_parameters : `tuple` of `object`
@@ -77,8 +108,16 @@ class WebSocketServer:
                 - `max_queue` : `None | int`.
                     Max queue size of ``.messages``. If a new payload is added to a full queue, the oldest element of
                     it is removed. Defaults to `None`.
+                - `queue_backpressure` : `bool`. Whether reading from the connection should be paused when
+                    ``.messages`` is full, instead of dropping messages. Defaults to `False`.
+                - `queue_low_water` : `None | int`. With `queue_backpressure`, reading is resumed when the length of
+                    ``.messages`` drops to it. Defaults to the half of `max_queue`.
+                - `binary_as_memoryview` : `bool`. Whether binary messages should be delivered as `memoryview`-s
+                    over a single buffer. Defaults to `False`.
     """
-    __slots__ = ('loop', 'web_sockets', 'close_connection_task', 'handler', 'server', 'protocol_parameters')
+    __slots__ = (
+        'loop', 'web_sockets', 'close_connection_task', 'handler', 'keepalive_manager', 'server', 'protocol_parameters'
+    )
     
     async def __new__(
         cls,
@@ -95,6 +134,8 @@ class WebSocketServer:
         request_processor = None,
         subprotocol_selector = None,
         web_socket_keyword_parameters = None,
+        keepalive_interval = None,
+        keepalive_timeout = None,
         ssl_context = None,
         ssl = ...,
         **server_keyword_parameters,
@@ -130,6 +171,9 @@ class WebSocketServer:
                 maximal size of a received frame. If it is passed, ``PayloadError`` is raised.
             - `encode` : `callable`. Encoder method, what processes the web socket frames to send. Should accept `1`
                 parameter, the respective ``WebSocketFrame``.
+            
+            Or ``WebSocketExtensionBase`` instances, like ``WebSocketExtensionPerMessageDeflate``, which are negotiated
+            for each connection.
         extra_response_headers : `None` or (``IgnoreCaseMultiValueDictionary``, `dict-like`) of
                 (`str`, `str`) items = `None`, Optional (Keyword only)
             Extra headers to send with the http response.
@@ -160,6 +204,18 @@ class WebSocketServer:
             - `max_queue` : `None | int`.
                 Max queue size of ``.messages``. If a new payload is added to a full queue, the oldest element of
                 it is removed.
+            - `queue_backpressure` : `bool`. Whether reading from the connection should be paused when
+                ``.messages`` is full, instead of dropping messages.
+            - `queue_low_water` : `None | int`. With `queue_backpressure`, reading is resumed when the length of
+                ``.messages`` drops to it. Defaults to the half of `max_queue`.
+            - `binary_as_memoryview` : `bool`. Whether binary messages should be delivered as `memoryview`-s over a
+                single buffer.
+        keepalive_interval : `None | float` = `None`, Optional (Keyword only)
+            If given, the web sockets from which nothing was received for this amount of seconds are pinged.
+            The web sockets are checked in buckets by a single ``WebSocketKeepaliveManager``.
+        keepalive_timeout : `None | float` = `None`, Optional (Keyword only)
+            How much more idle time is tolerated after `keepalive_interval` before closing the web sockets.
+            Defaults to `keepalive_interval`.
         ssl_context : `None | SSLContext` = `None`, Optional (Keyword only)
             Whether and what ssl is enabled for the connections.
         **server_keyword_parameters : Keyword parameters
@@ -189,11 +245,13 @@ class WebSocketServer:
         ------
         TypeError
             - `extra_response_headers` is not given as `None`, neither as `dict-like`.
+            - `keepalive_interval`, `keepalive_timeout` is not given as `None`, neither as `float`.
             - If `reuse_port` is given as non `bool`.
             - If `reuse_address` is given as non `bool`.
             - If `reuse_port` is given as non `bool`.
             - If `host` is not given as `None`, `str` and neither as `iterable` of `None`, `str`.
         ValueError
+            - If `keepalive_interval`, `keepalive_timeout` is `0` or less.
             - If `host`, `port` parameter is given, when `socket` is defined as well.
             - If `reuse_port` is given as `True`, but not supported.
             - If neither `host`, `port nor `socket` were given.
@@ -232,11 +290,17 @@ class WebSocketServer:
         if (extra_response_headers is not None) and (not extra_response_headers):
             extra_response_headers = None
         
+        if keepalive_interval is None:
+            keepalive_manager = None
+        else:
+            keepalive_manager = WebSocketKeepaliveManager(loop, keepalive_interval, keepalive_timeout)
+        
         self = object.__new__(cls)
         self.loop = loop
         self.handler = handler
         self.web_sockets = set()
         self.close_connection_task = None
+        self.keepalive_manager = keepalive_manager
         self.server = None
         self.protocol_parameters = (
             handler, host, port, is_ssl, origin, available_extensions, available_subprotocols, extra_response_headers,
@@ -244,9 +308,14 @@ class WebSocketServer:
         )
         
         factory = partial_func(protocol, self,)
-        server = await loop.create_server_to(
-            factory, host, port, ssl_context = ssl_context, **server_keyword_parameters
-        )
+        try:
+            server = await loop.create_server_to(
+                factory, host, port, ssl_context = ssl_context, **server_keyword_parameters
+            )
+        except:
+            if (keepalive_manager is not None):
+                keepalive_manager.close()
+            raise
         
         self.server = server
         await server.start()
@@ -264,6 +333,10 @@ class WebSocketServer:
             The connected server side web socket.
         """
         self.web_sockets.add(protocol)
+        
+        keepalive_manager = self.keepalive_manager
+        if (keepalive_manager is not None):
+            keepalive_manager.add(protocol)
     
     
     def unregister(self, protocol):
@@ -276,6 +349,89 @@ class WebSocketServer:
             The disconnected server side web socket.
         """
         self.web_sockets.discard(protocol)
+        
+        keepalive_manager = self.keepalive_manager
+        if (keepalive_manager is not None):
+            keepalive_manager.remove(protocol)
+    
+    
+    def broadcast(
+        self, data, protocols = None, *, disconnect_slow = False, write_buffer_limit = BROADCAST_WRITE_BUFFER_LIMIT
+    ):
+        """
+        Sends the given data to every open web socket of the server.
+        
+        The frame is built only once and is written directly into the write buffers, without waiting for them to drain.
+        Web sockets with negotiated extensions cannot share the frame, to these the data is sent with `.send`
+        in a task.
+        
+        Parameters
+        ----------
+        data : `bytes-like`, `str`
+            The data to send.
+        
+        protocols : `None | iterable<WebSocketServerProtocol>` = `None`, Optional
+            The web sockets to send to. Defaults to all of the web sockets of the server.
+        
+        disconnect_slow : `bool` = `False`, Optional (Keyword only)
+            Whether web sockets with write buffers over `write_buffer_limit` should be disconnected instead of just
+            skipped.
+        
+        write_buffer_limit : `int` = `BROADCAST_WRITE_BUFFER_LIMIT`, Optional (Keyword only)
+            Web sockets with more buffered data in bytes are skipped.
+        
+        Returns
+        -------
+        skipped_count : `int`
+            To how many web sockets the data was not sent (not open or too slow).
+        
+        Raises
+        ------
+        TypeError
+            `data` was not given as `bytes-like`, neither as `str`.
+        """
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            operation_code = WEB_SOCKET_OPERATION_BINARY
+            frame_data = data
+        elif isinstance(data, str):
+            operation_code = WEB_SOCKET_OPERATION_TEXT
+            frame_data = data.encode('utf-8')
+        else:
+            raise TypeError(
+                f'Data must be `bytes-like`, `str`, got: {type(data).__name__}; {reprlib.repr(data)}.'
+            )
+        
+        if protocols is None:
+            protocols = self.web_sockets
+        
+        # Server side frames are not masked, so the same frame can be written to every transport.
+        frame = WebSocketFrame(True, operation_code, frame_data)
+        raw_frame = b''.join((create_web_socket_frame_header(frame.head_0, len(frame_data), False), frame_data))
+        
+        skipped_count = 0
+        
+        for protocol in [*protocols]:
+            if protocol.state != WEB_SOCKET_STATE_OPEN:
+                skipped_count += 1
+                continue
+            
+            if protocol.get_transport() is None:
+                skipped_count += 1
+                continue
+            
+            if protocol.get_write_buffer_size() > write_buffer_limit:
+                skipped_count += 1
+                if disconnect_slow:
+                    protocol.fail_connection(1008, 'Too slow.')
+                continue
+            
+            if protocol.extensions:
+                Task(self.loop, _broadcast_send(protocol, data))
+                continue
+            
+            protocol.write_buffered(raw_frame)
+        
+        return skipped_count
     
     
     def is_serving(self):
@@ -321,6 +477,11 @@ class WebSocketServer:
         
         This method is a coroutine.
         """
+        keepalive_manager = self.keepalive_manager
+        if (keepalive_manager is not None):
+            self.keepalive_manager = None
+            keepalive_manager.close()
+        
         server = self.server
         if server is None:
             return
@@ -20,6 +20,7 @@ from .web_socket_common_protocol import (
     BAD_REQUEST, FORBIDDEN, INTERNAL_SERVER_ERROR, SERVICE_UNAVAILABLE, SWITCHING_PROTOCOLS, UPGRADE_REQUIRED,
     WEB_SOCKET_KEY, WebSocketCommonProtocol
 )
+from .web_socket_extension_base import WebSocketExtensionBase
 
 
 class WebSocketServerProtocol(WebSocketCommonProtocol):
@@ -53,7 +54,21 @@ class WebSocketServerProtocol(WebSocketCommonProtocol):
     _drain_waiter : ``None | Future``
         A future, what is used to block the writing task, till it's writen data is drained.
     _drain_lock : ``Lock``
-        Asynchronous lock to ensure, that only `1` frame is written in `1` time.
+        Asynchronous lock to ensure, that extensions encode only `1` frame in `1` time and that only `1` writer waits
+        for drain.
+    _queue_paused_at : `None | float`
+        When reading was paused because of the full ``.messages`` queue. Set only meanwhile it is paused.
+    _queue_paused_duration : `float`
+        The total duration in seconds while reading was paused because of the full ``.messages`` queue, excluding the
+        current pause.
+    _write_buffer : `list<bytes-like>`
+        Frame data written meanwhile the current loop iteration, flushed to the transport together.
+    _write_buffer_size : `int`
+        The total size of ``._write_buffer``.
+    _write_flush_handle : ``None | Handle``
+        Handle scheduled to flush ``._write_buffer``. Set only meanwhile it is not empty.
+    _writing_paused : `bool`
+        Whether the protocol's respective transport asked it to pause writing. Defaults to `False`.
     close_code : `int`
         The web socket's close code if applicable. Defaults to `0`.
     close_connection_task : `None`, ``Task`` of ``.close_connection``
@@ -63,6 +78,9 @@ class WebSocketServerProtocol(WebSocketCommonProtocol):
     close_reason : `None`, `str`
         The reason, why the web socket was closed. Set only after the web socket is closed. Close reason might not be
         received tho.
+    binary_as_memoryview : `bool`
+        Whether binary messages are delivered as `memoryview`-s over a single buffer, into what the payload of each
+        frame of the message is read directly. Defaults to `False`.
     connection_lost_waiter : ``Future``
         A future, what's result is set as `None`, when the connection is closed. Used to wait for close frames.
         
@@ -80,10 +98,15 @@ class WebSocketServerProtocol(WebSocketCommonProtocol):
         An asynchronous queue of the received messages.
     is_ssl : `bool`
         Whether the connection is secure. Defaults to `False`.
+    last_activity : `float`
+        The loop time when the last frame was received (or when the web socket was created).
     pings : `OrderedDict` of (`bytes`, ``Future``) items
         An ordered dictionary of ping payloads and of their waiter futures.
     port : `int`
         The respective server's port to connect to.
+    queue_backpressure : `bool`
+        Whether reading from the connection is paused when ``.messages`` is full, so tcp flow control pushes back on
+        the other side. Defaults to `False`.
     state : `str`
         The web socket's state.
         
@@ -120,6 +143,9 @@ class WebSocketServerProtocol(WebSocketCommonProtocol):
             maximal size of a received frame. If it is passed, ``PayloadError`` is raised.
         - `encode` : `callable`. Encoder method, what processes the web socket frames to send. Should accept `1`
             parameter, the respective web socket ``WebSocketFrame``.
+        
+        Or ``WebSocketExtensionBase`` instances, like ``WebSocketExtensionPerMessageDeflate``, which are negotiated
+        for each connection.
     available_subprotocols : `None` or (`list` of `str`)
         A list of supported subprotocols in order of decreasing preference.
     extra_response_headers : ``IgnoreCaseMultiValueDictionary``, `dict-like` with (`str`, `str`) items
@@ -408,15 +434,14 @@ class WebSocketServerProtocol(WebSocketCommonProtocol):
                     for extension in available_extensions:
                         # Do names and parameters match?
                         if extension.name == name and extension.are_valid_parameters(parameters, accepted_extensions):
+                            if isinstance(extension, WebSocketExtensionBase):
+                                extension = extension.negotiate(parameters, False)
+                                if extension is None:
+                                    continue
+                            
                             accepted_extensions.append(extension)
-                            extension_headers.append((name, parameters))
+                            extension_headers.append(extension)
                             break
-                    else:
-                        # no matching extension
-                        raise InvalidHandshake(
-                            f'Unsupported extension: name = {name!r}, parameters = {parameters!r}.',
-                            request = request,
-                        )
                     
                     # If we didn't break from the loop, no extension in our list matched what the client sent. The
                     # extension is declined.
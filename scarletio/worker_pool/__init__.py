@@ -0,0 +1,14 @@
+from .event_thread_pool import *
+from .sharded_server import *
+from .supervised_worker import *
+from .worker_process import *
+from .worker_supervisor import *
+
+
+__all__ = (
+    *event_thread_pool.__all__,
+    *sharded_server.__all__,
+    *supervised_worker.__all__,
+    *worker_process.__all__,
+    *worker_supervisor.__all__,
+)
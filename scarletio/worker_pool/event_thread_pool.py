@@ -0,0 +1,145 @@
+__all__ = ('EventThreadPool',)
+
+from ..core import EventThread, get_event_loop
+from ..http_client import HTTPClient
+from ..utils import RichAttributeErrorBaseType
+
+
+class EventThreadPool(RichAttributeErrorBaseType):
+    """
+    A group of event loops running in the same process.
+    
+    Work running on different event loops can overlap if it releases the GIL, like blocking io or c extensions do.
+    
+    Attributes
+    ----------
+    _http_clients : `dict<EventThread, HTTPClient>`
+        The http clients created for the event loops.
+    
+    loops : `list<EventThread>`
+        The event loops of the pool.
+    """
+    __slots__ = ('_http_clients', 'loops')
+    
+    def __new__(cls, loop_count, *, name = 'event-thread-pool'):
+        """
+        Creates a new event thread pool and starts its event loops.
+        
+        Parameters
+        ----------
+        loop_count : `int`
+            The amount of event loops to start.
+        
+        name : `str` = `'event-thread-pool'`, Optional (Keyword only)
+            Name prefix of the event loops.
+        
+        Raises
+        ------
+        TypeError
+            - If a parameter's type is incorrect.
+        ValueError
+            - If a parameter's value is incorrect.
+        """
+        if not isinstance(loop_count, int):
+            raise TypeError(
+                f'`loop_count` can be `int`, got {type(loop_count).__name__}; {loop_count!r}.'
+            )
+        
+        if loop_count <= 0:
+            raise ValueError(
+                f'`loop_count` cannot be `0` or less, got {loop_count!r}.'
+            )
+        
+        if not isinstance(name, str):
+            raise TypeError(
+                f'`name` can be `str`, got {type(name).__name__}; {name!r}.'
+            )
+        
+        loops = [
+            EventThread(daemon = True, name = f'{name}-{index}', start_later = False) for index in range(loop_count)
+        ]
+        
+        self = object.__new__(cls)
+        self._http_clients = {}
+        self.loops = loops
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the event thread pool's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' loop_count = ')
+        repr_parts.append(repr(len(self.loops)))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __len__(self):
+        """Returns the amount of event loops in the pool."""
+        return len(self.loops)
+    
+    
+    def __iter__(self):
+        """
+        Iterates over the event loops of the pool.
+        
+        This method is an iterable generator.
+        
+        Yields
+        ------
+        loop : ``EventThread``
+        """
+        yield from self.loops
+    
+    
+    def get_http_client(self, loop = None):
+        """
+        Returns the http client of the given event loop. Creates it if not yet created.
+        
+        Connections of an http client are bound to its event loop, so each event loop has its own http client.
+        
+        Parameters
+        ----------
+        loop : `None | EventThread` = `None`, Optional
+            The event loop to get the http client for. Defaults to the current one.
+        
+        Returns
+        -------
+        http_client : ``HTTPClient``
+        
+        Raises
+        ------
+        RuntimeError
+            - If `loop` is not given and not called from an event loop.
+        ValueError
+            - If `loop` is not an event loop of the pool.
+        """
+        if loop is None:
+            loop = get_event_loop()
+        
+        if loop not in self.loops:
+            raise ValueError(
+                f'`loop` is not an event loop of the pool, got {loop!r}.'
+            )
+        
+        http_client = self._http_clients.get(loop, None)
+        if http_client is None:
+            http_client = HTTPClient(loop)
+            http_client = self._http_clients.setdefault(loop, http_client)
+        
+        return http_client
+    
+    
+    def stop(self):
+        """
+        Closes the http clients and stops the event loops of the pool. Thread safe.
+        """
+        http_clients = self._http_clients
+        for loop in self.loops:
+            http_client = http_clients.pop(loop, None)
+            if (http_client is not None):
+                loop.call_soon_thread_safe(http_client.close)
+            
+            loop.stop()
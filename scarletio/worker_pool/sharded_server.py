@@ -0,0 +1,430 @@
+__all__ = ('ServerShard', 'ShardedServer',)
+
+import errno
+
+from ..core import Task, write_exception_async
+from ..utils import RichAttributeErrorBaseType
+
+
+BALANCING_LEAST_CONNECTIONS = 'least_connections'
+BALANCING_ROUND_ROBIN = 'round_robin'
+
+BALANCINGS = (BALANCING_LEAST_CONNECTIONS, BALANCING_ROUND_ROBIN)
+
+
+class ServerShard(RichAttributeErrorBaseType):
+    """
+    An event loop of a ``ShardedServer`` and its connections.
+    
+    The connections are counted by 2 counters, each written only by 1 thread, so they need no locking.
+    
+    Attributes
+    ----------
+    closed_count : `int`
+        How much connections of the shard were closed (or failed to be set up). Written by the shard's event loop.
+    
+    dispatched_count : `int`
+        How much connections were dispatched to the shard. Written by the accepting event loop.
+    
+    loop : ``EventThread``
+        The event loop of the shard.
+    
+    server : ``ShardedServer``
+        The parent server.
+    """
+    __slots__ = ('closed_count', 'dispatched_count', 'loop', 'server')
+    
+    def __new__(cls, server, loop):
+        """
+        Creates a new server shard.
+        
+        Parameters
+        ----------
+        server : ``ShardedServer``
+            The parent server.
+        
+        loop : ``EventThread``
+            The event loop of the shard.
+        """
+        self = object.__new__(cls)
+        self.closed_count = 0
+        self.dispatched_count = 0
+        self.loop = loop
+        self.server = server
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the server shard's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' loop = ')
+        repr_parts.append(repr(self.loop))
+        
+        repr_parts.append(', connection_count = ')
+        repr_parts.append(repr(self.get_connection_count()))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def get_connection_count(self):
+        """
+        Returns the amount of connections of the shard, including the ones dispatched, but not yet set up.
+        
+        Returns
+        -------
+        connection_count : `int`
+        """
+        return self.dispatched_count - self.closed_count
+    
+    
+    def _create_protocol(self):
+        """
+        Creates a protocol for a connection of the shard.
+        
+        Returns
+        -------
+        protocol : ``AbstractProtocolBase``
+        """
+        try:
+            return self.server.protocol_factory(self.loop)
+        except:
+            # The transport is not created, so `._detach` will not be called.
+            self.closed_count += 1
+            raise
+    
+    
+    def _dispatch(self, connection_socket, extra):
+        """
+        Sets up the given connection on the shard's event loop. Called by the accepting event loop.
+        
+        Parameters
+        ----------
+        connection_socket : `socket.socket`
+            The accepted connection.
+        
+        extra : `dict<str, object>`
+            Transport information.
+        """
+        self.dispatched_count += 1
+        self.loop.call_soon_thread_safe(self._set_up_connection, connection_socket, extra)
+    
+    
+    def _set_up_connection(self, connection_socket, extra):
+        """
+        Sets up the given connection. Called on the shard's event loop.
+        
+        Parameters
+        ----------
+        connection_socket : `socket.socket`
+            The accepted connection.
+        
+        extra : `dict<str, object>`
+            Transport information.
+        """
+        loop = self.loop
+        Task(
+            loop,
+            loop._accept_connection_task(
+                self._create_protocol, connection_socket, extra, self.server.ssl_context, self
+            ),
+        )
+    
+    
+    def _attach(self):
+        """
+        Called by the transports of the shard when created.
+        """
+        pass
+    
+    
+    def _detach(self):
+        """
+        Called by the transports of the shard when closed.
+        """
+        self.closed_count += 1
+
+
+class ShardedServer(RichAttributeErrorBaseType):
+    """
+    Tcp server, what accepts connections on 1 event loop and sets them up on the event loops of its shards.
+    
+    Attributes
+    ----------
+    _round_robin_index : `int`
+        The index of the shard to dispatch the next connection to when using round robin balancing.
+    
+    backlog : `int`
+        The maximum number of queued connections passed to `socket.listen()`.
+    
+    balancing : `str`
+        How the connections are distributed between the shards. Can be `'round_robin'` or `'least_connections'`.
+    
+    loop : ``EventThread``
+        The event loop accepting the connections.
+    
+    protocol_factory : `callable`
+        Called with the shard's event loop to create a protocol for each connection.
+    
+    server : ``Server``
+        The server holding the listening sockets. It is not started, its sockets are served by the sharded server.
+    
+    serving : `bool`
+        Whether the server is serving.
+    
+    shards : `list<ServerShard>`
+        The shards of the server.
+    
+    ssl_context : `None | SSLContext`
+        Ssl context to use for the connections.
+    """
+    __slots__ = (
+        '_round_robin_index', 'backlog', 'balancing', 'loop', 'protocol_factory', 'server', 'serving', 'shards',
+        'ssl_context'
+    )
+    
+    async def __new__(
+        cls,
+        loop,
+        loops,
+        protocol_factory,
+        host,
+        port,
+        *,
+        backlog = 100,
+        balancing = BALANCING_ROUND_ROBIN,
+        ssl_context = None,
+        **server_keyword_parameters,
+    ):
+        """
+        Creates a new sharded server and starts serving.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        loop : ``EventThread``
+            The event loop accepting the connections.
+        
+        loops : `iterable<EventThread>`, ``EventThreadPool``
+            The event loops to set up the connections on.
+        
+        protocol_factory : `callable`
+            Called with the shard's event loop to create a protocol for each connection.
+        
+        host : `None | str | iterable<None | str>`
+            To what network interfaces should the server be bound.
+        
+        port : `None | int`
+            The port to use by the `host`(s).
+        
+        backlog : `int` = `100`, Optional (Keyword only)
+            The maximum number of queued connections passed to `socket.listen()`.
+        
+        balancing : `str` = `'round_robin'`, Optional (Keyword only)
+            How the connections should be distributed between the shards.
+            Can be `'round_robin'` or `'least_connections'`.
+        
+        ssl_context : `None | SSLContext` = `None`, Optional (Keyword only)
+            Ssl context to use for the connections.
+        
+        **server_keyword_parameters : Keyword parameters
+            Additional keyword parameters to create the server with. See ``EventThread.create_server_to``.
+        
+        Raises
+        ------
+        TypeError
+            - If a parameter's type is incorrect.
+        ValueError
+            - If a parameter's value is incorrect.
+        OsError
+            Error while attempting to binding to address.
+        """
+        if not callable(protocol_factory):
+            raise TypeError(
+                f'`protocol_factory` can be `callable`, got {type(protocol_factory).__name__}; {protocol_factory!r}.'
+            )
+        
+        if not isinstance(balancing, str):
+            raise TypeError(
+                f'`balancing` can be `str`, got {type(balancing).__name__}; {balancing!r}.'
+            )
+        
+        if balancing not in BALANCINGS:
+            raise ValueError(
+                f'`balancing` can be any of {BALANCINGS!r}, got {balancing!r}.'
+            )
+        
+        loops = [*loops]
+        if not loops:
+            raise ValueError(
+                f'`loops` cannot be empty, got {loops!r}.'
+            )
+        
+        server = await loop.create_server_to(
+            protocol_factory, host, port, backlog = backlog, **server_keyword_parameters
+        )
+        
+        self = object.__new__(cls)
+        self._round_robin_index = 0
+        self.backlog = backlog
+        self.balancing = balancing
+        self.loop = loop
+        self.protocol_factory = protocol_factory
+        self.server = server
+        self.serving = False
+        self.shards = [ServerShard(self, shard_loop) for shard_loop in loops]
+        self.ssl_context = ssl_context
+        
+        self.start()
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the sharded server's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        if self.serving:
+            repr_parts.append(' serving')
+        
+        repr_parts.append(' shard_count = ')
+        repr_parts.append(repr(len(self.shards)))
+        
+        repr_parts.append(', balancing = ')
+        repr_parts.append(repr(self.balancing))
+        
+        repr_parts.append(', connection_count = ')
+        repr_parts.append(repr(self.get_connection_count()))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def get_connection_count(self):
+        """
+        Returns the amount of connections of the server.
+        
+        Returns
+        -------
+        connection_count : `int`
+        """
+        return sum(shard.get_connection_count() for shard in self.shards)
+    
+    
+    def is_serving(self):
+        """
+        Returns whether the server is serving.
+        
+        Returns
+        -------
+        is_serving : `bool`
+        """
+        return self.serving
+    
+    
+    def start(self):
+        """
+        Starts serving the listening sockets. Should be called from the accepting event loop.
+        """
+        if self.serving:
+            return
+        
+        sockets = self.server.sockets
+        if sockets is None:
+            return
+        
+        self.serving = True
+        
+        for socket in sockets:
+            socket.listen(self.backlog)
+            self._start_serving(socket)
+    
+    
+    def close(self):
+        """
+        Stops serving and closes the listening sockets. The already accepted connections are not closed.
+        Should be called from the accepting event loop.
+        """
+        self.serving = False
+        self.server.close()
+    
+    
+    def _start_serving(self, socket):
+        """
+        Adds the accepting reader callback of the given listening socket.
+        
+        Parameters
+        ----------
+        socket : `socket.socket`
+            The listening socket.
+        """
+        if self.serving:
+            self.loop.add_reader(socket.fileno(), self._accept_connections, socket)
+    
+    
+    def _select_shard(self):
+        """
+        Selects the shard to dispatch the next connection to.
+        
+        Returns
+        -------
+        shard : ``ServerShard``
+        """
+        shards = self.shards
+        
+        if self.balancing == BALANCING_LEAST_CONNECTIONS:
+            selected_shard = shards[0]
+            selected_connection_count = selected_shard.get_connection_count()
+            
+            for shard in shards:
+                connection_count = shard.get_connection_count()
+                if connection_count < selected_connection_count:
+                    selected_shard = shard
+                    selected_connection_count = connection_count
+            
+            return selected_shard
+        
+        round_robin_index = self._round_robin_index
+        self._round_robin_index = (round_robin_index + 1) % len(shards)
+        return shards[round_robin_index]
+    
+    
+    def _accept_connections(self, socket):
+        """
+        Accepts the waiting connections of the given listening socket and dispatches them to the shards.
+        
+        Parameters
+        ----------
+        socket : `socket.socket`
+            The listening socket.
+        """
+        loop = self.loop
+        
+        for _ in range(self.backlog):
+            try:
+                connection_socket, address = socket.accept()
+                connection_socket.setblocking(False)
+            except (BlockingIOError, InterruptedError, ConnectionAbortedError):
+                return
+            
+            except OSError as err:
+                if err.errno not in (errno.EMFILE, errno.ENFILE, errno.ENOBUFS, errno.ENOMEM):
+                    raise
+                
+                # Out of resources, retry later.
+                loop.remove_reader(socket.fileno())
+                loop.call_after(1.0, self._start_serving, socket)
+                
+                write_exception_async(
+                    err,
+                    [
+                        'Exception occurred at ',
+                        type(self).__name__,
+                        '._accept_connections\n',
+                    ],
+                    loop = loop,
+                )
+                return
+            
+            self._select_shard()._dispatch(connection_socket, {'peer_name': address})
@@ -0,0 +1,247 @@
+__all__ = ('SupervisedWorker',)
+
+from os import read as read_file_descriptor, set_blocking, write as write_file_descriptor
+
+from ..core import Future, LOOP_TIME
+from ..utils import RichAttributeErrorBaseType, to_json
+
+
+WORKER_MESSAGE_TYPE_HEARTBEAT = 'heartbeat'
+WORKER_MESSAGE_TYPE_READY = 'ready'
+
+
+class SupervisedWorker(RichAttributeErrorBaseType):
+    """
+    Represents the current worker process inside of it. Passed to the worker function of ``WorkerSupervisor``.
+    
+    The worker reports to its supervisor through a pipe. It sends a heartbeat in every `heartbeat_interval` with the
+    stats returned by ``.stats_collector`` and tells when it is ready to serve. When the supervisor closes its side of
+    the control pipe (or dies), ``.wait_for_stop`` returns.
+    
+    Attributes
+    ----------
+    _control_file_descriptor : `int`
+        File descriptor of the control pipe's reading end.
+    
+    _report_file_descriptor : `int`
+        File descriptor of the report pipe's writing end.
+    
+    _stop_waiter : ``Future``
+        Future, which's result is set when the worker should stop.
+    
+    generation : `int`
+        The worker's generation. Incremented on every reload of the supervisor.
+    
+    heartbeat_cycler : ``None | Cycler``
+        The cycler sending the heartbeats. Set only meanwhile the worker is running.
+    
+    index : `int`
+        The worker's index inside of its generation.
+    
+    loop : ``EventThread``
+        The event loop of the worker.
+    
+    ready : `bool`
+        Whether the worker told its supervisor that it is ready to serve.
+    
+    started_at : `float`
+        The loop time when the worker was started.
+    
+    stats_collector : `None | FunctionType`
+        Function returning the stats of the worker as a `dict` of json serializable values. Called on every heartbeat.
+    """
+    __slots__ = (
+        '_control_file_descriptor', '_report_file_descriptor', '_stop_waiter', 'generation', 'heartbeat_cycler',
+        'index', 'loop', 'ready', 'started_at', 'stats_collector'
+    )
+    
+    def __new__(cls, loop, index, generation, control_file_descriptor, report_file_descriptor):
+        """
+        Creates a new supervised worker.
+        
+        Parameters
+        ----------
+        loop : ``EventThread``
+            The event loop of the worker.
+        
+        index : `int`
+            The worker's index inside of its generation.
+        
+        generation : `int`
+            The worker's generation.
+        
+        control_file_descriptor : `int`
+            File descriptor of the control pipe's reading end.
+        
+        report_file_descriptor : `int`
+            File descriptor of the report pipe's writing end.
+        """
+        self = object.__new__(cls)
+        self._control_file_descriptor = control_file_descriptor
+        self._report_file_descriptor = report_file_descriptor
+        self._stop_waiter = Future(loop)
+        self.generation = generation
+        self.heartbeat_cycler = None
+        self.index = index
+        self.loop = loop
+        self.ready = False
+        self.started_at = LOOP_TIME()
+        self.stats_collector = None
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the worker's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' index = ')
+        repr_parts.append(repr(self.index))
+        
+        repr_parts.append(', generation = ')
+        repr_parts.append(repr(self.generation))
+        
+        if self.ready:
+            repr_parts.append(', ready')
+        
+        if self.is_stopping():
+            repr_parts.append(', stopping')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def _start(self, heartbeat_interval):
+        """
+        Starts watching the control pipe and sending heartbeats.
+        
+        Should be called from the worker's event loop.
+        
+        Parameters
+        ----------
+        heartbeat_interval : `float`
+            Interval between two heartbeats.
+        """
+        set_blocking(self._report_file_descriptor, False)
+        set_blocking(self._control_file_descriptor, False)
+        self.loop.add_reader(self._control_file_descriptor, self._control_readable)
+        self.heartbeat_cycler = self.loop.cycle(heartbeat_interval, self._send_heartbeat)
+        self.send_heartbeat()
+    
+    
+    def _stop(self):
+        """
+        Stops sending heartbeats and watching the control pipe.
+        
+        The pipes are left open, so the supervisor detects the worker's exit by the closing of the report pipe.
+        
+        Should be called from the worker's event loop.
+        """
+        heartbeat_cycler = self.heartbeat_cycler
+        if heartbeat_cycler is None:
+            return
+        
+        self.heartbeat_cycler = None
+        heartbeat_cycler.cancel()
+        
+        if not self._stop_waiter.is_done():
+            self.loop.remove_reader(self._control_file_descriptor)
+    
+    
+    def set_ready(self):
+        """
+        Tells the supervisor that the worker is ready to serve. Call it after the server is bound.
+        
+        On reload the workers of the previous generation are stopped only after every worker of the new generation
+        is ready.
+        """
+        if self.ready:
+            return
+        
+        self.ready = True
+        self._send_message(WORKER_MESSAGE_TYPE_READY, None)
+    
+    
+    def is_stopping(self):
+        """
+        Returns whether the worker should stop.
+        
+        Returns
+        -------
+        is_stopping : `bool`
+        """
+        return self._stop_waiter.is_done()
+    
+    
+    async def wait_for_stop(self):
+        """
+        Waits till the supervisor tells the worker to stop.
+        
+        This method is a coroutine.
+        """
+        await self._stop_waiter
+    
+    
+    def _control_readable(self):
+        """
+        Called when the control pipe is readable. The supervisor writes nothing into it, so it is readable only when
+        it is closed.
+        """
+        try:
+            data = read_file_descriptor(self._control_file_descriptor, 1)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b''
+        
+        if not data:
+            self.loop.remove_reader(self._control_file_descriptor)
+            self._stop_waiter.set_result_if_pending(None)
+    
+    
+    def _send_heartbeat(self, cycler):
+        """
+        Sends a heartbeat. Called by ``.heartbeat_cycler``.
+        
+        Parameters
+        ----------
+        cycler : ``Cycler``
+            The cycler calling the worker.
+        """
+        self.send_heartbeat()
+    
+    
+    def send_heartbeat(self):
+        """
+        Sends a heartbeat to the supervisor with the worker's current stats.
+        """
+        stats_collector = self.stats_collector
+        if stats_collector is None:
+            stats = None
+        else:
+            stats = stats_collector()
+        
+        self._send_message(WORKER_MESSAGE_TYPE_HEARTBEAT, stats)
+    
+    
+    def _send_message(self, message_type, stats):
+        """
+        Sends a message to the supervisor.
+        
+        If the report pipe is full, the message is dropped, the supervisor will notice the missing heartbeats anyways.
+        
+        Parameters
+        ----------
+        message_type : `str`
+            The message's type.
+        
+        stats : `None | dict<str, object>`
+            The worker's stats.
+        """
+        message = {'type': message_type}
+        if (stats is not None):
+            message['stats'] = stats
+        
+        try:
+            write_file_descriptor(self._report_file_descriptor, (to_json(message) + '\n').encode())
+        except (BlockingIOError, BrokenPipeError):
+            pass
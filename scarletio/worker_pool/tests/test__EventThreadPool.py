@@ -0,0 +1,120 @@
+import vampytest
+
+from ...core import EventThread, get_event_loop
+from ...http_client import HTTPClient
+
+from ..event_thread_pool import EventThreadPool
+
+
+def _assert_fields_set(event_thread_pool):
+    """
+    Asserts whether every fields are set of the given event thread pool.
+    
+    Parameters
+    ----------
+    event_thread_pool : ``EventThreadPool``
+        The event thread pool to check.
+    """
+    vampytest.assert_instance(event_thread_pool, EventThreadPool)
+    vampytest.assert_instance(event_thread_pool._http_clients, dict)
+    vampytest.assert_instance(event_thread_pool.loops, list)
+
+
+def test__EventThreadPool__new():
+    """
+    Tests whether ``EventThreadPool.__new__`` works as intended.
+    """
+    event_thread_pool = EventThreadPool(2, name = 'koishi')
+    try:
+        _assert_fields_set(event_thread_pool)
+        
+        vampytest.assert_eq(len(event_thread_pool.loops), 2)
+        for index, loop in enumerate(event_thread_pool.loops):
+            vampytest.assert_instance(loop, EventThread)
+            vampytest.assert_eq(loop.name, f'koishi-{index}')
+            vampytest.assert_true(loop.running)
+    finally:
+        event_thread_pool.stop()
+
+
+def _iter_options__new__type_error():
+    yield 'a', {}
+    yield 1, {'name': 12}
+
+
+def _iter_options__new__value_error():
+    yield 0, {}
+
+
+@vampytest._(vampytest.call_from(_iter_options__new__type_error()).raising(TypeError))
+@vampytest._(vampytest.call_from(_iter_options__new__value_error()).raising(ValueError))
+def test__EventThreadPool__new__error(loop_count, keyword_parameters):
+    """
+    Tests whether ``EventThreadPool.__new__`` raises the correct errors.
+    
+    Parameters
+    ----------
+    loop_count : `object`
+        The amount of event loops to start.
+    
+    keyword_parameters : `dict<str, object>`
+        Additional keyword parameters to create the instance with.
+    
+    Raises
+    ------
+    TypeError
+    ValueError
+    """
+    EventThreadPool(loop_count, **keyword_parameters)
+
+
+def test__EventThreadPool__repr():
+    """
+    Tests whether ``EventThreadPool.__repr__`` works as intended.
+    """
+    event_thread_pool = EventThreadPool(1)
+    try:
+        output = repr(event_thread_pool)
+        vampytest.assert_instance(output, str)
+        vampytest.assert_in(type(event_thread_pool).__name__, output)
+    finally:
+        event_thread_pool.stop()
+
+
+def test__EventThreadPool__iter():
+    """
+    Tests whether ``EventThreadPool.__iter__`` and ``.__len__`` work as intended.
+    """
+    event_thread_pool = EventThreadPool(2)
+    try:
+        vampytest.assert_eq(len(event_thread_pool), 2)
+        vampytest.assert_eq([*event_thread_pool], event_thread_pool.loops)
+    finally:
+        event_thread_pool.stop()
+
+
+async def test__EventThreadPool__get_http_client():
+    """
+    Tests whether ``EventThreadPool.get_http_client`` works as intended.
+    
+    This function is a coroutine.
+    """
+    event_thread_pool = EventThreadPool(2)
+    try:
+        loop_0, loop_1 = event_thread_pool.loops
+        
+        http_client_0 = event_thread_pool.get_http_client(loop_0)
+        vampytest.assert_instance(http_client_0, HTTPClient)
+        vampytest.assert_is(http_client_0.loop, loop_0)
+        vampytest.assert_is(event_thread_pool.get_http_client(loop_0), http_client_0)
+        
+        http_client_1 = event_thread_pool.get_http_client(loop_1)
+        vampytest.assert_is(http_client_1.loop, loop_1)
+        vampytest.assert_is_not(http_client_0, http_client_1)
+        
+        with vampytest.assert_raises(ValueError):
+            event_thread_pool.get_http_client(get_event_loop())
+    finally:
+        event_thread_pool.stop()
+    
+    vampytest.assert_eq(event_thread_pool._http_clients, {})
@@ -0,0 +1,144 @@
+from socket import create_connection
+
+import vampytest
+
+from ...core import ReadWriteProtocolBase, get_event_loop, sleep
+
+from ..event_thread_pool import EventThreadPool
+from ..sharded_server import ServerShard, ShardedServer
+
+
+def _assert_fields_set(sharded_server):
+    """
+    Asserts whether every fields are set of the given sharded server.
+    
+    Parameters
+    ----------
+    sharded_server : ``ShardedServer``
+        The sharded server to check.
+    """
+    vampytest.assert_instance(sharded_server, ShardedServer)
+    vampytest.assert_instance(sharded_server._round_robin_index, int)
+    vampytest.assert_instance(sharded_server.backlog, int)
+    vampytest.assert_instance(sharded_server.balancing, str)
+    vampytest.assert_instance(sharded_server.serving, bool)
+    vampytest.assert_instance(sharded_server.shards, list)
+
+
+async def _wait_for(check):
+    """
+    Waits till the given check passes.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    check : `callable`
+        The check to pass.
+    """
+    loop = get_event_loop()
+    for _ in range(200):
+        if check():
+            return
+        
+        await sleep(0.01, loop)
+    
+    raise AssertionError('Timed out.')
+
+
+def _iter_options():
+    yield 'round_robin', [(1, 0), (1, 1), (2, 1), (2, 2)]
+    yield 'least_connections', [(1, 0), (1, 1), (2, 1), (2, 2)]
+
+
+@vampytest._(vampytest.call_from(_iter_options()))
+async def test__ShardedServer__serving(balancing, expected_connection_counts):
+    """
+    Tests whether ``ShardedServer`` dispatches the connections between its shards.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    balancing : `str`
+        How the connections are distributed between the shards.
+    
+    expected_connection_counts : `list<(int, int)>`
+        The expected connection counts of the shards after each new connection.
+    
+    Raises
+    ------
+    AssertionError
+    """
+    loop = get_event_loop()
+    event_thread_pool = EventThreadPool(2)
+    
+    sharded_server = None
+    connections = []
+    try:
+        sharded_server = await ShardedServer(
+            loop, event_thread_pool, ReadWriteProtocolBase, '127.0.0.1', 0, balancing = balancing
+        )
+        _assert_fields_set(sharded_server)
+        vampytest.assert_true(sharded_server.is_serving())
+        
+        output = repr(sharded_server)
+        vampytest.assert_instance(output, str)
+        vampytest.assert_in(type(sharded_server).__name__, output)
+        
+        for shard, shard_loop in zip(sharded_server.shards, event_thread_pool.loops):
+            vampytest.assert_instance(shard, ServerShard)
+            vampytest.assert_is(shard.loop, shard_loop)
+        
+        port = next(iter(sharded_server.server.sockets)).getsockname()[1]
+        
+        for connection_counts in expected_connection_counts:
+            connections.append(create_connection(('127.0.0.1', port)))
+            await _wait_for(
+                lambda: (
+                    sum(shard.closed_count for shard in sharded_server.shards) == 0 and
+                    tuple(shard.dispatched_count for shard in sharded_server.shards) == connection_counts
+                )
+            )
+            vampytest.assert_eq(
+                tuple(shard.get_connection_count() for shard in sharded_server.shards),
+                connection_counts,
+            )
+        
+        vampytest.assert_eq(sharded_server.get_connection_count(), len(expected_connection_counts))
+        
+        while connections:
+            connections.pop().close()
+        
+        await _wait_for(lambda: sharded_server.get_connection_count() == 0)
+    
+    finally:
+        for connection in connections:
+            connection.close()
+        
+        if (sharded_server is not None):
+            sharded_server.close()
+            vampytest.assert_false(sharded_server.is_serving())
+        
+        event_thread_pool.stop()
+
+
+async def test__ShardedServer__new__error():
+    """
+    Tests whether ``ShardedServer.__new__`` raises the correct errors.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    
+    with vampytest.assert_raises(TypeError):
+        await ShardedServer(loop, [loop], 12, '127.0.0.1', 0)
+    
+    with vampytest.assert_raises(TypeError):
+        await ShardedServer(loop, [loop], ReadWriteProtocolBase, '127.0.0.1', 0, balancing = 12)
+    
+    with vampytest.assert_raises(ValueError):
+        await ShardedServer(loop, [loop], ReadWriteProtocolBase, '127.0.0.1', 0, balancing = 'random')
+    
+    with vampytest.assert_raises(ValueError):
+        await ShardedServer(loop, [], ReadWriteProtocolBase, '127.0.0.1', 0)
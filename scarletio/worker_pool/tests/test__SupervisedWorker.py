@@ -0,0 +1,92 @@
+from os import close as close_file_descriptor, pipe, read as read_file_descriptor, set_blocking
+
+import vampytest
+
+from ...core import Cycler, get_event_loop, sleep
+
+from ..supervised_worker import SupervisedWorker
+from ..worker_process import WorkerProcess
+
+
+def _assert_fields_set(worker):
+    """
+    Asserts whether every fields are set of the given worker.
+    
+    Parameters
+    ----------
+    worker : ``SupervisedWorker``
+        The worker to check.
+    """
+    vampytest.assert_instance(worker, SupervisedWorker)
+    vampytest.assert_instance(worker.generation, int)
+    vampytest.assert_instance(worker.heartbeat_cycler, Cycler, nullable = True)
+    vampytest.assert_instance(worker.index, int)
+    vampytest.assert_instance(worker.ready, bool)
+    vampytest.assert_instance(worker.started_at, float)
+
+
+async def test__SupervisedWorker__new():
+    """
+    Tests whether ``SupervisedWorker.__new__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    worker = SupervisedWorker(loop, 2, 3, -1, -1)
+    _assert_fields_set(worker)
+    
+    vampytest.assert_is(worker.loop, loop)
+    vampytest.assert_eq(worker.index, 2)
+    vampytest.assert_eq(worker.generation, 3)
+    vampytest.assert_is(worker.stats_collector, None)
+
+
+async def test__SupervisedWorker__repr():
+    """
+    Tests whether ``SupervisedWorker.__repr__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    worker = SupervisedWorker(get_event_loop(), 2, 3, -1, -1)
+    
+    output = repr(worker)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(worker).__name__, output)
+
+
+async def test__SupervisedWorker__reporting():
+    """
+    Tests whether ``SupervisedWorker`` reports to its supervisor and stops when its control pipe is closed.
+    
+    This function is a coroutine.
+    """
+    loop = get_event_loop()
+    control_read_file_descriptor, control_write_file_descriptor = pipe()
+    report_read_file_descriptor, report_write_file_descriptor = pipe()
+    set_blocking(report_read_file_descriptor, False)
+    
+    worker = SupervisedWorker(loop, 2, 3, control_read_file_descriptor, report_write_file_descriptor)
+    worker_process = WorkerProcess(0, 2, 3, control_write_file_descriptor, report_read_file_descriptor, 0.0)
+    
+    try:
+        worker.stats_collector = lambda : {'web_sockets': 5}
+        worker._start(60.0)
+        worker.set_ready()
+        
+        worker_process.feed(read_file_descriptor(report_read_file_descriptor, 65536), 1.0)
+        vampytest.assert_true(worker_process.ready)
+        vampytest.assert_eq(worker_process.stats, {'web_sockets': 5})
+        
+        vampytest.assert_false(worker.is_stopping())
+        worker_process.close_control()
+        await sleep(0.01, loop)
+        vampytest.assert_true(worker.is_stopping())
+        await worker.wait_for_stop()
+    
+    finally:
+        worker._stop()
+        vampytest.assert_is(worker.heartbeat_cycler, None)
+        worker_process.close_control()
+        close_file_descriptor(control_read_file_descriptor)
+        close_file_descriptor(report_read_file_descriptor)
+        close_file_descriptor(report_write_file_descriptor)
@@ -0,0 +1,114 @@
+from os import close as close_file_descriptor, pipe, read as read_file_descriptor
+
+import vampytest
+
+from ..worker_process import WorkerProcess
+
+
+def _assert_fields_set(worker_process):
+    """
+    Asserts whether every fields are set of the given worker process.
+    
+    Parameters
+    ----------
+    worker_process : ``WorkerProcess``
+        The worker process to check.
+    """
+    vampytest.assert_instance(worker_process, WorkerProcess)
+    vampytest.assert_instance(worker_process.control_file_descriptor, int)
+    vampytest.assert_instance(worker_process.generation, int)
+    vampytest.assert_instance(worker_process.index, int)
+    vampytest.assert_instance(worker_process.last_heartbeat, float)
+    vampytest.assert_instance(worker_process.pid, int)
+    vampytest.assert_instance(worker_process.ready, bool)
+    vampytest.assert_instance(worker_process.report_buffer, bytes)
+    vampytest.assert_instance(worker_process.report_file_descriptor, int)
+    vampytest.assert_instance(worker_process.started_at, float)
+    vampytest.assert_instance(worker_process.stats, dict, nullable = True)
+    vampytest.assert_instance(worker_process.stop_deadline, float, nullable = True)
+
+
+def test__WorkerProcess__new():
+    """
+    Tests whether ``WorkerProcess.__new__`` works as intended.
+    """
+    worker_process = WorkerProcess(100, 2, 3, -1, -1, 10.0)
+    _assert_fields_set(worker_process)
+    
+    vampytest.assert_eq(worker_process.pid, 100)
+    vampytest.assert_eq(worker_process.index, 2)
+    vampytest.assert_eq(worker_process.generation, 3)
+    vampytest.assert_eq(worker_process.started_at, 10.0)
+    vampytest.assert_eq(worker_process.last_heartbeat, 10.0)
+
+
+def test__WorkerProcess__repr():
+    """
+    Tests whether ``WorkerProcess.__repr__`` works as intended.
+    """
+    worker_process = WorkerProcess(100, 2, 3, -1, -1, 10.0)
+    
+    output = repr(worker_process)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(worker_process).__name__, output)
+
+
+def test__WorkerProcess__feed():
+    """
+    Tests whether ``WorkerProcess.feed`` works as intended.
+    """
+    worker_process = WorkerProcess(100, 2, 3, -1, -1, 10.0)
+    
+    worker_process.feed(b'{"type": "heartbeat", "stats": {"web_sockets": 2}}\n{"type": "rea', 11.0)
+    vampytest.assert_eq(worker_process.stats, {'web_sockets': 2})
+    vampytest.assert_false(worker_process.ready)
+    vampytest.assert_eq(worker_process.last_heartbeat, 11.0)
+    
+    worker_process.feed(b'dy"}\nnot json\n', 12.0)
+    vampytest.assert_true(worker_process.ready)
+    vampytest.assert_eq(worker_process.last_heartbeat, 12.0)
+    vampytest.assert_eq(worker_process.report_buffer, b'')
+
+
+def test__WorkerProcess__request_stop():
+    """
+    Tests whether ``WorkerProcess.request_stop`` works as intended.
+    """
+    read_file_descriptor_, write_file_descriptor_ = pipe()
+    try:
+        worker_process = WorkerProcess(100, 2, 3, write_file_descriptor_, -1, 10.0)
+        
+        worker_process.request_stop(20.0)
+        vampytest.assert_eq(worker_process.stop_deadline, 20.0)
+        vampytest.assert_eq(worker_process.control_file_descriptor, -1)
+        
+        # The reading end sees the pipe closed.
+        vampytest.assert_eq(read_file_descriptor(read_file_descriptor_, 1), b'')
+        
+        worker_process.request_stop(30.0)
+        vampytest.assert_eq(worker_process.stop_deadline, 20.0)
+    finally:
+        close_file_descriptor(read_file_descriptor_)
+
+
+def test__WorkerProcess__get_stats():
+    """
+    Tests whether ``WorkerProcess.get_stats`` works as intended.
+    """
+    worker_process = WorkerProcess(100, 2, 3, -1, -1, 10.0)
+    worker_process.feed(b'{"type": "heartbeat", "stats": {"web_sockets": 2}}\n', 11.0)
+    
+    output = worker_process.get_stats(15.0)
+    vampytest.assert_eq(
+        output,
+        {
+            'generation': 3,
+            'index': 2,
+            'last_heartbeat_age': 4.0,
+            'pid': 100,
+            'ready': False,
+            'stats': {'web_sockets': 2},
+            'stopping': False,
+            'uptime': 5.0,
+        },
+    )
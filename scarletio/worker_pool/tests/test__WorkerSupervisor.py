@@ -0,0 +1,146 @@
+import vampytest
+
+from ..worker_process import WorkerProcess
+from ..worker_supervisor import WorkerSupervisor
+
+
+async def worker_function(worker):
+    pass
+
+
+def _assert_fields_set(worker_supervisor):
+    """
+    Asserts whether every fields are set of the given worker supervisor.
+    
+    Parameters
+    ----------
+    worker_supervisor : ``WorkerSupervisor``
+        The worker supervisor to check.
+    """
+    vampytest.assert_instance(worker_supervisor, WorkerSupervisor)
+    vampytest.assert_instance(worker_supervisor._pending_restarts, list)
+    vampytest.assert_instance(worker_supervisor._reload_requested, bool)
+    vampytest.assert_instance(worker_supervisor._stop_requested, bool)
+    vampytest.assert_instance(worker_supervisor._wake_up_file_descriptor, int)
+    vampytest.assert_instance(worker_supervisor.generation, int)
+    vampytest.assert_instance(worker_supervisor.health_check_timeout, float)
+    vampytest.assert_instance(worker_supervisor.heartbeat_interval, float)
+    vampytest.assert_instance(worker_supervisor.restart_count, int)
+    vampytest.assert_instance(worker_supervisor.running, bool)
+    vampytest.assert_instance(worker_supervisor.stop_timeout, float)
+    vampytest.assert_instance(worker_supervisor.worker_count, int)
+    vampytest.assert_instance(worker_supervisor.workers, dict)
+
+
+def test__WorkerSupervisor__new():
+    """
+    Tests whether ``WorkerSupervisor.__new__`` works as intended.
+    """
+    worker_supervisor = WorkerSupervisor(worker_function, 4, heartbeat_interval = 2, stop_timeout = 5.0)
+    _assert_fields_set(worker_supervisor)
+    
+    vampytest.assert_is(worker_supervisor.worker_function, worker_function)
+    vampytest.assert_eq(worker_supervisor.worker_count, 4)
+    vampytest.assert_eq(worker_supervisor.heartbeat_interval, 2.0)
+    vampytest.assert_eq(worker_supervisor.health_check_timeout, 6.0)
+    vampytest.assert_eq(worker_supervisor.stop_timeout, 5.0)
+    vampytest.assert_is(worker_supervisor.stats_callback, None)
+
+
+def _iter_options__new__type_error():
+    yield (None, 4), {}
+    yield (worker_function, 4.0), {}
+    yield (worker_function, 4), {'heartbeat_interval': '2'}
+    yield (worker_function, 4), {'health_check_timeout': '2'}
+    yield (worker_function, 4), {'stop_timeout': '2'}
+    yield (worker_function, 4), {'stats_callback': 2}
+
+
+def _iter_options__new__value_error():
+    yield (worker_function, 0), {}
+    yield (worker_function, 4), {'heartbeat_interval': 0.0}
+    yield (worker_function, 4), {'health_check_timeout': -1.0}
+    yield (worker_function, 4), {'stop_timeout': 0.0}
+
+
+@vampytest._(vampytest.call_from(_iter_options__new__type_error()).raising(TypeError))
+@vampytest._(vampytest.call_from(_iter_options__new__value_error()).raising(ValueError))
+def test__WorkerSupervisor__new__error(positional_parameters, keyword_parameters):
+    """
+    Tests whether ``WorkerSupervisor.__new__`` raises on invalid parameters.
+    
+    Parameters
+    ----------
+    positional_parameters : `tuple<object>`
+        Positional parameters to create the worker supervisor with.
+    
+    keyword_parameters : `dict<str, object>`
+        Keyword parameters to create the worker supervisor with.
+    
+    Raises
+    ------
+    TypeError
+    ValueError
+    """
+    WorkerSupervisor(*positional_parameters, **keyword_parameters)
+
+
+def test__WorkerSupervisor__repr():
+    """
+    Tests whether ``WorkerSupervisor.__repr__`` works as intended.
+    """
+    worker_supervisor = WorkerSupervisor(worker_function, 4)
+    
+    output = repr(worker_supervisor)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(worker_supervisor).__name__, output)
+
+
+def test__WorkerSupervisor__get_stats():
+    """
+    Tests whether ``WorkerSupervisor.get_stats`` works as intended.
+    """
+    worker_supervisor = WorkerSupervisor(worker_function, 2)
+    
+    worker_process_0 = WorkerProcess(100, 0, 0, -1, 10, 0.0)
+    worker_process_0.stats = {'web_sockets': 2, 'name': 'koishi', 'healthy': True}
+    worker_process_1 = WorkerProcess(101, 1, 0, -1, 11, 0.0)
+    worker_process_1.stats = {'web_sockets': 3, 'queue': 1.5}
+    worker_process_2 = WorkerProcess(102, 0, 0, -1, 12, 0.0)
+    
+    worker_supervisor.workers[10] = worker_process_0
+    worker_supervisor.workers[11] = worker_process_1
+    worker_supervisor.workers[12] = worker_process_2
+    
+    output = worker_supervisor.get_stats()
+    vampytest.assert_eq(output['generation'], 0)
+    vampytest.assert_eq(output['restart_count'], 0)
+    vampytest.assert_eq(output['total'], {'web_sockets': 5, 'queue': 1.5})
+    vampytest.assert_eq([worker_stats['pid'] for worker_stats in output['workers']], [100, 102, 101])
+
+
+def test__WorkerSupervisor__retire_previous_generations():
+    """
+    Tests whether ``WorkerSupervisor._retire_previous_generations`` works as intended.
+    """
+    worker_supervisor = WorkerSupervisor(worker_function, 2, stop_timeout = 5.0)
+    worker_supervisor.generation = 1
+    
+    worker_process_old = WorkerProcess(100, 0, 0, -1, 10, 0.0)
+    worker_process_new_0 = WorkerProcess(101, 0, 1, -1, 11, 0.0)
+    worker_process_new_1 = WorkerProcess(102, 1, 1, -1, 12, 0.0)
+    
+    worker_supervisor.workers[10] = worker_process_old
+    worker_supervisor.workers[11] = worker_process_new_0
+    worker_supervisor.workers[12] = worker_process_new_1
+    
+    # Not every new worker is ready.
+    worker_process_new_0.ready = True
+    worker_supervisor._retire_previous_generations(1.0)
+    vampytest.assert_is(worker_process_old.stop_deadline, None)
+    
+    worker_process_new_1.ready = True
+    worker_supervisor._retire_previous_generations(2.0)
+    vampytest.assert_eq(worker_process_old.stop_deadline, 7.0)
+    vampytest.assert_is(worker_process_new_0.stop_deadline, None)
+    vampytest.assert_is(worker_process_new_1.stop_deadline, None)
@@ -0,0 +1,200 @@
+__all__ = ('WorkerProcess',)
+
+from os import close as close_file_descriptor
+
+from ..utils import JSONDecodeError, RichAttributeErrorBaseType, from_json
+
+from .supervised_worker import WORKER_MESSAGE_TYPE_HEARTBEAT, WORKER_MESSAGE_TYPE_READY
+
+
+class WorkerProcess(RichAttributeErrorBaseType):
+    """
+    Represents a worker process inside of its ``WorkerSupervisor``.
+    
+    Attributes
+    ----------
+    control_file_descriptor : `int`
+        File descriptor of the control pipe's writing end. Set as `-1` after closed.
+    
+    generation : `int`
+        The worker's generation.
+    
+    index : `int`
+        The worker's index inside of its generation.
+    
+    last_heartbeat : `float`
+        When the last message was received from the worker (or when it was started).
+    
+    pid : `int`
+        The worker's process identifier.
+    
+    ready : `bool`
+        Whether the worker is ready to serve.
+    
+    report_buffer : `bytes`
+        Received, not yet processed data.
+    
+    report_file_descriptor : `int`
+        File descriptor of the report pipe's reading end.
+    
+    started_at : `float`
+        When the worker was started.
+    
+    stats : `None | dict<str, object>`
+        The last stats received from the worker.
+    
+    stop_deadline : `None | float`
+        Till when the worker is waited to exit after it was asked to stop. Set only after asked to stop.
+    """
+    __slots__ = (
+        'control_file_descriptor', 'generation', 'index', 'last_heartbeat', 'pid', 'ready', 'report_buffer',
+        'report_file_descriptor', 'started_at', 'stats', 'stop_deadline'
+    )
+    
+    def __new__(cls, pid, index, generation, control_file_descriptor, report_file_descriptor, now):
+        """
+        Creates a new worker process.
+        
+        Parameters
+        ----------
+        pid : `int`
+            The worker's process identifier.
+        
+        index : `int`
+            The worker's index inside of its generation.
+        
+        generation : `int`
+            The worker's generation.
+        
+        control_file_descriptor : `int`
+            File descriptor of the control pipe's writing end.
+        
+        report_file_descriptor : `int`
+            File descriptor of the report pipe's reading end.
+        
+        now : `float`
+            The current time.
+        """
+        self = object.__new__(cls)
+        self.control_file_descriptor = control_file_descriptor
+        self.generation = generation
+        self.index = index
+        self.last_heartbeat = now
+        self.pid = pid
+        self.ready = False
+        self.report_buffer = b''
+        self.report_file_descriptor = report_file_descriptor
+        self.started_at = now
+        self.stats = None
+        self.stop_deadline = None
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the worker process's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' pid = ')
+        repr_parts.append(repr(self.pid))
+        
+        repr_parts.append(', index = ')
+        repr_parts.append(repr(self.index))
+        
+        repr_parts.append(', generation = ')
+        repr_parts.append(repr(self.generation))
+        
+        if self.ready:
+            repr_parts.append(', ready')
+        
+        if (self.stop_deadline is not None):
+            repr_parts.append(', stopping')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def feed(self, data, now):
+        """
+        Processes the data received from the worker.
+        
+        Parameters
+        ----------
+        data : `bytes`
+            The received data.
+        
+        now : `float`
+            The current time.
+        """
+        lines = (self.report_buffer + data).split(b'\n')
+        self.report_buffer = lines.pop()
+        
+        for line in lines:
+            try:
+                message = from_json(line)
+            except JSONDecodeError:
+                continue
+            
+            if not isinstance(message, dict):
+                continue
+            
+            self.last_heartbeat = now
+            
+            message_type = message.get('type', None)
+            if message_type == WORKER_MESSAGE_TYPE_READY:
+                self.ready = True
+            
+            elif message_type == WORKER_MESSAGE_TYPE_HEARTBEAT:
+                stats = message.get('stats', None)
+                if (stats is None) or isinstance(stats, dict):
+                    self.stats = stats
+    
+    
+    def request_stop(self, deadline):
+        """
+        Asks the worker to stop by closing the control pipe.
+        
+        Parameters
+        ----------
+        deadline : `float`
+            Till when the worker is waited to exit.
+        """
+        if (self.stop_deadline is not None):
+            return
+        
+        self.stop_deadline = deadline
+        self.close_control()
+    
+    
+    def close_control(self):
+        """
+        Closes the control pipe's writing end if not yet closed.
+        """
+        control_file_descriptor = self.control_file_descriptor
+        if control_file_descriptor != -1:
+            self.control_file_descriptor = -1
+            close_file_descriptor(control_file_descriptor)
+    
+    
+    def get_stats(self, now):
+        """
+        Returns the worker's stats.
+        
+        Parameters
+        ----------
+        now : `float`
+            The current time.
+        
+        Returns
+        -------
+        stats : `dict<str, object>`
+        """
+        return {
+            'generation': self.generation,
+            'index': self.index,
+            'last_heartbeat_age': now - self.last_heartbeat,
+            'pid': self.pid,
+            'ready': self.ready,
+            'stats': self.stats,
+            'stopping': self.stop_deadline is not None,
+            'uptime': now - self.started_at,
+        }
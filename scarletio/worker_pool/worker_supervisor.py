@@ -0,0 +1,691 @@
+__all__ = ('WorkerSupervisor',)
+
+import signal as signal_module
+from os import close as close_file_descriptor, pipe, read as read_file_descriptor, set_blocking
+from os import write as write_file_descriptor
+from selectors import DefaultSelector, EVENT_READ
+from threading import current_thread, main_thread
+from time import monotonic
+
+from ..core import EventThread, write_exception_sync
+from ..utils import RichAttributeErrorBaseType, validate_duration
+
+from .supervised_worker import SupervisedWorker
+from .worker_process import WorkerProcess
+
+try:
+    from os import _exit as exit_process, fork, kill, waitpid
+    from signal import SIGHUP, SIGKILL
+except ImportError:
+    fork = None
+
+
+POLL_INTERVAL = 1.0
+RESTART_DELAY_MIN = 1.0
+
+
+class WorkerSupervisor(RichAttributeErrorBaseType):
+    """
+    Runs a server in multiple forked worker processes, each with its own event loop.
+    
+    The workers should bind the same address with `reuse_port = True`, so the kernel distributes the connections
+    between them.
+    
+    ```py
+    async def serve(worker):
+        server = await WebSocketServer(worker.loop, '0.0.0.0', 8080, handler, reuse_port = True)
+        worker.stats_collector = lambda : {'web_sockets': len(server.web_sockets)}
+        worker.set_ready()
+        await worker.wait_for_stop()
+        await server.close()
+    
+    WorkerSupervisor(serve, 4).run()
+    ```
+    
+    `SIGTERM` and `SIGINT` stop the supervisor gracefully, `SIGHUP` reloads it.
+    
+    Attributes
+    ----------
+    _pending_restarts : `list<(float, int, int)>`
+        `when` - `index` - `generation` items of workers to restart.
+    
+    _reload_requested : `bool`
+        Whether reload was requested.
+    
+    _stop_requested : `bool`
+        Whether stopping was requested.
+    
+    _wake_up_file_descriptor : `int`
+        File descriptor of the wake up pipe's writing end. Set as `-1` if the supervisor is not running.
+    
+    generation : `int`
+        The current generation of the workers.
+    
+    health_check_timeout : `float`
+        After how much time without heartbeat are the workers killed.
+    
+    heartbeat_interval : `float`
+        Interval between two heartbeats of the workers.
+    
+    restart_count : `int`
+        How much times workers were restarted, because they exited unexpectedly or were killed.
+    
+    running : `bool`
+        Whether the supervisor is running.
+    
+    stats_callback : `None | FunctionType`
+        Called in every `heartbeat_interval` with the aggregated stats.
+    
+    stop_timeout : `float`
+        How much time the workers have to exit after asked to stop, before they are killed.
+    
+    worker_count : `int`
+        The amount of workers to run.
+    
+    worker_function : `CoroutineFunctionType`
+        Coroutine function called with a ``SupervisedWorker`` inside of each worker process. The worker exits when it
+        returns.
+    
+    workers : `dict<int, WorkerProcess>`
+        The running workers by the file descriptor of their report pipe.
+    """
+    __slots__ = (
+        '_pending_restarts', '_reload_requested', '_stop_requested', '_wake_up_file_descriptor', 'generation',
+        'health_check_timeout', 'heartbeat_interval', 'restart_count', 'running', 'stats_callback', 'stop_timeout',
+        'worker_count', 'worker_function', 'workers'
+    )
+    
+    def __new__(
+        cls,
+        worker_function,
+        worker_count,
+        *,
+        health_check_timeout = None,
+        heartbeat_interval = 5.0,
+        stats_callback = None,
+        stop_timeout = 30.0,
+    ):
+        """
+        Creates a new worker supervisor.
+        
+        Parameters
+        ----------
+        worker_function : `CoroutineFunctionType`
+            Coroutine function called with a ``SupervisedWorker`` inside of each worker process.
+        
+        worker_count : `int`
+            The amount of workers to run.
+        
+        health_check_timeout : `None | float` = `None`, Optional (Keyword only)
+            After how much time without heartbeat are the workers killed. Defaults to 3 times `heartbeat_interval`.
+        
+        heartbeat_interval : `float` = `5.0`, Optional (Keyword only)
+            Interval between two heartbeats of the workers.
+        
+        stats_callback : `None | FunctionType` = `None`, Optional (Keyword only)
+            Called in every `heartbeat_interval` with the aggregated stats.
+        
+        stop_timeout : `float` = `30.0`, Optional (Keyword only)
+            How much time the workers have to exit after asked to stop, before they are killed.
+        
+        Raises
+        ------
+        TypeError
+            - If a parameter's type is incorrect.
+        ValueError
+            - If a parameter's value is incorrect.
+        """
+        if not callable(worker_function):
+            raise TypeError(
+                f'`worker_function` can be `callable`, got {type(worker_function).__name__}; {worker_function!r}.'
+            )
+        
+        if not isinstance(worker_count, int):
+            raise TypeError(
+                f'`worker_count` can be `int`, got {type(worker_count).__name__}; {worker_count!r}.'
+            )
+        
+        if worker_count <= 0:
+            raise ValueError(
+                f'`worker_count` cannot be `0` or less, got {worker_count!r}.'
+            )
+        
+        heartbeat_interval = validate_duration(heartbeat_interval, 'heartbeat_interval')
+        
+        if health_check_timeout is None:
+            health_check_timeout = heartbeat_interval * 3.0
+        else:
+            health_check_timeout = validate_duration(health_check_timeout, 'health_check_timeout')
+        
+        stop_timeout = validate_duration(stop_timeout, 'stop_timeout')
+        
+        if (stats_callback is not None) and (not callable(stats_callback)):
+            raise TypeError(
+                f'`stats_callback` can be `None`, `callable`, got {type(stats_callback).__name__}; {stats_callback!r}.'
+            )
+        
+        self = object.__new__(cls)
+        self._pending_restarts = []
+        self._reload_requested = False
+        self._stop_requested = False
+        self._wake_up_file_descriptor = -1
+        self.generation = 0
+        self.health_check_timeout = health_check_timeout
+        self.heartbeat_interval = heartbeat_interval
+        self.restart_count = 0
+        self.running = False
+        self.stats_callback = stats_callback
+        self.stop_timeout = stop_timeout
+        self.worker_count = worker_count
+        self.worker_function = worker_function
+        self.workers = {}
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the worker supervisor's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' worker_count = ')
+        repr_parts.append(repr(self.worker_count))
+        
+        repr_parts.append(', generation = ')
+        repr_parts.append(repr(self.generation))
+        
+        if self.running:
+            repr_parts.append(', running')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def stop(self):
+        """
+        Stops the supervisor gracefully. Can be called from signal handlers and from ``.stats_callback`` as well.
+        """
+        self._stop_requested = True
+        self._wake_up()
+    
+    
+    def reload(self):
+        """
+        Starts a new generation of workers and stops the current ones after every new worker is ready.
+        Can be called from signal handlers and from ``.stats_callback`` as well.
+        """
+        self._reload_requested = True
+        self._wake_up()
+    
+    
+    def _wake_up(self):
+        """
+        Wakes up the supervisor if it is waiting.
+        """
+        wake_up_file_descriptor = self._wake_up_file_descriptor
+        if wake_up_file_descriptor != -1:
+            try:
+                write_file_descriptor(wake_up_file_descriptor, b'\0')
+            except OSError:
+                pass
+    
+    
+    def get_stats(self):
+        """
+        Returns the stats of the supervisor and of its workers. Numeric stats of the workers are summed up.
+        
+        Returns
+        -------
+        stats : `dict<str, object>`
+        """
+        now = monotonic()
+        worker_stats = []
+        total = {}
+        
+        for worker in sorted(self.workers.values(), key = lambda worker: (worker.generation, worker.index)):
+            worker_stats.append(worker.get_stats(now))
+            
+            stats = worker.stats
+            if stats is None:
+                continue
+            
+            for key, value in stats.items():
+                if isinstance(value, (int, float)) and (not isinstance(value, bool)):
+                    total[key] = total.get(key, 0) + value
+        
+        return {
+            'generation': self.generation,
+            'restart_count': self.restart_count,
+            'total': total,
+            'workers': worker_stats,
+        }
+    
+    
+    def run(self):
+        """
+        Starts the workers and supervises them till the supervisor is stopped. Blocking.
+        
+        Should be called before any other thread is started in the process, since the workers are forked.
+        
+        Raises
+        ------
+        RuntimeError
+            - If forking is not supported on the platform.
+            - If the supervisor is already running.
+        """
+        if fork is None:
+            raise RuntimeError(
+                'Worker processes are not supported on this platform.'
+            )
+        
+        if self.running:
+            raise RuntimeError(
+                f'{type(self).__name__} is already running.'
+            )
+        
+        self.running = True
+        self._reload_requested = False
+        self._stop_requested = False
+        
+        wake_up_read_file_descriptor, wake_up_write_file_descriptor = pipe()
+        set_blocking(wake_up_read_file_descriptor, False)
+        set_blocking(wake_up_write_file_descriptor, False)
+        self._wake_up_file_descriptor = wake_up_write_file_descriptor
+        
+        selector = DefaultSelector()
+        selector.register(wake_up_read_file_descriptor, EVENT_READ)
+        
+        previous_signal_handlers = self._install_signal_handlers()
+        try:
+            now = monotonic()
+            for index in range(self.worker_count):
+                self._start_worker(selector, wake_up_read_file_descriptor, index, self.generation, now)
+            
+            next_stats_at = now + self.heartbeat_interval
+            
+            while True:
+                now = monotonic()
+                
+                if self._stop_requested:
+                    for worker in self.workers.values():
+                        worker.request_stop(now + self.stop_timeout)
+                    
+                    self._pending_restarts.clear()
+                    
+                    if not self.workers:
+                        break
+                
+                elif self._reload_requested:
+                    self._reload_requested = False
+                    self.generation += 1
+                    self._pending_restarts.clear()
+                    
+                    for index in range(self.worker_count):
+                        self._start_worker(selector, wake_up_read_file_descriptor, index, self.generation, now)
+                
+                self._check_workers(now)
+                self._restart_workers(selector, wake_up_read_file_descriptor, now)
+                self._retire_previous_generations(now)
+                
+                if now >= next_stats_at:
+                    next_stats_at = now + self.heartbeat_interval
+                    stats_callback = self.stats_callback
+                    if (stats_callback is not None):
+                        stats_callback(self.get_stats())
+                
+                for key, mask in selector.select(POLL_INTERVAL):
+                    file_descriptor = key.fileobj
+                    if file_descriptor == wake_up_read_file_descriptor:
+                        try:
+                            read_file_descriptor(wake_up_read_file_descriptor, 4096)
+                        except BlockingIOError:
+                            pass
+                        continue
+                    
+                    self._read_report(selector, self.workers[file_descriptor])
+        
+        finally:
+            self._restore_signal_handlers(previous_signal_handlers)
+            
+            for worker in [*self.workers.values()]:
+                try:
+                    kill(worker.pid, SIGKILL)
+                except ProcessLookupError:
+                    pass
+                
+                self._remove_worker(selector, worker)
+            
+            selector.close()
+            self._wake_up_file_descriptor = -1
+            close_file_descriptor(wake_up_read_file_descriptor)
+            close_file_descriptor(wake_up_write_file_descriptor)
+            self._pending_restarts.clear()
+            self.running = False
+    
+    
+    def _install_signal_handlers(self):
+        """
+        Installs the signal handlers of the supervisor if called from the main thread.
+        
+        Returns
+        -------
+        previous_signal_handlers : `None | list<(int, object)>`
+        """
+        if current_thread() is not main_thread():
+            return None
+        
+        previous_signal_handlers = []
+        
+        for signal, handler in (
+            (signal_module.SIGINT, self._handle_stop_signal),
+            (signal_module.SIGTERM, self._handle_stop_signal),
+            (SIGHUP, self._handle_reload_signal),
+        ):
+            previous_signal_handlers.append((signal, signal_module.signal(signal, handler)))
+        
+        return previous_signal_handlers
+    
+    
+    def _restore_signal_handlers(self, previous_signal_handlers):
+        """
+        Restores the signal handlers replaced by ``._install_signal_handlers``.
+        
+        Parameters
+        ----------
+        previous_signal_handlers : `None | list<(int, object)>`
+            The signal handlers to restore.
+        """
+        if previous_signal_handlers is None:
+            return
+        
+        for signal, handler in previous_signal_handlers:
+            signal_module.signal(signal, handler)
+    
+    
+    def _handle_stop_signal(self, signal, frame):
+        """
+        Handles `SIGINT` and `SIGTERM`.
+        
+        Parameters
+        ----------
+        signal : `int`
+            The received signal.
+        
+        frame : `None | FrameType`
+            The interrupted frame.
+        """
+        self.stop()
+    
+    
+    def _handle_reload_signal(self, signal, frame):
+        """
+        Handles `SIGHUP`.
+        
+        Parameters
+        ----------
+        signal : `int`
+            The received signal.
+        
+        frame : `None | FrameType`
+            The interrupted frame.
+        """
+        self.reload()
+    
+    
+    def _start_worker(self, selector, wake_up_read_file_descriptor, index, generation, now):
+        """
+        Forks a new worker process.
+        
+        Parameters
+        ----------
+        selector : `selectors.BaseSelector`
+            The supervisor's selector.
+        
+        wake_up_read_file_descriptor : `int`
+            File descriptor of the wake up pipe's reading end.
+        
+        index : `int`
+            The worker's index inside of its generation.
+        
+        generation : `int`
+            The worker's generation.
+        
+        now : `float`
+            The current time.
+        """
+        control_read_file_descriptor, control_write_file_descriptor = pipe()
+        report_read_file_descriptor, report_write_file_descriptor = pipe()
+        
+        pid = fork()
+        if not pid:
+            exit_code = 1
+            try:
+                # Close the file descriptors of the supervisor, so only the supervisor holds the other workers' pipes.
+                selector.close()
+                close_file_descriptor(wake_up_read_file_descriptor)
+                close_file_descriptor(self._wake_up_file_descriptor)
+                close_file_descriptor(control_write_file_descriptor)
+                close_file_descriptor(report_read_file_descriptor)
+                
+                for worker in self.workers.values():
+                    worker.close_control()
+                    close_file_descriptor(worker.report_file_descriptor)
+                
+                # The supervisor is the one who handles the signals of the terminal.
+                signal_module.signal(signal_module.SIGINT, signal_module.SIG_IGN)
+                signal_module.signal(signal_module.SIGTERM, signal_module.SIG_DFL)
+                signal_module.signal(SIGHUP, signal_module.SIG_IGN)
+                
+                exit_code = self._run_worker(
+                    index, generation, control_read_file_descriptor, report_write_file_descriptor
+                )
+            finally:
+                exit_process(exit_code)
+        
+        close_file_descriptor(control_read_file_descriptor)
+        close_file_descriptor(report_write_file_descriptor)
+        set_blocking(report_read_file_descriptor, False)
+        
+        worker = WorkerProcess(
+            pid, index, generation, control_write_file_descriptor, report_read_file_descriptor, now
+        )
+        self.workers[report_read_file_descriptor] = worker
+        selector.register(report_read_file_descriptor, EVENT_READ)
+    
+    
+    def _run_worker(self, index, generation, control_file_descriptor, report_file_descriptor):
+        """
+        Runs the worker function inside of the worker process.
+        
+        Parameters
+        ----------
+        index : `int`
+            The worker's index inside of its generation.
+        
+        generation : `int`
+            The worker's generation.
+        
+        control_file_descriptor : `int`
+            File descriptor of the control pipe's reading end.
+        
+        report_file_descriptor : `int`
+            File descriptor of the report pipe's writing end.
+        
+        Returns
+        -------
+        exit_code : `int`
+        """
+        loop = EventThread(daemon = True, name = f'worker-{generation}-{index}', start_later = False)
+        worker = SupervisedWorker(loop, index, generation, control_file_descriptor, report_file_descriptor)
+        
+        try:
+            loop.run(self._worker_task(worker))
+        except BaseException as exception:
+            write_exception_sync(exception, f'Worker {index} of generation {generation} failed:\n')
+            return 1
+        
+        return 0
+    
+    
+    async def _worker_task(self, worker):
+        """
+        Runs the worker function with heartbeats.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        worker : ``SupervisedWorker``
+            The worker to run the function with.
+        """
+        worker._start(self.heartbeat_interval)
+        try:
+            await self.worker_function(worker)
+        finally:
+            worker._stop()
+    
+    
+    def _read_report(self, selector, worker):
+        """
+        Reads the report pipe of the given worker. If it is closed, the worker exited.
+        
+        Parameters
+        ----------
+        selector : `selectors.BaseSelector`
+            The supervisor's selector.
+        
+        worker : ``WorkerProcess``
+            The worker to read from.
+        """
+        try:
+            data = read_file_descriptor(worker.report_file_descriptor, 65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b''
+        
+        now = monotonic()
+        if data:
+            worker.feed(data, now)
+            return
+        
+        self._remove_worker(selector, worker)
+        
+        if (
+            (worker.stop_deadline is None) and
+            (not self._stop_requested) and
+            (worker.generation == self.generation)
+        ):
+            self.restart_count += 1
+            self._pending_restarts.append(
+                (max(now, worker.started_at + RESTART_DELAY_MIN), worker.index, worker.generation)
+            )
+    
+    
+    def _remove_worker(self, selector, worker):
+        """
+        Removes the given exited (or killed) worker and waits for its process.
+        
+        Parameters
+        ----------
+        selector : `selectors.BaseSelector`
+            The supervisor's selector.
+        
+        worker : ``WorkerProcess``
+            The worker to remove.
+        """
+        report_file_descriptor = worker.report_file_descriptor
+        del self.workers[report_file_descriptor]
+        selector.unregister(report_file_descriptor)
+        close_file_descriptor(report_file_descriptor)
+        worker.close_control()
+        
+        # The report pipe is closed when the process exits, so it should not block.
+        try:
+            waitpid(worker.pid, 0)
+        except ChildProcessError:
+            pass
+    
+    
+    def _check_workers(self, now):
+        """
+        Kills the workers which did not send heartbeat for long enough or did not exit after asked to stop.
+        
+        Parameters
+        ----------
+        now : `float`
+            The current time.
+        """
+        health_check_timeout = self.health_check_timeout
+        
+        for worker in self.workers.values():
+            stop_deadline = worker.stop_deadline
+            if stop_deadline is None:
+                if worker.last_heartbeat + health_check_timeout > now:
+                    continue
+            else:
+                if stop_deadline > now:
+                    continue
+            
+            try:
+                kill(worker.pid, SIGKILL)
+            except ProcessLookupError:
+                pass
+    
+    
+    def _restart_workers(self, selector, wake_up_read_file_descriptor, now):
+        """
+        Restarts the workers whose restart is due.
+        
+        Parameters
+        ----------
+        selector : `selectors.BaseSelector`
+            The supervisor's selector.
+        
+        wake_up_read_file_descriptor : `int`
+            File descriptor of the wake up pipe's reading end.
+        
+        now : `float`
+            The current time.
+        """
+        pending_restarts = self._pending_restarts
+        if not pending_restarts:
+            return
+        
+        for item in [*pending_restarts]:
+            when, index, generation = item
+            if when > now:
+                continue
+            
+            pending_restarts.remove(item)
+            self._start_worker(selector, wake_up_read_file_descriptor, index, generation, now)
+    
+    
+    def _retire_previous_generations(self, now):
+        """
+        Stops the workers of the previous generations if every worker of the current generation is ready.
+        
+        Parameters
+        ----------
+        now : `float`
+            The current time.
+        """
+        generation = self.generation
+        ready_count = 0
+        previous_workers = None
+        
+        for worker in self.workers.values():
+            if worker.generation == generation:
+                if worker.ready:
+                    ready_count += 1
+                continue
+            
+            if (worker.stop_deadline is None):
+                if previous_workers is None:
+                    previous_workers = []
+                
+                previous_workers.append(worker)
+        
+        if (previous_workers is None) or (ready_count < self.worker_count):
+            return
+        
+        for worker in previous_workers:
+            worker.request_stop(now + self.stop_timeout)
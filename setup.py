@@ -49,6 +49,7 @@ setup(
         'scarletio.web_common',
         'scarletio.web_common.url',
         'scarletio.web_socket',
+        'scarletio.worker_pool',
         'scarletio.streaming',
         'scarletio.streaming.resource_streaming',
         'scarletio.streaming.zip_streaming',